@@ -15,11 +15,15 @@ from typing import Any, Dict, List, Optional
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.seeding import PodcastKnowledgePipeline
 from src.core.config import Config
 from src.core.exceptions import PodcastKGError
+from src.utils.lazy_imports import LazyImport
 from src.utils.logging import setup_logging as setup_structured_logging, get_logger
 
+# The pipeline pulls in every provider and analysis module; commands such as
+# --help and validate-config never need it
+PodcastKnowledgePipeline = LazyImport('src.seeding.orchestrator', 'PodcastKnowledgePipeline')
+
 
 def setup_logging(verbose: bool = False, log_file: Optional[str] = None) -> None:
     """Set up structured logging configuration."""
@@ -285,6 +289,74 @@ def schema_stats(args: argparse.Namespace) -> int:
         return 1
 
 
+def analyze_graph(args: argparse.Namespace) -> int:
+    """Run corpus-wide graph analytics and write the scores to the entities.
+    
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    graph_provider = None
+    try:
+        from dataclasses import asdict
+        from src.factories.provider_factory import ProviderFactory
+        from src.processing.corpus_graph_analytics import CorpusGraphAnalytics
+        
+        config = Config.from_file(args.config) if args.config else Config()
+        config_dict = asdict(config) if hasattr(config, '__dataclass_fields__') else config
+        graph_provider = ProviderFactory.create_provider(
+            'graph',
+            getattr(config, 'graph_provider', 'neo4j'),
+            config_dict
+        )
+        graph_provider.connect()
+        
+        job = CorpusGraphAnalytics(
+            graph_provider,
+            work_dir=Path(args.work_dir),
+            page_size=args.page_size,
+            write_batch_size=args.write_batch_size,
+            betweenness_pivots=args.pivots,
+            resolution=args.resolution,
+            relationship_types=args.relationship_types,
+            seed=args.seed
+        )
+        progress = job.run(restart=args.restart)
+        summary = progress.summary
+        
+        print("Corpus Graph Analytics:")
+        print(f"  Entities: {summary.get('entities', 0)}")
+        print(f"  Edges: {summary.get('edges', 0)}")
+        print(f"  Communities: {summary.get('communities', 0)} "
+              f"(modularity {summary.get('modularity', 0.0):.3f})")
+        print(f"  Entities updated: {progress.written_count}")
+        
+        if summary.get('bridge_concepts'):
+            print("\nTop Bridge Concepts:")
+            for concept in summary['bridge_concepts'][:10]:
+                print(f"  - {concept['name'] or concept['id']}: betweenness "
+                      f"{concept['betweenness']:.4f}, bridges "
+                      f"{concept['bridged_communities']} communities")
+        
+        if summary.get('structural_gaps'):
+            print("\nLargest Structural Gaps:")
+            for gap in summary['structural_gaps'][:5]:
+                print(f"  - {', '.join(gap['representative_concepts_1'])} <-> "
+                      f"{', '.join(gap['representative_concepts_2'])} "
+                      f"({gap['connection_count']} links, gap {gap['gap_score']:.2f})")
+        
+        return 0
+        
+    except Exception as e:
+        print(f"Graph analytics failed (rerun to resume): {e}", file=sys.stderr)
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        return 1
+    finally:
+        if graph_provider is not None:
+            graph_provider.disconnect()
+
+
 def main() -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -315,6 +387,9 @@ Examples:
   
   # View schema discovery statistics
   %(prog)s schema-stats --checkpoint-dir checkpoints
+  
+  # Compute corpus-wide centrality and communities (resumable)
+  %(prog)s analyze-graph --config config/prod.yml --work-dir graph_analytics
         """
     )
     
@@ -435,6 +510,59 @@ Examples:
         help='Directory containing checkpoint files (default: checkpoints)'
     )
     
+    # Corpus graph analytics command
+    analyze_parser = subparsers.add_parser(
+        'analyze-graph',
+        help='Compute PageRank, betweenness and communities over the whole graph'
+    )
+    analyze_parser.add_argument(
+        '--work-dir',
+        type=str,
+        default='graph_analytics',
+        help='Directory for the exported graph and checkpoint (default: graph_analytics)'
+    )
+    analyze_parser.add_argument(
+        '--page-size',
+        type=int,
+        default=10000,
+        help='Entities read per page (default: 10000)'
+    )
+    analyze_parser.add_argument(
+        '--write-batch-size',
+        type=int,
+        default=1000,
+        help='Entities updated per write (default: 1000)'
+    )
+    analyze_parser.add_argument(
+        '--pivots',
+        type=int,
+        default=256,
+        help='Sampled sources for approximate betweenness, 0 for exact (default: 256)'
+    )
+    analyze_parser.add_argument(
+        '--resolution',
+        type=float,
+        default=1.0,
+        help='Louvain resolution (default: 1.0)'
+    )
+    analyze_parser.add_argument(
+        '--relationship-types',
+        type=str,
+        nargs='+',
+        help='Only use these relationship types between entities (default: all)'
+    )
+    analyze_parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Random seed for pivot sampling and Louvain (default: 0)'
+    )
+    analyze_parser.add_argument(
+        '--restart',
+        action='store_true',
+        help='Discard previous progress instead of resuming'
+    )
+    
     # Parse arguments
     args = parser.parse_args()
     
@@ -459,6 +587,8 @@ Examples:
         return validate_config(args)
     elif args.command == 'schema-stats':
         return schema_stats(args)
+    elif args.command == 'analyze-graph':
+        return analyze_graph(args)
     else:
         parser.print_help()
         return 1
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Compare the CSR graph backend with NetworkX on synthetic co-occurrence graphs.
+
+Times betweenness centrality (exact and pivot-sampled) and modularity. NetworkX
+exact betweenness is cubic in practice, so it only runs up to --networkx-limit
+nodes.
+
+Usage:
+    python scripts/benchmarks/benchmark_graph_backend.py [--sizes 1000 5000 ...]
+        [--degree N] [--pivots N] [--networkx-limit N] [--output FILE]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import networkx as nx
+
+from src.processing.sparse_graph import SparseGraph
+
+
+def make_graph(num_nodes: int, degree: int, seed: int = 0) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str, float]]]:
+    """Generate clustered weighted edges, like entity co-occurrences across episodes."""
+    rng = random.Random(seed)
+    nodes = [{'id': f'n{i}', 'name': f'Entity {i}'} for i in range(num_nodes)]
+    cluster_size = 50
+    edges = []
+    for i in range(num_nodes):
+        for _ in range(degree // 2):
+            if rng.random() < 0.9:
+                base = i - i % cluster_size
+                j = base + rng.randrange(min(cluster_size, num_nodes - base))
+            else:
+                j = rng.randrange(num_nodes)
+            if i != j:
+                edges.append((f'n{i}', f'n{j}', round(rng.uniform(0.1, 1.0), 3)))
+    return nodes, edges
+
+
+def timed(func, *args, **kwargs) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def benchmark_size(num_nodes: int, degree: int, pivots: int, networkx_limit: int) -> Dict[str, Any]:
+    """Time both backends on one graph size."""
+    nodes, edges = make_graph(num_nodes, degree)
+    graph, build_seconds = timed(SparseGraph.from_edges, nodes, edges)
+    result = {
+        'nodes': num_nodes,
+        'edges': graph.number_of_edges,
+        'csr_build_seconds': build_seconds,
+        'csr_sampled_seconds': timed(graph.betweenness_centrality, pivots=pivots, seed=0)[1],
+    }
+    if num_nodes <= networkx_limit:
+        result['csr_exact_seconds'] = timed(graph.betweenness_centrality)[1]
+
+        nx_graph = nx.Graph()
+        nx_graph.add_nodes_from(node['id'] for node in nodes)
+        nx_graph.add_weighted_edges_from(edges)
+        result['networkx_exact_seconds'] = timed(
+            nx.betweenness_centrality, nx_graph, weight='weight'
+        )[1]
+        result['networkx_sampled_seconds'] = timed(
+            nx.betweenness_centrality, nx_graph, k=min(pivots, num_nodes), weight='weight', seed=0
+        )[1]
+
+        communities = nx.community.label_propagation_communities(nx_graph)
+        communities = [set(c) for c in communities]
+        result['csr_modularity_seconds'] = timed(graph.modularity, communities)[1]
+        result['networkx_modularity_seconds'] = timed(
+            nx.community.modularity, nx_graph, communities
+        )[1]
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 3000, 10000, 50000])
+    parser.add_argument('--degree', type=int, default=8, help='Average node degree')
+    parser.add_argument('--pivots', type=int, default=256, help='Sampled betweenness sources')
+    parser.add_argument('--networkx-limit', type=int, default=3000,
+                        help='Largest graph to run NetworkX and exact betweenness on')
+    parser.add_argument('--output', type=Path, help='Write results as JSON')
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        result = benchmark_size(size, args.degree, args.pivots, args.networkx_limit)
+        results.append(result)
+
+        line = (f"{result['nodes']:>6} nodes {result['edges']:>7} edges: "
+                f"CSR {args.pivots} pivots {result['csr_sampled_seconds']:.2f}s")
+        if 'csr_exact_seconds' in result:
+            line += (f", CSR exact {result['csr_exact_seconds']:.2f}s, "
+                     f"NetworkX exact {result['networkx_exact_seconds']:.2f}s, "
+                     f"NetworkX {args.pivots} pivots {result['networkx_sampled_seconds']:.2f}s")
+        print(line)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
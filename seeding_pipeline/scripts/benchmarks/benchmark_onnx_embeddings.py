@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Compare the PyTorch and ONNX Runtime embedding backends on CPU.
+
+Reports throughput for both backends and the cosine drift of the ONNX
+vectors from the PyTorch ones.
+
+Usage:
+    python scripts/benchmarks/benchmark_onnx_embeddings.py [--model NAME] [--texts-file FILE]
+        [--count N] [--threads N] [--batch-size N] [--no-quantize] [--output FILE]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import numpy as np
+
+from src.providers.embeddings.sentence_transformer import SentenceTransformerProvider
+
+
+WORDS = ("podcast episode guest host discussion artificial intelligence climate market "
+         "startup funding research science history music energy policy health data model "
+         "network quantum computing language learning").split()
+
+
+def load_texts(texts_file: Path = None, count: int = 2000) -> List[str]:
+    """Load texts, one per line, or generate texts of mixed length."""
+    if texts_file:
+        return [line.strip() for line in texts_file.read_text().splitlines() if line.strip()][:count]
+    rng = random.Random(0)
+    # Mostly short entity names with some segment-length texts, like an episode
+    return [
+        ' '.join(rng.choice(WORDS) for _ in range(rng.choice([2, 3, 5, 12, 40, 120])))
+        for _ in range(count)
+    ]
+
+
+def time_backend(provider: SentenceTransformerProvider, texts: List[str]) -> Dict[str, Any]:
+    """Embed all texts and measure throughput after a warm-up call."""
+    provider.generate_embeddings(texts[:8])
+    start = time.perf_counter()
+    embeddings = np.asarray(provider.generate_embeddings(texts), dtype=np.float32)
+    elapsed = time.perf_counter() - start
+    return {
+        'seconds': elapsed,
+        'texts_per_second': len(texts) / elapsed if elapsed else 0.0,
+        'embeddings': embeddings
+    }
+
+
+def cosine_drift(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, float]:
+    """Summarize the cosine similarity between matching rows."""
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    cosine = (reference * candidate).sum(axis=1) / np.clip(norms, 1e-12, None)
+    return {
+        'mean_cosine': float(cosine.mean()),
+        'min_cosine': float(cosine.min()),
+        'p01_cosine': float(np.percentile(cosine, 1))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ONNX vs PyTorch embeddings")
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='Sentence-transformers model')
+    parser.add_argument('--texts-file', type=Path, help='File with one text per line')
+    parser.add_argument('--count', type=int, default=2000, help='Number of texts')
+    parser.add_argument('--threads', type=int, default=0, help='ONNX Runtime intra-op threads')
+    parser.add_argument('--batch-size', type=int, default=32, help='Texts per batch')
+    parser.add_argument('--no-quantize', action='store_true', help='Use the fp32 ONNX export')
+    parser.add_argument('--onnx-dir', help='Directory for exported models')
+    parser.add_argument('--output', type=Path, help='Write results as JSON')
+    args = parser.parse_args()
+
+    texts = load_texts(args.texts_file, args.count)
+    base_config = {'model_name': args.model, 'batch_size': args.batch_size, 'device': 'cpu'}
+
+    torch_provider = SentenceTransformerProvider(base_config)
+    onnx_provider = SentenceTransformerProvider({
+        **base_config,
+        'embedding_backend': 'onnx',
+        'embedding_onnx_threads': args.threads,
+        'embedding_onnx_quantize': not args.no_quantize,
+        'embedding_onnx_dir': args.onnx_dir
+    })
+
+    torch_result = time_backend(torch_provider, texts)
+    onnx_result = time_backend(onnx_provider, texts)
+    if onnx_provider.backend != 'onnx':
+        print("ONNX backend unavailable; install onnxruntime and transformers", file=sys.stderr)
+        return 1
+
+    results = {
+        'model': args.model,
+        'texts': len(texts),
+        'quantized': not args.no_quantize,
+        'threads': args.threads,
+        'torch': {k: v for k, v in torch_result.items() if k != 'embeddings'},
+        'onnx': {k: v for k, v in onnx_result.items() if k != 'embeddings'},
+        'speedup': torch_result['seconds'] / onnx_result['seconds'] if onnx_result['seconds'] else None,
+        'drift': cosine_drift(torch_result['embeddings'], onnx_result['embeddings'])
+    }
+
+    print(f"Model: {args.model} ({len(texts)} texts)")
+    print(f"PyTorch: {results['torch']['texts_per_second']:.1f} texts/s")
+    print(f"ONNX{' int8' if results['quantized'] else ''}: "
+          f"{results['onnx']['texts_per_second']:.1f} texts/s ({results['speedup']:.2f}x)")
+    print(f"Cosine vs PyTorch: mean {results['drift']['mean_cosine']:.4f}, "
+          f"min {results['drift']['min_cosine']:.4f}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
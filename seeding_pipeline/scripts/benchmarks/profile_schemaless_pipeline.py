@@ -11,7 +11,8 @@ import sys
 from pathlib import Path
 import time
 import json
-from typing import Dict, Any
+from types import SimpleNamespace
+from typing import Dict, Any, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -54,6 +55,7 @@ def profile_extraction_components(profiler: PerformanceProfiler,
     # Profile LLM calls
     with profiler.profile_section("llm_initialization"):
         llm_provider = get_llm_provider(config)
+    results["llm_provider"] = llm_provider
     
     with profiler.profile_section("llm_single_call"):
         response = llm_provider.generate(
@@ -64,6 +66,7 @@ def profile_extraction_components(profiler: PerformanceProfiler,
     # Profile embedding generation
     with profiler.profile_section("embedding_initialization"):
         embedding_provider = get_embedding_provider(config)
+    results["embedding_provider"] = embedding_provider
     
     with profiler.profile_section("embedding_single"):
         embedding = embedding_provider.embed_text(test_text[:500])
@@ -78,6 +81,7 @@ def profile_extraction_components(profiler: PerformanceProfiler,
         with profiler.profile_section("graph_initialization"):
             graph_provider = SchemalessNeo4jProvider(config)
             graph_provider.connect()
+        results["graph_provider"] = graph_provider
         
         with profiler.profile_section("graph_write_single"):
             graph_provider.query("""
@@ -204,9 +208,10 @@ def main():
     # Apply optimizations if requested
     if args.enable_optimization:
         logger.info("Applying optimizations...")
-        optimizer = OptimizationManager()
-        # Note: This would need the actual pipeline instance
-        # optimizer.apply_optimizations(pipeline)
+        optimizer = OptimizationManager(profiler=profiler)
+        optimizer.apply_optimizations(SimpleNamespace(**component_results))
+        optimization_report = optimizer.generate_report(args.output_dir / "optimization_report.md")
+        print("\n" + optimization_report)
         print("\nOptimizations applied. Re-run profiling to measure improvements.")
     
     print(f"\nDetailed report saved to: {report_path}")
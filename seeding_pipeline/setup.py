@@ -67,6 +67,10 @@ setup(
             "flake8>=6.1.0",
             "pre-commit>=3.5.0",
         ],
+        "onnx": [
+            "onnxruntime>=1.16.0",
+            "transformers>=4.30.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -6,8 +6,19 @@ Main API:
     - seed_podcasts: Seed knowledge graph with multiple podcasts
 """
 
+from typing import TYPE_CHECKING
+
 from .__version__ import __version__, __version_info__, __api_version__
-from .seeding import PodcastKnowledgePipeline
+from .utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .seeding import PodcastKnowledgePipeline
+
+# The orchestrator imports every provider and analysis module, so it is only
+# loaded when first used
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'PodcastKnowledgePipeline': '.seeding',
+})
 
 # Convenience functions
 def seed_podcast(podcast_config, max_episodes=1, use_large_context=True, config=None):
@@ -23,6 +34,7 @@ def seed_podcast(podcast_config, max_episodes=1, use_large_context=True, config=
         Processing summary dict
     """
     from .core.config import Config
+    from .seeding import PodcastKnowledgePipeline
     
     if config is None:
         config = Config()
@@ -47,6 +59,7 @@ def seed_podcasts(podcast_configs, max_episodes_each=10, use_large_context=True,
         Summary dict with processing statistics
     """
     from .core.config import Config
+    from .seeding import PodcastKnowledgePipeline
     
     if config is None:
         config = Config()
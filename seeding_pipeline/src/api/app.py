@@ -115,6 +115,10 @@ setup_metrics(app)
 from .v1.slo import router as slo_router
 app.include_router(slo_router, prefix="/api/v1")
 
+# Add stage profiling endpoints
+from .v1.profiling import router as profiling_router
+app.include_router(profiling_router, prefix="/api/v1")
+
 
 @app.get("/", tags=["root"])
 @trace_request("GET", "/")
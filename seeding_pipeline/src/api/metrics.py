@@ -290,6 +290,30 @@ class MetricsCollector:
             "Current extraction mode (0=fixed, 1=schemaless)"
         )
         
+        # Cache metrics
+        self.cache_hits = Counter(
+            "podcast_kg_cache_hits_total",
+            "Total cache hits",
+            labels=["cache"]
+        )
+        self.cache_misses = Counter(
+            "podcast_kg_cache_misses_total",
+            "Total cache misses",
+            labels=["cache"]
+        )
+        
+        # Garbage collection metrics
+        self.gc_pause_duration = Histogram(
+            "podcast_kg_gc_pause_seconds",
+            "Time spent in explicit garbage collections",
+            labels=["generation"],
+            buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0]
+        )
+        self.memory_backpressure_wait = Histogram(
+            "podcast_kg_memory_backpressure_seconds",
+            "Time new episodes were held back waiting for memory headroom"
+        )
+        
         # Start resource monitoring
         self._start_resource_monitoring()
     
@@ -331,7 +355,8 @@ class MetricsCollector:
                       self.nodes_created, self.relationships_created,
                       self.entities_extracted_total, self.http_requests_total,
                       self.discovered_entity_types, self.discovered_relationship_types,
-                      self.entity_resolution_matches]:
+                      self.entity_resolution_matches,
+                      self.cache_hits, self.cache_misses]:
             lines.append(f"# HELP {metric.name} {metric.description}")
             lines.append(f"# TYPE {metric.name} counter")
             for key, value in metric._values.items():
@@ -357,7 +382,8 @@ class MetricsCollector:
         # Export histograms
         for metric in [self.processing_duration, self.provider_latency,
                       self.extraction_quality, self.queue_wait_time,
-                      self.http_request_duration]:
+                      self.http_request_duration, self.gc_pause_duration,
+                      self.memory_backpressure_wait]:
             lines.append(f"# HELP {metric.name} {metric.description}")
             lines.append(f"# TYPE {metric.name} histogram")
             
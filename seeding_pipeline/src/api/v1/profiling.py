@@ -0,0 +1,90 @@
+"""
+Stage profiling API endpoints
+
+Exposes per-stage costs of recently processed episodes and lets operators
+request stack sampling of an episode, returning its flamegraph stacks.
+"""
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from typing import Dict, Any
+
+from ...utils.stage_profiling import get_stage_profiler
+from ...utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/profiling", tags=["profiling"])
+
+
+@router.get("/episodes")
+async def list_episode_profiles() -> Dict[str, Any]:
+    """
+    List the stage profiles of recently processed episodes.
+
+    Returns:
+        Recent profiles, most recent first, and episodes waiting to be sampled
+    """
+    profiler = get_stage_profiler()
+    return {
+        "profiles": [profile.to_dict() for profile in profiler.recent_profiles()],
+        "pending_sampling": profiler.pending_requests()
+    }
+
+
+@router.get("/episodes/{episode_id}")
+async def get_episode_profile(episode_id: str) -> Dict[str, Any]:
+    """
+    Get the stage profile of an episode.
+
+    Args:
+        episode_id: Episode identifier
+
+    Returns:
+        Per-stage wall time, CPU time and allocations of the episode
+    """
+    profile = get_stage_profiler().get_profile(episode_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"No profile for episode {episode_id}")
+    return profile.to_dict()
+
+
+@router.get("/episodes/{episode_id}/flamegraph", response_class=PlainTextResponse)
+async def get_episode_flamegraph(episode_id: str) -> str:
+    """
+    Get the sampled stacks of an episode in collapsed-stack format.
+
+    The output can be piped into flamegraph.pl or loaded into speedscope.
+
+    Args:
+        episode_id: Episode identifier
+
+    Returns:
+        One ``frame;frame;... count`` line per distinct stack
+    """
+    profile = get_stage_profiler().get_profile(episode_id)
+    if profile is None or not profile.sampled:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Episode {episode_id} was not sampled; request sampling and process it again"
+        )
+    return profile.collapsed_stacks()
+
+
+@router.post("/episodes/{episode_id}/sample")
+async def request_episode_sampling(episode_id: str) -> Dict[str, str]:
+    """
+    Sample stacks of an episode the next time it is processed.
+
+    Args:
+        episode_id: Episode identifier
+
+    Returns:
+        Confirmation message
+    """
+    get_stage_profiler().request_sampling(episode_id)
+    logger.info(f"Stack sampling requested for episode {episode_id}")
+    return {
+        "status": "requested",
+        "message": f"Episode {episode_id} will be sampled when next processed"
+    }
@@ -58,6 +58,12 @@ class PipelineConfig:
     embedding_dimensions: int = 1536
     embedding_similarity: str = "cosine"
     embedding_model: str = "text-embedding-ada-002"
+    embedding_cache_size: int = 10000  # In-memory LRU entries of the shared embedding cache
+    embedding_cache_dir: Optional[str] = field(default_factory=lambda: os.environ.get("EMBEDDING_CACHE_DIR"))
+    embedding_backend: str = field(default_factory=lambda: os.environ.get("EMBEDDING_BACKEND", "torch"))  # torch or onnx
+    embedding_onnx_threads: int = field(default_factory=lambda: int(os.environ.get("EMBEDDING_ONNX_THREADS", "0")))
+    embedding_onnx_quantize: bool = True  # int8 dynamic quantization of the ONNX export
+    embedding_onnx_dir: Optional[str] = field(default_factory=lambda: os.environ.get("EMBEDDING_ONNX_DIR"))
     
     # File Paths
     base_dir: Path = field(default_factory=lambda: Path("."))
@@ -79,6 +85,26 @@ class PipelineConfig:
     # Progress and Monitoring
     checkpoint_interval: int = 1  # Save after N episodes
     memory_cleanup_interval: int = 1  # Cleanup after N episodes
+    memory_budget_mb: Optional[float] = None  # RSS budget; None uses 75% of system memory
+    memory_backpressure_timeout: float = 60.0  # Max seconds to hold back episodes over budget
+
+    # Stage Profiling (per-stage counters are cheap; listed episodes, or "*", are also stack-sampled)
+    stage_profiling: bool = field(default_factory=lambda: os.environ.get("STAGE_PROFILING", "true").lower() == "true")
+    profile_episodes: List[str] = field(default_factory=lambda: [e.strip() for e in os.environ.get("PROFILE_EPISODES", "").split(",") if e.strip()])
+    profile_sample_interval_ms: float = field(default_factory=lambda: float(os.environ.get("PROFILE_SAMPLE_INTERVAL_MS", "5")))
+    profile_output_dir: Optional[str] = field(default_factory=lambda: os.environ.get("PROFILE_OUTPUT_DIR"))
+
+    # Post-extraction analyses (discourse flow, emergent themes, episode flow) run side by side
+    analysis_executor: str = field(default_factory=lambda: os.environ.get("ANALYSIS_EXECUTOR", "thread"))  # serial, thread or process
+    analysis_timeout: Optional[float] = field(default_factory=lambda: float(os.environ.get("ANALYSIS_TIMEOUT", "600")) or None)  # Seconds per analysis; 0 disables
+
+    # Rate Limiting (shared backends let several workers draw from one quota)
+    rate_limit_backend: str = field(default_factory=lambda: os.environ.get("RATE_LIMIT_BACKEND", "memory"))
+    rate_limit_ledger_path: Optional[str] = field(default_factory=lambda: os.environ.get("RATE_LIMIT_LEDGER_PATH"))
+    rate_limit_redis_url: Optional[str] = field(default_factory=lambda: os.environ.get("RATE_LIMIT_REDIS_URL"))
+    
+    # LLM Routing (each route overrides model_name/api_key; non-empty routes select the router)
+    llm_routes: List[Dict[str, Any]] = field(default_factory=list)
     
     # Logging
     log_level: str = field(default_factory=lambda: os.environ.get("LOG_LEVEL", "INFO"))
@@ -87,6 +113,7 @@ class PipelineConfig:
     use_schemaless_extraction: bool = field(default_factory=lambda: os.environ.get("USE_SCHEMALESS_EXTRACTION", "false").lower() == "true")
     schemaless_confidence_threshold: float = field(default_factory=lambda: float(os.environ.get("SCHEMALESS_CONFIDENCE_THRESHOLD", "0.7")))
     entity_resolution_threshold: float = field(default_factory=lambda: float(os.environ.get("ENTITY_RESOLUTION_THRESHOLD", "0.85")))
+    incremental_entity_resolution: bool = field(default_factory=lambda: os.environ.get("INCREMENTAL_ENTITY_RESOLUTION", "false").lower() == "true")
     max_properties_per_node: int = field(default_factory=lambda: int(os.environ.get("MAX_PROPERTIES_PER_NODE", "50")))
     relationship_normalization: bool = field(default_factory=lambda: os.environ.get("RELATIONSHIP_NORMALIZATION", "true").lower() == "true")
     
@@ -126,6 +153,14 @@ class PipelineConfig:
             errors.append("min_speakers must be less than or equal to max_speakers")
         if not 0 < self.gpu_memory_fraction <= 1:
             errors.append("gpu_memory_fraction must be between 0 and 1")
+        if self.rate_limit_backend not in ("memory", "sqlite", "redis"):
+            errors.append("rate_limit_backend must be one of: memory, sqlite, redis")
+        if self.profile_sample_interval_ms <= 0:
+            errors.append("profile_sample_interval_ms must be positive")
+        if self.analysis_executor not in ("serial", "thread", "process"):
+            errors.append("analysis_executor must be one of: serial, thread, process")
+        if self.analysis_timeout is not None and self.analysis_timeout < 0:
+            errors.append("analysis_timeout must not be negative")
             
         # Validate schemaless settings
         if not 0 <= self.schemaless_confidence_threshold <= 1:
@@ -0,0 +1,138 @@
+"""
+Compact representation of embedding vectors.
+
+Embeddings are kept as float32 NumPy arrays from the provider onwards: a
+768-dimensional vector takes 3 KB that way against about 25 KB as a list of
+Python floats, and similarity code can use it without converting. Lists are
+still accepted everywhere, so older checkpoints, mock providers and callers
+that build embeddings by hand keep working.
+
+At the edges the vectors are converted back: :func:`embedding_to_list` for
+graph properties and JSON, :func:`encode_embedding` and
+:func:`decode_embedding` for a base64 text form of the raw float32 bytes, and
+:func:`json_default` for JSON files such as checkpoints.
+"""
+
+import base64
+from typing import Any, Iterable, List, Optional, Sequence, Union
+
+from ..utils.lazy_imports import LazyImport
+
+# NumPy is only needed once embeddings exist; keeps ``src.core`` light to import
+np = LazyImport('numpy')
+
+EMBEDDING_DTYPE = 'float32'
+
+EmbeddingLike = Union[Sequence[float], "np.ndarray"]
+
+
+def as_embedding(value: Optional[EmbeddingLike]) -> Optional["np.ndarray"]:
+    """
+    Convert an embedding to a float32 array.
+
+    Float32 arrays are returned as they are, without copying.
+
+    Args:
+        value: Embedding as a list or array, or None
+
+    Returns:
+        One-dimensional float32 array, or None if no embedding was given
+    """
+    if value is None:
+        return None
+    if isinstance(value, (str, bytes)):
+        return decode_embedding(value)
+    embedding = np.asarray(value, dtype=EMBEDDING_DTYPE)
+    return embedding if embedding.ndim == 1 else embedding.reshape(-1)
+
+
+def has_embedding(obj: Any) -> bool:
+    """Whether an object carries a non-empty ``embedding``."""
+    embedding = getattr(obj, 'embedding', None)
+    return embedding is not None and len(embedding) > 0
+
+
+def embedding_matrix(embeddings: Iterable[Optional[EmbeddingLike]]) -> "np.ndarray":
+    """
+    Stack embeddings into one float32 matrix, one row per embedding.
+
+    None and empty embeddings are skipped.
+
+    Args:
+        embeddings: Embeddings of the same dimension
+
+    Returns:
+        Array of shape (count, dimension)
+    """
+    rows = [as_embedding(e) for e in embeddings if e is not None and len(e) > 0]
+    if not rows:
+        return np.empty((0, 0), dtype=EMBEDDING_DTYPE)
+    return np.vstack(rows)
+
+
+def embedding_to_list(value: Optional[EmbeddingLike]) -> Optional[List[float]]:
+    """
+    Convert an embedding to a list of floats for graph properties and JSON.
+
+    Args:
+        value: Embedding as a list or array, or None
+
+    Returns:
+        List of floats, or None
+    """
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return value
+    return as_embedding(value).tolist()
+
+
+def encode_embedding(value: Optional[EmbeddingLike]) -> Optional[str]:
+    """
+    Encode an embedding as base64 of its little-endian float32 bytes.
+
+    Args:
+        value: Embedding as a list or array, or None
+
+    Returns:
+        ASCII string, about a third of the JSON list size, or None
+    """
+    if value is None:
+        return None
+    data = as_embedding(value).astype('<f4', copy=False).tobytes()
+    return base64.b64encode(data).decode('ascii')
+
+
+def decode_embedding(value: Optional[Union[str, bytes, EmbeddingLike]]) -> Optional["np.ndarray"]:
+    """
+    Decode an embedding written by :func:`encode_embedding`.
+
+    Lists and arrays, as stored by older versions, are converted instead.
+
+    Args:
+        value: Encoded embedding, list, array or None
+
+    Returns:
+        Float32 array, or None
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = base64.b64decode(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return np.frombuffer(value, dtype='<f4').astype(EMBEDDING_DTYPE)
+    return as_embedding(value)
+
+
+def json_default(obj: Any) -> Any:
+    """
+    ``default`` hook for ``json.dump`` that writes arrays as lists.
+
+    Example:
+        json.dump(checkpoint_data, f, default=json_default)
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -10,6 +10,8 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
 from enum import Enum
 
+from .embeddings import as_embedding, embedding_to_list
+
 
 # Enums for various types
 class ComplexityLevel(str, Enum):
@@ -162,13 +164,16 @@ class Segment:
     information_score: Optional[float] = None
     accessibility_score: Optional[float] = None
     
-    # Embeddings
-    embedding: Optional[List[float]] = None
+    # Embeddings, stored as a float32 array
+    embedding: Optional[Any] = None
     
     # Timestamps
     created_timestamp: Optional[datetime] = None
     updated_timestamp: Optional[datetime] = None
     
+    def __post_init__(self):
+        self.embedding = as_embedding(self.embedding)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for Neo4j."""
         return {
@@ -183,7 +188,7 @@ class Segment:
             "word_count": self.word_count,
             "duration_seconds": self.duration_seconds,
             "content_hash": self.content_hash,
-            "embedding": self.embedding
+            "embedding": embedding_to_list(self.embedding)
         }
 
 
@@ -216,13 +221,16 @@ class Entity:
     importance_factors: Dict[str, float] = field(default_factory=dict)  # Breakdown of importance factors
     discourse_roles: Dict[str, float] = field(default_factory=dict)  # Entity's discourse functions
     
-    # Embeddings
-    embedding: Optional[List[float]] = None
+    # Embeddings, stored as a float32 array
+    embedding: Optional[Any] = None
     
     # Timestamps
     created_timestamp: Optional[datetime] = None
     updated_timestamp: Optional[datetime] = None
     
+    def __post_init__(self):
+        self.embedding = as_embedding(self.embedding)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for Neo4j."""
         return {
@@ -237,7 +245,7 @@ class Entity:
             "importance_score": self.importance_score,
             "importance_factors": self.importance_factors,
             "discourse_roles": self.discourse_roles,
-            "embedding": self.embedding
+            "embedding": embedding_to_list(self.embedding)
         }
 
 
@@ -290,8 +298,11 @@ class Quote:
     segment_id: Optional[str] = None
     episode_id: Optional[str] = None
     
-    # Embedding
-    embedding: Optional[List[float]] = None
+    # Embedding, stored as a float32 array
+    embedding: Optional[Any] = None
+    
+    def __post_init__(self):
+        self.embedding = as_embedding(self.embedding)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for Neo4j."""
@@ -306,7 +317,7 @@ class Quote:
             "estimated_timestamp": self.estimated_timestamp,
             "segment_id": self.segment_id,
             "episode_id": self.episode_id,
-            "embedding": self.embedding
+            "embedding": embedding_to_list(self.embedding)
         }
 
 
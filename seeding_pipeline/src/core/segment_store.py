@@ -0,0 +1,408 @@
+"""
+Columnar storage of an episode's transcript segments.
+
+An episode used to exist as segment dicts, as ``Segment`` dataclasses per
+analyzer and as pickled checkpoint payloads, and every analyzer lowercased
+each segment's text again. ``SegmentStore`` keeps one copy per episode: all
+texts in a single buffer addressed by offsets, NumPy columns for times,
+speakers and word counts, and a lower-cased buffer computed once on first use.
+
+Iterating a store yields ``SegmentView`` objects that read from the columns.
+Views offer the attributes of :class:`src.core.models.Segment` and also
+dict-style access (``segment['text']``, ``segment.get('start')``), so code
+written against either segment representation keeps working.
+"""
+
+from collections.abc import Sequence
+from functools import cached_property
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .embeddings import embedding_to_list
+
+# Joins segment texts in the buffer; a search term never spans two segments
+SEPARATOR = "\x00"
+
+# Dict keys used for segment times by the segmenter and older callers
+_KEY_ALIASES = {'start': 'start_time', 'end': 'end_time'}
+
+_MAPPING_KEYS = (
+    'id', 'text', 'start_time', 'end_time', 'speaker', 'episode_id', 'segment_index',
+    'word_count', 'duration_seconds', 'is_advertisement', 'sentiment'
+)
+
+
+def _first(data: Dict[str, Any], keys: Tuple[str, ...], default: Any) -> Any:
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+class SegmentStore(Sequence):
+    """Transcript segments of one episode, stored column-wise."""
+
+    def __init__(self,
+                 texts: Iterable[str],
+                 start_times: Iterable[float],
+                 end_times: Iterable[float],
+                 speakers: Optional[Iterable[Optional[str]]] = None,
+                 episode_id: str = "",
+                 is_advertisement: Optional[Iterable[bool]] = None,
+                 sentiments: Optional[List[Any]] = None):
+        """
+        Initialize segment store.
+
+        Args:
+            texts: Segment texts in episode order
+            start_times: Segment start times in seconds
+            end_times: Segment end times in seconds
+            speakers: Speaker label per segment, None if unknown
+            episode_id: Episode the segments belong to
+            is_advertisement: Advertisement flag per segment
+            sentiments: Sentiment result per segment
+        """
+        texts = [text or "" for text in texts]
+        count = len(texts)
+        self.episode_id = episode_id
+
+        self._buffer = SEPARATOR.join(texts)
+        lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=count)
+        self._starts = np.zeros(count, dtype=np.int64)
+        if count:
+            np.cumsum(lengths[:-1] + 1, out=self._starts[1:])
+        self._ends = self._starts + lengths
+
+        self.start_times = np.asarray(list(start_times), dtype=np.float64)
+        self.end_times = np.asarray(list(end_times), dtype=np.float64)
+
+        # Speakers are interned; -1 marks an unknown speaker
+        self.speakers: List[str] = []
+        self.speaker_ids = np.full(count, -1, dtype=np.int32)
+        if speakers is not None:
+            codes: Dict[str, int] = {}
+            for i, speaker in enumerate(speakers):
+                if speaker is None:
+                    continue
+                code = codes.get(speaker)
+                if code is None:
+                    code = codes[speaker] = len(self.speakers)
+                    self.speakers.append(speaker)
+                self.speaker_ids[i] = code
+
+        self.is_advertisement = (
+            np.asarray(list(is_advertisement), dtype=bool) if is_advertisement is not None
+            else np.zeros(count, dtype=bool)
+        )
+        self.sentiments: List[Any] = list(sentiments) if sentiments is not None else [None] * count
+
+        if not (len(self.start_times) == len(self.end_times) == len(self.is_advertisement)
+                == len(self.sentiments) == count):
+            raise ValueError("All segment columns must have one entry per segment")
+
+        self._views: List[Optional["SegmentView"]] = [None] * count
+
+    @classmethod
+    def from_dicts(cls, segments: Iterable[Dict[str, Any]], episode_id: str = "") -> "SegmentStore":
+        """
+        Build a store from segment dictionaries.
+
+        Accepts the segmenter's ``start_time``/``end_time`` keys as well as
+        ``start``/``end``. Segments without a speaker get ``'Unknown'``.
+
+        Args:
+            segments: Segment dictionaries
+            episode_id: Episode the segments belong to
+
+        Returns:
+            Segment store
+        """
+        segments = list(segments)
+        return cls(
+            texts=[segment.get('text', '') for segment in segments],
+            start_times=[_first(segment, ('start_time', 'start'), 0.0) for segment in segments],
+            end_times=[_first(segment, ('end_time', 'end'), 0.0) for segment in segments],
+            speakers=[segment.get('speaker', 'Unknown') for segment in segments],
+            episode_id=episode_id,
+            is_advertisement=[bool(segment.get('is_advertisement', False)) for segment in segments],
+            sentiments=[segment.get('sentiment') for segment in segments]
+        )
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Any], episode_id: str = "") -> "SegmentStore":
+        """
+        Build a store from objects with ``Segment`` attributes.
+
+        Args:
+            segments: Segments
+            episode_id: Episode the segments belong to, defaults to the
+                first segment's
+
+        Returns:
+            Segment store
+        """
+        segments = list(segments)
+        if not episode_id and segments:
+            episode_id = getattr(segments[0], 'episode_id', '') or ''
+        return cls(
+            texts=[segment.text for segment in segments],
+            start_times=[segment.start_time for segment in segments],
+            end_times=[segment.end_time for segment in segments],
+            speakers=[getattr(segment, 'speaker', None) for segment in segments],
+            episode_id=episode_id,
+            is_advertisement=[getattr(segment, 'is_advertisement', False) for segment in segments],
+            sentiments=[getattr(segment, 'sentiment', None) for segment in segments]
+        )
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["SegmentView", List["SegmentView"]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        view = self._views[index]
+        if view is None:
+            view = self._views[index] = SegmentView(self, index)
+        return view
+
+    def __iter__(self) -> Iterator["SegmentView"]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"SegmentStore(episode_id={self.episode_id!r}, segments={len(self)})"
+
+    def text(self, index: int) -> str:
+        """Text of a segment."""
+        return self._buffer[self._starts[index]:self._ends[index]]
+
+    @cached_property
+    def _lowered(self) -> Tuple[str, np.ndarray, np.ndarray]:
+        lowered = self._buffer.lower()
+        if len(lowered) == len(self._buffer):
+            return lowered, self._starts, self._ends
+
+        # A few characters lowercase to several, which shifts the offsets
+        texts = [self.text(i).lower() for i in range(len(self))]
+        lengths = np.array([len(text) for text in texts], dtype=np.int64)
+        starts = np.zeros(len(texts), dtype=np.int64)
+        if len(texts):
+            np.cumsum(lengths[:-1] + 1, out=starts[1:])
+        return SEPARATOR.join(texts), starts, starts + lengths
+
+    def text_lower(self, index: int) -> str:
+        """Lower-cased text of a segment."""
+        lowered, starts, ends = self._lowered
+        return lowered[starts[index]:ends[index]]
+
+    @cached_property
+    def word_counts(self) -> np.ndarray:
+        """Whitespace-separated words per segment."""
+        return np.fromiter((len(self.text(i).split()) for i in range(len(self))),
+                           dtype=np.int32, count=len(self))
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Duration of each segment in seconds."""
+        return self.end_times - self.start_times
+
+    def segments_containing(self, term: str) -> np.ndarray:
+        """
+        Indices of segments whose text contains a term, ignoring case.
+
+        Scans the lower-cased buffer once instead of lowercasing and
+        searching every segment.
+
+        Args:
+            term: Text to look for
+
+        Returns:
+            Sorted segment indices
+        """
+        needle = term.lower()
+        if not needle or SEPARATOR in needle:
+            return np.empty(0, dtype=np.int64)
+
+        lowered, starts, ends = self._lowered
+        found = []
+        position = lowered.find(needle)
+        while position != -1:
+            index = int(np.searchsorted(starts, position, side='right')) - 1
+            found.append(index)
+            # Continue in the next segment
+            position = lowered.find(needle, int(ends[index]) + 1)
+        return np.asarray(found, dtype=np.int64)
+
+    def speaker(self, index: int) -> Optional[str]:
+        """Speaker of a segment."""
+        code = self.speaker_ids[index]
+        return self.speakers[code] if code >= 0 else None
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Segments as dictionaries with the segmenter's keys."""
+        return [view.to_dict() for view in self]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns, excluding views."""
+        columns = (self._starts, self._ends, self.start_times, self.end_times,
+                   self.speaker_ids, self.is_advertisement)
+        total = sum(column.nbytes for column in columns) + len(self._buffer.encode('utf-8'))
+        if '_lowered' in self.__dict__:
+            total += len(self._lowered[0].encode('utf-8'))
+        return total
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Views and the lower-cased buffer are rebuilt on demand
+        state = self.__dict__.copy()
+        state.pop('_lowered', None)
+        state['_views'] = len(self._views)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state['_views'] = [None] * state['_views']
+        self.__dict__.update(state)
+
+
+class SegmentView:
+    """
+    One segment of a :class:`SegmentStore`.
+
+    Reads text, times and speaker from the store's columns. Analysis results
+    assigned by analyzers live on the view itself.
+    """
+
+    __slots__ = (
+        '_store', 'segment_index', 'complexity_score', 'complexity_level',
+        'technical_density', 'information_score', 'accessibility_score',
+        'embedding', 'content_hash', 'created_timestamp', 'updated_timestamp'
+    )
+
+    def __init__(self, store: SegmentStore, index: int):
+        self._store = store
+        self.segment_index = index
+        self.complexity_score = None
+        self.complexity_level = None
+        self.technical_density = None
+        self.information_score = None
+        self.accessibility_score = None
+        self.embedding = None
+        self.content_hash = None
+        self.created_timestamp = None
+        self.updated_timestamp = None
+
+    @property
+    def store(self) -> SegmentStore:
+        """Store holding the segment."""
+        return self._store
+
+    @property
+    def id(self) -> str:
+        if not self._store.episode_id:
+            return f"segment_{self.segment_index}"
+        return f"{self._store.episode_id}_segment_{self.segment_index}"
+
+    @property
+    def episode_id(self) -> str:
+        return self._store.episode_id
+
+    @property
+    def text(self) -> str:
+        return self._store.text(self.segment_index)
+
+    @property
+    def text_lower(self) -> str:
+        """Lower-cased text, shared with every other user of the store."""
+        return self._store.text_lower(self.segment_index)
+
+    @property
+    def start_time(self) -> float:
+        return float(self._store.start_times[self.segment_index])
+
+    @property
+    def end_time(self) -> float:
+        return float(self._store.end_times[self.segment_index])
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.end_time - self.start_time
+
+    @property
+    def speaker(self) -> Optional[str]:
+        return self._store.speaker(self.segment_index)
+
+    @property
+    def word_count(self) -> int:
+        return int(self._store.word_counts[self.segment_index])
+
+    @property
+    def is_advertisement(self) -> bool:
+        return bool(self._store.is_advertisement[self.segment_index])
+
+    @is_advertisement.setter
+    def is_advertisement(self, value: bool) -> None:
+        self._store.is_advertisement[self.segment_index] = value
+
+    @property
+    def sentiment(self) -> Any:
+        return self._store.sentiments[self.segment_index]
+
+    @sentiment.setter
+    def sentiment(self, value: Any) -> None:
+        self._store.sentiments[self.segment_index] = value
+
+    # Dict-style access for code written against segment dictionaries
+
+    def __getitem__(self, key: str) -> Any:
+        key = _KEY_ALIASES.get(key, key)
+        if key not in _MAPPING_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of a segment field, or ``default`` if missing or None."""
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def keys(self) -> Tuple[str, ...]:
+        """Field names available through dict-style access."""
+        return _MAPPING_KEYS
+
+    def __contains__(self, key: str) -> bool:
+        return _KEY_ALIASES.get(key, key) in _MAPPING_KEYS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for Neo4j."""
+        return {
+            "id": self.id,
+            "text": self.text,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "speaker": self.speaker,
+            "episode_id": self.episode_id,
+            "segment_index": self.segment_index,
+            "is_advertisement": self.is_advertisement,
+            "word_count": self.word_count,
+            "duration_seconds": self.duration_seconds,
+            "content_hash": self.content_hash,
+            "embedding": embedding_to_list(self.embedding)
+        }
+
+    def __repr__(self) -> str:
+        return f"SegmentView(id={self.id!r}, start_time={self.start_time}, end_time={self.end_time})"
+
+
+def lower_text(segment: Any) -> str:
+    """Lower-cased text of a segment, shared across analyzers for store views."""
+    if isinstance(segment, SegmentView):
+        return segment.text_lower
+    return segment.text.lower()
@@ -45,7 +45,8 @@ class ProviderFactory:
         },
         'llm': {
             'gemini': 'src.providers.llm.gemini.GeminiProvider',
-            'mock': 'src.providers.llm.mock.MockLLMProvider'
+            'mock': 'src.providers.llm.mock.MockLLMProvider',
+            'router': 'src.providers.llm.router.LLMRouter'
         },
         'graph': {
             'neo4j': 'src.providers.graph.neo4j.Neo4jProvider',
@@ -174,7 +175,25 @@ class ProviderFactory:
                 except Exception as e:
                     logger.warning(f"Failed to load provider from config: {e}")
         
-        # 2. Check plugin discovery
+        # 2. Check registry
+        if provider_class is None and provider_name in cls._provider_registry.get(provider_type, {}):
+            provider_class = cls._provider_registry[provider_type][provider_name]
+            provider_source = 'registry'
+        
+        if provider_class is None and provider_type not in cls._default_providers:
+            raise ValueError(f"Invalid provider type: {provider_type}")
+        
+        # 3. Try default providers, importing only the requested module
+        if provider_class is None and provider_name in cls._default_providers[provider_type]:
+            module_path = cls._default_providers[provider_type][provider_name]
+            provider_class = cls._import_provider_class(module_path)
+            provider_source = 'default'
+            
+            # Cache in registry
+            cls.register_provider(provider_type, provider_name, provider_class)
+        
+        # 4. Check plugin discovery, which imports every provider module, only
+        # for names not registered by import path
         if provider_class is None:
             discovery = cls._get_plugin_discovery()
             plugin_class = discovery.get_plugin(provider_type, provider_name)
@@ -189,32 +208,14 @@ class ProviderFactory:
                     
                 logger.info(f"Loaded {provider_type} provider '{provider_name}' from plugin discovery")
         
-        # 3. Check registry
-        if provider_class is None and provider_name in cls._provider_registry.get(provider_type, {}):
-            provider_class = cls._provider_registry[provider_type][provider_name]
-            provider_source = 'registry'
-        
-        # 4. Try default providers
         if provider_class is None:
-            if provider_type not in cls._default_providers:
-                raise ValueError(f"Invalid provider type: {provider_type}")
-                
-            if provider_name not in cls._default_providers[provider_type]:
-                # Show migration warning if using deprecated name
-                cls._show_migration_warning(provider_type, provider_name)
-                
-                raise ValueError(
-                    f"Unknown {provider_type} provider: {provider_name}. "
-                    f"Available: {list(cls._default_providers[provider_type].keys())}"
-                )
-                
-            # Dynamic import
-            module_path = cls._default_providers[provider_type][provider_name]
-            provider_class = cls._import_provider_class(module_path)
-            provider_source = 'default'
+            # Show migration warning if using deprecated name
+            cls._show_migration_warning(provider_type, provider_name)
             
-            # Cache in registry
-            cls.register_provider(provider_type, provider_name, provider_class)
+            raise ValueError(
+                f"Unknown {provider_type} provider: {provider_name}. "
+                f"Available: {list(cls._default_providers[provider_type].keys())}"
+            )
             
         # Create instance
         try:
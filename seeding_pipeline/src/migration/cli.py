@@ -214,8 +214,9 @@ def migrate_schema(ctx, target_version, dry_run):
 @click.option("--dry-run", is_flag=True, help="Simulate migration without changes")
 @click.option("--batch-size", default=100, help="Number of items per batch")
 @click.option("--checkpoint-dir", default="migration_checkpoints", help="Checkpoint directory")
+@click.option("--workers", default=4, help="Number of independent labels migrated in parallel")
 @click.pass_context
-def migrate_data(ctx, dry_run, batch_size, checkpoint_dir):
+def migrate_data(ctx, dry_run, batch_size, checkpoint_dir, workers):
     """Migrate data from monolithic to modular system."""
     logger.info("Starting data migration")
     
@@ -226,7 +227,8 @@ def migrate_data(ctx, dry_run, batch_size, checkpoint_dir):
     migrator = DataMigrator(
         graph_provider,
         checkpoint_dir=Path(checkpoint_dir),
-        batch_size=batch_size
+        batch_size=batch_size,
+        max_workers=workers
     )
     
     # Check for existing checkpoint
@@ -7,6 +7,9 @@ system to the modular architecture.
 
 import logging
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -43,6 +46,7 @@ class MigrationProgress:
     end_time: Optional[datetime] = None
     status: MigrationStatus = MigrationStatus.PENDING
     errors: List[str] = field(default_factory=list)
+    last_id: Optional[str] = None
     
     @property
     def success_rate(self) -> float:
@@ -70,10 +74,24 @@ class MigrationProgress:
             "status": self.status.value,
             "success_rate": self.success_rate,
             "duration_seconds": self.duration_seconds,
-            "errors": self.errors[:10]  # Limit errors to prevent huge logs
+            "errors": self.errors[:10],  # Limit errors to prevent huge logs
+            "last_id": self.last_id
         }
 
 
+@dataclass(frozen=True)
+class LabelSpec:
+    """Describes how nodes of one label are paged and marked as migrated."""
+    key: str
+    label: str
+    variable: str
+    transform: Optional[str] = None
+    parent_match: Optional[str] = None
+    parent_expression: Optional[str] = None
+    parent_field: Optional[str] = None
+    skip_orphans: bool = False
+
+
 class DataMigrator:
     """
     Handles data migration from monolithic to modular system.
@@ -83,13 +101,49 @@ class DataMigrator:
     - Data transformation and validation
     - Progress tracking and resumability
     - Rollback capabilities
+    
+    Nodes are read with keyset pagination on ``id`` and written back with
+    one UNWIND query per page, so the cost of a migration grows linearly
+    with the number of nodes.
     """
     
+    LABEL_SPECS: Dict[str, LabelSpec] = {
+        "podcasts": LabelSpec("podcasts", "Podcast", "p", transform="_transform_podcast"),
+        "episodes": LabelSpec(
+            "episodes", "Episode", "e",
+            transform="_transform_episode",
+            parent_match="(p:Podcast)-[:HAS_EPISODE]->(e)",
+            parent_expression="p.id",
+            parent_field="podcast_id",
+            skip_orphans=True
+        ),
+        "segments": LabelSpec(
+            "segments", "Segment", "s",
+            transform="_transform_segment",
+            parent_match="(e:Episode)-[:HAS_SEGMENT]->(s)",
+            parent_expression="e.id",
+            parent_field="episode_id"
+        ),
+        "entities": LabelSpec("entities", "Entity", "n"),
+        "insights": LabelSpec("insights", "Insight", "n"),
+        "quotes": LabelSpec("quotes", "Quote", "n"),
+        "topics": LabelSpec("topics", "Topic", "n"),
+        "speakers": LabelSpec("speakers", "Speaker", "n"),
+    }
+    
+    # Labels in the same stage do not depend on each other and run in parallel
+    MIGRATION_STAGES: List[List[str]] = [
+        ["podcasts"],
+        ["episodes"],
+        ["segments", "entities", "insights", "quotes", "topics", "speakers"],
+    ]
+    
     def __init__(
         self,
         graph_provider: GraphProvider,
         checkpoint_dir: Path = Path("migration_checkpoints"),
-        batch_size: int = 100
+        batch_size: int = 100,
+        max_workers: int = 4
     ):
         """
         Initialize data migrator.
@@ -98,10 +152,14 @@ class DataMigrator:
             graph_provider: Graph database provider
             checkpoint_dir: Directory for migration checkpoints
             batch_size: Number of items to process in each batch
+            max_workers: Number of labels migrated concurrently within a stage
         """
         self.graph_provider = graph_provider
         self.checkpoint_dir = checkpoint_dir
         self.batch_size = batch_size
+        self.max_workers = max_workers
+        self._checkpoint_lock = threading.Lock()
+        self._active_progress: Optional[Dict[str, MigrationProgress]] = None
         # Removed CheckpointManager - using direct file operations
         
         # Create checkpoint directory
@@ -144,16 +202,12 @@ class DataMigrator:
         if checkpoint:
             progress = self._restore_progress(checkpoint)
         
+        self._active_progress = None if dry_run else progress
+        
         try:
-            # Migrate in dependency order
-            self._migrate_podcasts(progress["podcasts"], dry_run)
-            self._migrate_episodes(progress["episodes"], dry_run)
-            self._migrate_segments(progress["segments"], dry_run)
-            self._migrate_entities(progress["entities"], dry_run)
-            self._migrate_insights(progress["insights"], dry_run)
-            self._migrate_quotes(progress["quotes"], dry_run)
-            self._migrate_topics(progress["topics"], dry_run)
-            self._migrate_speakers(progress["speakers"], dry_run)
+            # Migrate in dependency order; labels within a stage are independent
+            for stage in self.MIGRATION_STAGES:
+                self._run_stage(stage, progress, dry_run)
             
             # Migrate relationships after all nodes
             self._migrate_relationships(dry_run)
@@ -164,263 +218,162 @@ class DataMigrator:
                 if p.status == MigrationStatus.IN_PROGRESS:
                     p.status = MigrationStatus.FAILED
                     p.errors.append(str(e))
+        finally:
+            self._active_progress = None
         
         # Save final checkpoint
         if not dry_run:
-            checkpoint_file = self.checkpoint_dir / "migration_progress.json"
-            try:
-                with open(checkpoint_file, 'w') as f:
-                    json.dump(self._save_progress(progress), f, indent=2)
-            except Exception as e:
-                logger.error(f"Failed to save checkpoint: {e}")
+            self._save_checkpoint(progress)
         
         return progress
     
-    def _migrate_podcasts(self, progress: MigrationProgress, dry_run: bool):
-        """Migrate podcast nodes."""
-        progress.status = MigrationStatus.IN_PROGRESS
-        progress.start_time = datetime.now()
+    def _run_stage(self, stage: List[str], progress: Dict[str, MigrationProgress], dry_run: bool):
+        """Migrate the labels of one stage, in parallel when there are several."""
+        if len(stage) == 1 or self.max_workers <= 1:
+            for key in stage:
+                self._migrate_label(self.LABEL_SPECS[key], progress[key], dry_run)
+            return
         
-        try:
-            # Count total podcasts
-            count_query = "MATCH (p:Podcast) RETURN count(p) as count"
-            result = self.graph_provider.execute_query(count_query)
-            progress.total_items = result[0]["count"] if result else 0
-            
-            logger.info(f"Migrating {progress.total_items} podcasts")
-            
-            # Process in batches
-            skip = 0
-            while skip < progress.total_items:
-                batch_query = """
-                MATCH (p:Podcast)
-                RETURN p
-                ORDER BY p.id
-                SKIP $skip
-                LIMIT $limit
-                """
-                
-                batch = self.graph_provider.execute_query(
-                    batch_query,
-                    {"skip": skip, "limit": self.batch_size}
-                )
-                
-                for record in batch:
-                    try:
-                        node = record["p"]
-                        
-                        # Validate and transform data
-                        podcast = self._transform_podcast(node)
-                        
-                        if not dry_run:
-                            # Add migration metadata
-                            update_query = """
-                            MATCH (p:Podcast {id: $id})
-                            SET p.migrated_at = datetime(),
-                                p.migration_version = '1.0.0'
-                            """
-                            
-                            self.graph_provider.execute_write(
-                                update_query,
-                                {"id": podcast.id}
-                            )
-                        
-                        progress.processed_items += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to migrate podcast: {e}")
-                        progress.failed_items += 1
-                        progress.errors.append(str(e))
-                
-                skip += self.batch_size
-                
-                # Save checkpoint
-                if not dry_run and progress.processed_items % 1000 == 0:
-                    checkpoint_file = self.checkpoint_dir / "migration_progress.json"
-                    try:
-                        with open(checkpoint_file, 'w') as f:
-                            json.dump({"podcasts": progress.to_dict()}, f, indent=2)
-                    except Exception as e:
-                        logger.error(f"Failed to save checkpoint: {e}")
-            
-            progress.status = MigrationStatus.COMPLETED
-            
-        except Exception as e:
-            progress.status = MigrationStatus.FAILED
-            progress.errors.append(str(e))
-            raise
+        errors = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stage))) as executor:
+            futures = {
+                executor.submit(self._migrate_label, self.LABEL_SPECS[key], progress[key], dry_run): key
+                for key in stage
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(f"{futures[future]}: {e}")
         
-        finally:
-            progress.end_time = datetime.now()
+        if errors:
+            raise PodcastProcessingError(f"Migration stage failed: {'; '.join(errors)}")
+    
+    def _migrate_podcasts(self, progress: MigrationProgress, dry_run: bool):
+        """Migrate podcast nodes."""
+        self._migrate_label(self.LABEL_SPECS["podcasts"], progress, dry_run)
     
     def _migrate_episodes(self, progress: MigrationProgress, dry_run: bool):
         """Migrate episode nodes."""
+        self._migrate_label(self.LABEL_SPECS["episodes"], progress, dry_run)
+    
+    def _migrate_segments(self, progress: MigrationProgress, dry_run: bool):
+        """Migrate segment nodes."""
+        self._migrate_label(self.LABEL_SPECS["segments"], progress, dry_run)
+    
+    def _migrate_entities(self, progress: MigrationProgress, dry_run: bool):
+        """Migrate entity nodes."""
+        self._migrate_label(self.LABEL_SPECS["entities"], progress, dry_run)
+    
+    def _migrate_insights(self, progress: MigrationProgress, dry_run: bool):
+        """Migrate insight nodes."""
+        self._migrate_label(self.LABEL_SPECS["insights"], progress, dry_run)
+    
+    def _migrate_quotes(self, progress: MigrationProgress, dry_run: bool):
+        """Migrate quote nodes."""
+        self._migrate_label(self.LABEL_SPECS["quotes"], progress, dry_run)
+    
+    def _migrate_topics(self, progress: MigrationProgress, dry_run: bool):
+        """Migrate topic nodes."""
+        self._migrate_label(self.LABEL_SPECS["topics"], progress, dry_run)
+    
+    def _migrate_speakers(self, progress: MigrationProgress, dry_run: bool):
+        """Migrate speaker nodes."""
+        self._migrate_label(self.LABEL_SPECS["speakers"], progress, dry_run)
+    
+    def _migrate_label(self, spec: LabelSpec, progress: MigrationProgress, dry_run: bool):
+        """
+        Migrate all nodes of one label using keyset pagination.
+        
+        Pages are fetched with ``WHERE n.id > $last_id ORDER BY n.id``, so
+        every page is an index seek rather than a SKIP over already-migrated
+        rows. Each page is written back with a single UNWIND query and only
+        once that write succeeds is the page's last id checkpointed, so an
+        interrupted or failed run resumes at the first unwritten page.
+        
+        Args:
+            spec: Label description
+            progress: Progress record for this label
+            dry_run: If True, only read and validate nodes
+        """
+        if progress.status == MigrationStatus.COMPLETED:
+            logger.info(f"Skipping {spec.key}: already migrated")
+            return
+        
         progress.status = MigrationStatus.IN_PROGRESS
         progress.start_time = datetime.now()
+        v = spec.variable
         
         try:
-            # Count total episodes
-            count_query = "MATCH (e:Episode) RETURN count(e) as count"
+            # Count total nodes
+            count_query = f"MATCH ({v}:{spec.label}) RETURN count({v}) as count"
             result = self.graph_provider.execute_query(count_query)
             progress.total_items = result[0]["count"] if result else 0
             
-            logger.info(f"Migrating {progress.total_items} episodes")
+            logger.info(
+                f"Migrating {progress.total_items} {spec.key}"
+                + (f" (resuming after id {progress.last_id!r})" if progress.last_id else "")
+            )
             
-            # Process in batches
-            skip = 0
-            while skip < progress.total_items:
-                batch_query = """
-                MATCH (e:Episode)
-                OPTIONAL MATCH (p:Podcast)-[:HAS_EPISODE]->(e)
-                RETURN e, p.id as podcast_id
-                ORDER BY e.id
-                SKIP $skip
-                LIMIT $limit
-                """
-                
+            batch_query = self._build_batch_query(spec)
+            update_query = self._build_update_query(spec)
+            
+            while True:
                 batch = self.graph_provider.execute_query(
                     batch_query,
-                    {"skip": skip, "limit": self.batch_size}
+                    {"last_id": progress.last_id or "", "limit": self.batch_size}
                 )
+                if not batch:
+                    break
                 
+                rows = []
+                page_last_id = progress.last_id
                 for record in batch:
                     try:
-                        node = record["e"]
-                        podcast_id = record.get("podcast_id")
+                        node = record[v]
+                        page_last_id = node.get("id", page_last_id)
                         
                         # Validate and transform data
-                        episode = self._transform_episode(node)
-                        
-                        # Check for orphaned episodes
-                        if not podcast_id:
-                            logger.warning(f"Orphaned episode found: {episode.id}")
-                            progress.skipped_items += 1
-                            continue
+                        item_id = getattr(self, spec.transform)(node).id if spec.transform else node.get("id")
+                        row = {"id": item_id}
                         
-                        if not dry_run:
-                            # Add migration metadata
-                            update_query = """
-                            MATCH (e:Episode {id: $id})
-                            SET e.migrated_at = datetime(),
-                                e.migration_version = '1.0.0',
-                                e.podcast_id = $podcast_id
-                            """
-                            
-                            self.graph_provider.execute_write(
-                                update_query,
-                                {"id": episode.id, "podcast_id": podcast_id}
-                            )
+                        if spec.parent_field:
+                            parent_id = record.get(spec.parent_field)
+                            # Check for orphaned nodes
+                            if not parent_id and spec.skip_orphans:
+                                logger.warning(f"Orphaned {spec.label.lower()} found: {item_id}")
+                                progress.skipped_items += 1
+                                continue
+                            row[spec.parent_field] = parent_id
                         
-                        progress.processed_items += 1
+                        rows.append(row)
                         
                     except Exception as e:
-                        logger.error(f"Failed to migrate episode: {e}")
+                        logger.error(f"Failed to migrate {spec.label.lower()}: {e}")
                         progress.failed_items += 1
                         progress.errors.append(str(e))
                 
-                skip += self.batch_size
-                
-                # Save checkpoint periodically
-                if not dry_run and progress.processed_items % 1000 == 0:
-                    checkpoint_file = self.checkpoint_dir / "migration_progress.json"
+                if rows and not dry_run:
                     try:
-                        with open(checkpoint_file, 'w') as f:
-                            json.dump({"episodes": progress.to_dict()}, f, indent=2)
+                        # One write per page instead of one per node
+                        self.graph_provider.execute_write(update_query, {"rows": rows})
                     except Exception as e:
-                        logger.error(f"Failed to save checkpoint: {e}")
-            
-            progress.status = MigrationStatus.COMPLETED
-            
-        except Exception as e:
-            progress.status = MigrationStatus.FAILED
-            progress.errors.append(str(e))
-            raise
-        
-        finally:
-            progress.end_time = datetime.now()
-    
-    def _migrate_segments(self, progress: MigrationProgress, dry_run: bool):
-        """Migrate segment nodes."""
-        progress.status = MigrationStatus.IN_PROGRESS
-        progress.start_time = datetime.now()
-        
-        try:
-            # Count total segments
-            count_query = "MATCH (s:Segment) RETURN count(s) as count"
-            result = self.graph_provider.execute_query(count_query)
-            progress.total_items = result[0]["count"] if result else 0
-            
-            logger.info(f"Migrating {progress.total_items} segments")
-            
-            # Process in batches
-            skip = 0
-            while skip < progress.total_items:
-                batch_query = """
-                MATCH (s:Segment)
-                OPTIONAL MATCH (e:Episode)-[:HAS_SEGMENT]->(s)
-                RETURN s, e.id as episode_id
-                ORDER BY s.id
-                SKIP $skip
-                LIMIT $limit
-                """
+                        # Keep last_id on the previous page so a resume retries this one
+                        logger.error(f"Failed to write {spec.key} batch after id {progress.last_id!r}: {e}")
+                        progress.failed_items += len(rows)
+                        raise PodcastProcessingError(
+                            f"Failed to write {spec.key} batch: {e}"
+                        ) from e
                 
-                batch = self.graph_provider.execute_query(
-                    batch_query,
-                    {"skip": skip, "limit": self.batch_size}
-                )
+                progress.last_id = page_last_id
+                progress.processed_items += len(rows)
                 
-                for record in batch:
-                    try:
-                        node = record["s"]
-                        episode_id = record.get("episode_id")
-                        
-                        # Transform segment
-                        segment = self._transform_segment(node)
-                        
-                        if episode_id:
-                            segment.episode_id = episode_id
-                        
-                        if not dry_run:
-                            # Add migration metadata
-                            update_query = """
-                            MATCH (s:Segment {id: $id})
-                            SET s.migrated_at = datetime(),
-                                s.migration_version = '1.0.0',
-                                s.episode_id = $episode_id
-                            """
-                            
-                            self.graph_provider.execute_write(
-                                update_query,
-                                {"id": segment.id, "episode_id": episode_id}
-                            )
-                        
-                        progress.processed_items += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to migrate segment: {e}")
-                        progress.failed_items += 1
-                        progress.errors.append(str(e))
+                if not dry_run:
+                    self._save_checkpoint()
                 
-                skip += self.batch_size
-            
-            progress.status = MigrationStatus.COMPLETED
+                if len(batch) < self.batch_size:
+                    break
             
-        except Exception as e:
-            progress.status = MigrationStatus.FAILED
-            progress.errors.append(str(e))
-            raise
-        
-        finally:
-            progress.end_time = datetime.now()
-    
-    def _migrate_entities(self, progress: MigrationProgress, dry_run: bool):
-        """Migrate entity nodes."""
-        progress.status = MigrationStatus.IN_PROGRESS
-        progress.start_time = datetime.now()
-        
-        try:
-            # Implementation similar to other node types
-            # Count, batch process, transform, update
             progress.status = MigrationStatus.COMPLETED
             
         except Exception as e:
@@ -431,25 +384,55 @@ class DataMigrator:
         finally:
             progress.end_time = datetime.now()
     
-    def _migrate_insights(self, progress: MigrationProgress, dry_run: bool):
-        """Migrate insight nodes."""
-        # Similar implementation
-        pass
-    
-    def _migrate_quotes(self, progress: MigrationProgress, dry_run: bool):
-        """Migrate quote nodes."""
-        # Similar implementation
-        pass
+    def _build_batch_query(self, spec: LabelSpec) -> str:
+        """Build the keyset-paginated read query for a label."""
+        v = spec.variable
+        if not spec.parent_match:
+            return f"""
+            MATCH ({v}:{spec.label})
+            WHERE {v}.id > $last_id
+            RETURN {v}
+            ORDER BY {v}.id
+            LIMIT $limit
+            """
+        # Limit before the optional match so a page never grows past batch_size
+        return f"""
+        MATCH ({v}:{spec.label})
+        WHERE {v}.id > $last_id
+        WITH {v}
+        ORDER BY {v}.id
+        LIMIT $limit
+        OPTIONAL MATCH {spec.parent_match}
+        RETURN {v}, {spec.parent_expression} as {spec.parent_field}
+        ORDER BY {v}.id
+        """
     
-    def _migrate_topics(self, progress: MigrationProgress, dry_run: bool):
-        """Migrate topic nodes."""
-        # Similar implementation
-        pass
+    def _build_update_query(self, spec: LabelSpec) -> str:
+        """Build the UNWIND write query that marks one page as migrated."""
+        v = spec.variable
+        extra = f",\n                {v}.{spec.parent_field} = row.{spec.parent_field}" if spec.parent_field else ""
+        return f"""
+            UNWIND $rows AS row
+            MATCH ({v}:{spec.label} {{id: row.id}})
+            SET {v}.migrated_at = datetime(),
+                {v}.migration_version = '1.0.0'{extra}
+            """
     
-    def _migrate_speakers(self, progress: MigrationProgress, dry_run: bool):
-        """Migrate speaker nodes."""
-        # Similar implementation
-        pass
+    def _save_checkpoint(self, progress: Optional[Dict[str, MigrationProgress]] = None) -> None:
+        """Persist migration progress atomically (defaults to the running migration)."""
+        progress = progress or self._active_progress
+        if progress is None:
+            return
+        
+        checkpoint_file = self.checkpoint_dir / "migration_progress.json"
+        with self._checkpoint_lock:
+            try:
+                tmp_file = checkpoint_file.with_suffix(".json.tmp")
+                with open(tmp_file, 'w') as f:
+                    json.dump(self._save_progress(progress), f, indent=2)
+                os.replace(tmp_file, checkpoint_file)
+            except Exception as e:
+                logger.error(f"Failed to save checkpoint: {e}")
     
     def _migrate_relationships(self, dry_run: bool):
         """Migrate relationships after all nodes are migrated."""
@@ -512,6 +495,7 @@ class DataMigrator:
                 p.skipped_items = data.get("skipped_items", 0)
                 p.status = MigrationStatus(data.get("status", "pending"))
                 p.errors = data.get("errors", [])
+                p.last_id = data.get("last_id")
                 progress[key] = p
             else:
                 progress[key] = MigrationProgress()
@@ -2,10 +2,101 @@
 
 import re
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Dict, Any, List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Patterns shared by every translator instance, compiled once at import
+FIXED_LABELS = ('Entity', 'Quote', 'Segment', 'Episode', 'Podcast', 'Insight', 'Topic', 'Speaker')
+FIXED_SCHEMA_PATTERN = re.compile(r'\b(?:' + '|'.join(FIXED_LABELS) + r')\b')
+NODE_PATTERN = re.compile(r'\((\w+):(\w+)(?:\s*{[^}]*})?\)')
+RELATIONSHIP_PATTERN = re.compile(r'-\[:(\w+)\]-')
+COUNT_DISTINCT_PATTERN = re.compile(r'COUNT\(DISTINCT\s+(\w+)\)')
+WHERE_LABEL_PATTERN = re.compile(r'WHERE\s+(\w+):(\w+)')
+
+
+def is_fixed_schema_query(cypher: str) -> bool:
+    """Check if a query references fixed schema labels."""
+    return FIXED_SCHEMA_PATTERN.search(cypher) is not None
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """Result of translating a query once, reusable for every later call."""
+    original: str
+    translated: str
+    is_fixed_schema: bool
+
+
+class TranslationCache:
+    """
+    Thread-safe bounded LRU of compiled query translations keyed by query text.
+    
+    Parameterized queries repeat verbatim, so translating each distinct text
+    once and replaying the result removes the regex passes from the hot path.
+    """
+    
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize cache.
+        
+        Args:
+            max_size: Maximum number of translations kept
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, CompiledQuery]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, query: str) -> Optional[CompiledQuery]:
+        """Return the cached translation for a query, if any."""
+        with self._lock:
+            compiled = self._entries.get(query)
+            if compiled is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(query)
+            self.hits += 1
+            return compiled
+    
+    def put(self, compiled: CompiledQuery) -> None:
+        """Store a translation, evicting the least recently used entry when full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[compiled.original] = compiled
+            self._entries.move_to_end(compiled.original)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop all cached translations."""
+        with self._lock:
+            self._entries.clear()
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate
+        }
+
 
 class QueryTranslator:
     """
@@ -60,6 +151,36 @@ class QueryTranslator:
         
         # Common query patterns
         self.query_patterns = self._build_query_patterns()
+        
+        # Pre-compiled property patterns for _translate_properties
+        self._property_patterns = self._compile_property_patterns()
+    
+    def _compile_property_patterns(self) -> List[Tuple[Any, Any, str]]:
+        """Compile the per-property regexes once instead of on every translation."""
+        return [
+            (
+                re.compile(rf'\b{old_prop}\b(?=\s*[=:<>])'),
+                re.compile(rf'\.{old_prop}\b'),
+                new_prop
+            )
+            for old_prop, new_prop in self.property_mappings.items()
+            if old_prop != new_prop
+        ]
+    
+    def compile(self, cypher_query: str) -> CompiledQuery:
+        """
+        Translate a query if it uses the fixed schema.
+        
+        Args:
+            cypher_query: Original query
+            
+        Returns:
+            Compiled translation that can be cached and replayed
+        """
+        if is_fixed_schema_query(cypher_query):
+            translated = self.translate_fixed_to_schemaless(cypher_query)
+            return CompiledQuery(cypher_query, translated, True)
+        return CompiledQuery(cypher_query, cypher_query, False)
     
     def translate_fixed_to_schemaless(self, cypher_query: str) -> str:
         """
@@ -91,8 +212,6 @@ class QueryTranslator:
     def _translate_node_labels(self, query: str) -> str:
         """Replace node labels with Node label and property filters."""
         # Pattern to match node patterns like (n:Entity) or (p:Podcast)
-        node_pattern = r'\((\w+):(\w+)(?:\s*{[^}]*})?\)'
-        
         def replace_node(match):
             var_name = match.group(1)
             label = match.group(2)
@@ -114,27 +233,18 @@ class QueryTranslator:
                 logger.warning(f"Unknown node label in query: {label}")
                 return match.group(0)
         
-        return re.sub(node_pattern, replace_node, query)
+        return NODE_PATTERN.sub(replace_node, query)
     
     def _translate_properties(self, query: str) -> str:
         """Translate property names from fixed to schemaless."""
         translated = query
         
         # Replace property names in various contexts
-        for old_prop, new_prop in self.property_mappings.items():
-            if old_prop != new_prop:
-                # Property in WHERE clause or SET clause
-                translated = re.sub(
-                    rf'\b{old_prop}\b(?=\s*[=:<>])',
-                    new_prop,
-                    translated
-                )
-                # Property in RETURN clause
-                translated = re.sub(
-                    rf'\.{old_prop}\b',
-                    f'.{new_prop}',
-                    translated
-                )
+        for clause_pattern, return_pattern, new_prop in self._property_patterns:
+            # Property in WHERE clause or SET clause
+            translated = clause_pattern.sub(new_prop, translated)
+            # Property in RETURN clause
+            translated = return_pattern.sub(f'.{new_prop}', translated)
         
         return translated
     
@@ -144,8 +254,6 @@ class QueryTranslator:
         # with actual type in _type property
         
         # Pattern to match relationships like -[:KNOWS]->
-        rel_pattern = r'-\[:(\w+)\]-'
-        
         def replace_rel(match):
             rel_type = match.group(1)
             if rel_type in self.relationship_mappings:
@@ -155,24 +263,16 @@ class QueryTranslator:
                 logger.warning(f"Unknown relationship type: {rel_type}")
                 return f'-[:RELATIONSHIP {{_type: "{rel_type}"}}]-'
         
-        return re.sub(rel_pattern, replace_rel, query)
+        return RELATIONSHIP_PATTERN.sub(replace_rel, query)
     
     def _handle_special_patterns(self, query: str) -> str:
         """Handle special query patterns that need custom translation."""
         # Handle COUNT(DISTINCT n) patterns
-        query = re.sub(
-            r'COUNT\(DISTINCT\s+(\w+)\)',
-            r'COUNT(DISTINCT \1.id)',
-            query
-        )
+        query = COUNT_DISTINCT_PATTERN.sub(r'COUNT(DISTINCT \1.id)', query)
         
         # Handle node type checks in WHERE clauses
         # e.g., WHERE n:Entity -> WHERE n._type = 'Entity'
-        query = re.sub(
-            r'WHERE\s+(\w+):(\w+)',
-            r'WHERE \1._type = "\2"',
-            query
-        )
+        query = WHERE_LABEL_PATTERN.sub(r'WHERE \1._type = "\2"', query)
         
         return query
     
@@ -1,13 +1,26 @@
 """Result standardization for schemaless to fixed schema conversion."""
 
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, List, NamedTuple, Optional, Tuple, Union
 from datetime import datetime
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
 
+class PropertyRule(NamedTuple):
+    """One output property of a standardization plan."""
+    key: str
+    sources: Tuple[str, ...]
+    default: Any = None
+    default_factory: Optional[Callable[[], Any]] = None
+    optional: bool = False
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat()
+
+
 class ResultStandardizer:
     """
     Standardizes schemaless query results to match expected fixed schema format.
@@ -48,7 +61,112 @@ class ResultStandardizer:
         # Track schema evolution
         self.discovered_types = set()
         self.discovered_properties = defaultdict(set)
+        self._known_keys = defaultdict(lambda: {'id', '_type'})
         self.evolution_log = []
+        
+        # Per-type property plans, resolved once from the mappings above
+        self.build_plans()
+    
+    def build_plans(self) -> None:
+        """
+        Precompute the per-type property plans.
+        
+        Each plan lists, for every output property, the source keys to try in
+        order and the default to use, so a row is standardized with one dict
+        lookup per candidate key. Call again after changing
+        ``property_mappings`` or ``default_values``.
+        """
+        mapped = self._mapped_rule
+        self._plans: Dict[str, List[PropertyRule]] = {
+            'Entity': [
+                PropertyRule('name', ('name',), ''),
+                PropertyRule('type', ('entity_type', '_entity_type'), 'UNKNOWN'),
+                PropertyRule('description', ('description',)),
+                mapped('confidence', 'confidence'),
+                mapped('importance', 'importance_score', 'importance'),
+                mapped('first_mentioned', 'first_mentioned_at', 'first_mentioned'),
+                mapped('mention_count', 'total_mentions', 'mention_count'),
+                PropertyRule('bridge_score', ('bridge_score',), self.default_values['bridge_score']),
+                mapped('is_peripheral', 'is_peripheral_node', 'is_peripheral'),
+                mapped('embedding', 'vector_embedding', 'embedding', optional=True),
+            ],
+            'Quote': [
+                mapped('text', 'quote_text', 'text'),
+                mapped('speaker', 'attributed_to', 'speaker'),
+                PropertyRule('context', ('surrounding_context', 'context')),
+                PropertyRule('quote_type', ('quote_category', 'quote_type'), 'general'),
+                PropertyRule('timestamp', ('spoken_at', 'timestamp')),
+                PropertyRule('segment_id', ('source_segment', 'segment_id')),
+                mapped('importance', 'quote_importance', 'importance_score'),
+            ],
+            'Segment': [
+                PropertyRule('text', ('text',), ''),
+                PropertyRule('start_time', ('start_time',), 0.0),
+                PropertyRule('end_time', ('end_time',), 0.0),
+                mapped('speaker', 'speaker_name', 'speaker'),
+                mapped('confidence', 'transcription_confidence', 'confidence'),
+                PropertyRule('sentiment', ('sentiment_score', 'sentiment'), self.default_values['sentiment']),
+                PropertyRule('complexity_score', ('text_complexity', 'complexity_score'),
+                             self.default_values['complexity_score']),
+                PropertyRule('is_advertisement', ('is_ad_content', 'is_advertisement'), False),
+                mapped('embedding', 'segment_embedding', 'embedding', optional=True),
+            ],
+            'Episode': [
+                PropertyRule('title', ('title',), ''),
+                PropertyRule('description', ('description',)),
+                PropertyRule('audio_url', ('audio_url',)),
+                PropertyRule('publication_date', ('publication_date',)),
+                PropertyRule('duration', ('duration',)),
+                PropertyRule('episode_number', ('episode_number',)),
+                PropertyRule('season_number', ('season_number',)),
+                PropertyRule('processed_timestamp', ('processed_timestamp',), default_factory=_now_iso),
+            ],
+            'Podcast': [
+                PropertyRule('title', ('title', 'name'), ''),
+                PropertyRule('description', ('description',)),
+                PropertyRule('rss_url', ('rss_url', 'feed_url')),
+                PropertyRule('website', ('website',)),
+                PropertyRule('author', ('author',)),
+                PropertyRule('categories', ('categories',), default_factory=list),
+                PropertyRule('language', ('language',)),
+                PropertyRule('created_at', ('created_at',), default_factory=_now_iso),
+            ],
+        }
+        
+        # Reverse lookup used by generic mapping (first match wins)
+        self._reverse_mappings: Dict[str, str] = {}
+        for new_prop, old_prop in self.property_mappings.items():
+            self._reverse_mappings.setdefault(old_prop, new_prop)
+    
+    def _mapped_rule(self, key: str, *property_names: str, optional: bool = False) -> PropertyRule:
+        """Resolve the lookup order of ``_get_mapped_property`` into a rule."""
+        sources = list(property_names)
+        for prop_name in property_names:
+            mapped_name = self.property_mappings.get(prop_name)
+            if mapped_name and mapped_name not in sources:
+                sources.append(mapped_name)
+        
+        default = next(
+            (self.default_values[name] for name in property_names if name in self.default_values),
+            None
+        )
+        return PropertyRule(key, tuple(sources), default, optional=optional)
+    
+    def _apply_plan(self, node: Dict[str, Any], plan: List[PropertyRule]) -> Dict[str, Any]:
+        """Standardize one node with a precomputed plan in a single pass."""
+        props = {}
+        for rule in plan:
+            for source in rule.sources:
+                if source in node:
+                    value = node[source]
+                    break
+            else:
+                value = rule.default_factory() if rule.default_factory else rule.default
+            
+            if rule.optional and not value:
+                continue
+            props[rule.key] = value
+        return props
     
     def standardize_results(self, results: List[Dict[str, Any]], expected_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -101,110 +219,52 @@ class ResultStandardizer:
         }
         
         # Map properties based on node type
-        if node_type == 'Entity':
-            standardized.update(self._standardize_entity_properties(node))
-        elif node_type == 'Quote':
-            standardized.update(self._standardize_quote_properties(node))
-        elif node_type == 'Segment':
-            standardized.update(self._standardize_segment_properties(node))
-        elif node_type == 'Episode':
-            standardized.update(self._standardize_episode_properties(node))
-        elif node_type == 'Podcast':
-            standardized.update(self._standardize_podcast_properties(node))
+        plan = self._plans.get(node_type)
+        if plan is not None:
+            standardized.update(self._apply_plan(node, plan))
+            if node_type == 'Segment':
+                self._add_segment_duration(node, standardized)
         else:
             # Generic property mapping
             standardized.update(self._map_properties(node))
         
-        # Track discovered properties
-        for prop in node.keys():
-            if prop not in ['id', '_type'] and prop not in self.discovered_properties[node_type]:
-                self.discovered_properties[node_type].add(prop)
-                self._log_evolution('new_property', f"{node_type}.{prop}")
+        # Track discovered properties (fast path when nothing is new)
+        known = self._known_keys[node_type]
+        if not known.issuperset(node.keys()):
+            for prop in node.keys():
+                if prop not in known:
+                    known.add(prop)
+                    self.discovered_properties[node_type].add(prop)
+                    self._log_evolution('new_property', f"{node_type}.{prop}")
         
         return standardized
     
     def _standardize_entity_properties(self, node: Dict[str, Any]) -> Dict[str, Any]:
         """Standardize entity-specific properties."""
-        props = {
-            'name': node.get('name', ''),
-            'type': node.get('entity_type', node.get('_entity_type', 'UNKNOWN')),
-            'description': node.get('description'),
-            'confidence': self._get_mapped_property(node, 'confidence'),
-            'importance': self._get_mapped_property(node, 'importance_score', 'importance'),
-            'first_mentioned': self._get_mapped_property(node, 'first_mentioned_at', 'first_mentioned'),
-            'mention_count': self._get_mapped_property(node, 'total_mentions', 'mention_count'),
-            'bridge_score': node.get('bridge_score', self.default_values['bridge_score']),
-            'is_peripheral': self._get_mapped_property(node, 'is_peripheral_node', 'is_peripheral')
-        }
-        
-        # Add embedding if present
-        embedding = self._get_mapped_property(node, 'vector_embedding', 'embedding')
-        if embedding:
-            props['embedding'] = embedding
-            
-        return props
+        return self._apply_plan(node, self._plans['Entity'])
     
     def _standardize_quote_properties(self, node: Dict[str, Any]) -> Dict[str, Any]:
         """Standardize quote-specific properties."""
-        return {
-            'text': self._get_mapped_property(node, 'quote_text', 'text'),
-            'speaker': self._get_mapped_property(node, 'attributed_to', 'speaker'),
-            'context': node.get('surrounding_context', node.get('context')),
-            'quote_type': node.get('quote_category', node.get('quote_type', 'general')),
-            'timestamp': node.get('spoken_at', node.get('timestamp')),
-            'segment_id': node.get('source_segment', node.get('segment_id')),
-            'importance': self._get_mapped_property(node, 'quote_importance', 'importance_score')
-        }
+        return self._apply_plan(node, self._plans['Quote'])
     
     def _standardize_segment_properties(self, node: Dict[str, Any]) -> Dict[str, Any]:
         """Standardize segment-specific properties."""
-        props = {
-            'text': node.get('text', ''),
-            'start_time': node.get('start_time', 0.0),
-            'end_time': node.get('end_time', 0.0),
-            'speaker': self._get_mapped_property(node, 'speaker_name', 'speaker'),
-            'confidence': self._get_mapped_property(node, 'transcription_confidence', 'confidence'),
-            'sentiment': node.get('sentiment_score', node.get('sentiment', self.default_values['sentiment'])),
-            'complexity_score': node.get('text_complexity', node.get('complexity_score', self.default_values['complexity_score'])),
-            'is_advertisement': node.get('is_ad_content', node.get('is_advertisement', False))
-        }
-        
-        # Add duration if not present
+        props = self._apply_plan(node, self._plans['Segment'])
+        self._add_segment_duration(node, props)
+        return props
+    
+    def _add_segment_duration(self, node: Dict[str, Any], props: Dict[str, Any]) -> None:
+        """Add duration if not present."""
         if 'duration' not in node and props['end_time'] > props['start_time']:
             props['duration'] = props['end_time'] - props['start_time']
-        
-        # Add embedding if present
-        embedding = self._get_mapped_property(node, 'segment_embedding', 'embedding')
-        if embedding:
-            props['embedding'] = embedding
-            
-        return props
     
     def _standardize_episode_properties(self, node: Dict[str, Any]) -> Dict[str, Any]:
         """Standardize episode-specific properties."""
-        return {
-            'title': node.get('title', ''),
-            'description': node.get('description'),
-            'audio_url': node.get('audio_url'),
-            'publication_date': node.get('publication_date'),
-            'duration': node.get('duration'),
-            'episode_number': node.get('episode_number'),
-            'season_number': node.get('season_number'),
-            'processed_timestamp': node.get('processed_timestamp', datetime.now().isoformat())
-        }
+        return self._apply_plan(node, self._plans['Episode'])
     
     def _standardize_podcast_properties(self, node: Dict[str, Any]) -> Dict[str, Any]:
         """Standardize podcast-specific properties."""
-        return {
-            'title': node.get('title', node.get('name', '')),
-            'description': node.get('description'),
-            'rss_url': node.get('rss_url', node.get('feed_url')),
-            'website': node.get('website'),
-            'author': node.get('author'),
-            'categories': node.get('categories', []),
-            'language': node.get('language'),
-            'created_at': node.get('created_at', datetime.now().isoformat())
-        }
+        return self._apply_plan(node, self._plans['Podcast'])
     
     def _standardize_relationship(self, rel: Dict[str, Any]) -> Dict[str, Any]:
         """Standardize a relationship."""
@@ -266,18 +326,12 @@ class ResultStandardizer:
             # Check if we have a mapping
             if key in self.property_mappings:
                 mapped[self.property_mappings[key]] = value
-            else:
+            elif key in self._reverse_mappings:
                 # Check reverse mapping
-                reverse_mapped = False
-                for new_prop, old_prop in self.property_mappings.items():
-                    if old_prop == key:
-                        mapped[new_prop] = value
-                        reverse_mapped = True
-                        break
-                
-                if not reverse_mapped:
-                    # Keep original property
-                    mapped[key] = value
+                mapped[self._reverse_mappings[key]] = value
+            else:
+                # Keep original property
+                mapped[key] = value
         
         return mapped
     
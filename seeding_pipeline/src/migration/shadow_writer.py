@@ -0,0 +1,215 @@
+"""Background shadow writes to the secondary store during migration mode."""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.retry import ExponentialBackoff
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ShadowWrite:
+    """A write to replay on the secondary store."""
+    operation: str
+    func: Callable[[], Any]
+    primary_result: Any = None
+    compare: bool = False
+    enqueued_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class Divergence:
+    """A secondary write that could not be applied or disagreed with the primary."""
+    operation: str
+    reason: str
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'operation': self.operation,
+            'reason': self.reason,
+            'timestamp': self.timestamp
+        }
+
+
+class ShadowWriteQueue:
+    """
+    Bounded queue that applies secondary-store writes on a background thread.
+
+    The primary store is written synchronously by the caller; the same
+    operation is then enqueued here and replayed with retries. Writes that
+    still fail, are dropped because the queue stayed full, or return a
+    different id than the primary are recorded as divergences.
+    """
+
+    def __init__(self,
+                 max_size: int = 1000,
+                 max_retries: int = 3,
+                 retry_base_delay: float = 2.0,
+                 max_retry_delay: float = 30.0,
+                 enqueue_timeout: float = 5.0,
+                 max_divergences: int = 1000):
+        """
+        Initialize shadow write queue.
+
+        Args:
+            max_size: Maximum pending writes before enqueue blocks
+            max_retries: Retries per write after the first attempt
+            retry_base_delay: Base for exponential backoff between retries
+            max_retry_delay: Maximum delay between retries in seconds
+            enqueue_timeout: Seconds to wait for space before dropping a write
+            max_divergences: Number of divergence records retained
+        """
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.max_retry_delay = max_retry_delay
+        self.enqueue_timeout = enqueue_timeout
+
+        self._queue: "queue.Queue[Optional[ShadowWrite]]" = queue.Queue(maxsize=max_size)
+        self._divergences: deque = deque(maxlen=max_divergences)
+        self._lock = threading.Lock()
+        self._stats = {
+            'enqueued': 0,
+            'applied': 0,
+            'retried': 0,
+            'failed': 0,
+            'dropped': 0,
+            'mismatched': 0
+        }
+        self._worker: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self) -> None:
+        """Start the background worker."""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._worker = threading.Thread(
+                target=self._run, name="shadow-write-worker", daemon=True
+            )
+            self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Drain pending writes and stop the worker."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self._queue.put(None)
+        if self._worker:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def submit(self, operation: str, func: Callable[[], Any],
+               primary_result: Any = None, compare: bool = False) -> bool:
+        """
+        Enqueue a secondary write.
+
+        Args:
+            operation: Description used in logs and divergence reports
+            func: Callable performing the secondary write
+            primary_result: Result returned by the primary write
+            compare: Whether to report a divergence if results differ
+
+        Returns:
+            True if the write was queued, False if it was dropped
+        """
+        if not self._running:
+            self.start()
+
+        write = ShadowWrite(operation, func, primary_result, compare)
+        try:
+            self._queue.put(write, timeout=self.enqueue_timeout)
+        except queue.Full:
+            self._record_divergence(operation, "dropped: shadow write queue full", 'dropped')
+            return False
+
+        with self._lock:
+            self._stats['enqueued'] += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued writes have been applied or given up on.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _run(self) -> None:
+        """Worker loop."""
+        while True:
+            write = self._queue.get()
+            try:
+                if write is None:
+                    return
+                self._apply(write)
+            finally:
+                self._queue.task_done()
+
+    def _apply(self, write: ShadowWrite) -> None:
+        """Apply one write with retries."""
+        backoff = ExponentialBackoff(base=self.retry_base_delay, max_delay=self.max_retry_delay)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = write.func()
+            except Exception as e:
+                if attempt < self.max_retries:
+                    with self._lock:
+                        self._stats['retried'] += 1
+                    delay = backoff.get_next_delay()
+                    logger.warning(f"Shadow write {write.operation} failed (attempt {attempt + 1}), "
+                                   f"retrying in {delay:.1f}s: {e}")
+                    time.sleep(delay)
+                    continue
+                self._record_divergence(write.operation, f"failed: {e}", 'failed')
+                return
+
+            with self._lock:
+                self._stats['applied'] += 1
+            if write.compare and result != write.primary_result:
+                self._record_divergence(
+                    write.operation,
+                    f"result mismatch: primary={write.primary_result}, secondary={result}",
+                    'mismatched'
+                )
+            return
+
+    def _record_divergence(self, operation: str, reason: str, stat: str) -> None:
+        """Record a divergence between primary and secondary stores."""
+        logger.warning(f"Dual write divergence in {operation}: {reason}")
+        with self._lock:
+            self._stats[stat] += 1
+            self._divergences.append(Divergence(operation, reason))
+
+    def get_divergences(self) -> List[Dict[str, Any]]:
+        """Get recorded divergences, oldest first."""
+        with self._lock:
+            return [d.to_dict() for d in self._divergences]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['pending'] = self._queue.qsize()
+        stats['running'] = self._running
+        return stats
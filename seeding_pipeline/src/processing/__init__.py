@@ -1,8 +1,21 @@
 """Processing modules for podcast knowledge pipeline."""
 
-from .segmentation import EnhancedPodcastSegmenter, SegmentMetadata
-from .strategies import ExtractionStrategy, ExtractedData
-from .strategies.extraction_factory import ExtractionFactory
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .segmentation import EnhancedPodcastSegmenter, SegmentMetadata
+    from .strategies import ExtractionStrategy, ExtractedData
+    from .strategies.extraction_factory import ExtractionFactory
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'EnhancedPodcastSegmenter': '.segmentation',
+    'SegmentMetadata': '.segmentation',
+    'ExtractionStrategy': '.strategies',
+    'ExtractedData': '.strategies',
+    'ExtractionFactory': '.strategies.extraction_factory',
+})
 
 __all__ = [
     "EnhancedPodcastSegmenter",
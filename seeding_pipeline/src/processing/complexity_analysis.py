@@ -1,15 +1,21 @@
 """
 Advanced complexity analysis functionality
 """
-import re
 import logging
 from typing import Dict, Any, List, Optional, Tuple, Set
 from dataclasses import dataclass
-from statistics import mean, stdev
+from statistics import mean
 from collections import Counter
 import math
 
+import numpy as np
+
 from src.core.models import Entity, Insight, Quote, ComplexityLevel, EntityType
+from src.processing.text_statistics import (
+    TextStatisticsEngine,
+    count_syllables,
+    get_text_statistics_engine
+)
 
 
 logger = logging.getLogger(__name__)
@@ -55,8 +61,16 @@ class EpisodeComplexity:
 class ComplexityAnalyzer:
     """Advanced complexity analysis for podcast content"""
     
-    def __init__(self):
-        """Initialize complexity analyzer"""
+    def __init__(self, text_statistics: Optional[TextStatisticsEngine] = None):
+        """
+        Initialize complexity analyzer
+        
+        Args:
+            text_statistics: Engine for tokenization and word statistics,
+                shared with other analyzers by default
+        """
+        self.text_statistics = text_statistics or get_text_statistics_engine()
+        
         # Common technical terms in various domains
         self.technical_terms = {
             'medical': {
@@ -83,9 +97,7 @@ class ComplexityAnalyzer:
         }
         
         # Flatten all technical terms
-        self.all_technical_terms = set()
-        for domain_terms in self.technical_terms.values():
-            self.all_technical_terms.update(domain_terms)
+        self.all_technical_terms = frozenset().union(*self.technical_terms.values())
     
     def analyze_vocabulary_complexity(
         self, 
@@ -102,21 +114,9 @@ class ComplexityAnalyzer:
         Returns:
             VocabularyMetrics with detailed analysis
         """
-        if not text:
-            return VocabularyMetrics(
-                unique_word_count=0,
-                total_word_count=0,
-                vocabulary_richness=0.0,
-                avg_word_length=0.0,
-                technical_term_count=0,
-                technical_density=0.0,
-                syllable_complexity=0.0,
-                lexical_diversity=0.0
-            )
-        
-        # Tokenize and clean text
-        words = re.findall(r'\b[a-z]+\b', text.lower())
-        if not words:
+        stats = self.text_statistics.analyze(text)
+        total_words = len(stats.words)
+        if total_words == 0:
             return VocabularyMetrics(
                 unique_word_count=0,
                 total_word_count=0,
@@ -129,45 +129,35 @@ class ComplexityAnalyzer:
             )
         
         # Basic metrics
-        total_words = len(words)
-        unique_words = set(words)
-        unique_count = len(unique_words)
+        unique_count = len(stats.word_counts)
         
         # Vocabulary richness (unique/total ratio)
-        vocabulary_richness = unique_count / total_words if total_words > 0 else 0
+        vocabulary_richness = unique_count / total_words
         
         # Average word length
-        avg_word_length = mean(len(word) for word in words) if words else 0
-        
-        # Technical term detection
-        technical_terms_to_check = self.all_technical_terms.copy()
+        avg_word_length = stats.word_length_total / total_words
         
-        # Add domain-specific terms if hints provided
+        # Technical term detection; domain terms are part of all_technical_terms,
+        # hints only matter for domains added after initialization
+        technical_terms_to_check = self.all_technical_terms
         if domain_hints:
+            extra_terms = set()
             for domain in domain_hints:
-                if domain.lower() in self.technical_terms:
-                    technical_terms_to_check.update(self.technical_terms[domain.lower()])
+                extra_terms.update(self.technical_terms.get(domain.lower(), ()))
+            if not extra_terms <= technical_terms_to_check:
+                technical_terms_to_check = technical_terms_to_check | extra_terms
         
-        # Count technical terms
-        technical_count = sum(1 for word in words if word in technical_terms_to_check)
-        technical_density = technical_count / total_words if total_words > 0 else 0
+        technical_count = stats.count_terms(technical_terms_to_check)
+        technical_density = technical_count / total_words
         
         # Syllable complexity (approximation)
-        total_syllables = sum(self._count_syllables(word) for word in words)
-        avg_syllables = total_syllables / total_words if total_words > 0 else 0
+        avg_syllables = stats.word_syllables / total_words
         syllable_complexity = avg_syllables / 3.0  # Normalize to 0-1 range
         
-        # Lexical diversity (Type-Token Ratio with adjustment for text length)
-        # Using Moving Average Type-Token Ratio (MATTR) approximation
-        if total_words > 50:
-            # Sample windows for diversity calculation
-            window_size = 50
-            diversities = []
-            for i in range(0, total_words - window_size + 1, 10):
-                window = words[i:i + window_size]
-                diversities.append(len(set(window)) / window_size)
-            lexical_diversity = mean(diversities) if diversities else vocabulary_richness
-        else:
+        # Lexical diversity: Moving Average Type-Token Ratio over 50-word
+        # windows; every 10th window keeps scores comparable with earlier runs
+        lexical_diversity = stats.lexical_diversity(window=50, step=10)
+        if lexical_diversity is None:
             lexical_diversity = vocabulary_richness
         
         return VocabularyMetrics(
@@ -183,24 +173,7 @@ class ComplexityAnalyzer:
     
     def _count_syllables(self, word: str) -> int:
         """Count syllables in a word (approximation)"""
-        word = word.lower()
-        syllables = 0
-        vowels = "aeiouy"
-        
-        # Count vowel groups
-        prev_was_vowel = False
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_was_vowel:
-                syllables += 1
-            prev_was_vowel = is_vowel
-        
-        # Adjust for silent e
-        if word.endswith("e") and syllables > 1:
-            syllables -= 1
-        
-        # Minimum of 1 syllable
-        return max(1, syllables)
+        return count_syllables(word)
     
     def classify_segment_complexity(
         self,
@@ -224,18 +197,12 @@ class ComplexityAnalyzer:
             vocab_metrics = self.analyze_vocabulary_complexity(text)
         
         # Count sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        sentence_count = len(sentences)
+        stats = self.text_statistics.analyze(text)
+        sentence_count = len(stats.sentences)
         
         # Average sentence length
-        words_per_sentence = []
-        for sentence in sentences:
-            words = re.findall(r'\b\w+\b', sentence)
-            if words:
-                words_per_sentence.append(len(words))
-        
-        avg_sentence_length = mean(words_per_sentence) if words_per_sentence else 0
+        words_per_sentence = [count for count in stats.sentence_word_counts if count]
+        avg_sentence_length = sum(words_per_sentence) / len(words_per_sentence) if words_per_sentence else 0
         
         # Count technical entities
         technical_entity_count = 0
@@ -340,13 +307,18 @@ class ComplexityAnalyzer:
                 segment_complexities=[]
             )
         
-        # Calculate average complexity score
-        scores = [seg.complexity_score for seg in segment_complexities]
-        avg_complexity = mean(scores)
+        # Gather per-segment values once and aggregate them as arrays
+        values = np.array(
+            [(seg.complexity_score, seg.vocabulary_metrics.technical_density)
+             for seg in segment_complexities],
+            dtype=np.float64
+        )
+        scores = values[:, 0]
+        avg_complexity = float(scores.mean())
         
         # Calculate variance
         if len(scores) > 1:
-            variance = stdev(scores) ** 2
+            variance = float(scores.var(ddof=1))
         else:
             variance = 0.0
         
@@ -361,9 +333,7 @@ class ComplexityAnalyzer:
             dominant_level = ComplexityLevel.MODERATE
         
         # Average technical density
-        tech_densities = [seg.vocabulary_metrics.technical_density 
-                         for seg in segment_complexities]
-        avg_technical_density = mean(tech_densities) if tech_densities else 0.0
+        avg_technical_density = float(values[:, 1].mean())
         
         return EpisodeComplexity(
             average_complexity=avg_complexity,
@@ -394,8 +364,7 @@ class ComplexityAnalyzer:
             Dictionary of density metrics
         """
         # Word count
-        words = re.findall(r'\b\w+\b', text)
-        word_count = len(words)
+        word_count = self.text_statistics.analyze(text).word_run_count
         
         if word_count == 0:
             return {
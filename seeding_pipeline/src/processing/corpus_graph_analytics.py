@@ -0,0 +1,447 @@
+"""
+Corpus-wide graph analytics over the whole knowledge graph.
+
+GraphAnalyzer works on the entities of one episode. This job analyzes the
+entity graph of the entire corpus so bridge concepts and communities that
+span podcasts become visible:
+
+1. Entities are read with keyset pagination on ``id`` and numbered in id
+   order (``nodes.jsonl``).
+2. Relationships between entities are read one id range at a time and
+   appended to ``edges.bin``, a compact (int32, int32, float32) edge list
+   that is memory-mapped for the analysis.
+3. PageRank, pivot-sampled betweenness and Louvain communities run on a CSR
+   matrix built from the edge list; scores are kept in ``scores.npz``.
+4. Scores are written back to the entities with one UNWIND query per batch.
+
+Progress is checkpointed after every page and batch in ``state.json``, so an
+interrupted run resumes where it stopped.
+"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.exceptions import PodcastProcessingError
+from src.processing.graph_analysis import StructuralGap
+from src.processing.sparse_graph import SparseGraph
+from src.utils.lazy_imports import LazyImport
+
+sparse = LazyImport('scipy.sparse')
+
+
+logger = logging.getLogger(__name__)
+
+# One edge on disk: node positions and weight
+EDGE_DTYPE = np.dtype([('source', '<i4'), ('target', '<i4'), ('weight', '<f4')])
+
+
+class AnalyticsStage(Enum):
+    """Stages of a corpus analytics run, in order."""
+    EXPORT_NODES = "export_nodes"
+    EXPORT_EDGES = "export_edges"
+    ANALYZE = "analyze"
+    WRITE_BACK = "write_back"
+    COMPLETED = "completed"
+
+
+@dataclass
+class CorpusAnalyticsProgress:
+    """Checkpointed progress of a corpus analytics run."""
+    stage: AnalyticsStage = AnalyticsStage.EXPORT_NODES
+    node_count: int = 0
+    last_node_id: Optional[str] = None
+    nodes_bytes: int = 0
+    edge_position: int = 0
+    edge_count: int = 0
+    dropped_edges: int = 0
+    written_count: int = 0
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    summary: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        data = asdict(self)
+        data['stage'] = self.stage.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CorpusAnalyticsProgress':
+        """Restore from a checkpoint dictionary."""
+        data = dict(data)
+        data['stage'] = AnalyticsStage(data.get('stage', AnalyticsStage.EXPORT_NODES.value))
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+class CorpusGraphAnalytics:
+    """
+    Resumable batch job computing graph analytics for the whole corpus.
+
+    Memory is bounded by the compact edge list and the CSR matrix built from
+    it: no per-edge Python objects are kept, and betweenness processes
+    sources in memory-bounded batches.
+    """
+
+    def __init__(
+        self,
+        graph_provider,
+        work_dir: Path = Path("graph_analytics"),
+        page_size: int = 10000,
+        write_batch_size: int = 1000,
+        betweenness_pivots: int = 256,
+        resolution: float = 1.0,
+        relationship_types: Optional[Sequence[str]] = None,
+        seed: Optional[int] = 0
+    ):
+        """
+        Initialize the job.
+
+        Args:
+            graph_provider: Graph database provider
+            work_dir: Directory for the exported graph, scores and checkpoint
+            page_size: Entities per read page
+            write_batch_size: Entities per UNWIND write
+            betweenness_pivots: Sampled sources for betweenness (0 for exact)
+            resolution: Louvain resolution
+            relationship_types: Entity relationship types to include (default: all)
+            seed: Seed for pivot sampling and Louvain
+        """
+        self.graph_provider = graph_provider
+        self.work_dir = Path(work_dir)
+        self.page_size = page_size
+        self.write_batch_size = write_batch_size
+        self.betweenness_pivots = betweenness_pivots or None
+        self.resolution = resolution
+        self.relationship_types = list(relationship_types or [])
+        self.seed = seed
+
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.state_file = self.work_dir / "state.json"
+        self.nodes_file = self.work_dir / "nodes.jsonl"
+        self.edges_file = self.work_dir / "edges.bin"
+        self.scores_file = self.work_dir / "scores.npz"
+
+    def run(self, restart: bool = False) -> CorpusAnalyticsProgress:
+        """
+        Run the job, resuming from the checkpoint unless ``restart`` is set.
+
+        Args:
+            restart: Discard previous progress and export the graph again
+
+        Returns:
+            Final progress, with the analysis summary
+        """
+        progress = CorpusAnalyticsProgress() if restart else self.load_progress()
+        if progress.stage == AnalyticsStage.COMPLETED:
+            logger.info("Corpus analytics already completed; use restart to run again")
+            return progress
+        if progress.start_time is None:
+            progress.start_time = datetime.now().isoformat()
+
+        stages = [
+            (AnalyticsStage.EXPORT_NODES, self._export_nodes, AnalyticsStage.EXPORT_EDGES),
+            (AnalyticsStage.EXPORT_EDGES, self._export_edges, AnalyticsStage.ANALYZE),
+            (AnalyticsStage.ANALYZE, self._analyze, AnalyticsStage.WRITE_BACK),
+            (AnalyticsStage.WRITE_BACK, self._write_back, AnalyticsStage.COMPLETED),
+        ]
+        for stage, step, next_stage in stages:
+            if progress.stage != stage:
+                continue
+            logger.info(f"Corpus analytics: {stage.value}")
+            step(progress)
+            progress.stage = next_stage
+            self._save_progress(progress)
+
+        progress.end_time = datetime.now().isoformat()
+        self._save_progress(progress)
+        return progress
+
+    def load_progress(self) -> CorpusAnalyticsProgress:
+        """Load the checkpoint, or start fresh if there is none."""
+        if not self.state_file.exists():
+            return CorpusAnalyticsProgress()
+        try:
+            with open(self.state_file, 'r') as f:
+                progress = CorpusAnalyticsProgress.from_dict(json.load(f))
+            logger.info(f"Resuming corpus analytics at stage {progress.stage.value}")
+            return progress
+        except Exception as e:
+            logger.warning(f"Failed to load checkpoint, starting over: {e}")
+            return CorpusAnalyticsProgress()
+
+    def _save_progress(self, progress: CorpusAnalyticsProgress) -> None:
+        """Persist progress atomically."""
+        tmp_file = self.state_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(progress.to_dict(), f, indent=2)
+        os.replace(tmp_file, self.state_file)
+
+    def _export_nodes(self, progress: CorpusAnalyticsProgress) -> None:
+        """Page through entities in id order and number them."""
+        query = """
+        MATCH (e:Entity)
+        WHERE e.id > $last_id
+        RETURN e.id AS id, e.name AS name
+        ORDER BY e.id
+        LIMIT $limit
+        """
+        # Drop lines appended after the last checkpoint
+        with open(self.nodes_file, 'ab') as f:
+            f.truncate(progress.nodes_bytes)
+
+        while True:
+            page = self.graph_provider.query(
+                query, {"last_id": progress.last_node_id or "", "limit": self.page_size}
+            )
+            if not page:
+                break
+
+            lines = ''.join(json.dumps([row["id"], row.get("name")]) + '\n' for row in page)
+            with open(self.nodes_file, 'ab') as f:
+                f.write(lines.encode('utf-8'))
+                progress.nodes_bytes = f.tell()
+            progress.node_count += len(page)
+            progress.last_node_id = page[-1]["id"]
+            self._save_progress(progress)
+
+            if len(page) < self.page_size:
+                break
+
+        logger.info(f"Exported {progress.node_count} entities")
+
+    def _export_edges(self, progress: CorpusAnalyticsProgress) -> None:
+        """Read the relationships of one id range of entities per page."""
+        node_ids, _ = self._load_nodes()
+        index = {node_id: position for position, node_id in enumerate(node_ids)}
+        rel_pattern = f"[r:{'|'.join(self.relationship_types)}]" if self.relationship_types else "[r]"
+        # Every relationship is returned once, from its endpoint with the smaller id
+        query = f"""
+        MATCH (a:Entity)-{rel_pattern}-(b:Entity)
+        WHERE a.id > $after_id AND a.id <= $until_id AND a.id < b.id
+        RETURN a.id AS source, b.id AS target, coalesce(r.weight, 1.0) AS weight
+        """
+
+        # Drop edges appended after the last checkpoint
+        with open(self.edges_file, 'ab') as f:
+            f.truncate(progress.edge_count * EDGE_DTYPE.itemsize)
+
+        for start in range(progress.edge_position, len(node_ids), self.page_size):
+            end = min(start + self.page_size, len(node_ids))
+            rows = self.graph_provider.query(query, {
+                "after_id": node_ids[start - 1] if start else "",
+                "until_id": node_ids[end - 1]
+            })
+
+            edges = np.empty(len(rows), dtype=EDGE_DTYPE)
+            kept = 0
+            for row in rows:
+                source = index.get(row["source"])
+                target = index.get(row["target"])
+                if source is None or target is None:
+                    # Entity created after the node export
+                    progress.dropped_edges += 1
+                    continue
+                edges[kept] = (source, target, row["weight"])
+                kept += 1
+
+            with open(self.edges_file, 'ab') as f:
+                f.write(edges[:kept].tobytes())
+            progress.edge_count += kept
+            progress.edge_position = end
+            self._save_progress(progress)
+
+        logger.info(f"Exported {progress.edge_count} relationships "
+                    f"({progress.dropped_edges} to unknown entities dropped)")
+
+    def _analyze(self, progress: CorpusAnalyticsProgress) -> None:
+        """Compute scores on the exported graph and save them with a summary."""
+        node_ids, names = self._load_nodes()
+        edges = self._load_edges(progress)
+        graph = SparseGraph.from_arrays(node_ids, edges['source'], edges['target'], edges['weight'])
+        n = graph.number_of_nodes
+        logger.info(f"Analyzing corpus graph: {n} entities, {graph.number_of_edges} edges")
+
+        pagerank = np.fromiter(graph.pagerank().values(), dtype=np.float64, count=n)
+        # Hop counts: weights of different relationship types are not comparable lengths
+        betweenness = np.fromiter(
+            graph.betweenness_centrality(pivots=self.betweenness_pivots, weighted=False,
+                                         seed=self.seed).values(),
+            dtype=np.float64, count=n
+        )
+        communities = graph.louvain_communities(resolution=self.resolution, seed=self.seed)
+        community = np.empty(n, dtype=np.int64)
+        for label, members in enumerate(communities):
+            community[[graph.index[node_id] for node_id in members]] = label
+        bridged = self._bridged_communities(graph, community)
+
+        tmp_file = self.scores_file.with_suffix(".tmp.npz")
+        np.savez(tmp_file, pagerank=pagerank, betweenness=betweenness,
+                 community=community, bridged_communities=bridged)
+        os.replace(tmp_file, self.scores_file)
+
+        progress.summary = {
+            'entities': n,
+            'edges': graph.number_of_edges,
+            'communities': len(communities),
+            'modularity': graph.modularity(communities, resolution=self.resolution) if n else 0.0,
+            'largest_communities': [len(members) for members in communities[:10]],
+            'bridge_concepts': self._top_entities(node_ids, names, betweenness, pagerank,
+                                                  community, bridged),
+            'structural_gaps': [asdict(gap) for gap in self._structural_gaps(
+                graph, community, names, pagerank
+            )]
+        }
+
+    def _write_back(self, progress: CorpusAnalyticsProgress) -> None:
+        """Write scores to the entities in UNWIND batches."""
+        node_ids, _ = self._load_nodes()
+        with np.load(self.scores_file) as scores:
+            pagerank = scores['pagerank']
+            betweenness = scores['betweenness']
+            community = scores['community']
+            bridged = scores['bridged_communities']
+
+        query = """
+        UNWIND $rows AS row
+        MATCH (e:Entity {id: row.id})
+        SET e.corpus_pagerank = row.pagerank,
+            e.corpus_betweenness = row.betweenness,
+            e.corpus_community = row.community,
+            e.corpus_bridged_communities = row.bridged_communities,
+            e.corpus_analyzed_at = datetime()
+        """
+        for start in range(progress.written_count, len(node_ids), self.write_batch_size):
+            end = min(start + self.write_batch_size, len(node_ids))
+            rows = [
+                {
+                    'id': node_ids[i],
+                    'pagerank': float(pagerank[i]),
+                    'betweenness': float(betweenness[i]),
+                    'community': int(community[i]),
+                    'bridged_communities': int(bridged[i])
+                }
+                for i in range(start, end)
+            ]
+            try:
+                self.graph_provider.query(query, {"rows": rows})
+            except Exception as e:
+                raise PodcastProcessingError(
+                    f"Failed to write corpus analytics for entities {start}-{end}: {e}"
+                ) from e
+            progress.written_count = end
+            self._save_progress(progress)
+
+        logger.info(f"Wrote corpus analytics to {progress.written_count} entities")
+
+    def _load_nodes(self) -> Tuple[List[str], List[Optional[str]]]:
+        """Entity ids and names in position order."""
+        node_ids, names = [], []
+        if self.nodes_file.exists():
+            with open(self.nodes_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    node_id, name = json.loads(line)
+                    node_ids.append(node_id)
+                    names.append(name)
+        return node_ids, names
+
+    def _load_edges(self, progress: CorpusAnalyticsProgress) -> np.ndarray:
+        """Memory-map the exported edge list."""
+        if progress.edge_count == 0:
+            return np.empty(0, dtype=EDGE_DTYPE)
+        return np.memmap(self.edges_file, dtype=EDGE_DTYPE, mode='r', shape=(progress.edge_count,))
+
+    @staticmethod
+    def _bridged_communities(graph: SparseGraph, community: np.ndarray) -> np.ndarray:
+        """Number of communities each entity's neighbours belong to, its own excluded."""
+        n = graph.number_of_nodes
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+        adjacency = graph.adjacency.tocoo()
+        neighbour_community = community[adjacency.col]
+        other = neighbour_community != community[adjacency.row]
+        pairs = np.unique(adjacency.row[other].astype(np.int64) * (community.max() + 1)
+                          + neighbour_community[other])
+        return np.bincount(pairs // (community.max() + 1), minlength=n)
+
+    @staticmethod
+    def _top_entities(node_ids: List[str], names: List[Optional[str]], betweenness: np.ndarray,
+                      pagerank: np.ndarray, community: np.ndarray, bridged: np.ndarray,
+                      limit: int = 20) -> List[Dict[str, Any]]:
+        """Entities with the highest betweenness, i.e. the strongest bridges."""
+        top = np.argsort(-betweenness, kind='stable')[:limit]
+        return [
+            {
+                'id': node_ids[i],
+                'name': names[i],
+                'betweenness': float(betweenness[i]),
+                'pagerank': float(pagerank[i]),
+                'community': int(community[i]),
+                'bridged_communities': int(bridged[i])
+            }
+            for i in top
+        ]
+
+    @staticmethod
+    def _structural_gaps(graph: SparseGraph, community: np.ndarray, names: List[Optional[str]],
+                         pagerank: np.ndarray, max_communities: int = 20,
+                         limit: int = 10) -> List[StructuralGap]:
+        """
+        Pairs of large communities with far fewer links than expected.
+
+        The expected number of links between two communities is that of a
+        random graph with the same degrees, ``d1 * d2 / 2m``.
+        """
+        n = graph.number_of_nodes
+        if n == 0 or graph.number_of_edges == 0:
+            return []
+
+        links = graph.adjacency.copy()
+        links.data[:] = 1.0
+        num_communities = int(community.max()) + 1
+        membership = sparse.csr_matrix((np.ones(n), (np.arange(n), community)),
+                                       shape=(n, num_communities))
+        between = (membership.T @ links @ membership).toarray()
+        degree = between.sum(axis=1)
+        degree_sum = degree.sum()
+
+        sizes = np.bincount(community, minlength=num_communities)
+        candidates = [c for c in np.argsort(-sizes, kind='stable')[:max_communities] if sizes[c] > 1]
+        representatives = {
+            label: CorpusGraphAnalytics._representatives(community, label, names, pagerank)
+            for label in candidates
+        }
+
+        gaps = []
+        for position, first in enumerate(candidates):
+            for second in candidates[position + 1:]:
+                expected = degree[first] * degree[second] / degree_sum
+                if expected <= 0:
+                    continue
+                connections = int(between[first, second])
+                gaps.append(StructuralGap(
+                    community_1=int(first),
+                    community_2=int(second),
+                    connection_count=connections,
+                    representative_concepts_1=representatives[first],
+                    representative_concepts_2=representatives[second],
+                    gap_score=float(max(0.0, 1 - connections / expected))
+                ))
+
+        gaps.sort(key=lambda gap: gap.gap_score, reverse=True)
+        return gaps[:limit]
+
+    @staticmethod
+    def _representatives(community: np.ndarray, label: int, names: List[Optional[str]],
+                         pagerank: np.ndarray, count: int = 3) -> List[str]:
+        """Names of the highest-PageRank members of a community."""
+        members = np.flatnonzero(community == label)
+        top = members[np.argsort(-pagerank[members], kind='stable')[:count]]
+        return [names[i] or '' for i in top]
@@ -6,11 +6,13 @@ identifying introduction points, development arcs, and resolution patterns.
 """
 
 import logging
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Union
 from collections import defaultdict
 import numpy as np
 
 from src.core.models import Entity, Insight, Segment
+from src.core.segment_store import lower_text
+from src.processing.text_markers import DISCOURSE_TRANSITION, markers_for
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +50,7 @@ class DiscourseFlowTracker:
             entity_name_lower = entity.name.lower()
             
             for segment_idx, segment in enumerate(segments):
-                segment_text_lower = segment.text.lower()
+                segment_text_lower = lower_text(segment)
                 
                 # Check if entity is mentioned in this segment
                 if entity_name_lower in segment_text_lower:
@@ -189,7 +191,7 @@ class DiscourseFlowTracker:
         if mention_types.count("callback") > 1:
             return "recurring-theme"
         
-        if all(t["mention_type"] == "development" for t in mention_types[1:-1]):
+        if all(t == "development" for t in mention_types[1:-1]):
             return "introduce-develop-integrate"
         
         return "fragmented"
@@ -515,7 +517,7 @@ class DiscourseFlowTracker:
         solution_count_late = 0
         
         for i, segment in enumerate(segments):
-            text_lower = segment.text.lower()
+            text_lower = lower_text(segment)
             if i < first_third:
                 problem_count_early += sum(1 for kw in problem_keywords if kw in text_lower)
             if i >= last_third:
@@ -569,7 +571,7 @@ class DiscourseFlowTracker:
         contrast_segments = []
         
         for i, segment in enumerate(segments):
-            text_lower = segment.text.lower()
+            text_lower = lower_text(segment)
             segment_contrasts = sum(1 for kw in contrast_keywords if kw in text_lower)
             if segment_contrasts > 0:
                 contrast_count += segment_contrasts
@@ -742,7 +744,7 @@ class DiscourseFlowTracker:
                 # Look for explicit transition markers
                 if i + 1 < len(segments):
                     transition["explicit_marker"] = self._find_transition_marker(
-                        segments[i + 1].text
+                        segments[i + 1]
                     )
                 
                 transitions.append(transition)
@@ -779,20 +781,9 @@ class DiscourseFlowTracker:
         
         return overlap / total if total > 0 else 0.0
     
-    def _find_transition_marker(self, text: str) -> Optional[str]:
-        """Find explicit transition markers in text."""
-        transition_markers = [
-            "speaking of which", "on that note", "similarly", "however",
-            "moving on", "furthermore", "in addition", "consequently",
-            "therefore", "as a result", "in contrast", "meanwhile"
-        ]
-        
-        text_lower = text.lower()
-        for marker in transition_markers:
-            if marker in text_lower:
-                return marker
-        
-        return None
+    def _find_transition_marker(self, segment: Union[Segment, str]) -> Optional[str]:
+        """Find explicit transition markers in a segment or text."""
+        return markers_for(segment).first(DISCOURSE_TRANSITION)
     
     def generate_flow_visualization_data(
         self,
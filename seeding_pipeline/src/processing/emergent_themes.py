@@ -4,16 +4,27 @@ import logging
 from typing import List, Dict, Any, Optional, Set, Tuple
 from collections import defaultdict, Counter
 import numpy as np
-import networkx as nx
-from scipy.spatial.distance import cosine
 
 from src.core.models import Entity, Insight, Segment
+from src.core.embeddings import as_embedding, embedding_matrix, has_embedding
+from src.core.segment_store import lower_text
 from src.providers.llm.base import LLMProvider
 from src.providers.embeddings.base import EmbeddingProvider
+from src.providers.embeddings.cache import get_embedding_cache
+from src.processing.sparse_graph import SparseGraph
+from src.processing.text_markers import (
+    ACKNOWLEDGMENT,
+    METAPHOR_FAMILIES,
+    markers_for,
+    metaphor_category,
+)
+from src.utils.lazy_imports import LazyImport
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+cosine = LazyImport('scipy.spatial.distance', 'cosine')
+
 
 class EmergentThemeDetector:
     """
@@ -31,7 +42,7 @@ class EmergentThemeDetector:
             embedding_provider: Provider for generating embeddings
             llm_provider: Provider for generating field descriptions
         """
-        self.embedding_provider = embedding_provider
+        self.embedding_provider = get_embedding_cache(embedding_provider)
         self.llm_provider = llm_provider
     
     def analyze_concept_clusters(
@@ -53,35 +64,31 @@ class EmergentThemeDetector:
             return []
         
         # Build co-occurrence graph
-        G = nx.Graph()
-        
-        # Add nodes
-        for entity in entities:
-            G.add_node(entity.id, entity=entity)
-        
-        # Add edges from co-occurrences
-        for co_occ in co_occurrences:
-            entity1_id = co_occ.get("entity1_id")
-            entity2_id = co_occ.get("entity2_id")
-            weight = co_occ.get("weight", 1.0)
-            
-            if entity1_id and entity2_id and entity1_id in G and entity2_id in G:
-                G.add_edge(entity1_id, entity2_id, weight=weight)
+        entities_by_id = {entity.id: entity for entity in entities}
+        graph = SparseGraph.from_edges(
+            [{'id': entity.id} for entity in entities],
+            (
+                (co_occ.get("entity1_id"), co_occ.get("entity2_id"), co_occ.get("weight", 1.0))
+                for co_occ in co_occurrences
+                if co_occ.get("entity1_id") and co_occ.get("entity2_id")
+            )
+        )
         
         # Apply community detection at multiple resolutions
         clusters = []
         resolutions = [0.5, 1.0, 1.5]  # Different granularity levels
+        components_added = False
         
         for resolution in resolutions:
             try:
                 # Use Louvain community detection
                 import community as community_louvain
-                partition = community_louvain.best_partition(G, resolution=resolution)
+                partition = community_louvain.best_partition(graph.to_networkx(), resolution=resolution)
                 
                 # Group entities by community
                 communities = defaultdict(list)
                 for node_id, comm_id in partition.items():
-                    entity = G.nodes[node_id]["entity"]
+                    entity = entities_by_id[node_id]
                     communities[f"res_{resolution}_comm_{comm_id}"].append(entity)
                 
                 # Calculate cluster coherence and filter
@@ -99,10 +106,13 @@ class EmergentThemeDetector:
                             "resolution": resolution
                         })
             except:
-                # Fallback to connected components if community detection fails
-                components = nx.connected_components(G)
-                for i, component in enumerate(components):
-                    cluster_entities = [G.nodes[node_id]["entity"] for node_id in component]
+                # Fallback to connected components if community detection fails;
+                # they do not depend on the resolution, so add them once
+                if components_added:
+                    continue
+                components_added = True
+                for i, component in enumerate(graph.connected_components()):
+                    cluster_entities = [entities_by_id[node_id] for node_id in component]
                     if len(cluster_entities) >= 2:
                         clusters.append({
                             "cluster_id": f"component_{i}",
@@ -122,23 +132,19 @@ class EmergentThemeDetector:
         if not entities or not self.embedding_provider:
             return 0.5
         
-        # Get embeddings
-        embeddings = []
-        for entity in entities:
-            if hasattr(entity, 'embedding') and entity.embedding:
-                embeddings.append(np.array(entity.embedding))
+        # Get embeddings as one matrix
+        embeddings = embedding_matrix(entity.embedding for entity in entities if has_embedding(entity))
         
         if len(embeddings) < 2:
             return 0.5
         
-        # Calculate average pairwise similarity
-        similarities = []
-        for i in range(len(embeddings)):
-            for j in range(i + 1, len(embeddings)):
-                sim = 1 - cosine(embeddings[i], embeddings[j])
-                similarities.append(sim)
+        # Average pairwise cosine similarity from one matrix product
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        normalized = embeddings / np.where(norms == 0, 1, norms)
+        similarities = normalized @ normalized.T
+        upper = np.triu_indices(len(embeddings), k=1)
         
-        return np.mean(similarities) if similarities else 0.5
+        return float(np.mean(similarities[upper]))
     
     def _deduplicate_clusters(self, clusters: List[Dict]) -> List[Dict]:
         """Remove duplicate clusters based on entity overlap."""
@@ -186,8 +192,8 @@ class EmergentThemeDetector:
             embeddings = []
             entity_names = []
             for entity in cluster_entities:
-                if hasattr(entity, 'embedding') and entity.embedding:
-                    embeddings.append(np.array(entity.embedding))
+                if has_embedding(entity):
+                    embeddings.append(as_embedding(entity.embedding))
                     entity_names.append(entity.name)
             
             if not embeddings:
@@ -628,31 +634,19 @@ Semantic field:"""
         """
         metaphorical_themes = []
         
-        # Common metaphor families
-        metaphor_families = {
-            "journey": ["path", "road", "journey", "destination", "milestone", "crossroads"],
-            "war": ["battle", "fight", "combat", "victory", "defeat", "strategy", "weapon"],
-            "growth": ["grow", "seed", "bloom", "flourish", "root", "branch", "fertile"],
-            "building": ["foundation", "build", "construct", "architect", "structure", "pillar"],
-            "game": ["play", "rules", "win", "lose", "score", "team", "compete"],
-            "machine": ["engine", "gear", "mechanism", "fuel", "drive", "operate"],
-            "ecosystem": ["ecosystem", "environment", "evolve", "adapt", "balance", "symbiosis"]
-        }
-        
         # Count metaphor occurrences
         metaphor_counts = defaultdict(list)
         
         for segment in segments:
-            text_lower = segment.text.lower()
+            markers = markers_for(segment)
             
-            for family, keywords in metaphor_families.items():
-                for keyword in keywords:
-                    if keyword in text_lower:
-                        metaphor_counts[family].append({
-                            "segment_index": segment.segment_index,
-                            "keyword": keyword,
-                            "context": segment.text[:100]  # First 100 chars for context
-                        })
+            for family in METAPHOR_FAMILIES:
+                for keyword in markers.found(metaphor_category(family)):
+                    metaphor_counts[family].append({
+                        "segment_index": segment.segment_index,
+                        "keyword": keyword,
+                        "context": segment.text[:100]  # First 100 chars for context
+                    })
         
         # Analyze significant metaphor families
         for family, occurrences in metaphor_counts.items():
@@ -690,7 +684,7 @@ Semantic field:"""
             
             # Check which segments mention this entity
             for i, segment in enumerate(segments):
-                if entity.name.lower() in segment.text.lower():
+                if entity.name.lower() in lower_text(segment):
                     entity_segments.add(i)
             
             # Calculate overlap with metaphor segments
@@ -768,7 +762,7 @@ Semantic field:"""
         key_concepts = theme.get("key_concepts", [])
         
         for i, segment in enumerate(segments):
-            segment_lower = segment.text.lower()
+            segment_lower = lower_text(segment)
             
             # Check if any key concepts appear
             for concept in key_concepts:
@@ -788,7 +782,7 @@ Semantic field:"""
         key_concepts = theme.get("key_concepts", [])
         
         for segment in segments:
-            segment_lower = segment.text.lower()
+            segment_lower = lower_text(segment)
             
             # Count concept mentions
             mention_count = sum(1 for concept in key_concepts 
@@ -814,7 +808,7 @@ Semantic field:"""
         key_concepts = theme.get("key_concepts", [])
         
         for i, segment in enumerate(segments):
-            segment_lower = segment.text.lower()
+            segment_lower = lower_text(segment)
             
             contributing = []
             for concept in key_concepts:
@@ -835,26 +829,17 @@ Semantic field:"""
         theme_field = theme.get("semantic_field", "")
         
         # Look for explicit mentions of the theme
-        acknowledgment_phrases = [
-            "this is really about",
-            "what we're talking about is",
-            "the underlying theme",
-            "this comes down to",
-            "at its core"
-        ]
-        
         for i, segment in enumerate(segments):
-            segment_lower = segment.text.lower()
-            
-            for phrase in acknowledgment_phrases:
-                if phrase in segment_lower:
-                    # Check if theme-related terms appear nearby
-                    if any(term.lower() in segment_lower for term in theme_field.split()):
-                        return {
-                            "segment_index": i,
-                            "acknowledgment_type": "explicit",
-                            "phrase": phrase
-                        }
+            phrase = markers_for(segment).first(ACKNOWLEDGMENT)
+            if phrase is not None:
+                segment_lower = lower_text(segment)
+                # Check if theme-related terms appear nearby
+                if any(term.lower() in segment_lower for term in theme_field.split()):
+                    return {
+                        "segment_index": i,
+                        "acknowledgment_type": "explicit",
+                        "phrase": phrase
+                    }
         
         return None
     
@@ -1003,7 +988,7 @@ Semantic field:"""
         contradiction_count = 0
         
         for segment in segments:
-            segment_lower = segment.text.lower()
+            segment_lower = lower_text(segment)
             
             # Check if contradiction keywords appear near theme concepts
             for keyword in contradiction_keywords:
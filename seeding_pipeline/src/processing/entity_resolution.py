@@ -8,6 +8,7 @@ from dataclasses import dataclass
 
 from src.core.models import Entity, EntityType
 from src.core.interfaces import EmbeddingProvider
+from src.providers.embeddings.cache import get_embedding_cache
 
 
 @dataclass
@@ -463,9 +464,9 @@ class VectorEntityMatcher:
             embedding_provider: Provider for generating embeddings
             similarity_threshold: Minimum cosine similarity for matches
         """
-        self.embedding_provider = embedding_provider
+        # The shared content-hash cache de-duplicates repeated entity texts
+        self.embedding_provider = get_embedding_cache(embedding_provider)
         self.similarity_threshold = similarity_threshold
-        self._embedding_cache: Dict[str, List[float]] = {}
     
     def get_entity_embedding(self, entity: Entity) -> List[float]:
         """
@@ -477,23 +478,11 @@ class VectorEntityMatcher:
         Returns:
             Embedding vector
         """
-        # Create cache key
-        cache_key = f"{entity.name}_{entity.type.value}_{entity.description or ''}"
-        
-        # Check cache
-        if cache_key in self._embedding_cache:
-            return self._embedding_cache[cache_key]
-        
         # Create entity text representation
         entity_text = self._create_entity_text(entity)
         
-        # Generate embedding
-        embedding = self.embedding_provider.embed(entity_text)
-        
-        # Cache result
-        self._embedding_cache[cache_key] = embedding
-        
-        return embedding
+        # Generate embedding (cached by content hash)
+        return self.embedding_provider.embed(entity_text)
     
     def _create_entity_text(self, entity: Entity) -> str:
         """Create text representation of entity for embedding"""
@@ -1,17 +1,22 @@
 """Within-episode discourse flow analysis."""
 
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from collections import defaultdict, Counter
-import numpy as np
-from scipy.spatial.distance import cosine
 
 from src.core.models import Entity, Segment
+from src.core.embeddings import as_embedding
+from src.core.segment_store import lower_text
+from src.processing.text_markers import EPISODE_TRANSITION, markers_for
 from src.providers.embeddings.base import EmbeddingProvider
+from src.providers.embeddings.cache import CachedEmbeddingProvider, get_embedding_cache
+from src.utils.lazy_imports import LazyImport
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+cosine = LazyImport('scipy.spatial.distance', 'cosine')
+
 
 class EpisodeFlowAnalyzer:
     """
@@ -27,7 +32,7 @@ class EpisodeFlowAnalyzer:
         Args:
             embedding_provider: Provider for calculating semantic similarity
         """
-        self.embedding_provider = embedding_provider
+        self.embedding_provider = get_embedding_cache(embedding_provider)
     
     def classify_segment_transitions(self, segments: List[Segment]) -> List[Dict]:
         """
@@ -41,6 +46,13 @@ class EpisodeFlowAnalyzer:
         """
         transitions = []
         
+        # Embed every segment once up front; the pairwise lookups below then hit the cache
+        if isinstance(self.embedding_provider, CachedEmbeddingProvider) and len(segments) > 1:
+            try:
+                self.embedding_provider.generate_embeddings([s.text for s in segments])
+            except Exception as e:
+                logger.warning(f"Failed to pre-compute segment embeddings: {e}")
+        
         for i in range(len(segments) - 1):
             current_segment = segments[i]
             next_segment = segments[i + 1]
@@ -59,7 +71,7 @@ class EpisodeFlowAnalyzer:
             )
             
             # Look for explicit transition markers
-            explicit_marker = self._find_transition_marker(next_segment.text)
+            explicit_marker = self._find_transition_marker(next_segment)
             
             # Calculate smoothness score
             smoothness_score = self._calculate_smoothness(
@@ -85,8 +97,8 @@ class EpisodeFlowAnalyzer:
             return 0.5  # Default neutral similarity
         
         try:
-            emb1 = np.array(self.embedding_provider.embed_text(text1))
-            emb2 = np.array(self.embedding_provider.embed_text(text2))
+            emb1 = as_embedding(self.embedding_provider.embed_text(text1))
+            emb2 = as_embedding(self.embedding_provider.embed_text(text2))
             return 1 - cosine(emb1, emb2)
         except:
             return 0.5
@@ -114,23 +126,10 @@ class EpisodeFlowAnalyzer:
         else:
             return "jump"
     
-    def _find_transition_marker(self, text: str) -> Optional[str]:
-        """Find explicit transition markers in text."""
-        markers = {
-            "continuation": ["furthermore", "moreover", "additionally", "also"],
-            "expansion": ["speaking of which", "on that note", "similarly"],
-            "pivot": ["however", "on the other hand", "but", "alternatively"],
-            "jump": ["anyway", "moving on", "let's shift to", "changing topics"],
-            "return": ["going back to", "as I was saying", "to return to"]
-        }
-        
-        text_lower = text.lower()
-        for marker_type, phrases in markers.items():
-            for phrase in phrases:
-                if phrase in text_lower[:100]:  # Check first 100 chars
-                    return phrase
-        
-        return None
+    def _find_transition_marker(self, segment: Union[Segment, str]) -> Optional[str]:
+        """Find explicit transition markers at the start of a segment or text."""
+        # Check first 100 chars
+        return markers_for(segment).first(EPISODE_TRANSITION, within=100)
     
     def _calculate_smoothness(
         self, 
@@ -220,7 +219,7 @@ class EpisodeFlowAnalyzer:
         mentions = defaultdict(list)
         
         for i, segment in enumerate(segments):
-            text_lower = segment.text.lower()
+            text_lower = lower_text(segment)
             
             for entity in entities:
                 if entity.name.lower() in text_lower:
@@ -258,7 +257,7 @@ class EpisodeFlowAnalyzer:
         
         # Check for responsive introduction (question in previous segment)
         if segment_idx > 0:
-            prev_text = all_segments[segment_idx - 1].text.lower()
+            prev_text = lower_text(all_segments[segment_idx - 1])
             if "?" in prev_text and entity_lower in text_lower:
                 return "responsive"
         
@@ -315,7 +314,7 @@ class EpisodeFlowAnalyzer:
         # Find all mentions
         mentions = []
         for i, segment in enumerate(segments):
-            if entity.name.lower() in segment.text.lower():
+            if entity.name.lower() in lower_text(segment):
                 mentions.append({
                     "segment_index": i,
                     "segment": segment
@@ -519,7 +518,7 @@ class EpisodeFlowAnalyzer:
         
         insight_count = 0
         for segment in segments:
-            text_lower = segment.text.lower()
+            text_lower = lower_text(segment)
             for phrase in insight_phrases:
                 if phrase in text_lower:
                     insight_count += 1
@@ -537,7 +536,7 @@ class EpisodeFlowAnalyzer:
         total_words = 0
         
         for segment in segments:
-            words = segment.text.lower().split()
+            words = lower_text(segment).split()
             total_words += len(words)
             emotion_count += sum(1 for word in words if word in emotion_words)
         
@@ -597,7 +596,7 @@ class EpisodeFlowAnalyzer:
         topic_duration = 0
         
         for segment in segments:
-            if entity.name.lower() in segment.text.lower():
+            if entity.name.lower() in lower_text(segment):
                 topic_duration += segment.end_time - segment.start_time
         
         return min(topic_duration / max(total_duration, 1), 1.0)
@@ -614,7 +613,7 @@ class EpisodeFlowAnalyzer:
         
         # Find segments mentioning the entity
         for i, segment in enumerate(segments):
-            if entity.name.lower() in segment.text.lower():
+            if entity.name.lower() in lower_text(segment):
                 entity_segments.append(i)
         
         # Check other entities in same segments
@@ -623,7 +622,7 @@ class EpisodeFlowAnalyzer:
                 continue
             
             for i, segment in enumerate(segments):
-                if i in entity_segments and other_entity.name.lower() in segment.text.lower():
+                if i in entity_segments and other_entity.name.lower() in lower_text(segment):
                     related_count += 1
                     break
         
@@ -638,9 +637,9 @@ class EpisodeFlowAnalyzer:
         mention_count = 0
         
         for segment in segments:
-            if entity.name.lower() in segment.text.lower():
+            if entity.name.lower() in lower_text(segment):
                 mention_count += 1
-                text_lower = segment.text.lower()
+                text_lower = lower_text(segment)
                 for indicator in detail_indicators:
                     if indicator in text_lower:
                         detail_count += 1
@@ -656,8 +655,8 @@ class EpisodeFlowAnalyzer:
         example_count = 0
         
         for segment in segments:
-            if entity.name.lower() in segment.text.lower():
-                text_lower = segment.text.lower()
+            if entity.name.lower() in lower_text(segment):
+                text_lower = lower_text(segment)
                 for indicator in example_indicators:
                     if indicator in text_lower:
                         example_count += 1
@@ -670,13 +669,13 @@ class EpisodeFlowAnalyzer:
         questions_answered = 0
         
         for i, segment in enumerate(segments):
-            if entity.name.lower() in segment.text.lower():
+            if entity.name.lower() in lower_text(segment):
                 # Count questions
                 questions_raised += segment.text.count('?')
                 
                 # Look for answer indicators in next segments
                 if i < len(segments) - 1:
-                    next_text = segments[i + 1].text.lower()
+                    next_text = lower_text(segments[i + 1])
                     if any(phrase in next_text for phrase in ["the answer", "that's because", "this means"]):
                         questions_answered += 1
         
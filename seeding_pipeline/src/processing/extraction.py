@@ -20,7 +20,8 @@ from datetime import datetime
 from functools import lru_cache
 
 from src.core.interfaces import LLMProvider
-from src.core.models import Entity, Insight, Quote, InsightType, QuoteType, EntityType, Segment
+from src.core.models import Entity, Insight, Quote, InsightType, QuoteType, EntityType
+from src.core.segment_store import SegmentStore
 from src.core.exceptions import ExtractionError
 from src.utils.deprecation import deprecated, deprecated_class
 from src.processing.importance_scoring import ImportanceScorer
@@ -404,7 +405,7 @@ class KnowledgeExtractor:
         Extract knowledge from multiple segments with multi-factor importance scoring.
         
         Args:
-            segments: List of segment dictionaries
+            segments: Segment store or list of segment dictionaries
             podcast_name: Optional podcast name for context
             episode_title: Optional episode title for context
             
@@ -414,27 +415,18 @@ class KnowledgeExtractor:
         all_entities = []
         all_insights = []
         all_quotes = []
-        segment_objects = []
+        # Segment stores are used as they are; dictionaries are packed into one
+        if not isinstance(segments, SegmentStore):
+            segments = SegmentStore.from_dicts(segments)
+        segment_objects = segments
         
         # Calculate total duration from segments
         total_duration = 0.0
-        if segments:
-            last_segment = segments[-1]
-            total_duration = last_segment.get('end_time', 0)
+        if len(segments):
+            total_duration = segments[-1].end_time
         
         # Extract from each segment
-        for i, segment_data in enumerate(segments):
-            # Create Segment object
-            segment_obj = Segment(
-                id=f"segment_{i}",
-                text=segment_data.get('text', ''),
-                start_time=segment_data.get('start_time', 0),
-                end_time=segment_data.get('end_time', 0),
-                speaker=segment_data.get('speaker', 'Unknown'),
-                segment_index=i
-            )
-            segment_objects.append(segment_obj)
-            
+        for i, segment_obj in enumerate(segments):
             # Extract from this segment
             if segment_obj.text.strip():
                 try:
@@ -467,82 +459,43 @@ class KnowledgeExtractor:
         logger.info("Applying multi-factor importance scoring to entities...")
         importance_scorer = ImportanceScorer()
         
-        for entity in merged_entities:
-            try:
-                # Build entity mentions data
-                entity_mentions = []
-                if hasattr(entity, '_segment_indices'):
-                    for idx, timestamp in zip(entity._segment_indices, entity._timestamps):
-                        entity_mentions.append({
-                            'segment_index': idx,
-                            'timestamp': timestamp
-                        })
-                
-                # Calculate individual factors
-                all_factors = {}
-                
-                # 1. Frequency factor
-                all_factors['frequency'] = importance_scorer.calculate_frequency_factor(
-                    entity_mentions,
-                    total_duration
-                )
-                
-                # 2. Semantic centrality (using embeddings if available)
-                if hasattr(entity, 'embedding') and entity.embedding:
-                    all_embeddings = [e.embedding for e in merged_entities 
-                                     if hasattr(e, 'embedding') and e.embedding]
-                    all_factors['semantic_centrality'] = importance_scorer.calculate_semantic_centrality(
-                        entity.embedding,
-                        all_embeddings
-                    )
-                else:
-                    all_factors['semantic_centrality'] = 0.5  # Default
-                
-                # 3. Discourse function
-                discourse_factors = importance_scorer.analyze_discourse_function(
-                    entity_mentions,
-                    segment_objects
-                )
-                all_factors.update(discourse_factors)
-                entity.discourse_roles = discourse_factors
-                
-                # 4. Temporal dynamics
-                temporal_factors = importance_scorer.analyze_temporal_dynamics(
-                    entity_mentions,
-                    segment_objects
-                )
-                all_factors.update(temporal_factors)
-                
-                # 5. Cross-reference score
-                all_factors['cross_reference'] = importance_scorer.calculate_cross_reference_score(
-                    entity.id,
-                    merged_entities,
-                    all_insights
-                )
-                
-                # Note: Structural centrality will be calculated later when graph is available
-                all_factors['structural_centrality'] = 0.5  # Placeholder
-                
-                # Calculate composite importance
-                composite_score = importance_scorer.calculate_composite_importance(all_factors)
-                
-                # Update entity with importance data
-                entity.importance_score = composite_score
-                entity.importance_factors = all_factors
-                
-                # Clean up temporary attributes
-                if hasattr(entity, '_segment_indices'):
-                    delattr(entity, '_segment_indices')
-                if hasattr(entity, '_timestamps'):
-                    delattr(entity, '_timestamps')
-                    
-            except Exception as e:
-                logger.warning(f"Failed to calculate importance for entity {entity.name}: {e}")
-                # Set defaults on error
+        # Build entity mentions data
+        entity_mentions = [
+            [{'segment_index': idx, 'timestamp': timestamp}
+             for idx, timestamp in zip(getattr(entity, '_segment_indices', []),
+                                       getattr(entity, '_timestamps', []))]
+            for entity in merged_entities
+        ]
+        
+        try:
+            # All factors for all entities at once; structural centrality is
+            # a placeholder until the graph is available
+            scores = importance_scorer.score_entities(
+                merged_entities,
+                entity_mentions,
+                segment_objects,
+                all_insights,
+                total_duration
+            )
+            for i, entity in enumerate(merged_entities):
+                entity.importance_score = float(scores.composite[i])
+                entity.importance_factors = scores.factors_for(i)
+                entity.discourse_roles = scores.discourse_roles_for(i)
+        except Exception as e:
+            logger.warning(f"Failed to calculate importance for entities: {e}")
+            # Set defaults on error
+            for entity in merged_entities:
                 entity.importance_score = 0.5
                 entity.importance_factors = {}
                 entity.discourse_roles = {}
         
+        # Clean up temporary attributes
+        for entity in merged_entities:
+            if hasattr(entity, '_segment_indices'):
+                delattr(entity, '_segment_indices')
+            if hasattr(entity, '_timestamps'):
+                delattr(entity, '_timestamps')
+        
         # Sort entities by importance
         merged_entities.sort(key=lambda e: e.importance_score, reverse=True)
         
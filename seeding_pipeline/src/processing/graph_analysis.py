@@ -2,6 +2,7 @@
 Graph analysis and enhancement functionality
 """
 import logging
+import os
 from typing import List, Dict, Optional, Tuple, Any, Set
 from dataclasses import dataclass
 from enum import Enum
@@ -11,22 +12,18 @@ import numpy as np
 
 from src.core.models import Entity, Insight
 from src.core.interfaces import LLMProvider
+from src.core.embeddings import as_embedding, has_embedding
+from src.core.segment_store import lower_text
+from src.processing.sparse_graph import SparseGraph
+from src.utils.lazy_imports import LazyImport, is_available
 
-try:
-    import networkx as nx
-    from networkx.algorithms import community
-    NETWORKX_AVAILABLE = True
-except ImportError:
-    NETWORKX_AVAILABLE = False
-    nx = None
-    community = None
+# networkx and scipy.stats are imported on first use; networkx is only
+# needed for Louvain, everything else runs on the CSR graph backend
+NETWORKX_AVAILABLE = is_available('networkx')
+community = LazyImport('networkx.algorithms.community') if NETWORKX_AVAILABLE else None
 
-try:
-    from scipy.stats import entropy
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
-    entropy = None
+SCIPY_AVAILABLE = is_available('scipy')
+entropy = LazyImport('scipy.stats', 'entropy') if SCIPY_AVAILABLE else None
 
 
 logger = logging.getLogger(__name__)
@@ -124,13 +121,22 @@ class BridgeInsight:
 class GraphAnalyzer:
     """Handles graph analysis and enhancement operations"""
     
-    def __init__(self, graph_provider=None):
+    def __init__(self, graph_provider=None, betweenness_pivots: Optional[int] = None,
+                 seed: Optional[int] = None):
         """Initialize graph analyzer
         
         Args:
             graph_provider: Optional graph provider instance (for compatibility)
+            betweenness_pivots: Graphs with more nodes get betweenness estimated
+                from this many sampled sources (default: GRAPH_BETWEENNESS_PIVOTS
+                environment variable or 500; 0 always computes it exactly)
+            seed: Seed for pivot sampling and Louvain
         """
         self.graph_provider = graph_provider
+        if betweenness_pivots is None:
+            betweenness_pivots = int(os.environ.get('GRAPH_BETWEENNESS_PIVOTS', '500'))
+        self.betweenness_pivots = betweenness_pivots or None
+        self.seed = seed
         if not NETWORKX_AVAILABLE:
             logger.warning("NetworkX not available. Graph analysis features will be limited.")
         if not SCIPY_AVAILABLE:
@@ -178,12 +184,12 @@ class GraphAnalyzer:
             embeddings2 = []
             
             for entity in community1_entities:
-                if hasattr(entity, 'embedding') and entity.embedding:
-                    embeddings1.append(np.array(entity.embedding))
+                if has_embedding(entity):
+                    embeddings1.append(as_embedding(entity.embedding))
                     
             for entity in community2_entities:
-                if hasattr(entity, 'embedding') and entity.embedding:
-                    embeddings2.append(np.array(entity.embedding))
+                if has_embedding(entity):
+                    embeddings2.append(as_embedding(entity.embedding))
             
             # If no embeddings available, return default distances
             if not embeddings1 or not embeddings2:
@@ -246,7 +252,7 @@ class GraphAnalyzer:
             
             for entity in all_entities:
                 if entity.id not in comm1_entity_ids and entity.id not in comm2_entity_ids:
-                    if hasattr(entity, 'embedding') and entity.embedding:
+                    if has_embedding(entity):
                         # Calculate similarity to both communities
                         comm1_entities = [e for e in all_entities if e.id in comm1_entity_ids]
                         comm2_entities = [e for e in all_entities if e.id in comm2_entity_ids]
@@ -256,12 +262,12 @@ class GraphAnalyzer:
                         comm2_embeddings = []
                         
                         for e in comm1_entities:
-                            if hasattr(e, 'embedding') and e.embedding:
-                                comm1_embeddings.append(np.array(e.embedding))
+                            if has_embedding(e):
+                                comm1_embeddings.append(as_embedding(e.embedding))
                         
                         for e in comm2_entities:
-                            if hasattr(e, 'embedding') and e.embedding:
-                                comm2_embeddings.append(np.array(e.embedding))
+                            if has_embedding(e):
+                                comm2_embeddings.append(as_embedding(e.embedding))
                         
                         if comm1_embeddings and comm2_embeddings:
                             # Calculate centroids
@@ -269,7 +275,7 @@ class GraphAnalyzer:
                             centroid2 = np.mean(comm2_embeddings, axis=0)
                             
                             # Normalize
-                            entity_emb = np.array(entity.embedding)
+                            entity_emb = as_embedding(entity.embedding)
                             entity_emb_norm = entity_emb / (np.linalg.norm(entity_emb) + 1e-8)
                             centroid1_norm = centroid1 / (np.linalg.norm(centroid1) + 1e-8)
                             centroid2_norm = centroid2 / (np.linalg.norm(centroid2) + 1e-8)
@@ -362,13 +368,13 @@ class GraphAnalyzer:
             Returns:
                 List of paths (each path is a list of entities)
             """
-            if not (hasattr(entity1, 'embedding') and entity1.embedding and
-                    hasattr(entity2, 'embedding') and entity2.embedding):
+            if not (has_embedding(entity1) and
+                    has_embedding(entity2)):
                 return []
             
             # Use embedding space to find intermediate concepts
-            start_emb = np.array(entity1.embedding)
-            end_emb = np.array(entity2.embedding)
+            start_emb = as_embedding(entity1.embedding)
+            end_emb = as_embedding(entity2.embedding)
             
             # Normalize
             start_emb = start_emb / (np.linalg.norm(start_emb) + 1e-8)
@@ -380,10 +386,9 @@ class GraphAnalyzer:
             for intermediate in all_entities:
                 if (intermediate.id != entity1.id and 
                     intermediate.id != entity2.id and
-                    hasattr(intermediate, 'embedding') and 
-                    intermediate.embedding):
+                    has_embedding(intermediate)):
                     
-                    inter_emb = np.array(intermediate.embedding)
+                    inter_emb = as_embedding(intermediate.embedding)
                     inter_emb = inter_emb / (np.linalg.norm(inter_emb) + 1e-8)
                     
                     # Check similarity to both start and end
@@ -401,10 +406,10 @@ class GraphAnalyzer:
                     return 0
                 scores = []
                 for i in range(len(path) - 1):
-                    if (hasattr(path[i], 'embedding') and path[i].embedding and
-                        hasattr(path[i+1], 'embedding') and path[i+1].embedding):
-                        emb1 = np.array(path[i].embedding)
-                        emb2 = np.array(path[i+1].embedding)
+                    if (has_embedding(path[i]) and
+                        has_embedding(path[i+1])):
+                        emb1 = as_embedding(path[i].embedding)
+                        emb2 = as_embedding(path[i+1].embedding)
                         emb1 = emb1 / (np.linalg.norm(emb1) + 1e-8)
                         emb2 = emb2 / (np.linalg.norm(emb2) + 1e-8)
                         scores.append(np.dot(emb1, emb2))
@@ -692,7 +697,7 @@ class GraphAnalyzer:
         
         # Process each segment
         for segment in segments:
-            segment_text = segment.text.lower() if hasattr(segment, 'text') else str(segment).lower()
+            segment_text = lower_text(segment) if hasattr(segment, 'text') else str(segment).lower()
             
             # Find entities that appear in this segment
             entities_in_segment = []
@@ -718,52 +723,70 @@ class GraphAnalyzer:
         
         return result
     
+    def build_graph(
+        self,
+        nodes: List[Dict[str, Any]],
+        edges: List[Tuple[str, str, float]],
+        add_missing_nodes: bool = False
+    ) -> SparseGraph:
+        """
+        Build the CSR graph shared by the analyses of one episode
+        
+        Args:
+            nodes: List of node dictionaries with 'id' and 'name' keys
+            edges: List of (source_id, target_id, weight) tuples
+            add_missing_nodes: Add nodes only referenced by edges instead of
+                dropping those edges
+            
+        Returns:
+            Sparse graph
+        """
+        return SparseGraph.from_edges(nodes, edges, add_missing_nodes=add_missing_nodes)
+    
     def calculate_betweenness_centrality(
         self, 
         nodes: List[Dict[str, Any]], 
-        edges: List[Tuple[str, str, float]]
+        edges: List[Tuple[str, str, float]],
+        graph: Optional[SparseGraph] = None
     ) -> List[CentralityResult]:
         """
         Calculate betweenness centrality for nodes to find bridge concepts
         
+        Exact for graphs up to ``betweenness_pivots`` nodes, estimated from
+        that many sampled sources for larger graphs.
+        
         Args:
             nodes: List of node dictionaries with 'id' and 'name' keys
             edges: List of (source_id, target_id, weight) tuples
+            graph: Graph already built from nodes and edges
             
         Returns:
             List of centrality results sorted by score
         """
-        if not NETWORKX_AVAILABLE:
-            logger.warning("NetworkX not available. Cannot calculate centrality.")
+        if not SCIPY_AVAILABLE:
+            logger.warning("SciPy not available. Cannot calculate centrality.")
             return []
         
         try:
-            # Build graph
-            G = nx.Graph()
-            
-            # Add nodes
-            for node in nodes:
-                G.add_node(node['id'], name=node.get('name', ''), type=node.get('type', 'unknown'))
-            
-            # Add edges
-            for source, target, weight in edges:
-                G.add_edge(source, target, weight=weight)
+            if graph is None:
+                graph = self.build_graph(nodes, edges, add_missing_nodes=True)
             
             # Check if graph has nodes
-            if len(G.nodes()) == 0:
+            if graph.number_of_nodes == 0:
                 return []
             
             # Calculate betweenness centrality
-            centrality = nx.betweenness_centrality(G, weight='weight')
+            centrality = graph.betweenness_centrality(
+                pivots=self.betweenness_pivots, seed=self.seed
+            )
             
             # Create results
             results = []
-            for node_id, score in centrality.items():
-                node_data = G.nodes[node_id]
+            for node_id, node_data in zip(graph.node_ids, graph.node_data):
                 results.append(CentralityResult(
                     node_id=node_id,
                     node_name=node_data.get('name', ''),
-                    centrality_score=score,
+                    centrality_score=centrality[node_id],
                     node_type=node_data.get('type', 'unknown')
                 ))
             
@@ -780,7 +803,8 @@ class GraphAnalyzer:
         self, 
         nodes: List[Dict[str, Any]], 
         edges: List[Tuple[str, str, float]],
-        resolution_levels: List[float] = None
+        resolution_levels: List[float] = None,
+        graph: Optional[SparseGraph] = None
     ) -> Tuple[List[CommunityResult], Dict[str, str]]:
         """
         Detect communities at multiple resolution levels using Louvain algorithm
@@ -789,6 +813,7 @@ class GraphAnalyzer:
             nodes: List of node dictionaries
             edges: List of (source_id, target_id, weight) tuples
             resolution_levels: List of resolution parameters (default: [0.5, 1.0, 2.0])
+            graph: Graph already built from nodes and edges
             
         Returns:
             Tuple of (community results, node name mapping)
@@ -801,31 +826,22 @@ class GraphAnalyzer:
             resolution_levels = [0.5, 1.0, 2.0]
         
         try:
-            # Build graph
-            G = nx.Graph()
-            node_names = {}
-            
-            # Add nodes
-            for node in nodes:
-                node_id = node['id']
-                node_name = node.get('name', node_id)
-                G.add_node(node_id)
-                node_names[node_id] = node_name
-            
-            # Add edges
-            for source, target, weight in edges:
-                if source in G and target in G:
-                    G.add_edge(source, target, weight=weight)
+            node_names = {node['id']: node.get('name', node['id']) for node in nodes}
+            if graph is None:
+                graph = self.build_graph(nodes, edges)
             
             # Check if graph has nodes
-            if len(G.nodes()) == 0:
+            if graph.number_of_nodes == 0:
                 return [], {}
             
+            # Louvain runs on NetworkX; the graph is converted once for all levels
+            nx_graph = graph.to_networkx()
+            
             # Detect communities at each resolution level
             community_results = []
             for resolution in resolution_levels:
                 communities = community.louvain_communities(
-                    G, resolution=resolution, weight='weight'
+                    nx_graph, resolution=resolution, weight='weight', seed=self.seed
                 )
                 
                 # Convert to node->community mapping
@@ -836,8 +852,8 @@ class GraphAnalyzer:
                 
                 # Calculate modularity if possible
                 try:
-                    modularity = community.modularity(G, communities, weight='weight')
-                except:
+                    modularity = graph.modularity(communities)
+                except Exception:
                     modularity = None
                 
                 community_results.append(CommunityResult(
@@ -1055,11 +1071,16 @@ class GraphAnalyzer:
             entities, insights, co_occurrences
         )
         
+        # Build the graph once for all analyses
+        graph = self.build_graph(nodes, edges)
+        
         # Calculate centrality
-        centrality_results = self.calculate_betweenness_centrality(nodes, edges)
+        centrality_results = self.calculate_betweenness_centrality(nodes, edges, graph=graph)
         
         # Detect communities
-        community_results, node_names = self.detect_communities_multi_level(nodes, edges)
+        community_results, node_names = self.detect_communities_multi_level(
+            nodes, edges, graph=graph
+        )
         
         # Calculate segment mentions if not provided
         if segment_mentions is None:
@@ -1067,7 +1088,7 @@ class GraphAnalyzer:
             for entity in entities:
                 count = 0
                 for segment in segments:
-                    segment_text = segment.text.lower() if hasattr(segment, 'text') else str(segment).lower()
+                    segment_text = lower_text(segment) if hasattr(segment, 'text') else str(segment).lower()
                     if entity.name.lower() in segment_text:
                         count += 1
                 segment_mentions[entity.id] = count
@@ -1430,13 +1451,17 @@ Return only the topic name, nothing else."""
                 entities, insights, co_occurrences
             )
             
+            graph = self.build_graph(nodes, edges)
+            
             # Step 2: Calculate betweenness centrality
             logger.info("Calculating betweenness centrality...")
-            centrality_results = self.calculate_betweenness_centrality(nodes, edges)
+            centrality_results = self.calculate_betweenness_centrality(nodes, edges, graph=graph)
             
             # Step 3: Multi-level community detection
             logger.info("Detecting communities at multiple levels...")
-            community_results, node_names = self.detect_communities_multi_level(nodes, edges)
+            community_results, node_names = self.detect_communities_multi_level(
+                nodes, edges, graph=graph
+            )
             
             # Step 4: Create hierarchical topics
             logger.info("Creating hierarchical topic structure...")
@@ -1449,7 +1474,7 @@ Return only the topic name, nothing else."""
             for entity in entities:
                 count = 0
                 for segment in segments:
-                    segment_text = segment.text.lower() if hasattr(segment, 'text') else str(segment).lower()
+                    segment_text = lower_text(segment) if hasattr(segment, 'text') else str(segment).lower()
                     if entity.name.lower() in segment_text:
                         count += 1
                 segment_mentions[entity.id] = count
@@ -12,14 +12,103 @@ This module implements sophisticated importance calculation that considers:
 
 import logging
 import math
-from typing import List, Dict, Optional, Tuple, Any
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Sequence, Tuple, Any
 import numpy as np
-import networkx as nx
 
+from ..core.embeddings import as_embedding, embedding_matrix, has_embedding
 from ..core.models import Entity, Insight, Segment
+from ..core.segment_store import SEPARATOR
+from ..utils.lazy_imports import LazyImport
+
+nx = LazyImport('networkx')
+sparse = LazyImport('scipy.sparse')
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WEIGHTS = {
+    "frequency": 0.15,
+    "structural_centrality": 0.25,
+    "semantic_centrality": 0.20,
+    "discourse_function": 0.20,
+    "temporal_dynamics": 0.10,
+    "cross_reference": 0.10
+}
+
+DISCOURSE_FACTORS = ["introduction_role", "development_role", "conclusion_role", "bridge_role"]
+TEMPORAL_FACTORS = ["recency_weight", "persistence_score", "peak_influence", "momentum"]
+
+# Order of the per-entity factor dictionaries
+FACTOR_NAMES = (
+    ["frequency", "semantic_centrality"] + DISCOURSE_FACTORS + TEMPORAL_FACTORS
+    + ["cross_reference", "structural_centrality"]
+)
+
+
+@dataclass
+class ImportanceScores:
+    """Importance factors and composite scores of all entities in an episode."""
+    entity_ids: List[str]
+    composite: np.ndarray
+    factors: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    def factors_for(self, index: int) -> Dict[str, float]:
+        """Factors of one entity, as stored in ``Entity.importance_factors``."""
+        return {name: float(self.factors[name][index]) for name in FACTOR_NAMES}
+
+    def discourse_roles_for(self, index: int) -> Dict[str, float]:
+        """Discourse roles of one entity, as stored in ``Entity.discourse_roles``."""
+        return {name: float(self.factors[name][index]) for name in DISCOURSE_FACTORS}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            entity_id: {
+                "importance_score": float(self.composite[i]),
+                "importance_factors": self.factors_for(i)
+            }
+            for i, entity_id in enumerate(self.entity_ids)
+        }
+
+
+def _documents_containing(documents: List[str], terms: List[str]) -> "sparse.csr_matrix":
+    """
+    Which lower-cased documents contain which terms, as a terms x documents matrix.
+
+    Documents are joined into one buffer that each term is searched in with
+    ``str.find``, jumping to the next document after a hit, so the scan runs
+    at C speed instead of testing every term against every document.
+    """
+    lengths = np.fromiter((len(doc) for doc in documents), dtype=np.int64, count=len(documents))
+    starts = np.zeros(len(documents), dtype=np.int64)
+    if len(documents):
+        np.cumsum(lengths[:-1] + 1, out=starts[1:])
+    ends = starts + lengths
+    buffer = SEPARATOR.join(documents)
+
+    rows, cols = [], []
+    for row, term in enumerate(terms):
+        if not term:
+            # An empty name is "in" every text
+            found = range(len(documents))
+        elif SEPARATOR in term:
+            found = ()
+        else:
+            # Without the separator a match lies inside one document
+            found = []
+            position = buffer.find(term)
+            while position != -1:
+                doc = int(np.searchsorted(starts, position, side='right')) - 1
+                found.append(doc)
+                position = buffer.find(term, int(ends[doc]) + 1)
+        rows.extend([row] * len(found))
+        cols.extend(found)
+    data = np.ones(len(rows), dtype=np.float64)
+    return sparse.csr_matrix((data, (rows, cols)), shape=(len(terms), len(documents)))
+
 
 class ImportanceScorer:
     """
@@ -88,7 +177,7 @@ class ImportanceScorer:
     def calculate_structural_centrality(
         self, 
         entity_id: str, 
-        graph: nx.Graph
+        graph: 'nx.Graph'
     ) -> float:
         """
         Measure how central the entity is in the knowledge structure.
@@ -153,26 +242,18 @@ class ImportanceScorer:
         if entity_embedding is None or len(all_embeddings) == 0:
             return 0.5  # Default to neutral if no embeddings available
             
-        # Convert to numpy array if needed
-        if not isinstance(entity_embedding, np.ndarray):
-            entity_embedding = np.array(entity_embedding)
-            
-        # Calculate cosine similarity to all other entities
-        similarities = []
-        for other_embedding in all_embeddings:
-            if other_embedding is not None:
-                if not isinstance(other_embedding, np.ndarray):
-                    other_embedding = np.array(other_embedding)
-                    
-                # Cosine similarity
-                similarity = np.dot(entity_embedding, other_embedding) / (
-                    np.linalg.norm(entity_embedding) * np.linalg.norm(other_embedding)
-                )
-                similarities.append(similarity)
-                
-        if not similarities:
+        # Float32 embeddings are used without copying
+        entity_embedding = as_embedding(entity_embedding)
+        others = embedding_matrix(all_embeddings)
+        
+        if len(others) == 0:
             return 0.5
             
+        # Cosine similarity to all other entities in one matrix product
+        similarities = (others @ entity_embedding) / (
+            np.linalg.norm(others, axis=1) * np.linalg.norm(entity_embedding)
+        )
+            
         # Calculate average similarity (semantic centrality)
         avg_similarity = np.mean(similarities)
         
@@ -422,14 +503,7 @@ class ImportanceScorer:
         """
         # Default weights if not provided
         if weights is None:
-            weights = {
-                "frequency": 0.15,
-                "structural_centrality": 0.25,
-                "semantic_centrality": 0.20,
-                "discourse_function": 0.20,
-                "temporal_dynamics": 0.10,
-                "cross_reference": 0.10
-            }
+            weights = DEFAULT_WEIGHTS
             
         # Validate weights sum to 1.0
         weight_sum = sum(weights.values())
@@ -485,6 +559,302 @@ class ImportanceScorer:
                 
         return min(1.0, max(0.0, composite_score))
     
+    def score_entities(
+        self,
+        entities: List[Entity],
+        entity_mentions: List[List[Dict[str, Any]]],
+        segments: Sequence[Segment],
+        insights: List[Insight],
+        episode_duration: float,
+        structural_centrality: Optional[Sequence[float]] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> ImportanceScores:
+        """
+        Score all entities of an episode at once.
+        
+        Computes the same factors as the per-entity methods, each as one
+        array operation over the episode: mention counts and positions come
+        from a sparse entity x segment matrix, semantic centrality from one
+        product with the normalized embedding matrix.
+        
+        Args:
+            entities: Entities of the episode
+            entity_mentions: Mentions of each entity, as for the per-entity methods
+            segments: All segments in the episode
+            insights: All insights in the episode
+            episode_duration: Total episode duration in seconds
+            structural_centrality: Centrality per entity; 0.5 for every entity
+                when the graph is not available yet
+            weights: Optional custom weights for factors
+            
+        Returns:
+            Factors and composite scores, in the order of ``entities``
+        """
+        n = len(entities)
+        if len(entity_mentions) != n:
+            raise ValueError("entity_mentions must have one entry per entity")
+        
+        factors: Dict[str, np.ndarray] = {}
+        factors["frequency"] = self._batch_frequency(entity_mentions, episode_duration)
+        factors["semantic_centrality"] = self._batch_semantic_centrality(entities)
+        factors.update(self._batch_discourse_function(entity_mentions, len(segments)))
+        factors.update(self._batch_temporal_dynamics(entity_mentions, segments))
+        factors["cross_reference"] = self._batch_cross_reference(entities, insights)
+        if structural_centrality is None:
+            factors["structural_centrality"] = np.full(n, 0.5)
+        else:
+            factors["structural_centrality"] = np.asarray(structural_centrality, dtype=np.float64)
+        
+        return ImportanceScores(
+            entity_ids=[entity.id for entity in entities],
+            composite=self._batch_composite(factors, n, weights),
+            factors=factors
+        )
+    
+    def _batch_frequency(self, entity_mentions: List[List[Dict[str, Any]]],
+                         episode_duration: float) -> np.ndarray:
+        """Frequency factor of every entity."""
+        if episode_duration <= 0:
+            logger.warning(f"Invalid episode duration: {episode_duration}")
+            return np.zeros(len(entity_mentions))
+        
+        counts = np.fromiter((len(mentions) for mentions in entity_mentions),
+                             dtype=np.float64, count=len(entity_mentions))
+        mentions_per_minute = counts / (episode_duration / 60.0)
+        scores = np.log1p(mentions_per_minute) / math.log(1 + self.max_expected_mentions_per_minute)
+        return np.clip(scores, 0.0, 1.0)
+    
+    def _batch_semantic_centrality(self, entities: List[Entity]) -> np.ndarray:
+        """Semantic centrality of every entity; 0.5 for entities without embeddings."""
+        scores = np.full(len(entities), 0.5)
+        with_embedding = [i for i, entity in enumerate(entities) if has_embedding(entity)]
+        if not with_embedding:
+            return scores
+        
+        matrix = embedding_matrix(entities[i].embedding for i in with_embedding).astype(np.float64)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        normalized = matrix / np.where(norms == 0, 1, norms)
+        # Mean cosine similarity to all embeddings (itself included) is the
+        # dot product with the mean of the normalized rows
+        mean_similarity = normalized @ normalized.mean(axis=0)
+        scores[with_embedding] = (mean_similarity + 1) / 2
+        return scores
+    
+    @staticmethod
+    def _mention_matrix(entity_mentions: List[List[Dict[str, Any]]],
+                        total_segments: int) -> "sparse.csr_matrix":
+        """Sparse entity x segment matrix of mention counts."""
+        rows, cols = [], []
+        for row, mentions in enumerate(entity_mentions):
+            for mention in mentions:
+                index = mention.get("segment_index")
+                if index is not None and index >= 0:
+                    rows.append(row)
+                    cols.append(index)
+        width = max(total_segments, max(cols) + 1 if cols else 0)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(entity_mentions), width)
+        )
+        matrix.sum_duplicates()
+        matrix.sort_indices()
+        return matrix
+    
+    def _batch_discourse_function(self, entity_mentions: List[List[Dict[str, Any]]],
+                                  total_segments: int) -> Dict[str, np.ndarray]:
+        """Discourse roles of every entity."""
+        n = len(entity_mentions)
+        roles = {name: np.zeros(n) for name in DISCOURSE_FACTORS}
+        if not total_segments or n == 0:
+            return roles
+        
+        matrix = self._mention_matrix(entity_mentions, total_segments)
+        has_mentions = np.array([bool(mentions) for mentions in entity_mentions])
+        
+        # Distinct mentioned segments per entity
+        spread = np.diff(matrix.indptr).astype(np.float64)
+        present = matrix.copy()
+        present.data[:] = 1.0
+        
+        columns = np.arange(matrix.shape[1])
+        early = (columns <= int(total_segments * 0.2)).astype(np.float64)
+        late = (columns >= int(total_segments * 0.8)).astype(np.float64)
+        denominator = np.maximum(1.0, spread)
+        
+        roles["introduction_role"] = (present @ early) / denominator
+        roles["development_role"] = np.minimum(1.0, spread / total_segments * 2)
+        roles["conclusion_role"] = (present @ late) / denominator
+        
+        # Gaps between sorted segments sum to last - first
+        multi = spread > 1
+        first = np.zeros(n)
+        last = np.zeros(n)
+        nonempty = spread > 0
+        first[nonempty] = matrix.indices[matrix.indptr[:-1][nonempty]]
+        last[nonempty] = matrix.indices[matrix.indptr[1:][nonempty] - 1]
+        avg_gap = np.where(multi, (last - first) / np.maximum(1.0, spread - 1), 0.0)
+        roles["bridge_role"] = np.where(
+            multi, np.minimum(1.0, avg_gap / max(1, total_segments * 0.1)), 0.0
+        )
+        
+        for name in DISCOURSE_FACTORS:
+            roles[name] = np.where(has_mentions, roles[name], 0.0)
+        return roles
+    
+    def _batch_temporal_dynamics(self, entity_mentions: List[List[Dict[str, Any]]],
+                                 segments: Sequence[Segment]) -> Dict[str, np.ndarray]:
+        """Temporal dynamics of every entity."""
+        n = len(entity_mentions)
+        dynamics = {name: np.zeros(n) for name in TEMPORAL_FACTORS}
+        if not len(segments) or n == 0:
+            return dynamics
+        
+        total_duration = segments[-1].end_time
+        if total_duration <= 0:
+            return dynamics
+        start_times = getattr(segments, "start_times", None)
+        if start_times is None:
+            start_times = np.array([segment.start_time for segment in segments], dtype=np.float64)
+        
+        # Mention times, flattened and grouped by entity
+        groups, times = [], []
+        for group, mentions in enumerate(entity_mentions):
+            for mention in mentions:
+                if "timestamp" in mention:
+                    times.append(mention["timestamp"])
+                elif "segment_index" in mention and mention["segment_index"] < len(segments):
+                    times.append(start_times[mention["segment_index"]])
+                else:
+                    continue
+                groups.append(group)
+        if not times:
+            return dynamics
+        
+        groups = np.asarray(groups, dtype=np.int64)
+        times = np.asarray(times, dtype=np.float64)
+        order = np.lexsort((times, groups))
+        groups, times = groups[order], times[order]
+        counts = np.bincount(groups, minlength=n)
+        timed = counts > 0
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        
+        first = np.zeros(n)
+        last = np.zeros(n)
+        first[timed] = times[starts[timed]]
+        last[timed] = times[starts[timed] + counts[timed] - 1]
+        
+        dynamics["recency_weight"] = np.where(
+            timed, np.exp(-self.temporal_decay_alpha * ((total_duration - last) / total_duration)), 0.0
+        )
+        dynamics["persistence_score"] = np.where(timed, (last - first) / total_duration, 0.0)
+        
+        # Peak influence: most mentions within any window starting at a mention.
+        # Times and window ends are ranked together so the comparisons stay exact.
+        window_size = total_duration * 0.1
+        ranks = np.unique(np.concatenate((times, times + window_size)), return_inverse=True)[1]
+        stride = len(ranks) + 1
+        keys = groups * stride + ranks[:len(times)]
+        window_ends = groups * stride + ranks[len(times):]
+        in_window = (np.searchsorted(keys, window_ends, side='right')
+                     - np.searchsorted(keys, keys, side='left'))
+        max_in_window = np.zeros(n, dtype=np.int64)
+        np.maximum.at(max_in_window, groups, in_window)
+        dynamics["peak_influence"] = np.minimum(1.0, max_in_window / window_size * 60)
+        
+        # Momentum: second half of the episode against the first
+        first_half = np.bincount(groups, weights=times < total_duration / 2, minlength=n)
+        second_half = counts - first_half
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = second_half / first_half
+            momentum = (ratio - 1) / (ratio + 1)
+        dynamics["momentum"] = np.where(
+            first_half > 0, momentum, np.where(second_half > 0, 1.0, 0.0)
+        )
+        
+        has_mentions = np.array([bool(mentions) for mentions in entity_mentions])
+        for name in TEMPORAL_FACTORS:
+            dynamics[name] = np.where(has_mentions & timed, dynamics[name], 0.0)
+        return dynamics
+    
+    def _batch_cross_reference(self, entities: List[Entity], insights: List[Insight]) -> np.ndarray:
+        """Cross-reference score of every entity."""
+        n = len(entities)
+        if n == 0:
+            return np.zeros(0)
+        
+        # Entities sharing an id are scored with the first one's name and aliases
+        first_index: Dict[str, int] = {}
+        for i, entity in enumerate(entities):
+            first_index.setdefault(entity.id, i)
+        codes = np.array([first_index[entity.id] for entity in entities])
+        
+        term_rows, terms = [], []
+        for i, entity in enumerate(entities):
+            if first_index[entity.id] != i:
+                continue
+            for term in [entity.name] + list(entity.aliases or []):
+                term_rows.append(i)
+                terms.append(term.lower())
+        term_owner = sparse.csr_matrix(
+            (np.ones(len(terms)), (term_rows, np.arange(len(terms)))), shape=(n, len(terms))
+        )
+        
+        # References from other entities' descriptions, weighted by mention count
+        descriptions = [entity.description.lower() if entity.description else "" for entity in entities]
+        mentions_found = (term_owner @ _documents_containing(descriptions, terms)).tocoo()
+        referencing = mentions_found.col
+        keep = codes[referencing] != mentions_found.row
+        keep &= np.array([bool(entities[j].description) for j in referencing], dtype=bool)
+        description_weights = np.array([
+            min(1.0, entity.mention_count / 10) if hasattr(entity, 'mention_count') else 0.5
+            for entity in entities
+        ])
+        # bincount of an empty selection is integer; the insight terms below are floats
+        weighted = np.bincount(mentions_found.row[keep], weights=description_weights[referencing[keep]],
+                               minlength=n).astype(float)
+        
+        if insights:
+            # Name or alias in an insight's text
+            insight_texts = [f"{insight.title} {insight.description}".lower() for insight in insights]
+            in_insights = term_owner @ _documents_containing(insight_texts, terms)
+            weighted += 1.5 * np.asarray((in_insights > 0).sum(axis=1)).ravel()
+            
+            # Listed as a supporting entity
+            supporting: Dict[str, int] = {}
+            for insight in insights:
+                for entity_id in set(getattr(insight, 'supporting_entities', None) or ()):
+                    supporting[entity_id] = supporting.get(entity_id, 0) + 1
+            weighted += 2.0 * np.array([supporting.get(entity.id, 0) for entity in entities])
+        
+        # Score of the first entity with each id
+        weighted = weighted[codes]
+        scores = np.log1p(weighted) / math.log(1 + 10)
+        return np.minimum(1.0, scores)
+    
+    def _batch_composite(self, factors: Dict[str, np.ndarray], n: int,
+                         weights: Optional[Dict[str, float]]) -> np.ndarray:
+        """Composite importance of every entity, as in calculate_composite_importance."""
+        if weights is None:
+            weights = DEFAULT_WEIGHTS
+        weight_sum = sum(weights.values())
+        if abs(weight_sum - 1.0) > 0.001:
+            logger.warning(f"Weights sum to {weight_sum}, normalizing...")
+            weights = {k: v / weight_sum for k, v in weights.items()}
+        
+        composite = np.zeros(n)
+        for name in ("frequency", "structural_centrality", "semantic_centrality", "cross_reference"):
+            if name in weights:
+                composite += weights[name] * factors[name]
+        if "discourse_function" in weights:
+            composite += weights["discourse_function"] * np.mean(
+                [factors[name] for name in DISCOURSE_FACTORS], axis=0
+            )
+        if "temporal_dynamics" in weights:
+            composite += weights["temporal_dynamics"] * np.mean(
+                [factors[name] for name in ("recency_weight", "persistence_score", "peak_influence")],
+                axis=0
+            )
+        return np.clip(composite, 0.0, 1.0)
+    
     def generate_importance_visualization_data(
         self, 
         entities: List[Entity]
@@ -4,10 +4,12 @@ import re
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
-from statistics import mean, stdev
 from collections import Counter
 
+import numpy as np
+
 from src.core.models import Entity, Insight, ComplexityLevel
+from src.processing.text_statistics import TextStatisticsEngine, get_text_statistics_engine
 
 
 logger = logging.getLogger(__name__)
@@ -52,9 +54,18 @@ class AccessibilityMetrics:
 class MetricsCalculator:
     """Calculator for various content metrics."""
     
-    def __init__(self):
-        """Initialize metrics calculator."""
-        # Technical term patterns
+    def __init__(self, text_statistics: Optional[TextStatisticsEngine] = None):
+        """
+        Initialize metrics calculator.
+        
+        Args:
+            text_statistics: Engine for tokenization and word statistics,
+                shared with other analyzers by default
+        """
+        self.text_statistics = text_statistics or get_text_statistics_engine()
+        
+        # Technical term patterns; each matches a single whole word, so they
+        # are evaluated once per distinct word
         self.technical_patterns = [
             r'\b[A-Z]{3,}\b',  # Acronyms
             r'\b\w+(?:ology|itis|osis|ase|ine|cyte|plasm)\b',  # Medical/scientific suffixes
@@ -79,6 +90,8 @@ class MetricsCalculator:
             r'\b(?:statistically|significantly|correlation)',
             r'\b\d{4}\b',  # Years (potential citations)
         ]
+        self._explanation_regexes = [re.compile(p, re.IGNORECASE) for p in self.explanation_patterns]
+        self._fact_regexes = [re.compile(p, re.IGNORECASE) for p in self.fact_patterns]
         
     def calculate_complexity(
         self,
@@ -169,8 +182,7 @@ class MetricsCalculator:
             InformationDensityMetrics object
         """
         # Basic text metrics
-        words = text.split()
-        word_count = len(words)
+        word_count = len(self.text_statistics.analyze(text).tokens)
         
         if word_count == 0:
             return InformationDensityMetrics(
@@ -237,9 +249,9 @@ class MetricsCalculator:
             AccessibilityMetrics object
         """
         # Split into sentences and words
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        words = text.split()
+        stats = self.text_statistics.analyze(text)
+        sentences = stats.sentences
+        words = stats.tokens
         
         if not sentences or not words:
             return AccessibilityMetrics(
@@ -254,14 +266,11 @@ class MetricsCalculator:
         avg_sentence_length = len(words) / len(sentences)
         
         # Count jargon and explanations
-        jargon_count = sum(
-            len(re.findall(pattern, text, re.IGNORECASE))
-            for pattern in self.technical_patterns
-        )
+        jargon_count = stats.count_word_pattern_matches(tuple(self.technical_patterns))
         
         explanation_count = sum(
-            len(re.findall(pattern, text, re.IGNORECASE))
-            for pattern in self.explanation_patterns
+            len(regex.findall(text))
+            for regex in self._explanation_regexes
         )
         
         # Calculate percentages
@@ -275,7 +284,7 @@ class MetricsCalculator:
         )
         
         # Calculate readability score (simplified Flesch Reading Ease)
-        avg_syllables_per_word = self._estimate_syllables(text) / len(words)
+        avg_syllables_per_word = stats.token_syllables / len(words)
         readability_score = max(0, min(100,
             206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
         ))
@@ -316,10 +325,18 @@ class MetricsCalculator:
         if not segment_complexities:
             return self._empty_episode_metrics()
             
+        # Gather per-segment values once and aggregate them as arrays
+        complexity_values = np.array(
+            [(m.complexity_score, m.technical_density) for m in segment_complexities],
+            dtype=np.float64
+        )
+        
         # Complexity aggregation
-        complexity_scores = [m.complexity_score for m in segment_complexities]
-        avg_complexity = mean(complexity_scores)
-        complexity_variance = stdev(complexity_scores) if len(complexity_scores) > 1 else 0
+        complexity_scores = complexity_values[:, 0]
+        avg_complexity = float(complexity_scores.mean())
+        complexity_variance = (
+            float(complexity_scores.std(ddof=1)) if len(complexity_scores) > 1 else 0
+        )
         
         # Count complexity level distribution
         level_counts = Counter(m.classification for m in segment_complexities)
@@ -335,7 +352,8 @@ class MetricsCalculator:
         
         # Information density aggregation
         if segment_densities:
-            avg_info_score = mean(m.information_score for m in segment_densities)
+            info_scores = np.array([m.information_score for m in segment_densities], dtype=np.float64)
+            avg_info_score = float(info_scores.mean())
             total_insights = sum(
                 m.word_count * m.insight_density / 100
                 for m in segment_densities
@@ -344,9 +362,7 @@ class MetricsCalculator:
                 m.word_count * m.entity_density / 100
                 for m in segment_densities
             )
-            info_variance = stdev(
-                m.information_score for m in segment_densities
-            ) if len(segment_densities) > 1 else 0
+            info_variance = float(info_scores.std(ddof=1)) if len(info_scores) > 1 else 0
         else:
             avg_info_score = 0
             total_insights = 0
@@ -355,12 +371,12 @@ class MetricsCalculator:
             
         # Accessibility aggregation
         if segment_accessibilities:
-            avg_accessibility = mean(m.accessibility_score for m in segment_accessibilities)
+            avg_accessibility = float(np.mean([m.accessibility_score for m in segment_accessibilities]))
         else:
             avg_accessibility = 0
             
         # Technical characteristics
-        avg_technical_density = mean(m.technical_density for m in segment_complexities)
+        avg_technical_density = float(complexity_values[:, 1].mean())
         is_technical = avg_technical_density > 0.05
         is_mixed_complexity = complexity_variance > 1.5
         has_consistent_density = info_variance < 2.0
@@ -395,9 +411,10 @@ class MetricsCalculator:
     
     def _analyze_vocabulary_complexity(self, text: str) -> Dict[str, float]:
         """Analyze vocabulary complexity of text."""
-        words = text.split()
+        stats = self.text_statistics.analyze(text)
+        word_count = len(stats.tokens)
         
-        if not words:
+        if not word_count:
             return {
                 'avg_word_length': 0,
                 'unique_ratio': 0,
@@ -407,27 +424,21 @@ class MetricsCalculator:
             }
             
         # Average word length
-        avg_word_length = mean(len(word) for word in words)
+        avg_word_length = stats.token_length_total / word_count
         
         # Unique word ratio
-        unique_words = set(word.lower() for word in words)
-        unique_ratio = len(unique_words) / len(words)
+        unique_ratio = stats.unique_token_count / word_count
         
         # Technical term density
-        technical_count = sum(
-            len(re.findall(pattern, text, re.IGNORECASE))
-            for pattern in self.technical_patterns
-        )
-        technical_density = technical_count / len(words)
+        technical_count = stats.count_word_pattern_matches(tuple(self.technical_patterns))
+        technical_density = technical_count / word_count
         
         # Syllable complexity
-        total_syllables = self._estimate_syllables(text)
-        syllable_complexity = total_syllables / len(words)
+        syllable_complexity = stats.token_syllables / word_count
         
         # Average sentence length
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        avg_sentence_length = len(words) / len(sentences) if sentences else len(words)
+        sentences = stats.sentences
+        avg_sentence_length = word_count / len(sentences) if sentences else word_count
         
         return {
             'avg_word_length': avg_word_length,
@@ -439,46 +450,17 @@ class MetricsCalculator:
         
     def _estimate_syllables(self, text: str) -> int:
         """Estimate syllable count in text."""
-        # Simple syllable estimation
-        vowels = 'aeiouAEIOU'
-        syllable_count = 0
-        
-        words = text.split()
-        for word in words:
-            word = word.strip('.,!?;:"')
-            if len(word) <= 3:
-                syllable_count += 1
-            else:
-                # Count vowel groups
-                prev_was_vowel = False
-                word_syllables = 0
-                
-                for char in word:
-                    is_vowel = char in vowels
-                    if is_vowel and not prev_was_vowel:
-                        word_syllables += 1
-                    prev_was_vowel = is_vowel
-                    
-                # Adjust for silent e
-                if word.endswith('e') and word_syllables > 1:
-                    word_syllables -= 1
-                    
-                syllable_count += max(1, word_syllables)
-                
-        return syllable_count
+        return self.text_statistics.analyze(text).token_syllables
         
     def _count_facts(self, text: str) -> int:
         """Count fact-like statements in text."""
         fact_count = sum(
-            len(re.findall(pattern, text, re.IGNORECASE))
-            for pattern in self.fact_patterns
+            len(regex.findall(text))
+            for regex in self._fact_regexes
         )
         
-        # Also count sentences with numbers (often factual)
-        sentences = re.split(r'[.!?]+', text)
-        for sentence in sentences:
-            if re.search(r'\d+', sentence):
-                fact_count += 0.5  # Half weight for general numeric content
+        # Also count sentences with numbers (often factual), half weight
+        fact_count += 0.5 * self.text_statistics.analyze(text).numeric_sentence_count
                 
         return int(fact_count)
         
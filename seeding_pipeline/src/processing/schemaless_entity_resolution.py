@@ -23,7 +23,9 @@ THRESHOLD: If entity resolution reduces unique entities by less than 5%, conside
 """
 
 import re
-from typing import Dict, Any, List, Set, Tuple, Optional
+import random
+import zlib
+from typing import Dict, Any, List, Set, Tuple, Optional, Iterable
 from dataclasses import dataclass
 from collections import defaultdict
 import logging
@@ -45,6 +47,9 @@ class EntityResolutionConfig:
     preview_mode: bool = False  # Show merges without applying
     max_merge_distance: int = 3  # Max edit distance for fuzzy matching
     confidence_weight: bool = True  # Weight merges by entity confidence
+    blocking_min_entities: int = 64  # Below this many entities, compare all pairs
+    lsh_bands: int = 16  # MinHash LSH bands for fuzzy candidate blocking
+    lsh_rows: int = 2  # MinHash rows per band (more rows = stricter blocks)
 
 
 @dataclass
@@ -57,6 +62,150 @@ class EntityMatch:
     confidence: float
 
 
+# Irregular plurals recognised when merging singular/plural forms
+IRREGULAR_PLURALS = {
+    'person': 'people',
+    'child': 'children',
+    'man': 'men',
+    'woman': 'women',
+    'datum': 'data',
+    'index': 'indices'
+}
+
+_MINHASH_PRIME = (1 << 61) - 1
+
+
+class UnionFind:
+    """Disjoint-set forest with path compression, union by size and member lists."""
+    
+    def __init__(self, size: int = 0):
+        self.parent = list(range(size))
+        self.members: Dict[int, List[int]] = {i: [i] for i in range(size)}
+    
+    def add(self) -> int:
+        """Add a new singleton set and return its index."""
+        item = len(self.parent)
+        self.parent.append(item)
+        self.members[item] = [item]
+        return item
+    
+    def find(self, item: int) -> int:
+        """Return the representative of the set containing item."""
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+    
+    def union(self, item1: int, item2: int) -> bool:
+        """Merge the sets containing both items. Returns False if already joined."""
+        root1, root2 = self.find(item1), self.find(item2)
+        if root1 == root2:
+            return False
+        if len(self.members[root1]) < len(self.members[root2]):
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.members[root1].extend(self.members.pop(root2))
+        return True
+    
+    def groups(self, roots: Optional[Iterable[int]] = None) -> List[List[int]]:
+        """Sets (all, or those with the given roots) ordered by their smallest member."""
+        selected = self.members.keys() if roots is None else roots
+        return sorted((sorted(self.members[root]) for root in selected), key=lambda group: group[0])
+
+
+class EntityBlockIndex:
+    """
+    Blocking index that proposes candidate pairs for entity comparison.
+    
+    Each entity name is reduced to a handful of blocking keys (normalized
+    form, acronym, singular stem, alias group, expanded abbreviation and
+    MinHash LSH bands over character bigrams). Only entities sharing at least
+    one key are compared, which keeps resolution close to linear instead of
+    comparing every pair.
+    """
+    
+    def __init__(self, resolver: 'SchemalessEntityResolver'):
+        self.resolver = resolver
+        config = resolver.config
+        self.bands = config.lsh_bands
+        self.rows = config.lsh_rows
+        rng = random.Random(42)
+        self._hash_params = [
+            (rng.randrange(1, _MINHASH_PRIME), rng.randrange(0, _MINHASH_PRIME))
+            for _ in range(self.bands * self.rows)
+        ]
+        self.blocks: Dict[str, List[int]] = defaultdict(list)
+    
+    def add(self, item: int, name: str) -> Set[int]:
+        """Index an entity name and return previously indexed candidate items."""
+        candidates = set()
+        for key in self.blocking_keys(name):
+            block = self.blocks[key]
+            candidates.update(block)
+            block.append(item)
+        return candidates
+    
+    def blocking_keys(self, name: str) -> Set[str]:
+        """Return all blocking keys for an entity name."""
+        normalized = _normalize_name(name)
+        if not normalized:
+            # Punctuation-only names can still match exactly
+            return {f"raw:{name}"} if name else set()
+        keys = {f"norm:{normalized}"}
+        resolver = self.resolver
+        
+        if resolver.config.use_abbreviations:
+            # Acronyms and their expansions share an initials key
+            words = normalized.split()
+            if len(words) > 1:
+                keys.add("acr:" + ''.join(word[0] for word in words))
+            elif name.isupper():
+                keys.add(f"acr:{normalized}")
+            expansion = resolver.abbreviation_map.get(name)
+            if expansion:
+                keys.add(f"norm:{_normalize_name(expansion)}")
+        
+        if resolver.config.use_aliases:
+            group = resolver._alias_index.get(name.lower())
+            if group is not None:
+                keys.add(f"alias:{group}")
+        
+        if resolver.config.merge_singular_plural:
+            keys.add(f"stem:{_singular_stem(normalized)}")
+        
+        keys.update(self._lsh_keys(normalized))
+        return keys
+    
+    def _lsh_keys(self, normalized: str) -> Iterable[str]:
+        """MinHash the padded character bigrams and emit one key per band."""
+        padded = f"^{normalized}$"
+        grams = {zlib.crc32(padded[i:i + 2].encode()) for i in range(len(padded) - 1)}
+        signature = [
+            min((a * gram + b) % _MINHASH_PRIME for gram in grams)
+            for a, b in self._hash_params
+        ]
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            yield f"lsh:{band}:" + ':'.join(map(str, rows))
+
+
+def _normalize_name(name: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return ' '.join(re.sub(r"[^\w\s]", ' ', name.lower()).split())
+
+
+def _singular_stem(normalized: str) -> str:
+    """Singular form used to block singular/plural variants together."""
+    for singular, plural in IRREGULAR_PLURALS.items():
+        if normalized == plural:
+            return singular
+    if normalized.endswith('s'):
+        return normalized[:-1]
+    return normalized
+
+
 class SchemalessEntityResolver:
     """
     Resolves and merges duplicate entities from schemaless extraction.
@@ -69,7 +218,15 @@ class SchemalessEntityResolver:
         """Initialize the entity resolver with configuration."""
         self.config = config or EntityResolutionConfig()
         self.alias_rules = self._load_alias_rules()
+        self._alias_index = {
+            alias: group for group, aliases in enumerate(self.alias_rules) for alias in aliases
+        }
         self.abbreviation_map = self._load_abbreviations()
+        # Persistent state for incremental resolution across segments
+        self._seen_entities: List[Dict[str, Any]] = []
+        self._seen_sets = UnionFind()
+        self._seen_first_by_name: Dict[str, int] = {}
+        self._seen_index = EntityBlockIndex(self)
         self.resolution_metrics = {
             "entities_before": 0,
             "entities_after": 0,
@@ -128,7 +285,7 @@ class SchemalessEntityResolver:
             contribution = ComponentContribution(
                 component_name="entity_resolution",
                 contribution_type="entities_merged",
-                details={
+                metadata={
                     "merge_types": dict(self.resolution_metrics["merge_types"]),
                     "reduction_ratio": 1 - (len(resolved_entities) / len(entities))
                 },
@@ -147,17 +304,54 @@ class SchemalessEntityResolver:
         }
     
     def _find_entity_matches(self, entities: List[Dict[str, Any]]) -> List[EntityMatch]:
-        """Find all potential matches between entities."""
+        """Find the matches that connect entities into clusters.
+        
+        Small inputs compare every pair. Larger inputs only compare entities
+        that share a blocking key, and skip pairs a previous match has already
+        placed in the same cluster, since they cannot change the clustering.
+        """
         matches = []
         
-        for i in range(len(entities)):
-            for j in range(i + 1, len(entities)):
-                match = self._compare_entities(entities[i], entities[j])
-                if match and match.similarity_score >= self.config.similarity_threshold:
-                    matches.append(match)
+        if len(entities) < self.config.blocking_min_entities:
+            for i in range(len(entities)):
+                for j in range(i + 1, len(entities)):
+                    match = self._compare_entities(entities[i], entities[j])
+                    if match and match.similarity_score >= self.config.similarity_threshold:
+                        matches.append(match)
+            return matches
+        
+        index = EntityBlockIndex(self)
+        sets = UnionFind(len(entities))
+        first_by_name: Dict[str, int] = {}
+        for j in range(len(entities)):
+            matches.extend(self._link_entity(entities, j, index, sets, first_by_name))
         
         return matches
     
+    def _link_entity(self, entities: List[Dict[str, Any]], item: int, index: 'EntityBlockIndex',
+                     sets: UnionFind, first_by_name: Dict[str, int]) -> List[EntityMatch]:
+        """Compare one entity with its blocking candidates and union it with its matches."""
+        entity = entities[item]
+        name = entity.get('value', entity.get('name', '')) or ''
+        if name in first_by_name:
+            # Repeated names are exact matches; only the first occurrence is indexed
+            match = self._compare_entities(entities[first_by_name[name]], entity)
+            if match:
+                sets.union(first_by_name[name], item)
+                return [match]
+            return []
+        first_by_name[name] = item
+        
+        matches = []
+        for candidate in sorted(index.add(item, name)):
+            if sets.find(candidate) == sets.find(item):
+                continue
+            match = self._compare_entities(entities[candidate], entity)
+            if match and match.similarity_score >= self.config.similarity_threshold:
+                sets.union(candidate, item)
+                matches.append(match)
+        return matches
+    
     def _compare_entities(self, entity1: Dict[str, Any], entity2: Dict[str, Any]) -> Optional[EntityMatch]:
         """Compare two entities and return match information if similar."""
         name1 = entity1.get('value', entity1.get('name', ''))
@@ -279,19 +473,10 @@ class SchemalessEntityResolver:
             return True
         
         # Common irregular plurals
-        irregular_plurals = {
-            'person': 'people',
-            'child': 'children',
-            'man': 'men',
-            'woman': 'women',
-            'datum': 'data',
-            'index': 'indices'
-        }
-        
         name1_lower = name1.lower()
         name2_lower = name2.lower()
         
-        for singular, plural in irregular_plurals.items():
+        for singular, plural in IRREGULAR_PLURALS.items():
             if (name1_lower == singular and name2_lower == plural) or \
                (name1_lower == plural and name2_lower == singular):
                 return True
@@ -305,38 +490,70 @@ class SchemalessEntityResolver:
     
     def _cluster_entities(self, entities: List[Dict[str, Any]], matches: List[EntityMatch]) -> List[List[Dict[str, Any]]]:
         """Group entities into clusters based on matches."""
-        # Create a mapping of entity to cluster ID
-        entity_to_cluster = {}
-        clusters = []
+        position = {id(entity): i for i, entity in enumerate(entities)}
+        sets = UnionFind(len(entities))
+        for match in matches:
+            sets.union(position[id(match.entity1)], position[id(match.entity2)])
+        return [[entities[i] for i in group] for group in sets.groups()]
+    
+    def resolve_incremental(self, entities: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        """
+        Resolve new entities against everything this resolver has already seen.
         
-        # Initialize each entity in its own cluster
-        for i, entity in enumerate(entities):
-            entity_id = id(entity)
-            entity_to_cluster[entity_id] = i
-            clusters.append([entity])
+        Each new entity is only compared with previously seen entities that
+        share a blocking key, so resolving a segment costs roughly the size of
+        the segment rather than re-running all pairs over the whole episode.
         
-        # Merge clusters based on matches
-        for match in matches:
-            id1 = id(match.entity1)
-            id2 = id(match.entity2)
-            
-            cluster1 = entity_to_cluster[id1]
-            cluster2 = entity_to_cluster[id2]
+        Args:
+            entities: Newly extracted entities (e.g. from one segment)
+            **kwargs: Additional context (episode_id, segment_id)
             
-            if cluster1 != cluster2:
-                # Merge smaller cluster into larger
-                if len(clusters[cluster1]) < len(clusters[cluster2]):
-                    cluster1, cluster2 = cluster2, cluster1
-                
-                # Move all entities from cluster2 to cluster1
-                for entity in clusters[cluster2]:
-                    entity_to_cluster[id(entity)] = cluster1
-                    clusters[cluster1].append(entity)
-                
-                clusters[cluster2] = []  # Mark as empty
-        
-        # Return non-empty clusters
-        return [cluster for cluster in clusters if cluster]
+        Returns:
+            Dictionary with the canonical entities touched by this batch,
+            merged over all occurrences seen so far
+        """
+        self.resolution_metrics = {
+            "entities_before": len(entities),
+            "entities_after": 0,
+            "merges_performed": 0,
+            "merge_types": defaultdict(int)
+        }
+        
+        new_items = []
+        for entity in entities:
+            item = self._seen_sets.add()
+            self._seen_entities.append(entity)
+            new_items.append(item)
+            matches = self._link_entity(self._seen_entities, item, self._seen_index,
+                                        self._seen_sets, self._seen_first_by_name)
+            self.resolution_metrics["merges_performed"] += len(matches)
+        
+        # Rebuild only the clusters this batch touched
+        touched_roots = {self._seen_sets.find(item) for item in new_items}
+        resolved_entities = []
+        for group in self._seen_sets.groups(touched_roots):
+            cluster = [self._seen_entities[i] for i in group]
+            resolved_entities.append(
+                self._merge_entity_cluster(cluster) if len(cluster) > 1 else cluster[0]
+            )
+        self.resolution_metrics["entities_after"] = len(resolved_entities)
+        
+        return {
+            "resolved_entities": resolved_entities,
+            "original_count": len(entities),
+            "resolved_count": len(resolved_entities),
+            "canonical_count": len(self._seen_sets.members),
+            "metrics": self._get_resolution_metrics(),
+            "episode_id": kwargs.get('episode_id'),
+            "segment_id": kwargs.get('segment_id')
+        }
+    
+    def reset_incremental(self) -> None:
+        """Forget the entities accumulated by resolve_incremental."""
+        self._seen_entities = []
+        self._seen_sets = UnionFind()
+        self._seen_first_by_name = {}
+        self._seen_index = EntityBlockIndex(self)
     
     def _merge_entity_cluster(self, cluster: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Merge a cluster of entities into a single canonical entity."""
@@ -111,7 +111,7 @@ class SegmentPreprocessor:
             contribution = ComponentContribution(
                 component_name="segment_preprocessor",
                 contribution_type="metadata_injection",
-                details={
+                metadata={
                     "markers_added": self.markers_added,
                     "injection_types": list(set(m.split(':')[0].strip('[') for m in self.markers_added))
                 },
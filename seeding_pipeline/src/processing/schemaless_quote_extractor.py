@@ -145,7 +145,7 @@ class SchemalessQuoteExtractor:
             contribution = ComponentContribution(
                 component_name="quote_extractor",
                 contribution_type="quotes_extracted",
-                details={
+                metadata={
                     "quote_types": list(set(q.get('type', 'general') for q in scored_quotes)),
                     "avg_importance": sum(q['importance_score'] for q in scored_quotes) / len(scored_quotes)
                 },
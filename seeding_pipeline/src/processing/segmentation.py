@@ -5,7 +5,6 @@ This module handles the segmentation and post-processing of podcast transcripts,
 including advertisement detection and sentiment analysis.
 """
 
-import re
 import logging
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
@@ -16,6 +15,7 @@ from ..core import (
     AudioProvider,
     constants,
 )
+from .text_markers import ADVERTISEMENT, NEGATIVE, POSITIVE, markers_for
 
 
 logger = logging.getLogger(__name__)
@@ -189,14 +189,11 @@ class EnhancedPodcastSegmenter:
         if not self.config.get('ad_detection_enabled', True):
             return False
             
-        # Convert to lowercase for matching
-        text_lower = text.lower()
-        
         # Check for common ad markers
-        for marker in constants.AD_MARKERS:
-            if marker in text_lower:
-                logger.debug(f"Advertisement detected: '{marker}' found in text")
-                return True
+        marker = markers_for(text).first(ADVERTISEMENT)
+        if marker is not None:
+            logger.debug(f"Advertisement detected: '{marker}' found in text")
+            return True
                 
         return False
         
@@ -214,28 +211,11 @@ class EnhancedPodcastSegmenter:
                 - positive_count: Number of positive words
                 - negative_count: Number of negative words
         """
-        # Simple lexicon-based sentiment analysis
-        positive_words = {
-            "good", "great", "excellent", "amazing", "love", "best", "positive",
-            "happy", "excited", "wonderful", "fantastic", "superior", "beneficial",
-            "brilliant", "outstanding", "remarkable", "impressive", "delightful",
-            "perfect", "enjoyable", "beautiful", "awesome", "incredible"
-        }
-        
-        negative_words = {
-            "bad", "terrible", "awful", "hate", "worst", "negative", "poor",
-            "horrible", "failure", "inadequate", "disappointing", "problem",
-            "wrong", "difficult", "unfortunate", "ugly", "nasty", "disaster",
-            "pathetic", "inferior", "useless", "annoying", "frustrating"
-        }
-        
-        # Extract words from text
-        text_lower = text.lower()
-        words = re.findall(r'\b\w+\b', text_lower)
-        
-        # Count sentiment words
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        # Simple lexicon-based sentiment analysis; the segment's markers
+        # carry the counts of positive and negative words
+        markers = markers_for(text)
+        positive_count = markers.count(POSITIVE)
+        negative_count = markers.count(NEGATIVE)
         
         # Calculate sentiment score (-1 to 1)
         total = positive_count + negative_count
@@ -0,0 +1,463 @@
+"""
+CSR adjacency graph backend for graph analytics.
+
+GraphAnalyzer and EmergentThemeDetector used to build a separate NetworkX
+graph (dict-of-dicts) for every analysis. A SparseGraph is built once per
+episode from the node and edge lists and shared: betweenness, connected
+components, degrees and modularity run on the SciPy CSR matrix, and the
+graph is only converted to NetworkX (once, cached) for the per-episode
+Louvain. Corpus-sized graphs use the CSR PageRank and Louvain instead.
+
+Betweenness uses Brandes' dependency accumulation over a batch of sources
+at a time: distances come from SciPy's Dijkstra, and shortest-path counts
+and dependencies are propagated along the shortest-path DAG with sparse
+matrix products. Sampling ``pivots`` sources gives the usual unbiased
+approximation for large graphs.
+"""
+
+import logging
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.lazy_imports import LazyImport
+
+sparse = LazyImport('scipy.sparse')
+csgraph = LazyImport('scipy.sparse.csgraph')
+nx = LazyImport('networkx')
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the per-batch (sources x edges) working arrays
+BATCH_MEMORY_BYTES = 64 * 1024 * 1024
+
+
+class SparseGraph:
+    """Undirected weighted graph stored as a symmetric CSR adjacency matrix."""
+
+    def __init__(self, node_ids: Sequence[Hashable], adjacency: Any,
+                 node_data: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize the graph.
+
+        Args:
+            node_ids: Node identifiers; position i is row/column i
+            adjacency: Symmetric scipy.sparse matrix of edge weights
+            node_data: Optional attributes per node
+        """
+        self.node_ids = list(node_ids)
+        self.index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.adjacency = sparse.csr_matrix(adjacency, dtype=np.float64)
+        self.node_data = node_data or [{} for _ in self.node_ids]
+        self._networkx = None
+
+    @classmethod
+    def from_edges(cls, nodes: Iterable[Dict[str, Any]], edges: Iterable[Tuple[Any, Any, float]],
+                   add_missing_nodes: bool = False) -> 'SparseGraph':
+        """
+        Build a graph from node dictionaries and weighted edges.
+
+        Like ``nx.Graph.add_edge``, a repeated edge keeps the last weight.
+
+        Args:
+            nodes: Node dictionaries with an 'id' key
+            edges: (source_id, target_id, weight) tuples
+            add_missing_nodes: Add nodes that only appear in edges instead of
+                dropping their edges
+
+        Returns:
+            The graph
+        """
+        node_ids: List[Hashable] = []
+        node_data: List[Dict[str, Any]] = []
+        index: Dict[Hashable, int] = {}
+        for node in nodes:
+            node_id = node['id']
+            if node_id in index:
+                node_data[index[node_id]] = node
+                continue
+            index[node_id] = len(node_ids)
+            node_ids.append(node_id)
+            node_data.append(node)
+
+        rows, cols, weights = [], [], []
+        for source, target, weight in edges:
+            for endpoint in (source, target):
+                if endpoint not in index and add_missing_nodes:
+                    index[endpoint] = len(node_ids)
+                    node_ids.append(endpoint)
+                    node_data.append({'id': endpoint})
+            if source in index and target in index:
+                i, j = index[source], index[target]
+                rows.append(min(i, j))
+                cols.append(max(i, j))
+                weights.append(weight)
+
+        n = len(node_ids)
+        if rows:
+            rows_arr = np.asarray(rows, dtype=np.int64)
+            cols_arr = np.asarray(cols, dtype=np.int64)
+            weights_arr = np.asarray(weights, dtype=np.float64)
+            # Keep the last weight of repeated edges
+            keys = rows_arr * n + cols_arr
+            _, last = np.unique(keys[::-1], return_index=True)
+            keep = len(keys) - 1 - last
+            rows_arr, cols_arr, weights_arr = rows_arr[keep], cols_arr[keep], weights_arr[keep]
+            upper = sparse.coo_matrix((weights_arr, (rows_arr, cols_arr)), shape=(n, n))
+            adjacency = upper + sparse.triu(upper, k=1).T
+        else:
+            adjacency = sparse.csr_matrix((n, n))
+        return cls(node_ids, adjacency, node_data)
+
+    @classmethod
+    def from_arrays(cls, node_ids: Sequence[Hashable], sources: np.ndarray, targets: np.ndarray,
+                    weights: Optional[np.ndarray] = None) -> 'SparseGraph':
+        """
+        Build a graph from integer edge arrays, e.g. a memory-mapped edge list.
+
+        Parallel edges are merged by summing their weights.
+
+        Args:
+            node_ids: Node identifiers; edge endpoints index into this list
+            sources: Source node positions
+            targets: Target node positions
+            weights: Edge weights (default 1.0)
+
+        Returns:
+            The graph
+        """
+        n = len(node_ids)
+        if weights is None:
+            weights = np.ones(len(sources))
+        directed = sparse.coo_matrix(
+            (np.asarray(weights, dtype=np.float64), (np.asarray(sources), np.asarray(targets))),
+            shape=(n, n)
+        ).tocsr()
+        directed.sum_duplicates()
+        adjacency = directed + directed.T
+        # Self-loops were added to themselves by the transpose
+        adjacency.setdiag(directed.diagonal())
+        adjacency.eliminate_zeros()
+        return cls(node_ids, adjacency)
+
+    @property
+    def number_of_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def number_of_edges(self) -> int:
+        """Undirected edges, self-loops included."""
+        diagonal = int(np.count_nonzero(self.adjacency.diagonal()))
+        return (self.adjacency.nnz - diagonal) // 2 + diagonal
+
+    def __contains__(self, node_id: Hashable) -> bool:
+        return node_id in self.index
+
+    def degrees(self) -> np.ndarray:
+        """Number of neighbours per node (self-loops count twice, as in NetworkX)."""
+        degree = np.diff(self.adjacency.indptr)
+        return degree + (self.adjacency.diagonal() != 0)
+
+    def connected_components(self) -> List[List[Hashable]]:
+        """Node ids per connected component, ordered by their first node."""
+        if not self.node_ids:
+            return []
+        _, labels = csgraph.connected_components(self.adjacency, directed=False)
+        order = np.argsort(labels, kind='stable')
+        boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+        return [[self.node_ids[i] for i in group] for group in np.split(order, boundaries)]
+
+    def betweenness_centrality(self, pivots: Optional[int] = None, weighted: bool = True,
+                               normalized: bool = True,
+                               seed: Optional[int] = None) -> Dict[Hashable, float]:
+        """
+        Betweenness centrality, exact or estimated from sampled pivots.
+
+        Matches ``nx.betweenness_centrality(G, k=pivots, weight='weight')``:
+        weights are path lengths and scores are normalized by
+        ``(n - 1)(n - 2)``; sampled sums are scaled by ``n / pivots``.
+
+        Args:
+            pivots: Number of sampled source nodes; None (or >= n) is exact
+            weighted: Use edge weights as lengths instead of hop counts
+            normalized: Normalize scores
+            seed: Seed for pivot sampling
+
+        Returns:
+            Score per node id
+        """
+        n = self.number_of_nodes
+        if n == 0:
+            return {}
+
+        lengths = sparse.csr_matrix(self.adjacency)
+        lengths.setdiag(0)
+        lengths.eliminate_zeros()
+        if not weighted:
+            lengths.data[:] = 1.0
+
+        if pivots is not None and pivots < n:
+            sources = np.random.default_rng(seed).choice(n, size=pivots, replace=False)
+        else:
+            sources = np.arange(n)
+
+        edges = lengths.tocoo()
+        tails, heads, edge_lengths = edges.row, edges.col, edges.data
+        n_edges = len(tails)
+        betweenness = np.zeros(n)
+        if n_edges:
+            # Sum per-edge values into their head / tail node
+            edge_ids = np.arange(n_edges)
+            ones = np.ones(n_edges)
+            into_head = sparse.csr_matrix((ones, (heads, edge_ids)), shape=(n, n_edges))
+            into_tail = sparse.csr_matrix((ones, (tails, edge_ids)), shape=(n, n_edges))
+
+            batch_size = int(max(1, min(256, BATCH_MEMORY_BYTES // (8 * 6 * n_edges))))
+            for start in range(0, len(sources), batch_size):
+                batch = sources[start:start + batch_size]
+                betweenness += self._accumulate_dependencies(
+                    lengths, batch, tails, heads, edge_lengths, into_head, into_tail
+                )
+
+        # Rescale like NetworkX for undirected graphs
+        if normalized:
+            scale = 1 / ((n - 1) * (n - 2)) if n > 2 else None
+        else:
+            scale = 0.5
+        if scale is not None:
+            if len(sources) < n:
+                scale *= n / len(sources)
+            betweenness *= scale
+
+        return dict(zip(self.node_ids, betweenness.tolist()))
+
+    @staticmethod
+    def _accumulate_dependencies(lengths, batch: np.ndarray, tails: np.ndarray, heads: np.ndarray,
+                                 edge_lengths: np.ndarray, into_head, into_tail) -> np.ndarray:
+        """Brandes dependencies of every node summed over a batch of sources."""
+        n = lengths.shape[0]
+        rows = np.arange(len(batch))
+        dist = csgraph.dijkstra(lengths, directed=False, indices=batch)
+
+        # Edges on shortest paths from each source (the shortest-path DAG)
+        tail_dist = dist[:, tails]
+        head_dist = dist[:, heads]
+        with np.errstate(invalid='ignore'):
+            on_path = np.isfinite(tail_dist) & (
+                np.abs(tail_dist + edge_lengths - head_dist) <= 1e-12 * np.maximum(head_dist, 1.0)
+            )
+        del tail_dist, head_dist
+
+        # Shortest-path counts: sigma[v] = sum of sigma[u] over DAG edges u -> v
+        seed_counts = np.zeros((len(batch), n))
+        seed_counts[rows, batch] = 1.0
+        sigma = seed_counts
+        for _ in range(n):
+            updated = seed_counts + (into_head @ (on_path * sigma[:, tails]).T).T
+            if np.array_equal(updated, sigma):
+                break
+            sigma = updated
+
+        # Dependencies: delta[v] = sum over DAG edges v -> w of sigma[v] / sigma[w] * (1 + delta[w])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(on_path, sigma[:, tails] / sigma[:, heads], 0.0)
+        delta = np.zeros((len(batch), n))
+        for _ in range(n):
+            updated = (into_tail @ (ratio * (1.0 + delta[:, heads])).T).T
+            if np.array_equal(updated, delta):
+                break
+            delta = updated
+
+        delta[rows, batch] = 0.0
+        return delta.sum(axis=0)
+
+    def modularity(self, communities: Iterable[Iterable[Hashable]], resolution: float = 1.0) -> float:
+        """
+        Weighted modularity of a partition, as ``nx.community.modularity``.
+
+        Args:
+            communities: Node id sets partitioning the graph
+            resolution: Resolution parameter
+
+        Returns:
+            Modularity
+        """
+        labels = np.full(self.number_of_nodes, -1, dtype=np.int64)
+        for label, members in enumerate(communities):
+            for node_id in members:
+                labels[self.index[node_id]] = label
+
+        diagonal = self.adjacency.diagonal()
+        # Weighted degree; self-loops count twice
+        degree = np.asarray(self.adjacency.sum(axis=1)).ravel() + diagonal
+        degree_sum = degree.sum()
+        if degree_sum == 0:
+            return 0.0
+        m = degree_sum / 2
+
+        edges = self.adjacency.tocoo()
+        same = labels[edges.row] == labels[edges.col]
+        off_diagonal = edges.row != edges.col
+        intra_weight = edges.data[same & off_diagonal].sum() / 2 + diagonal[labels >= 0].sum()
+
+        community_degree = np.bincount(labels[labels >= 0], weights=degree[labels >= 0])
+        return float(intra_weight / m - resolution * (community_degree ** 2).sum() / degree_sum ** 2)
+
+    def pagerank(self, alpha: float = 0.85, max_iter: int = 100,
+                 tol: float = 1.0e-6) -> Dict[Hashable, float]:
+        """
+        Weighted PageRank, as ``nx.pagerank`` on the undirected graph.
+
+        Args:
+            alpha: Damping factor
+            max_iter: Maximum number of power iterations
+            tol: Convergence tolerance per node
+
+        Returns:
+            Score per node id
+        """
+        n = self.number_of_nodes
+        if n == 0:
+            return {}
+
+        out_weight = np.asarray(self.adjacency.sum(axis=1)).ravel()
+        dangling = out_weight == 0
+        inverse_out = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+        # The adjacency is symmetric, so it is its own transpose
+        transition = self.adjacency
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            previous = rank
+            rank = alpha * (transition @ (previous * inverse_out))
+            rank += (alpha * previous[dangling].sum() + 1.0 - alpha) / n
+            if np.abs(rank - previous).sum() < n * tol:
+                break
+        else:
+            logger.warning(f"PageRank did not converge in {max_iter} iterations")
+
+        return dict(zip(self.node_ids, rank.tolist()))
+
+    def louvain_communities(self, resolution: float = 1.0, threshold: float = 1.0e-7,
+                            seed: Optional[int] = None) -> List[List[Hashable]]:
+        """
+        Louvain communities computed on the CSR matrix.
+
+        Same method as ``nx.community.louvain_communities`` (move nodes in
+        random order to the neighbouring community with the best modularity
+        gain, then merge communities into nodes and repeat), but without a
+        NetworkX graph, so it scales to corpus-sized graphs. Results can
+        differ from NetworkX for the same seed.
+
+        Args:
+            resolution: Resolution parameter
+            threshold: Stop once a level improves modularity by less than this
+            seed: Seed for the node order
+
+        Returns:
+            Node ids per community, largest first
+        """
+        n = self.number_of_nodes
+        if n == 0:
+            return []
+
+        rng = np.random.default_rng(seed)
+        # Self-loops count twice in degrees, as in NetworkX
+        matrix = (self.adjacency + sparse.diags(self.adjacency.diagonal())).tocsr()
+        membership = np.arange(n)
+        modularity = self._matrix_modularity(matrix, np.arange(n), resolution)
+        while True:
+            labels, moved = self._louvain_local_moving(matrix, resolution, rng)
+            if not moved:
+                break
+            new_modularity = self._matrix_modularity(matrix, labels, resolution)
+            membership = labels[membership]
+            if new_modularity - modularity <= threshold:
+                break
+            modularity = new_modularity
+            # Merge every community into a single node
+            size = len(labels)
+            merge = sparse.csr_matrix((np.ones(size), (np.arange(size), labels)),
+                                      shape=(size, labels.max() + 1))
+            matrix = (merge.T @ matrix @ merge).tocsr()
+
+        order = np.argsort(membership, kind='stable')
+        boundaries = np.flatnonzero(np.diff(membership[order])) + 1
+        communities = [[self.node_ids[i] for i in group] for group in np.split(order, boundaries)]
+        communities.sort(key=len, reverse=True)
+        return communities
+
+    @staticmethod
+    def _louvain_local_moving(matrix, resolution: float, rng) -> Tuple[np.ndarray, bool]:
+        """One Louvain level: returns contiguous community labels and whether any node moved."""
+        n = matrix.shape[0]
+        degree = np.asarray(matrix.sum(axis=1)).ravel()
+        degree_sum = degree.sum()
+        if degree_sum == 0:
+            return np.arange(n), False
+
+        # Plain lists: per-node numpy calls would dominate the loop
+        indptr = matrix.indptr.tolist()
+        indices = matrix.indices.tolist()
+        weights = matrix.data.tolist()
+        degrees = degree.tolist()
+        community = list(range(n))
+        community_degree = list(degrees)
+        scale = resolution / degree_sum
+        order = rng.permutation(n).tolist()
+
+        moved_any = False
+        moved = True
+        while moved:
+            moved = False
+            for node in order:
+                links: Dict[int, float] = {}
+                for position in range(indptr[node], indptr[node + 1]):
+                    neighbour = indices[position]
+                    if neighbour != node:
+                        target = community[neighbour]
+                        links[target] = links.get(target, 0.0) + weights[position]
+
+                own = community[node]
+                node_degree = degrees[node]
+                community_degree[own] -= node_degree
+                best = own
+                best_gain = links.get(own, 0.0) - scale * community_degree[own] * node_degree
+                for target, weight in links.items():
+                    gain = weight - scale * community_degree[target] * node_degree
+                    if gain > best_gain:
+                        best, best_gain = target, gain
+                community_degree[best] += node_degree
+                if best != own:
+                    community[node] = best
+                    moved = moved_any = True
+
+        _, labels = np.unique(np.asarray(community), return_inverse=True)
+        return labels, moved_any
+
+    @staticmethod
+    def _matrix_modularity(matrix, labels: np.ndarray, resolution: float) -> float:
+        """Modularity of a labelling of a matrix whose row sums are degrees."""
+        degree = np.asarray(matrix.sum(axis=1)).ravel()
+        degree_sum = degree.sum()
+        if degree_sum == 0:
+            return 0.0
+        edges = matrix.tocoo()
+        intra = edges.data[labels[edges.row] == labels[edges.col]].sum()
+        community_degree = np.bincount(labels, weights=degree)
+        return float(intra / degree_sum - resolution * (community_degree ** 2).sum() / degree_sum ** 2)
+
+    def to_networkx(self) -> Any:
+        """The graph as a ``networkx.Graph``, converted once."""
+        if self._networkx is None:
+            graph = nx.Graph()
+            for node_id, data in zip(self.node_ids, self.node_data):
+                graph.add_node(node_id, **{k: v for k, v in data.items() if k != 'id'})
+            upper = sparse.triu(self.adjacency).tocoo()
+            graph.add_weighted_edges_from(
+                (self.node_ids[i], self.node_ids[j], w)
+                for i, j, w in zip(upper.row.tolist(), upper.col.tolist(), upper.data.tolist())
+            )
+            self._networkx = graph
+        return self._networkx
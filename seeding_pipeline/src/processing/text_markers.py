@@ -0,0 +1,334 @@
+"""
+Shared marker matching for the discourse analyzers and the segmenter.
+
+Transition markers, theme acknowledgment phrases, metaphor keywords,
+advertisement markers and sentiment words used to be looked up one phrase at
+a time with ``phrase in text``, by each analyzer and for every segment. This
+module compiles all of them into one pattern, built once per process, that
+tags a text with every phrase it contains in a single scan. For a
+``SegmentStore`` the whole episode is scanned at once and the tags are kept
+for all analyzers.
+
+Phrases match anywhere in the lower-cased text, as ``in`` did; sentiment
+words match whole words, as the segmenter's tokenizer did.
+"""
+
+import re
+import threading
+import weakref
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from ..core import constants
+from ..core.segment_store import SegmentStore, SegmentView
+
+
+# Explicit transition markers by transition type (EpisodeFlowAnalyzer)
+EPISODE_TRANSITION_MARKERS = {
+    "continuation": ["furthermore", "moreover", "additionally", "also"],
+    "expansion": ["speaking of which", "on that note", "similarly"],
+    "pivot": ["however", "on the other hand", "but", "alternatively"],
+    "jump": ["anyway", "moving on", "let's shift to", "changing topics"],
+    "return": ["going back to", "as I was saying", "to return to"]
+}
+
+# Transition markers between concept segments (DiscourseFlowTracker)
+DISCOURSE_TRANSITION_MARKERS = [
+    "speaking of which", "on that note", "similarly", "however",
+    "moving on", "furthermore", "in addition", "consequently",
+    "therefore", "as a result", "in contrast", "meanwhile"
+]
+
+# Phrases that name a theme explicitly (EmergentThemeDetector)
+ACKNOWLEDGMENT_PHRASES = [
+    "this is really about",
+    "what we're talking about is",
+    "the underlying theme",
+    "this comes down to",
+    "at its core"
+]
+
+# Common metaphor families (EmergentThemeDetector)
+METAPHOR_FAMILIES = {
+    "journey": ["path", "road", "journey", "destination", "milestone", "crossroads"],
+    "war": ["battle", "fight", "combat", "victory", "defeat", "strategy", "weapon"],
+    "growth": ["grow", "seed", "bloom", "flourish", "root", "branch", "fertile"],
+    "building": ["foundation", "build", "construct", "architect", "structure", "pillar"],
+    "game": ["play", "rules", "win", "lose", "score", "team", "compete"],
+    "machine": ["engine", "gear", "mechanism", "fuel", "drive", "operate"],
+    "ecosystem": ["ecosystem", "environment", "evolve", "adapt", "balance", "symbiosis"]
+}
+
+# Sentiment lexicon (EnhancedPodcastSegmenter)
+POSITIVE_WORDS = frozenset({
+    "good", "great", "excellent", "amazing", "love", "best", "positive",
+    "happy", "excited", "wonderful", "fantastic", "superior", "beneficial",
+    "brilliant", "outstanding", "remarkable", "impressive", "delightful",
+    "perfect", "enjoyable", "beautiful", "awesome", "incredible"
+})
+
+NEGATIVE_WORDS = frozenset({
+    "bad", "terrible", "awful", "hate", "worst", "negative", "poor",
+    "horrible", "failure", "inadequate", "disappointing", "problem",
+    "wrong", "difficult", "unfortunate", "ugly", "nasty", "disaster",
+    "pathetic", "inferior", "useless", "annoying", "frustrating"
+})
+
+# Category names
+EPISODE_TRANSITION = "episode_transition"
+DISCOURSE_TRANSITION = "discourse_transition"
+ACKNOWLEDGMENT = "acknowledgment"
+ADVERTISEMENT = "advertisement"
+POSITIVE = "positive"
+NEGATIVE = "negative"
+
+
+def metaphor_category(family: str) -> str:
+    """Category name of a metaphor family."""
+    return f"metaphor:{family}"
+
+
+def _trie_pattern(phrases: Iterable[str]) -> str:
+    """
+    Regex alternation of phrases, nested as a trie.
+
+    Each character is tested once per position instead of once per phrase,
+    and the longest phrase starting at a position is preferred.
+    """
+    trie: Dict[str, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        ends_here = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends_here:
+            # Greedy, so longer phrases win over their prefixes
+            return "(?:" + body + ")?" if len(branches) == 1 else body + "?"
+        return body
+
+    return build(trie)
+
+
+@dataclass
+class MarkerHits:
+    """Markers found in one text."""
+    # First position of each phrase in the lower-cased text
+    positions: Dict[str, int] = field(default_factory=dict)
+    # Matching whole words per word category
+    word_counts: Dict[str, int] = field(default_factory=dict)
+    matcher: Optional["MarkerMatcher"] = field(default=None, repr=False, compare=False)
+
+    def found(self, category: str) -> List[str]:
+        """Phrases of a category in the text, in the category's order."""
+        if not self.positions:
+            return []
+        order = self.matcher.order[category]
+        phrases = [phrase for phrase in self.positions if phrase in order]
+        phrases.sort(key=order.__getitem__)
+        return phrases
+
+    def first(self, category: str, within: Optional[int] = None) -> Optional[str]:
+        """
+        First phrase of a category, in the category's order, found in the text.
+
+        Args:
+            category: Category name
+            within: Only consider occurrences inside the first ``within`` characters
+
+        Returns:
+            The phrase, or None
+        """
+        if not self.positions:
+            return None
+        order = self.matcher.order[category]
+        best, best_rank = None, len(order)
+        for phrase, position in self.positions.items():
+            rank = order.get(phrase, best_rank)
+            if rank < best_rank and (within is None or position + len(phrase) <= within):
+                best, best_rank = phrase, rank
+        return best
+
+    def count(self, category: str) -> int:
+        """Number of words of a word category in the text."""
+        return self.word_counts.get(category, 0)
+
+
+class MarkerMatcher:
+    """
+    Precompiled matcher for phrase and word categories.
+
+    Phrases are found anywhere in the text, words only as whole words. All
+    of them go into one pattern, so a text is scanned once however many
+    categories there are; a phrase in several categories is matched once.
+    """
+
+    def __init__(self,
+                 categories: Mapping[str, Sequence[str]],
+                 word_categories: Optional[Mapping[str, Iterable[str]]] = None):
+        """
+        Compile the matcher.
+
+        Args:
+            categories: Ordered phrases per category, matched as substrings
+            word_categories: Words per category, matched and counted as whole words
+        """
+        # Rank of each phrase within its categories
+        self.order: Dict[str, Dict[str, int]] = {}
+        for name, values in categories.items():
+            order = self.order[name] = {}
+            for phrase in values:
+                order.setdefault(phrase, len(order))
+        phrases = {phrase for order in self.order.values() for phrase in order}
+        words = {word: name for name, values in (word_categories or {}).items() for word in values}
+
+        # Phrases that are empty are found at the start of every text
+        self._empty = "" in phrases
+        strings = sorted((phrases | set(words)) - {""})
+
+        # The scan reports the longest string starting at each position; the
+        # shorter ones starting there are its prefixes
+        self._prefixes = {
+            string: [
+                (other, other in phrases, words.get(other))
+                for other in strings if string.startswith(other)
+            ]
+            for string in strings
+        }
+        self._pattern = re.compile("(?=(" + _trie_pattern(strings) + "))") if strings else None
+
+    def scan(self, text: str) -> MarkerHits:
+        """
+        Find all markers in a lower-cased text.
+
+        Args:
+            text: Lower-cased text
+
+        Returns:
+            Markers found in the text
+        """
+        return self.scan_buffer(text, np.zeros(1, dtype=np.int64))[0]
+
+    def scan_buffer(self, buffer: str, starts: np.ndarray) -> List[MarkerHits]:
+        """
+        Find all markers in several lower-cased texts joined into one buffer.
+
+        Phrases must not span texts, which holds when texts are joined by a
+        character that no phrase contains.
+
+        Args:
+            buffer: Joined lower-cased texts
+            starts: Offset of each text in the buffer
+
+        Returns:
+            Markers found in each text
+        """
+        hits = [MarkerHits(matcher=self) for _ in range(len(starts))]
+        if self._empty:
+            for text_hits in hits:
+                text_hits.positions[""] = 0
+        if self._pattern is None:
+            return hits
+
+        positions, matched = [], []
+        for match in self._pattern.finditer(buffer):
+            positions.append(match.start())
+            matched.append(match.group(1))
+        owners = np.searchsorted(starts, positions, side='right') - 1
+        offsets = np.asarray(positions, dtype=np.int64) - np.asarray(starts)[owners]
+
+        for owner, position, offset, string in zip(owners.tolist(), positions, offsets.tolist(), matched):
+            text_hits = hits[owner]
+            for prefix, is_phrase, word_category in self._prefixes[string]:
+                if is_phrase:
+                    text_hits.positions.setdefault(prefix, offset)
+                if word_category is not None and _is_word(buffer, position, position + len(prefix)):
+                    counts = text_hits.word_counts
+                    counts[word_category] = counts.get(word_category, 0) + 1
+        return hits
+
+
+def _is_word_char(char: str) -> bool:
+    # Same characters as ``\w`` in a str pattern
+    return char.isalnum() or char == "_"
+
+
+def _is_word(buffer: str, start: int, end: int) -> bool:
+    """Whether ``buffer[start:end]`` is a whole word, as ``\\b...\\b`` would match."""
+    if start > 0 and _is_word_char(buffer[start - 1]):
+        return False
+    return end >= len(buffer) or not _is_word_char(buffer[end])
+
+
+_matcher: Optional[MarkerMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def get_marker_matcher() -> MarkerMatcher:
+    """Get the matcher for all analyzer markers, compiling it on first use."""
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                categories = {
+                    EPISODE_TRANSITION: [
+                        phrase for phrases in EPISODE_TRANSITION_MARKERS.values() for phrase in phrases
+                    ],
+                    DISCOURSE_TRANSITION: DISCOURSE_TRANSITION_MARKERS,
+                    ACKNOWLEDGMENT: ACKNOWLEDGMENT_PHRASES,
+                    ADVERTISEMENT: constants.AD_MARKERS,
+                }
+                for family, keywords in METAPHOR_FAMILIES.items():
+                    categories[metaphor_category(family)] = keywords
+                _matcher = MarkerMatcher(
+                    categories, {POSITIVE: POSITIVE_WORDS, NEGATIVE: NEGATIVE_WORDS}
+                )
+    return _matcher
+
+
+# Markers of each store's segments, computed on first use
+_store_hits: "weakref.WeakKeyDictionary[SegmentStore, List[MarkerHits]]" = weakref.WeakKeyDictionary()
+
+
+def store_markers(store: SegmentStore) -> List[MarkerHits]:
+    """Markers of every segment in a store, from one scan of the episode."""
+    hits = _store_hits.get(store)
+    if hits is None:
+        lowered, starts, _ = store._lowered
+        hits = get_marker_matcher().scan_buffer(lowered, starts)
+        _store_hits[store] = hits
+    return hits
+
+
+@lru_cache(maxsize=1024)
+def _text_markers(text: str) -> MarkerHits:
+    return get_marker_matcher().scan(text.lower())
+
+
+def markers_for(segment: Union[str, Any]) -> MarkerHits:
+    """
+    Markers of a segment or text.
+
+    Store views read the tags of their store; other segments and plain
+    texts are scanned, with recent texts cached.
+
+    Args:
+        segment: Segment, segment view or text
+
+    Returns:
+        Markers found in the text
+    """
+    if isinstance(segment, SegmentView):
+        return store_markers(segment.store)[segment.segment_index]
+    if isinstance(segment, str):
+        return _text_markers(segment)
+    return _text_markers(segment.text)
@@ -0,0 +1,273 @@
+"""
+Shared text statistics for the complexity and metrics analyzers.
+
+ComplexityAnalyzer and MetricsCalculator used to tokenize every segment
+several times, run per-occurrence syllable counting and scan the whole text
+once per technical-term regex. This module tokenizes a text once, memoizes
+per-word lookups (syllables, term matches) across segments and episodes, and
+computes moving-average type-token ratio with an O(n) sliding window.
+"""
+
+import re
+import threading
+from collections import Counter, OrderedDict
+from functools import cached_property, lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+
+# Lower-case alphabetic words (ComplexityAnalyzer vocabulary)
+ALPHA_WORD_PATTERN = re.compile(r'\b[a-z]+\b')
+# Maximal runs of word characters, i.e. what ``\b\w+\b`` matches
+WORD_RUN_PATTERN = re.compile(r'\w+')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+DIGIT_PATTERN = re.compile(r'\d')
+
+# Punctuation stripped from whitespace tokens before estimating syllables
+TOKEN_PUNCTUATION = '.,!?;:"'
+
+
+@lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """Count syllables in a word by vowel groups (approximation)."""
+    word = word.lower()
+    syllables = 0
+    prev_was_vowel = False
+    for char in word:
+        is_vowel = char in "aeiouy"
+        if is_vowel and not prev_was_vowel:
+            syllables += 1
+        prev_was_vowel = is_vowel
+
+    # Adjust for silent e
+    if word.endswith("e") and syllables > 1:
+        syllables -= 1
+
+    return max(1, syllables)
+
+
+@lru_cache(maxsize=65536)
+def estimate_token_syllables(token: str) -> int:
+    """Estimate syllables of a whitespace token; short tokens count as one."""
+    word = token.strip(TOKEN_PUNCTUATION)
+    if len(word) <= 3:
+        return 1
+
+    syllables = 0
+    prev_was_vowel = False
+    for char in word:
+        is_vowel = char in 'aeiouAEIOU'
+        if is_vowel and not prev_was_vowel:
+            syllables += 1
+        prev_was_vowel = is_vowel
+
+    # Adjust for silent e
+    if word.endswith('e') and syllables > 1:
+        syllables -= 1
+
+    return max(1, syllables)
+
+
+@lru_cache(maxsize=64)
+def _compile_word_patterns(patterns: Tuple[str, ...]) -> Tuple[Pattern, ...]:
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+
+@lru_cache(maxsize=65536)
+def _word_pattern_matches(word: str, patterns: Tuple[str, ...]) -> int:
+    """Number of patterns matching the whole word."""
+    return sum(1 for pattern in _compile_word_patterns(patterns) if pattern.fullmatch(word))
+
+
+def moving_average_ttr(words: Sequence[str], window: int = 50, step: int = 1) -> Optional[float]:
+    """
+    Moving-average type-token ratio (MATTR).
+
+    Slides a window over the words keeping counts of the words inside it, so
+    each shift costs O(1) instead of rebuilding a set of ``window`` words.
+
+    Args:
+        words: Tokens in text order
+        window: Window size in tokens
+        step: Average only every ``step``-th window
+
+    Returns:
+        Mean ratio of distinct words per window, or None if the text is not
+        longer than one window
+    """
+    total = len(words)
+    if total <= window:
+        return None
+
+    counts = Counter(words[:window])
+    unique = len(counts)
+    unique_sum = 0
+    samples = 0
+    for start in range(total - window + 1):
+        if start:
+            outgoing = words[start - 1]
+            counts[outgoing] -= 1
+            if counts[outgoing] == 0:
+                unique -= 1
+            incoming = words[start + window - 1]
+            if counts[incoming] == 0:
+                unique += 1
+            counts[incoming] += 1
+        if start % step == 0:
+            unique_sum += unique
+            samples += 1
+
+    return unique_sum / (window * samples)
+
+
+class TextStatistics:
+    """Tokens and counts of one text, each computed once on first use."""
+
+    def __init__(self, text: str):
+        """
+        Initialize text statistics.
+
+        Args:
+            text: Text to analyze
+        """
+        self.text = text or ""
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Lower-case alphabetic words."""
+        return ALPHA_WORD_PATTERN.findall(self.text.lower())
+
+    @cached_property
+    def word_counts(self) -> Counter:
+        """Occurrences of each alphabetic word."""
+        return Counter(self.words)
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Whitespace-separated tokens."""
+        return self.text.split()
+
+    @cached_property
+    def token_counts(self) -> Counter:
+        """Occurrences of each whitespace token."""
+        return Counter(self.tokens)
+
+    @cached_property
+    def word_run_counts(self) -> Counter:
+        """Occurrences of each run of word characters."""
+        return Counter(WORD_RUN_PATTERN.findall(self.text))
+
+    @cached_property
+    def word_run_count(self) -> int:
+        """Number of runs of word characters."""
+        return sum(self.word_run_counts.values())
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Non-empty sentences, stripped."""
+        stripped = (sentence.strip() for sentence in SENTENCE_SPLIT_PATTERN.split(self.text))
+        return [sentence for sentence in stripped if sentence]
+
+    @cached_property
+    def sentence_word_counts(self) -> List[int]:
+        """Word-character runs per sentence."""
+        return [len(WORD_RUN_PATTERN.findall(sentence)) for sentence in self.sentences]
+
+    @cached_property
+    def numeric_sentence_count(self) -> int:
+        """Sentences containing a digit."""
+        return sum(1 for sentence in self.sentences if DIGIT_PATTERN.search(sentence))
+
+    @cached_property
+    def word_length_total(self) -> int:
+        """Summed length of the alphabetic words."""
+        return sum(len(word) * count for word, count in self.word_counts.items())
+
+    @cached_property
+    def token_length_total(self) -> int:
+        """Summed length of the whitespace tokens."""
+        return sum(len(token) * count for token, count in self.token_counts.items())
+
+    @cached_property
+    def word_syllables(self) -> int:
+        """Syllables in the alphabetic words."""
+        return sum(count_syllables(word) * count for word, count in self.word_counts.items())
+
+    @cached_property
+    def token_syllables(self) -> int:
+        """Estimated syllables in the whitespace tokens."""
+        return sum(estimate_token_syllables(token) * count
+                   for token, count in self.token_counts.items())
+
+    @cached_property
+    def unique_token_count(self) -> int:
+        """Distinct whitespace tokens, ignoring case."""
+        return len({token.lower() for token in self.token_counts})
+
+    def count_terms(self, terms: FrozenSet[str]) -> int:
+        """Count occurrences of alphabetic words in ``terms``."""
+        return sum(count for word, count in self.word_counts.items() if word in terms)
+
+    def count_word_pattern_matches(self, patterns: Tuple[str, ...]) -> int:
+        """
+        Count matches of whole-word patterns, case-insensitively.
+
+        Equivalent to summing ``len(re.findall(p, text, re.IGNORECASE))`` over
+        patterns of the form ``\\b...\\b`` matching only word characters, but
+        every distinct word is tested once per text and memoized across texts.
+        """
+        return sum(_word_pattern_matches(word, patterns) * count
+                   for word, count in self.word_run_counts.items())
+
+    def lexical_diversity(self, window: int = 50, step: int = 1) -> Optional[float]:
+        """MATTR of the alphabetic words; None for texts within one window."""
+        return moving_average_ttr(self.words, window=window, step=step)
+
+
+class TextStatisticsEngine:
+    """Caches :class:`TextStatistics` so analyzers sharing a text tokenize it once."""
+
+    def __init__(self, max_texts: int = 1024):
+        """
+        Initialize the engine.
+
+        Args:
+            max_texts: Number of recently analyzed texts to keep
+        """
+        self.max_texts = max_texts
+        self._cache: "OrderedDict[str, TextStatistics]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def analyze(self, text: str) -> TextStatistics:
+        """Get the statistics of a text, reusing them if recently analyzed."""
+        text = text or ""
+        with self._lock:
+            stats = self._cache.get(text)
+            if stats is not None:
+                self._cache.move_to_end(text)
+                return stats
+            stats = TextStatistics(text)
+            self._cache[text] = stats
+            if len(self._cache) > self.max_texts:
+                self._cache.popitem(last=False)
+        return stats
+
+    def analyze_many(self, texts: Iterable[str]) -> List[TextStatistics]:
+        """Get the statistics of all segments of an episode."""
+        return [self.analyze(text) for text in texts]
+
+    def clear(self) -> None:
+        """Drop cached statistics."""
+        with self._lock:
+            self._cache.clear()
+
+
+# Global engine instance
+_global_engine: Optional[TextStatisticsEngine] = None
+
+
+def get_text_statistics_engine() -> TextStatisticsEngine:
+    """Get the global text statistics engine."""
+    global _global_engine
+    if _global_engine is None:
+        _global_engine = TextStatisticsEngine()
+    return _global_engine
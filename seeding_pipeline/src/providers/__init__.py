@@ -1,6 +1,18 @@
 """Provider implementations for podcast knowledge pipeline."""
 
-from .audio import BaseAudioProvider, WhisperAudioProvider, MockAudioProvider
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .audio import BaseAudioProvider, WhisperAudioProvider, MockAudioProvider
+
+# Providers import their SDKs, so they load only when used
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'BaseAudioProvider': '.audio',
+    'WhisperAudioProvider': '.audio',
+    'MockAudioProvider': '.audio',
+})
 
 __all__ = [
     "BaseAudioProvider",
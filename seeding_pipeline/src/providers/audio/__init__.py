@@ -1,8 +1,19 @@
 """Audio provider implementations."""
 
-from .base import BaseAudioProvider
-from .whisper import WhisperAudioProvider
-from .mock import MockAudioProvider
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import BaseAudioProvider
+    from .whisper import WhisperAudioProvider
+    from .mock import MockAudioProvider
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'BaseAudioProvider': '.base',
+    'WhisperAudioProvider': '.whisper',
+    'MockAudioProvider': '.mock',
+})
 
 __all__ = [
     "BaseAudioProvider",
@@ -137,10 +137,12 @@ class BaseAudioProvider(ABC, AudioProvider):
                 
             # Create aligned segment
             aligned_segment = TranscriptSegment(
+                id=segment.id,
                 text=segment.text,
                 start_time=segment.start_time,
                 end_time=segment.end_time,
-                speaker=speaker
+                speaker=speaker,
+                confidence=segment.confidence
             )
             aligned_segments.append(aligned_segment)
             
@@ -20,6 +20,7 @@ from ...core import (
 )
 from ...core.plugin_discovery import provider_plugin
 from ...tracing import trace_method, add_span_attributes
+from ...utils.model_pool import get_model_pool
 
 
 logger = logging.getLogger(__name__)
@@ -59,9 +60,10 @@ class WhisperAudioProvider(BaseAudioProvider):
         # Determine device
         self._setup_device()
         
-        # Models (lazy loaded)
+        # Models (lazy loaded from the shared model pool)
         self._whisper_model = None
         self._diarization_pipeline = None
+        self._pool_keys: List[Any] = []
         
     def _setup_device(self):
         """Set up the compute device (CPU or CUDA)."""
@@ -76,48 +78,55 @@ class WhisperAudioProvider(BaseAudioProvider):
             logger.warning("PyTorch not available. Using CPU for audio processing.")
             
     def _ensure_whisper_model(self):
-        """Ensure Whisper model is loaded."""
+        """Ensure Whisper model is loaded, reusing a pooled model if possible."""
         if self._whisper_model is not None:
             return
-            
+        
+        key = ("whisper", self.whisper_model_size, self.device, self.use_faster_whisper)
         try:
-            if self.use_faster_whisper:
-                try:
-                    from faster_whisper import WhisperModel
-                    
-                    compute_type = "float16" if self.device == "cuda" else "int8"
-                    self._whisper_model = WhisperModel(
-                        self.whisper_model_size,
-                        device=self.device,
-                        compute_type=compute_type
-                    )
-                    self._whisper_type = "faster"
-                    logger.info(f"Loaded faster-whisper model: {self.whisper_model_size}")
-                    
-                except ImportError:
-                    logger.warning("faster-whisper not available, falling back to standard whisper")
-                    self._load_standard_whisper()
-            else:
-                self._load_standard_whisper()
-                
+            self._whisper_model, self._whisper_type = get_model_pool().acquire(
+                key, self._load_whisper_model, fork_safe=self.device != "cuda"
+            )
+            self._pool_keys.append(key)
+        except AudioProcessingError:
+            raise
         except Exception as e:
             raise AudioProcessingError(
                 f"Failed to load Whisper model: {e}",
                 severity=ErrorSeverity.CRITICAL,
                 details={"model": self.whisper_model_size, "error": str(e)}
             )
+    
+    def _load_whisper_model(self):
+        """Load the Whisper model, returning it with its implementation type."""
+        if self.use_faster_whisper:
+            try:
+                from faster_whisper import WhisperModel
+                
+                compute_type = "float16" if self.device == "cuda" else "int8"
+                model = WhisperModel(
+                    self.whisper_model_size,
+                    device=self.device,
+                    compute_type=compute_type
+                )
+                logger.info(f"Loaded faster-whisper model: {self.whisper_model_size}")
+                return model, "faster"
+                
+            except ImportError:
+                logger.warning("faster-whisper not available, falling back to standard whisper")
+        return self._load_standard_whisper()
             
     def _load_standard_whisper(self):
         """Load standard Whisper model."""
         try:
             import whisper
             
-            self._whisper_model = whisper.load_model(
+            model = whisper.load_model(
                 self.whisper_model_size,
                 device=self.device
             )
-            self._whisper_type = "standard"
             logger.info(f"Loaded standard whisper model: {self.whisper_model_size}")
+            return model, "standard"
             
         except ImportError:
             raise AudioProcessingError(
@@ -284,24 +293,31 @@ class WhisperAudioProvider(BaseAudioProvider):
             )
             
     def _ensure_diarization_pipeline(self, hf_token: str):
-        """Ensure diarization pipeline is loaded."""
+        """Ensure diarization pipeline is loaded, reusing a pooled pipeline if possible."""
         if self._diarization_pipeline is not None:
             return
-            
-        try:
+        
+        def load_pipeline():
             from pyannote.audio import Pipeline
             
-            self._diarization_pipeline = Pipeline.from_pretrained(
+            pipeline = Pipeline.from_pretrained(
                 "pyannote/speaker-diarization-3.1",
                 use_auth_token=hf_token
             )
             
             if self.device == "cuda" and self.torch_available:
                 import torch
-                self._diarization_pipeline = self._diarization_pipeline.to(torch.device("cuda"))
+                pipeline = pipeline.to(torch.device("cuda"))
                 
             logger.info("Loaded pyannote diarization pipeline")
-            
+            return pipeline
+        
+        key = ("pyannote", "pyannote/speaker-diarization-3.1", self.device)
+        try:
+            self._diarization_pipeline = get_model_pool().acquire(
+                key, load_pipeline, fork_safe=self.device != "cuda"
+            )
+            self._pool_keys.append(key)
         except ImportError:
             raise AudioProcessingError(
                 "pyannote.audio not available for speaker diarization",
@@ -338,20 +354,19 @@ class WhisperAudioProvider(BaseAudioProvider):
         return health_info
         
     def cleanup_resources(self):
-        """Clean up GPU memory and resources."""
-        if self.device == "cuda" and self.torch_available:
-            try:
-                import torch
-                import gc
-                
-                # Clear models
-                self._whisper_model = None
-                self._diarization_pipeline = None
-                
-                # Clear GPU cache
-                torch.cuda.empty_cache()
-                gc.collect()
-                
-                logger.info("Cleaned up GPU resources")
-            except Exception as e:
-                logger.warning(f"Failed to clean up GPU resources: {e}")
\ No newline at end of file
+        """Release this provider's models.
+        
+        The models stay warm in the shared model pool for other providers
+        until they have been idle for the pool's idle timeout; GPU memory is
+        freed when the pool evicts them.
+        """
+        pool = get_model_pool()
+        for key in self._pool_keys:
+            pool.release(key)
+        self._pool_keys = []
+        self._whisper_model = None
+        self._diarization_pipeline = None
+    
+    def close(self):
+        """Release models when the pipeline shuts down."""
+        self.cleanup_resources()
\ No newline at end of file
@@ -66,7 +66,7 @@ class BaseEmbeddingProvider(EmbeddingProvider, HealthCheckable, ABC):
                 'provider': self.__class__.__name__,
                 'model': self.model_name,
                 'dimension': self.dimension,
-                'test_embedding_size': len(embedding) if embedding else 0,
+                'test_embedding_size': len(embedding) if embedding is not None else 0,
                 'initialized': self._initialized
             }
         except Exception as e:
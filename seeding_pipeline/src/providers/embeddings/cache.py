@@ -0,0 +1,393 @@
+"""Content-hash embedding cache shared by all embedding consumers."""
+
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from src.providers.embeddings.base import BaseEmbeddingProvider
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+# One cache per underlying provider, so every consumer shares the same entries
+_shared_caches: "weakref.WeakKeyDictionary[Any, CachedEmbeddingProvider]" = weakref.WeakKeyDictionary()
+_shared_caches_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different texts share a cache entry."""
+    return ' '.join((text or '').split())
+
+
+def embedding_key(model_name: str, text: str) -> str:
+    """Cache key for a model and text: a hash of the model name plus normalized text."""
+    return hashlib.sha1(f"{model_name}\0{normalize_text(text)}".encode('utf-8')).hexdigest()
+
+
+class EmbeddingStore:
+    """
+    Append-only on-disk store of float32 vectors, read through a memory map.
+
+    Vectors live in ``vectors.f32`` (rows of ``dimension`` float32 values) and
+    their keys in ``keys.tsv`` (one ``key<TAB>row`` line per vector). The
+    dimension is fixed by the first write and kept in ``dimension``. Appends
+    take an exclusive file lock and pick up rows written by other processes
+    first, so several workers can share one store.
+    """
+
+    def __init__(self, directory: str, initial_capacity: int = 1024):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.vectors_path = os.path.join(directory, "vectors.f32")
+        self.keys_path = os.path.join(directory, "keys.tsv")
+        self.dimension_path = os.path.join(directory, "dimension")
+        self.dimension: Optional[int] = None
+        self._rows: Dict[str, int] = {}
+        self._keys_offset = 0
+        self._capacity = 0
+        self._initial_capacity = initial_capacity
+        self._memmap: Optional[np.memmap] = None
+        self._lock = threading.Lock()
+        with self._lock:
+            self._read_dimension()
+            self._read_new_keys()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return a copy of the stored vector, or None."""
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                return None
+            self._ensure_mapped(row + 1)
+            return np.array(self._memmap[row], dtype=np.float32)
+
+    def refresh(self) -> None:
+        """Pick up vectors other processes appended since the last read."""
+        with self._lock:
+            self._read_dimension()
+            self._read_new_keys()
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """Append vectors that are not stored yet."""
+        if not items:
+            return
+        with self._lock, open(self.keys_path, 'a+', encoding='utf-8') as keys_file:
+            if HAS_FCNTL:
+                fcntl.flock(keys_file, fcntl.LOCK_EX)
+            try:
+                # Rows appended by other processes since we last looked
+                self._read_dimension()
+                self._read_new_keys()
+                if self.dimension is None:
+                    self.dimension = len(next(iter(items.values())))
+                    with open(self.dimension_path, 'w', encoding='utf-8') as dimension_file:
+                        dimension_file.write(str(self.dimension))
+                new_items = [(key, vector) for key, vector in items.items() if key not in self._rows]
+                if not new_items:
+                    return
+                start = len(self._rows)
+                self._ensure_capacity(start + len(new_items))
+                for offset, (key, vector) in enumerate(new_items):
+                    self._memmap[start + offset] = vector
+                self._memmap.flush()
+                lines = ''.join(f"{key}\t{start + offset}\n" for offset, (key, _) in enumerate(new_items))
+                keys_file.write(lines)
+                keys_file.flush()
+                for offset, (key, _) in enumerate(new_items):
+                    self._rows[key] = start + offset
+                self._keys_offset += len(lines.encode('utf-8'))
+            finally:
+                if HAS_FCNTL:
+                    fcntl.flock(keys_file, fcntl.LOCK_UN)
+
+    def _read_dimension(self) -> None:
+        if self.dimension is None and os.path.exists(self.dimension_path):
+            with open(self.dimension_path, encoding='utf-8') as dimension_file:
+                self.dimension = int(dimension_file.read().strip())
+
+    def _read_new_keys(self) -> None:
+        """Load key lines appended after the last read."""
+        if not os.path.exists(self.keys_path):
+            return
+        with open(self.keys_path, 'rb') as keys_file:
+            keys_file.seek(self._keys_offset)
+            data = keys_file.read()
+        # Ignore a trailing partial line from a concurrent writer
+        complete = data[:data.rfind(b'\n') + 1]
+        for line in complete.decode('utf-8').splitlines():
+            key, row = line.split('\t')
+            self._rows[key] = int(row)
+        self._keys_offset += len(complete)
+
+    def _ensure_mapped(self, rows: int) -> None:
+        """Map the vector file so at least `rows` rows are addressable."""
+        if self._memmap is not None and self._capacity >= rows:
+            return
+        size = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+        capacity = size // (4 * self.dimension)
+        if capacity < rows:
+            raise ValueError(f"Embedding store {self.directory} is missing rows")
+        self._map(capacity)
+
+    def _ensure_capacity(self, rows: int) -> None:
+        """Grow the vector file (doubling) so `rows` rows fit."""
+        size = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+        capacity = size // (4 * self.dimension)
+        if capacity < rows:
+            capacity = max(rows, capacity * 2, self._initial_capacity)
+            with open(self.vectors_path, 'ab') as vectors_file:
+                vectors_file.truncate(capacity * 4 * self.dimension)
+        if self._memmap is None or self._capacity < capacity:
+            self._map(capacity)
+
+    def _map(self, capacity: int) -> None:
+        if self._memmap is not None:
+            self._memmap.flush()
+        self._memmap = np.memmap(self.vectors_path, dtype=np.float32, mode='r+',
+                                 shape=(capacity, self.dimension))
+        self._capacity = capacity
+
+
+class CachedEmbeddingProvider(BaseEmbeddingProvider):
+    """
+    Embedding provider wrapper with a content-hash cache.
+
+    Keys are the model name (or the provider's ``cache_namespace``, for
+    providers whose vectors depend on more than the model) plus a hash of the
+    whitespace-normalized text.
+    Lookups go through a bounded in-memory LRU, then an optional memory-mapped
+    float32 store on disk (``embedding_cache_dir``). Only texts missing from
+    both are sent to the wrapped provider, de-duplicated within each batch.
+    Use :func:`get_embedding_cache` so every consumer of a provider shares
+    one cache.
+    """
+
+    def __init__(self, provider: Any, config: Optional[Dict[str, Any]] = None):
+        """Wrap an embedding provider.
+
+        Args:
+            provider: The embedding provider computing cache misses
+            config: Optional settings: embedding_cache_size (LRU entries) and
+                embedding_cache_dir (directory of the on-disk store)
+        """
+        config = config or {}
+        provider_config = getattr(provider, 'config', None)
+        super().__init__(provider_config if isinstance(provider_config, dict) else {})
+        self.provider = provider
+        self.model_name = getattr(provider, 'model_name', 'unknown')
+        self.dimension = getattr(provider, 'dimension', None)
+        self.batch_size = getattr(provider, 'batch_size', 32)
+        self.max_size = config.get('embedding_cache_size', 10000)
+        self.cache_dir = config.get('embedding_cache_dir')
+
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._store: Optional[EmbeddingStore] = None
+        self._resolved_namespace: Optional[str] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.batch_duplicates = 0
+
+    def _initialize_model(self) -> None:
+        """Initialize the wrapped provider."""
+        ensure = getattr(self.provider, '_ensure_initialized', None)
+        if callable(ensure):
+            ensure()
+
+    def _namespace(self) -> str:
+        """Identity of the vectors the provider produces, used in cache keys.
+
+        Resolved once the wrapped provider has loaded its model, since a
+        provider falling back to another backend changes its namespace. The
+        on-disk store for the namespace is opened at the same time.
+        """
+        if self._resolved_namespace is not None:
+            return self._resolved_namespace
+        with self._lock:
+            if self._resolved_namespace is None:
+                self._ensure_initialized()
+                namespace = getattr(self.provider, 'cache_namespace', None) or self.model_name
+                self.dimension = getattr(self.provider, 'dimension', self.dimension)
+                if self.cache_dir:
+                    model_dir = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in namespace)
+                    self._store = EmbeddingStore(os.path.join(self.cache_dir, model_dir))
+                self._resolved_namespace = namespace
+        return self._resolved_namespace
+
+    def generate_embedding(self, text: str) -> np.ndarray:
+        """Generate (or fetch) the float32 embedding for a single text."""
+        return self.generate_embeddings([text])[0]
+
+    def generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Generate float32 embeddings for texts, computing only uncached unique texts."""
+        return self.generate_embeddings_counted(texts)[0]
+
+    def generate_embeddings_counted(self, texts: List[str]) -> Tuple[List[np.ndarray], int, int]:
+        """Generate embeddings and report how this call was served.
+
+        Returns:
+            The embeddings, the number of unique texts found in the cache and
+            the number computed by the wrapped provider
+        """
+        namespace = self._namespace()
+        keys = [embedding_key(namespace, text) for text in texts]
+        vectors: Dict[str, np.ndarray] = {}
+        missing: Dict[str, str] = {}
+        if self._store is not None:
+            self._store.refresh()
+
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in vectors or key in missing:
+                    self.batch_duplicates += 1
+                    continue
+                vector = self._lookup(key)
+                if vector is None:
+                    missing[key] = text
+                else:
+                    vectors[key] = vector
+            self.misses += len(missing)
+        hits = len(vectors)
+        self._record_metrics(hits, len(missing))
+
+        if missing:
+            computed = self.provider.generate_embeddings(list(missing.values()))
+            new_vectors = {
+                key: np.asarray(vector, dtype=np.float32)
+                for key, vector in zip(missing, computed)
+            }
+            vectors.update(new_vectors)
+            with self._lock:
+                for key, vector in new_vectors.items():
+                    self._remember(key, vector)
+            if self._store is not None:
+                try:
+                    self._store.put_many(new_vectors)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Failed to persist embeddings to {self._store.directory}: {e}")
+
+        return [vectors[key] for key in keys], hits, len(missing)
+
+    # Aliases used by older call sites
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.generate_embedding(text)
+
+    def embed_text(self, text: str) -> np.ndarray:
+        return self.generate_embedding(text)
+
+    def embed_query(self, text: str) -> np.ndarray:
+        return self.generate_embedding(text)
+
+    def embed_documents(self, texts: List[str]) -> List[np.ndarray]:
+        return self.generate_embeddings(texts)
+
+    def generate_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
+        return self.generate_embeddings(texts)
+
+    def get_model_info(self) -> Dict[str, Any]:
+        """Get the wrapped model's information plus cache statistics."""
+        get_info = getattr(self.provider, 'get_model_info', None)
+        info = dict(get_info()) if callable(get_info) else {'model_name': self.model_name}
+        info['cache'] = self.get_stats()
+        return info
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'disk_size': len(self._store) if self._store is not None else 0,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'batch_duplicates': self.batch_duplicates,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0
+            }
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything the cache does not define comes from the wrapped provider
+        if name == 'provider':
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    def _lookup(self, key: str) -> Optional[np.ndarray]:
+        """Find a vector in memory, then on disk. Caller holds the lock."""
+        vector = self._entries.get(key)
+        if vector is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+        if self._store is not None:
+            vector = self._store.get(key)
+            if vector is not None:
+                self.disk_hits += 1
+                self._remember(key, vector)
+                return vector
+        return None
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """Add to the LRU, evicting the least recently used entries. Caller holds the lock."""
+        # Cached vectors are handed out without copying, so callers must not modify them
+        vector.flags.writeable = False
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _record_metrics(self, hits: int, misses: int) -> None:
+        """Report hits and misses to the metrics collector."""
+        try:
+            from src.api.metrics import get_metrics_collector
+            metrics = get_metrics_collector()
+        except Exception:
+            return
+        if hits:
+            metrics.cache_hits.inc(hits, labels={"cache": "embedding"})
+        if misses:
+            metrics.cache_misses.inc(misses, labels={"cache": "embedding"})
+
+
+def get_embedding_cache(provider: Any, config: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Return the shared caching wrapper for an embedding provider.
+
+    Wrapping is idempotent: an already-cached provider is returned unchanged
+    and the same underlying provider always gets the same wrapper, so every
+    consumer hits one cache. ``None`` and objects that are not embedding
+    providers are passed through unchanged.
+    """
+    if provider is None or isinstance(provider, CachedEmbeddingProvider):
+        return provider
+    if not isinstance(provider, BaseEmbeddingProvider):
+        # Only providers implementing the embedding provider base are wrapped
+        return provider
+    with _shared_caches_lock:
+        try:
+            cached = _shared_caches.get(provider)
+        except TypeError:
+            # Not weak-referenceable; cache without sharing
+            return CachedEmbeddingProvider(provider, config)
+        if cached is None:
+            cached = CachedEmbeddingProvider(provider, config)
+            _shared_caches[provider] = cached
+        return cached
@@ -0,0 +1,261 @@
+"""ONNX Runtime backend for sentence-transformer models on CPU.
+
+The configured model is exported once to ONNX, optionally quantized to int8
+with dynamic quantization, and cached on disk next to its tokenizer. Texts are
+sorted by token length and batched so each batch is padded only to its own
+longest text.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+import numpy as np
+
+from src.core.exceptions import ProviderError
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ONNX_DIR = Path.home() / ".cache" / "podcast_kg" / "onnx"
+SUPPORTED_POOLING = ('mean', 'cls', 'max')
+
+
+def length_buckets(lengths: List[int], batch_size: int) -> List[np.ndarray]:
+    """Group text indices into batches of similar token length.
+
+    Args:
+        lengths: Token count of every text
+        batch_size: Maximum texts per batch
+
+    Returns:
+        Index arrays, one per batch, shortest texts first
+    """
+    order = np.argsort(np.asarray(lengths), kind='stable')
+    return [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+
+
+def pool_embeddings(token_embeddings: np.ndarray, attention_mask: np.ndarray,
+                    pooling: str = 'mean') -> np.ndarray:
+    """Pool token embeddings into one vector per text, ignoring padding.
+
+    Args:
+        token_embeddings: Array of shape (batch, tokens, dimension)
+        attention_mask: Array of shape (batch, tokens), 1 for real tokens
+        pooling: 'mean', 'cls' or 'max'
+
+    Returns:
+        Array of shape (batch, dimension)
+    """
+    if pooling == 'cls':
+        return token_embeddings[:, 0]
+    mask = attention_mask[..., None].astype(token_embeddings.dtype)
+    if pooling == 'max':
+        return np.where(mask > 0, token_embeddings, -np.inf).max(axis=1)
+    summed = (token_embeddings * mask).sum(axis=1)
+    return summed / np.clip(mask.sum(axis=1), 1e-9, None)
+
+
+class OnnxSentenceEncoder:
+    """Drop-in replacement for ``SentenceTransformer.encode`` on ONNX Runtime.
+
+    Use :meth:`from_pretrained` to export (on first use) and load a model.
+    """
+
+    def __init__(self, session: Any, tokenizer: Any, dimension: int,
+                 pooling: str = 'mean', max_seq_length: int = 256,
+                 batch_size: int = 32, normalize: bool = False):
+        """
+        Initialize the encoder.
+
+        Args:
+            session: ONNX Runtime inference session returning token embeddings
+            tokenizer: Hugging Face tokenizer matching the exported model
+            dimension: Embedding dimension
+            pooling: Pooling mode of the original model
+            max_seq_length: Maximum tokens per text
+            batch_size: Default texts per batch
+            normalize: Whether the original model ends with a Normalize module,
+                in which case vectors are always scaled to unit length
+        """
+        if pooling not in SUPPORTED_POOLING:
+            raise ProviderError("sentence_transformer", f"Unsupported pooling mode for ONNX: {pooling}")
+        self.session = session
+        self.tokenizer = tokenizer
+        self.dimension = dimension
+        self.pooling = pooling
+        self.max_seq_length = max_seq_length
+        self.batch_size = batch_size
+        self.normalize = normalize
+        self.input_names = {model_input.name for model_input in session.get_inputs()}
+
+    @classmethod
+    def from_pretrained(cls, model_name: str, model_dir: Optional[Union[str, Path]] = None,
+                        quantize: bool = True, num_threads: int = 0,
+                        batch_size: int = 32) -> 'OnnxSentenceEncoder':
+        """Load an exported model, exporting it first if it is not cached.
+
+        Args:
+            model_name: Sentence-transformers model name or path
+            model_dir: Directory holding exported models
+            quantize: Whether to use the int8 dynamically quantized model
+            num_threads: Intra-op threads for ONNX Runtime, 0 for its default
+            batch_size: Default texts per batch
+
+        Returns:
+            Ready to use encoder
+        """
+        try:
+            import onnxruntime as ort
+            from transformers import AutoTokenizer
+        except ImportError:
+            raise ProviderError(
+                "sentence_transformer",
+                "The ONNX backend needs onnxruntime and transformers. "
+                "Install with: pip install onnxruntime transformers"
+            )
+
+        export_dir = Path(model_dir or DEFAULT_ONNX_DIR) / re.sub(r'[^\w.-]+', '_', model_name)
+        model_file = export_dir / ("model.int8.onnx" if quantize else "model.onnx")
+        if not model_file.exists():
+            export_model(model_name, export_dir, quantize=quantize)
+        info = json.loads((export_dir / "encoder.json").read_text())
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.inter_op_num_threads = 1
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        session = ort.InferenceSession(
+            str(model_file), sess_options=options, providers=['CPUExecutionProvider']
+        )
+        tokenizer = AutoTokenizer.from_pretrained(str(export_dir))
+
+        logger.info(f"Loaded ONNX model {model_file} (threads: {num_threads or 'default'})")
+        return cls(
+            session, tokenizer,
+            dimension=info['dimension'],
+            pooling=info['pooling'],
+            max_seq_length=info['max_seq_length'],
+            batch_size=batch_size,
+            normalize=info.get('normalize', False)
+        )
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """Embedding dimension, as on ``SentenceTransformer``."""
+        return self.dimension
+
+    def encode(self, sentences: Union[str, List[str]], batch_size: Optional[int] = None,
+               normalize_embeddings: bool = False, show_progress_bar: bool = False,
+               **kwargs) -> np.ndarray:
+        """Embed texts in length-sorted batches.
+
+        Args:
+            sentences: One text or a list of texts
+            batch_size: Texts per batch, defaults to the encoder's setting
+            normalize_embeddings: Whether to scale vectors to unit length; models
+                exported with a Normalize module are always normalized
+            show_progress_bar: Ignored, accepted for compatibility
+
+        Returns:
+            float32 array of shape (dimension,) for one text, else (len, dimension)
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        if not texts:
+            return embeddings
+
+        encoded = self.tokenizer(texts, truncation=True, max_length=self.max_seq_length)
+        lengths = [len(ids) for ids in encoded['input_ids']]
+        pad_id = self.tokenizer.pad_token_id or 0
+
+        for indices in length_buckets(lengths, batch_size or self.batch_size):
+            width = max(lengths[i] for i in indices)
+            input_ids = np.full((len(indices), width), pad_id, dtype=np.int64)
+            attention_mask = np.zeros((len(indices), width), dtype=np.int64)
+            for row, index in enumerate(indices):
+                ids = encoded['input_ids'][index]
+                input_ids[row, :len(ids)] = ids
+                attention_mask[row, :len(ids)] = 1
+
+            feeds = {'input_ids': input_ids, 'attention_mask': attention_mask}
+            if 'token_type_ids' in self.input_names:
+                feeds['token_type_ids'] = np.zeros_like(input_ids)
+            token_embeddings = self.session.run(None, feeds)[0]
+            embeddings[indices] = pool_embeddings(token_embeddings, attention_mask, self.pooling)
+
+        if normalize_embeddings or self.normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.clip(norms, 1e-12, None)
+        return embeddings[0] if single else embeddings
+
+
+def export_model(model_name: str, export_dir: Path, quantize: bool = True) -> None:
+    """Export a sentence-transformers model to ONNX and quantize it.
+
+    Only models made of a transformer followed by pooling (and optionally
+    normalization) are supported; the pooling runs in numpy at inference time.
+
+    Args:
+        model_name: Sentence-transformers model name or path
+        export_dir: Directory to write the model, tokenizer and settings to
+        quantize: Whether to also write an int8 dynamically quantized model
+    """
+    try:
+        import torch
+        from sentence_transformers import SentenceTransformer
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        raise ProviderError(
+            "sentence_transformer",
+            "Exporting to ONNX needs torch, sentence-transformers and onnxruntime"
+        )
+
+    model = SentenceTransformer(model_name, device='cpu')
+    modules = list(model)
+    module_types = [type(module).__name__ for module in modules]
+    if module_types[:2] != ['Transformer', 'Pooling'] or set(module_types[2:]) - {'Normalize'}:
+        raise ProviderError(
+            "sentence_transformer",
+            f"Model {model_name} has modules {module_types}; only Transformer + Pooling "
+            f"models can run on the ONNX backend"
+        )
+    pooling = modules[1].get_pooling_mode_str()
+    if pooling not in SUPPORTED_POOLING:
+        raise ProviderError("sentence_transformer", f"Unsupported pooling mode for ONNX: {pooling}")
+
+    export_dir.mkdir(parents=True, exist_ok=True)
+    transformer = modules[0].auto_model.eval()
+    tokenizer = modules[0].tokenizer
+    sample = tokenizer(["an example sentence"], return_tensors='pt')
+    input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids') if name in sample]
+    dynamic_axes = {name: {0: 'batch', 1: 'tokens'} for name in input_names}
+    dynamic_axes['token_embeddings'] = {0: 'batch', 1: 'tokens'}
+
+    fp32_file = export_dir / "model.onnx"
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(sample[name] for name in input_names),
+            str(fp32_file),
+            input_names=input_names,
+            output_names=['token_embeddings'],
+            dynamic_axes=dynamic_axes,
+            opset_version=14
+        )
+    if quantize:
+        quantize_dynamic(str(fp32_file), str(export_dir / "model.int8.onnx"),
+                         weight_type=QuantType.QInt8)
+
+    tokenizer.save_pretrained(str(export_dir))
+    (export_dir / "encoder.json").write_text(json.dumps({
+        'model_name': model_name,
+        'dimension': model.get_sentence_embedding_dimension(),
+        'pooling': pooling,
+        'max_seq_length': model.max_seq_length,
+        'normalize': 'Normalize' in module_types[2:]
+    }))
+    logger.info(f"Exported {model_name} to ONNX in {export_dir} (int8: {quantize})")
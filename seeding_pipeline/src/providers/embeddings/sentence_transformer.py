@@ -3,9 +3,13 @@
 import logging
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+
 from src.providers.embeddings.base import BaseEmbeddingProvider
+from src.core.embeddings import EMBEDDING_DTYPE, as_embedding
 from src.core.exceptions import ProviderError
 from src.core.plugin_discovery import provider_plugin
+from src.utils.model_pool import get_model_pool
 
 
 logger = logging.getLogger(__name__)
@@ -22,22 +26,50 @@ class SentenceTransformerProvider(BaseEmbeddingProvider):
         self.model = None
         self.normalize_embeddings = config.get('normalize_embeddings', True)
         self.device = config.get('device', 'cpu')
+        # 'torch' runs SentenceTransformer; 'onnx' runs an int8 ONNX export on CPU
+        self.backend = config.get('embedding_backend', 'torch')
+        self.onnx_threads = config.get('embedding_onnx_threads', 0)
+        self.onnx_quantize = config.get('embedding_onnx_quantize', True)
+        self.onnx_dir = config.get('embedding_onnx_dir')
+        self._pool_key = None
         
+    @property
+    def cache_namespace(self) -> str:
+        """Key prefix for the embedding cache; quantized vectors differ slightly."""
+        if self.backend == 'onnx':
+            return f"{self.model_name}@onnx{'-int8' if self.onnx_quantize else ''}"
+        return self.model_name
+    
     def _initialize_model(self) -> None:
         """Initialize the sentence transformer model."""
+        if self.backend == 'onnx':
+            try:
+                self._initialize_onnx_model()
+                return
+            except ProviderError as e:
+                logger.warning(f"ONNX backend unavailable, falling back to PyTorch: {e}")
+                self.backend = 'torch'
+        self._initialize_torch_model()
+    
+    def _initialize_torch_model(self) -> None:
+        """Initialize the PyTorch SentenceTransformer model."""
         try:
             from sentence_transformers import SentenceTransformer
         except ImportError:
             raise ProviderError(
+                "sentence_transformer",
                 "sentence-transformers is not installed. "
                 "Install with: pip install sentence-transformers"
             )
             
         try:
-            self.model = SentenceTransformer(
-                self.model_name,
-                device=self.device
+            key = ('sentence_transformer', self.model_name, self.device)
+            self.model = get_model_pool().acquire(
+                key,
+                lambda: SentenceTransformer(self.model_name, device=self.device),
+                fork_safe=self.device == 'cpu'
             )
+            self._pool_key = key
             
             # Update dimension based on model
             self.dimension = self.model.get_sentence_embedding_dimension()
@@ -48,15 +80,42 @@ class SentenceTransformerProvider(BaseEmbeddingProvider):
             )
             
         except Exception as e:
-            raise ProviderError(f"Failed to initialize SentenceTransformer: {e}")
+            raise ProviderError("sentence_transformer", f"Failed to initialize SentenceTransformer: {e}")
+    
+    def _initialize_onnx_model(self) -> None:
+        """Load (exporting on first use) the ONNX Runtime version of the model."""
+        from src.providers.embeddings.onnx_backend import OnnxSentenceEncoder
+        
+        key = ('onnx', self.model_name, self.onnx_dir, self.onnx_quantize, self.onnx_threads,
+               self.batch_size)
+        self.model = get_model_pool().acquire(
+            key,
+            lambda: OnnxSentenceEncoder.from_pretrained(
+                self.model_name,
+                model_dir=self.onnx_dir,
+                quantize=self.onnx_quantize,
+                num_threads=self.onnx_threads,
+                batch_size=self.batch_size
+            ),
+            # ONNX Runtime sessions own native thread pools
+            fork_safe=False
+        )
+        self._pool_key = key
+        self.dimension = self.model.get_sentence_embedding_dimension()
+        self.device = 'cpu'
+        
+        logger.info(
+            f"Initialized ONNX model: {self.model_name} "
+            f"(dimension: {self.dimension}, int8: {self.onnx_quantize})"
+        )
             
-    def generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for a single text."""
+    def generate_embedding(self, text: str) -> np.ndarray:
+        """Generate embedding for a single text as a float32 array."""
         self._ensure_initialized()
         
         if not text or not text.strip():
             # Return zero vector for empty text
-            return [0.0] * self.dimension
+            return np.zeros(self.dimension, dtype=EMBEDDING_DTYPE)
             
         try:
             # Clean text
@@ -69,14 +128,14 @@ class SentenceTransformerProvider(BaseEmbeddingProvider):
                 show_progress_bar=False
             )
             
-            return embedding.tolist()
+            return as_embedding(embedding)
             
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             raise ProviderError(f"Embedding generation failed: {e}")
             
-    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts (batch processing)."""
+    def generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Generate float32 embeddings for multiple texts (batch processing)."""
         self._ensure_initialized()
         
         if not texts:
@@ -104,14 +163,15 @@ class SentenceTransformerProvider(BaseEmbeddingProvider):
                     normalize_embeddings=self.normalize_embeddings,
                     show_progress_bar=False
                 )
-                embeddings_list = embeddings.tolist()
+                # Rows of one contiguous float32 matrix
+                embeddings_list = list(np.asarray(embeddings, dtype=EMBEDDING_DTYPE))
             else:
                 embeddings_list = []
                 
             # Build result with zero vectors for empty texts
             result = []
             embedding_idx = 0
-            zero_vector = [0.0] * self.dimension
+            zero_vector = np.zeros(self.dimension, dtype=EMBEDDING_DTYPE)
             
             for i, text in enumerate(cleaned_texts):
                 if i in empty_indices:
@@ -134,6 +194,7 @@ class SentenceTransformerProvider(BaseEmbeddingProvider):
             'model_name': self.model_name,
             'dimension': self.dimension,
             'device': self.device,
+            'backend': self.backend,
             'normalize_embeddings': self.normalize_embeddings,
             'max_seq_length': None
         }
@@ -145,12 +206,20 @@ class SentenceTransformerProvider(BaseEmbeddingProvider):
                 pass
                 
         return info
+    
+    def close(self) -> None:
+        """Release the model; it stays warm in the model pool for other providers."""
+        if self._pool_key is not None:
+            get_model_pool().release(self._pool_key)
+            self._pool_key = None
+        self.model = None
+        self._initialized = False
         
     def encode_with_pooling(
         self, 
         texts: List[str], 
         pooling_strategy: str = 'mean'
-    ) -> List[List[float]]:
+    ) -> List[np.ndarray]:
         """
         Encode texts with custom pooling strategy.
         
@@ -176,7 +245,7 @@ class SentenceTransformerProvider(BaseEmbeddingProvider):
                 show_progress_bar=False
             )
             
-            return embeddings.tolist()
+            return list(np.asarray(embeddings, dtype=EMBEDDING_DTYPE))
             
         except Exception as e:
             logger.error(f"Failed to encode with pooling: {e}")
@@ -218,13 +287,13 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
         except Exception as e:
             raise ProviderError(f"Failed to initialize OpenAI client: {e}")
             
-    def generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for a single text."""
+    def generate_embedding(self, text: str) -> np.ndarray:
+        """Generate embedding for a single text as a float32 array."""
         self._ensure_initialized()
         
         if not text or not text.strip():
             # Return zero vector for empty text
-            return [0.0] * self.dimension
+            return np.zeros(self.dimension, dtype=EMBEDDING_DTYPE)
             
         try:
             # Clean text
@@ -238,14 +307,14 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
             )
             
             embedding = response.data[0].embedding
-            return embedding
+            return as_embedding(embedding)
             
         except Exception as e:
             logger.error(f"Failed to generate OpenAI embedding: {e}")
             raise ProviderError(f"OpenAI embedding generation failed: {e}")
             
-    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts."""
+    def generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Generate float32 embeddings for multiple texts."""
         self._ensure_initialized()
         
         if not texts:
@@ -263,7 +332,7 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
                     cleaned_texts.append(text.replace("\n", " ").strip())
                     
             embeddings = []
-            zero_vector = [0.0] * self.dimension
+            zero_vector = np.zeros(self.dimension, dtype=EMBEDDING_DTYPE)
             
             if cleaned_texts:
                 # OpenAI supports batch embedding
@@ -274,7 +343,7 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
                 )
                 
                 # Extract embeddings
-                api_embeddings = [item.embedding for item in response.data]
+                api_embeddings = [as_embedding(item.embedding) for item in response.data]
                 
                 # Build result with zero vectors for empty texts
                 api_idx = 0
@@ -8,7 +8,9 @@ Embedder interface which expects embed_query and embed_documents methods.
 import logging
 from typing import List, Dict, Any, Optional
 
+from src.core.embeddings import embedding_to_list
 from src.providers.embeddings.sentence_transformer import SentenceTransformerProvider
+from src.providers.embeddings.cache import get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +50,8 @@ class SentenceTransformerGraphRAGAdapter:
             config.setdefault('device', 'cpu')  # Can be changed to 'cuda' if available
             
             self.provider = SentenceTransformerProvider(config)
+        # Share the content-hash cache with the other embedding consumers
+        self.provider = get_embedding_cache(self.provider)
         
         # Store model info for neo4j-graphrag compatibility
         self.model = self.provider.model_name
@@ -65,7 +69,8 @@ class SentenceTransformerGraphRAGAdapter:
             List of floats representing the embedding
         """
         try:
-            return self.provider.generate_embedding(text)
+            # The provider returns float32 arrays; neo4j-graphrag expects lists
+            return embedding_to_list(self.provider.generate_embedding(text))
         except Exception as e:
             logger.error(f"Error generating query embedding: {e}")
             raise
@@ -82,7 +87,10 @@ class SentenceTransformerGraphRAGAdapter:
             List of embeddings (each embedding is a list of floats)
         """
         try:
-            return self.provider.generate_embeddings(documents)
+            return [
+                embedding_to_list(embedding)
+                for embedding in self.provider.generate_embeddings(documents)
+            ]
         except Exception as e:
             logger.error(f"Error generating document embeddings: {e}")
             raise
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Iterator
 from contextlib import contextmanager
 
+from src.core.embeddings import embedding_to_list, has_embedding
 from src.core.interfaces import GraphProvider, HealthCheckable
 from src.core.models import (
     Podcast, Episode, Segment, Entity, 
@@ -172,8 +173,8 @@ class BaseGraphProvider(GraphProvider, HealthCheckable, ABC):
             'complexity_score': segment.complexity_score,
             'is_advertisement': segment.is_advertisement
         }
-        if segment.embedding:
-            properties['embedding'] = segment.embedding
+        if has_embedding(segment):
+            properties['embedding'] = embedding_to_list(segment.embedding)
         return self.create_node('Segment', properties)
         
     def create_entity(self, entity: Entity) -> str:
@@ -188,8 +189,8 @@ class BaseGraphProvider(GraphProvider, HealthCheckable, ABC):
             'bridge_score': entity.bridge_score,
             'is_peripheral': entity.is_peripheral
         }
-        if entity.embedding:
-            properties['embedding'] = entity.embedding
+        if has_embedding(entity):
+            properties['embedding'] = embedding_to_list(entity.embedding)
         return self.create_node('Entity', properties)
         
     def create_insight(self, insight: Insight) -> str:
@@ -1,16 +1,19 @@
 """Backwards compatible Neo4j provider supporting both fixed and schemaless modes."""
 
 import logging
-from typing import Dict, Any, List, Optional, Union
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple, Union
 from contextlib import contextmanager
 
 from src.providers.graph.base import BaseGraphProvider
 from src.providers.graph.neo4j import Neo4jProvider
 from src.providers.graph.schemaless_neo4j import SchemalessNeo4jProvider
 from src.core.plugin_discovery import provider_plugin
-from src.migration.query_translator import QueryTranslator
+from src.migration.query_translator import QueryTranslator, TranslationCache, is_fixed_schema_query
 from src.migration.result_standardizer import ResultStandardizer
+from src.migration.shadow_writer import ShadowWriteQueue
 from src.core.models import Podcast, Episode, Segment
+from src.api.metrics import get_metrics_collector
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +47,15 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
         # Migration utilities
         self.query_translator = QueryTranslator()
         self.result_standardizer = ResultStandardizer()
+        self.translation_cache = TranslationCache(config.get('query_cache_size', 1024))
+        
+        # Secondary writes in migration mode are applied in the background
+        self.async_shadow_writes = config.get('async_shadow_writes', True)
+        self.shadow_writer = ShadowWriteQueue(
+            max_size=config.get('shadow_write_queue_size', 1000),
+            max_retries=config.get('shadow_write_retries', 3),
+            enqueue_timeout=config.get('shadow_write_enqueue_timeout', 5.0)
+        )
         
         # Feature flags
         self.feature_flags = {
@@ -90,6 +102,9 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
     
     def disconnect(self) -> None:
         """Disconnect from Neo4j."""
+        # Apply pending shadow writes before closing the drivers
+        self.shadow_writer.stop()
+        
         if self.fixed_provider:
             self.fixed_provider.disconnect()
             
@@ -124,16 +139,11 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
         node_id = None
         
         if self.migration_mode:
-            # Dual write mode
-            if self.fixed_provider:
-                node_id = self.fixed_provider.create_node(node_type, properties)
-                
-            if self.schemaless_provider:
-                schemaless_id = self.schemaless_provider.create_node(node_type, properties)
-                
-                # Validate consistency if enabled
-                if self.feature_flags['validate_dual_writes'] and node_id != schemaless_id:
-                    logger.warning(f"ID mismatch in dual write: fixed={node_id}, schemaless={schemaless_id}")
+            # Dual write mode; consistency is validated by the shadow writer if enabled
+            node_id = self._dual_write(
+                'create_node', node_type, dict(properties),
+                compare=self.feature_flags['validate_dual_writes']
+            )
                     
             if self.feature_flags['log_migration_operations']:
                 logger.debug(f"Dual write node: type={node_type}, id={node_id}")
@@ -154,11 +164,10 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
         """Create a relationship, routing to appropriate provider."""
         if self.migration_mode:
             # Dual write mode
-            if self.fixed_provider:
-                self.fixed_provider.create_relationship(source_id, target_id, rel_type, properties)
-                
-            if self.schemaless_provider:
-                self.schemaless_provider.create_relationship(source_id, target_id, rel_type, properties)
+            self._dual_write(
+                'create_relationship', source_id, target_id, rel_type,
+                dict(properties) if properties else properties
+            )
                 
             if self.feature_flags['log_migration_operations']:
                 logger.debug(f"Dual write relationship: {source_id}-[{rel_type}]->{target_id}")
@@ -175,11 +184,7 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
         """
         if self.feature_flags['use_schemaless_query'] and self.schemaless_provider:
             # Translate query if needed
-            if self._is_fixed_schema_query(cypher):
-                translated_query = self.query_translator.translate_fixed_to_schemaless(cypher)
-                if self.feature_flags['log_migration_operations']:
-                    logger.debug(f"Translated query: {cypher} -> {translated_query}")
-                cypher = translated_query
+            cypher = self._translate_query(cypher)
             
             # Execute on schemaless
             results = self.schemaless_provider.query(cypher, parameters)
@@ -198,11 +203,7 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
         """Delete a node from appropriate provider(s)."""
         if self.migration_mode:
             # Delete from both
-            if self.fixed_provider:
-                self.fixed_provider.delete_node(node_id)
-                
-            if self.schemaless_provider:
-                self.schemaless_provider.delete_node(node_id)
+            self._dual_write('delete_node', node_id)
         else:
             provider = self._get_write_provider()
             provider.delete_node(node_id)
@@ -211,11 +212,7 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
         """Update node in appropriate provider(s)."""
         if self.migration_mode:
             # Update in both
-            if self.fixed_provider:
-                self.fixed_provider.update_node(node_id, properties)
-                
-            if self.schemaless_provider:
-                self.schemaless_provider.update_node(node_id, properties)
+            self._dual_write('update_node', node_id, dict(properties))
         else:
             provider = self._get_write_provider()
             provider.update_node(node_id, properties)
@@ -275,6 +272,59 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
         else:
             raise RuntimeError("No provider available for storing segments")
     
+    def _dual_write(self, method: str, *args, compare: bool = False) -> Any:
+        """
+        Write to the primary store synchronously and shadow the write to the secondary.
+        
+        Args:
+            method: Provider method name to call on both stores
+            *args: Arguments for the method
+            compare: Report a divergence if the secondary result differs
+            
+        Returns:
+            Result of the primary write
+        """
+        primary, secondary = self._get_dual_write_providers()
+        result = getattr(primary, method)(*args) if primary else None
+        
+        if secondary:
+            secondary_write = partial(getattr(secondary, method), *args)
+            if self.async_shadow_writes:
+                self.shadow_writer.submit(method, secondary_write, result, compare)
+            else:
+                secondary_result = secondary_write()
+                if compare and secondary_result != result:
+                    logger.warning(f"ID mismatch in dual write: primary={result}, secondary={secondary_result}")
+        
+        return result
+    
+    def _get_dual_write_providers(self) -> Tuple[Optional[BaseGraphProvider], Optional[BaseGraphProvider]]:
+        """Get (primary, secondary) providers for dual writes."""
+        if self.prefer_schemaless:
+            primary, secondary = self.schemaless_provider, self.fixed_provider
+        else:
+            primary, secondary = self.fixed_provider, self.schemaless_provider
+        
+        if primary is None:
+            return secondary, None
+        return primary, secondary
+    
+    def flush_shadow_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued secondary writes to be applied.
+        
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+            
+        Returns:
+            True if all shadow writes completed within the timeout
+        """
+        return self.shadow_writer.flush(timeout)
+    
+    def get_dual_write_divergences(self) -> List[Dict[str, Any]]:
+        """Get secondary writes that failed, were dropped or disagreed with the primary."""
+        return self.shadow_writer.get_divergences()
+    
     def _get_active_provider(self) -> BaseGraphProvider:
         """Get the currently active provider."""
         if self.schema_mode == 'fixed':
@@ -296,18 +346,32 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
             return self.schemaless_provider
         return self._get_active_provider()
     
+    def _translate_query(self, cypher: str) -> str:
+        """Translate a query for the schemaless graph, reusing cached translations."""
+        compiled = self.translation_cache.get(cypher)
+        if compiled is None:
+            compiled = self.query_translator.compile(cypher)
+            self.translation_cache.put(compiled)
+            if compiled.is_fixed_schema and self.feature_flags['log_migration_operations']:
+                logger.debug(f"Translated query: {cypher} -> {compiled.translated}")
+            self._record_cache_lookup(hit=False)
+        else:
+            self._record_cache_lookup(hit=True)
+        return compiled.translated
+    
+    def _record_cache_lookup(self, hit: bool) -> None:
+        """Export a translation cache lookup to the metrics collector."""
+        try:
+            metrics = get_metrics_collector()
+            counter = metrics.cache_hits if hit else metrics.cache_misses
+            counter.inc(labels={'cache': 'query_translation'})
+        except Exception:
+            # Metrics are best effort and must never break queries
+            pass
+    
     def _is_fixed_schema_query(self, cypher: str) -> bool:
         """Check if query uses fixed schema patterns."""
-        fixed_patterns = [
-            r'\b(Entity|Quote|Segment|Episode|Podcast|Insight|Topic|Speaker)\b',
-            r':\s*(Entity|Quote|Segment|Episode|Podcast|Insight|Topic|Speaker)',
-        ]
-        
-        import re
-        for pattern in fixed_patterns:
-            if re.search(pattern, cypher):
-                return True
-        return False
+        return is_fixed_schema_query(cypher)
     
     def _needs_standardization(self, results: List[Dict[str, Any]]) -> bool:
         """Check if results need standardization."""
@@ -334,7 +398,9 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
             'providers': {
                 'fixed': self.fixed_provider is not None,
                 'schemaless': self.schemaless_provider is not None
-            }
+            },
+            'query_cache': self.get_query_cache_stats(),
+            'shadow_writes': self.shadow_writer.get_stats()
         }
         
         # Add evolution report if available
@@ -343,6 +409,10 @@ class CompatibleNeo4jProvider(BaseGraphProvider):
             
         return status
     
+    def get_query_cache_stats(self) -> Dict[str, Any]:
+        """Get translation cache size, hit rate and eviction counts."""
+        return self.translation_cache.get_stats()
+    
     def enable_feature(self, feature: str, enabled: bool = True):
         """Enable or disable a feature flag."""
         if feature in self.feature_flags:
@@ -4,7 +4,9 @@ import logging
 from typing import Dict, Any, Optional, List
 import os
 
+from src.core.embeddings import embedding_to_list
 from src.core.exceptions import ProviderError
+from src.providers.embeddings.cache import get_embedding_cache
 
 
 logger = logging.getLogger(__name__)
@@ -147,6 +149,7 @@ class GraphEnhancements:
             episode_id: Episode ID
             embedding_provider: Embedding provider instance
         """
+        embedding_provider = get_embedding_cache(embedding_provider)
         try:
             # Get segments without embeddings
             result = neo4j_session.run("""
@@ -176,7 +179,7 @@ class GraphEnhancements:
                         s.embedding_model = $model
                     """, {
                         'segment_id': segment['id'],
-                        'embedding': embedding,
+                        'embedding': embedding_to_list(embedding),
                         'model': embedding_provider.model_name
                     })
                     
@@ -209,7 +212,7 @@ class GraphEnhancements:
                         e.embedding_model = $model
                     """, {
                         'entity_id': entity['id'],
-                        'embedding': embedding,
+                        'embedding': embedding_to_list(embedding),
                         'model': embedding_provider.model_name
                     })
                     
@@ -36,7 +36,9 @@ from datetime import datetime
 from dataclasses import dataclass
 
 from src.utils.component_tracker import track_component_impact, ComponentContribution, get_tracker
+from src.core.embeddings import embedding_to_list
 from src.core.models import Segment
+from src.providers.embeddings.cache import CachedEmbeddingProvider, embedding_key, get_embedding_cache
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,7 @@ class MetadataEnrichmentConfig:
     minimal_mode: bool = False  # Only essential metadata
     full_mode: bool = True  # All available metadata
     dry_run: bool = False  # Preview enrichment without applying
+    embedding_cache_size: int = 10000  # Max entries when the enricher creates the shared embedding cache
 
 
 class MetadataEnricher:
@@ -93,10 +96,19 @@ class SchemalessMetadataEnricher:
             self.config = MetadataEnrichmentConfig()
             self.embedding_provider = config_or_provider
             
-        self.enrichment_stats = {
+        self.enrichment_stats = self._new_stats()
+    
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        """Fresh enrichment stats; all values are bounded aggregates."""
+        return {
             "nodes_enriched": 0,
             "metadata_added": {},
-            "fields_per_node": []
+            "fields_total": 0,
+            "fields_max": 0,
+            "embedding_batches": 0,
+            "embeddings_computed": 0,
+            "embedding_cache_hits": 0
         }
     
     @track_component_impact("metadata_enricher", "1.0.0")
@@ -107,6 +119,7 @@ class SchemalessMetadataEnricher:
         episode_metadata: Dict[str, Any],
         podcast_metadata: Dict[str, Any],
         embedder: Optional[Callable] = None,
+        batch_embedder: Optional[Callable] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -118,6 +131,8 @@ class SchemalessMetadataEnricher:
             episode_metadata: Episode-level metadata
             podcast_metadata: Podcast-level metadata
             embedder: Optional embedding function
+            batch_embedder: Optional function embedding a list of texts in one call;
+                detected from the embedder or embedding provider when not given
             **kwargs: Additional context
             
         Returns:
@@ -127,11 +142,7 @@ class SchemalessMetadataEnricher:
             return self._preview_enrichment(extraction_results, segment, episode_metadata)
         
         # Reset stats
-        self.enrichment_stats = {
-            "nodes_enriched": 0,
-            "metadata_added": {},
-            "fields_per_node": []
-        }
+        self.enrichment_stats = self._new_stats()
         
         # Process different types of results
         enriched_results = extraction_results.copy()
@@ -143,7 +154,8 @@ class SchemalessMetadataEnricher:
                 segment,
                 episode_metadata,
                 podcast_metadata,
-                embedder
+                embedder,
+                batch_embedder
             )
         elif 'entities' in enriched_results:
             enriched_results['entities'] = self._enrich_nodes(
@@ -151,7 +163,8 @@ class SchemalessMetadataEnricher:
                 segment,
                 episode_metadata,
                 podcast_metadata,
-                embedder
+                embedder,
+                batch_embedder
             )
         
         # Enrich relationships
@@ -178,7 +191,7 @@ class SchemalessMetadataEnricher:
             contribution = ComponentContribution(
                 component_name="metadata_enricher",
                 contribution_type="metadata_added",
-                details=self.enrichment_stats["metadata_added"],
+                metadata=dict(self.enrichment_stats["metadata_added"]),
                 count=self.enrichment_stats["nodes_enriched"],
                 timestamp=kwargs.get('timestamp', datetime.now().isoformat())
             )
@@ -197,10 +210,12 @@ class SchemalessMetadataEnricher:
         segment: Segment,
         episode_metadata: Dict[str, Any],
         podcast_metadata: Dict[str, Any],
-        embedder: Optional[Callable]
+        embedder: Optional[Callable],
+        batch_embedder: Optional[Callable] = None
     ) -> List[Dict[str, Any]]:
         """Enrich a list of nodes with metadata."""
         enriched_nodes = []
+        node_fields = []
         
         for node in nodes:
             enriched_node = node.copy()
@@ -228,12 +243,6 @@ class SchemalessMetadataEnricher:
                 if extraction_meta:
                     fields_added.extend(extraction_meta)
             
-            # Add embeddings
-            if self.config.add_embeddings and embedder:
-                embedding_meta = self.add_embeddings(enriched_node, embedder)
-                if embedding_meta:
-                    fields_added.extend(embedding_meta)
-            
             # Add confidence scores
             if self.config.add_confidence_scores:
                 confidence_meta = self._add_confidence_scores(enriched_node, segment)
@@ -247,15 +256,24 @@ class SchemalessMetadataEnricher:
                     fields_added.extend(segment_meta)
             
             enriched_nodes.append(enriched_node)
-            
-            # Update stats
-            self.enrichment_stats["nodes_enriched"] += 1
-            self.enrichment_stats["fields_per_node"].append(len(fields_added))
-            
+            node_fields.append(fields_added)
+        
+        # Embed every node of the segment in one batch
+        if self.config.add_embeddings and (embedder or batch_embedder):
+            for fields_added, embedding_meta in zip(
+                node_fields,
+                self.add_embeddings_batch(enriched_nodes, embedder, batch_embedder)
+            ):
+                fields_added.extend(embedding_meta)
+        
+        # Update stats
+        stats = self.enrichment_stats
+        for fields_added in node_fields:
+            stats["nodes_enriched"] += 1
+            stats["fields_total"] += len(fields_added)
+            stats["fields_max"] = max(stats["fields_max"], len(fields_added))
             for field in fields_added:
-                if field not in self.enrichment_stats["metadata_added"]:
-                    self.enrichment_stats["metadata_added"][field] = 0
-                self.enrichment_stats["metadata_added"][field] += 1
+                stats["metadata_added"][field] = stats["metadata_added"].get(field, 0) + 1
         
         return enriched_nodes
     
@@ -341,31 +359,101 @@ class SchemalessMetadataEnricher:
     
     def add_embeddings(self, node: Dict[str, Any], embedder: Callable) -> List[str]:
         """Generate and add vector embeddings to a node."""
-        fields_added = []
+        return self.add_embeddings_batch([node], embedder)[0]
+    
+    def add_embeddings_batch(
+        self,
+        nodes: List[Dict[str, Any]],
+        embedder: Optional[Callable] = None,
+        batch_embedder: Optional[Callable] = None
+    ) -> List[List[str]]:
+        """
+        Embed many nodes with one batch call and write the vectors back.
         
-        # Get text representation of node
-        text = node.get('value', node.get('name', ''))
-        if 'description' in node:
-            text += f" {node['description']}"
+        Texts are de-duplicated and provider-backed embedders go through the
+        shared content-hash cache, so only unseen texts reach the model; cache
+        hits and computed embeddings are counted in the enrichment stats.
+        Callers can pass all nodes of an episode to embed them in a single batch.
         
-        if text:
+        Args:
+            nodes: Nodes to embed in place
+            embedder: Function embedding a single text
+            batch_embedder: Function embedding a list of texts
+            
+        Returns:
+            The fields added to each node, in node order
+        """
+        fields_per_node: List[List[str]] = [[] for _ in nodes]
+        batch_embedder = batch_embedder or self._resolve_batch_embedder(embedder)
+        if batch_embedder is None and embedder is None:
+            return fields_per_node
+        model_name = self._embedder_model_name(batch_embedder or embedder)
+        
+        texts = [self._embedding_text(node) for node in nodes]
+        keys = [embedding_key(model_name, text) if text else None for text in texts]
+        unique: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key is not None and key not in unique:
+                unique[key] = text
+        
+        embeddings: Dict[str, List[float]] = {}
+        if unique:
             try:
-                # Generate embedding
-                embedding = embedder(text)
-                node['embedding'] = embedding
-                fields_added.append('embedding')
-                
-                # Add embedding metadata
-                node['embedding_model'] = getattr(embedder, 'model_name', 'unknown')
-                fields_added.append('embedding_model')
-                
-                node['embedding_dimension'] = len(embedding) if isinstance(embedding, list) else None
-                fields_added.append('embedding_dimension')
-                
+                cache = getattr(batch_embedder, '__self__', None)
+                if isinstance(cache, CachedEmbeddingProvider):
+                    vectors, cache_hits, computed = cache.generate_embeddings_counted(list(unique.values()))
+                elif batch_embedder is not None:
+                    vectors, cache_hits, computed = batch_embedder(list(unique.values())), 0, len(unique)
+                else:
+                    vectors = [embedder(text) for text in unique.values()]
+                    cache_hits, computed = 0, len(unique)
+                self.enrichment_stats["embedding_batches"] += 1
+                self.enrichment_stats["embeddings_computed"] += computed
+                self.enrichment_stats["embedding_cache_hits"] += cache_hits
+                embeddings = dict(zip(unique, vectors))
             except Exception as e:
-                logger.warning(f"Failed to generate embedding: {e}")
+                logger.warning(f"Failed to generate embeddings: {e}")
+        
+        for node, key, fields_added in zip(nodes, keys, fields_per_node):
+            embedding = embeddings.get(key) if key is not None else None
+            if embedding is None:
+                continue
+            node['embedding'] = embedding = embedding_to_list(embedding)
+            node['embedding_model'] = model_name
+            node['embedding_dimension'] = len(embedding) if isinstance(embedding, list) else None
+            fields_added.extend(['embedding', 'embedding_model', 'embedding_dimension'])
+        
+        return fields_per_node
+    
+    def _resolve_batch_embedder(self, embedder: Optional[Callable]) -> Optional[Callable]:
+        """Find a batch embedding function on the embedder's owner or the provider.
         
-        return fields_added
+        Embedding providers are wrapped in the shared embedding cache.
+        """
+        owners = [getattr(embedder, '__self__', None), self.embedding_provider]
+        for owner in owners:
+            if owner is None:
+                continue
+            if callable(getattr(owner, 'generate_embeddings', None)):
+                cache_config = {'embedding_cache_size': self.config.embedding_cache_size}
+                return get_embedding_cache(owner, cache_config).generate_embeddings
+            if callable(getattr(owner, 'embed_documents', None)):
+                return owner.embed_documents
+        return None
+    
+    @staticmethod
+    def _embedder_model_name(embedder: Callable) -> str:
+        """Model name of the embedder (or the object it is bound to)."""
+        owner = getattr(embedder, '__self__', embedder)
+        return getattr(embedder, 'model_name', None) or getattr(owner, 'model_name', 'unknown')
+    
+    @staticmethod
+    def _embedding_text(node: Dict[str, Any]) -> str:
+        """Text representation of a node used for its embedding."""
+        text = node.get('value', node.get('name', '')) or ''
+        if 'description' in node:
+            text += f" {node['description']}"
+        return text
     
     def _add_confidence_scores(self, node: Dict[str, Any], segment: Segment) -> List[str]:
         """Add confidence scoring to nodes."""
@@ -474,9 +562,10 @@ class SchemalessMetadataEnricher:
     
     def get_enrichment_metrics(self) -> Dict[str, Any]:
         """Get metrics about the enrichment process."""
+        stats = self.enrichment_stats
         avg_fields = (
-            sum(self.enrichment_stats["fields_per_node"]) / len(self.enrichment_stats["fields_per_node"])
-            if self.enrichment_stats["fields_per_node"] else 0
+            stats["fields_total"] / stats["nodes_enriched"]
+            if stats["nodes_enriched"] else 0
         )
         
         return {
@@ -485,7 +574,11 @@ class SchemalessMetadataEnricher:
                 "nodes_enriched": self.enrichment_stats["nodes_enriched"],
                 "metadata_fields_added": self.enrichment_stats["metadata_added"],
                 "avg_fields_per_node": round(avg_fields, 2),
-                "total_fields_added": sum(self.enrichment_stats["metadata_added"].values())
+                "max_fields_per_node": stats["fields_max"],
+                "total_fields_added": sum(self.enrichment_stats["metadata_added"].values()),
+                "embedding_batches": stats["embedding_batches"],
+                "embeddings_computed": stats["embeddings_computed"],
+                "embedding_cache_hits": stats["embedding_cache_hits"]
             },
             "count": self.enrichment_stats["nodes_enriched"]
         }
@@ -49,6 +49,7 @@ class SchemalessNeo4jProvider(BaseGraphProvider):
             similarity_threshold=config.get('entity_resolution_threshold', 0.85)
         )
         self.entity_resolver = SchemalessEntityResolver(entity_config)
+        self._resolution_episode_id = None
         
         self.metadata_enricher = None
         self.quote_extractor = SchemalessQuoteExtractor()
@@ -513,9 +514,19 @@ class SchemalessNeo4jProvider(BaseGraphProvider):
         # Step 4: Entity resolution
         pre_resolution_count = len(extraction_results.get('entities', []))
         if extraction_results.get('entities'):
-            resolution_results = self.entity_resolver.resolve_entities(
-                extraction_results['entities']
-            )
+            if self.config.get('incremental_entity_resolution', False):
+                # Resolve against the canonical entities from this episode's earlier segments
+                if self._resolution_episode_id != episode.id:
+                    self.entity_resolver.reset_incremental()
+                    self._resolution_episode_id = episode.id
+                resolution_results = self.entity_resolver.resolve_incremental(
+                    extraction_results['entities'],
+                    episode_id=episode.id
+                )
+            else:
+                resolution_results = self.entity_resolver.resolve_entities(
+                    extraction_results['entities']
+                )
             extraction_results['entities'] = resolution_results['resolved_entities']
             resolved_count = pre_resolution_count - len(extraction_results['entities'])
             if resolved_count > 0:
@@ -538,7 +549,8 @@ class SchemalessNeo4jProvider(BaseGraphProvider):
             segment,
             episode_metadata,
             podcast_metadata,
-            embedder=self.embedding_adapter.embed_query if self.embedding_adapter else None
+            embedder=self.embedding_adapter.embed_query if self.embedding_adapter else None,
+            batch_embedder=self.embedding_adapter.embed_documents if self.embedding_adapter else None
         )
         extraction_results = enriched_results
         
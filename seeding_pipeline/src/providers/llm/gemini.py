@@ -1,12 +1,13 @@
 """Gemini LLM provider implementation."""
 
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 
 from src.providers.llm.base import BaseLLMProvider, LLMResponse
 from src.core.exceptions import ProviderError, RateLimitError
 from src.core.plugin_discovery import provider_plugin
-from src.utils.rate_limiting import WindowedRateLimiter
+from src.utils.rate_limiting import create_rate_limiter, scoped_identifier
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,10 @@ class GeminiProvider(BaseLLMProvider):
             raise ProviderError("gemini", "Gemini API key is required")
             
         self.client = None
+        # Pre-built clients keyed by (temperature, max_tokens) so per-call options
+        # reuse a client instead of constructing a new one for every request
+        self._clients: Dict[tuple, Any] = {}
+        self._clients_lock = threading.Lock()
         # Set up rate limiter with Gemini-specific limits
         rate_limits = config.get('rate_limits', {})
         if not rate_limits:
@@ -45,29 +50,47 @@ class GeminiProvider(BaseLLMProvider):
                     'rpd': 500
                 }
             }
-        self.rate_limiter = WindowedRateLimiter(rate_limits)
+        # Per-process by default; a sqlite or redis backend shares one budget across workers
+        self.rate_limiter = create_rate_limiter(rate_limits, config)
+        # Ledger identifier; a scope (e.g. API key hash) keeps separate budgets per key
+        self.rate_limit_id = scoped_identifier(self.model_name, config.get('rate_limit_scope'))
+        # Seconds to wait for rate limit capacity before giving up
+        self.rate_limit_timeout = config.get('rate_limit_timeout', 120.0)
         
     def _initialize_client(self) -> None:
         """Initialize the Gemini client."""
-        try:
-            from langchain_google_genai import ChatGoogleGenerativeAI
-        except ImportError:
-            raise ProviderError(
-                "gemini",
-                "langchain_google_genai is not installed. "
-                "Install with: pip install langchain-google-genai"
-            )
+        self.client = self._get_client(self.temperature, self.max_tokens)
+        logger.info(f"Initialized Gemini client with model: {self.model_name}")
             
-        try:
-            self.client = ChatGoogleGenerativeAI(
-                model=self.model_name,
-                google_api_key=self.api_key,
-                temperature=self.temperature,
-                max_output_tokens=self.max_tokens,
-            )
-            logger.info(f"Initialized Gemini client with model: {self.model_name}")
-        except Exception as e:
-            raise ProviderError("gemini", f"Failed to initialize Gemini client: {e}")
+    def _get_client(self, temperature: float, max_tokens: int) -> Any:
+        """Return the pooled client for the given options, creating it on first use."""
+        key = (temperature, max_tokens)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is not None:
+                return client
+                
+            try:
+                from langchain_google_genai import ChatGoogleGenerativeAI
+            except ImportError:
+                raise ProviderError(
+                    "gemini",
+                    "langchain_google_genai is not installed. "
+                    "Install with: pip install langchain-google-genai"
+                )
+                
+            try:
+                client = ChatGoogleGenerativeAI(
+                    model=self.model_name,
+                    google_api_key=self.api_key,
+                    temperature=temperature,
+                    max_output_tokens=max_tokens,
+                )
+            except Exception as e:
+                raise ProviderError("gemini", f"Failed to initialize Gemini client: {e}")
+                
+            self._clients[key] = client
+            return client
             
     def complete(self, prompt: str, **kwargs) -> str:
         """Generate completion for the given prompt."""
@@ -76,21 +99,13 @@ class GeminiProvider(BaseLLMProvider):
         # Estimate tokens (rough approximation)
         estimated_tokens = len(prompt.split()) * 1.3
         
-        # Check rate limits
-        if not self.rate_limiter.can_make_request(self.model_name, estimated_tokens):
-            raise RateLimitError(
-                "gemini",
-                f"Rate limit exceeded for model {self.model_name}. "
-                "Please wait before making another request."
-            )
+        # Wait for rate limit capacity (the request is recorded on admission)
+        self._acquire_rate_limit(estimated_tokens)
             
         try:
             # Make the request
             response = self.client.invoke(prompt)
             
-            # Record successful request
-            self.rate_limiter.record_request(self.model_name, estimated_tokens)
-            
             # Extract content from response
             if hasattr(response, 'content'):
                 return response.content
@@ -98,9 +113,9 @@ class GeminiProvider(BaseLLMProvider):
                 return str(response)
                 
         except Exception as e:
-            self.rate_limiter.record_error(self.model_name, str(type(e).__name__))
+            self.rate_limiter.record_error(self.rate_limit_id, str(type(e).__name__))
             if "quota" in str(e).lower() or "rate" in str(e).lower():
-                raise RateLimitError(f"Gemini rate limit error: {e}")
+                raise RateLimitError("gemini", f"Gemini rate limit error: {e}")
             raise ProviderError("gemini", f"Gemini completion failed: {e}")
             
     def complete_with_options(self, prompt: str, options: Dict[str, Any]) -> Dict[str, Any]:
@@ -111,28 +126,17 @@ class GeminiProvider(BaseLLMProvider):
         temperature = options.get('temperature', self.temperature)
         max_tokens = options.get('max_tokens', self.max_tokens)
         
-        # Create a temporary client with custom settings if needed
-        if temperature != self.temperature or max_tokens != self.max_tokens:
-            from langchain_google_genai import ChatGoogleGenerativeAI
-            temp_client = ChatGoogleGenerativeAI(
-                model=self.model_name,
-                google_api_key=self.api_key,
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-            )
-        else:
-            temp_client = self.client
+        # Reuse the pooled client for these settings
+        temp_client = self._get_client(temperature, max_tokens)
             
         # Estimate tokens
         estimated_tokens = len(prompt.split()) * 1.3
         
-        # Check rate limits
-        if not self.rate_limiter.can_make_request(self.model_name, estimated_tokens):
-            raise RateLimitError(f"Rate limit exceeded for model {self.model_name}")
+        # Wait for rate limit capacity (the request is recorded on admission)
+        self._acquire_rate_limit(estimated_tokens)
             
         try:
             response = temp_client.invoke(prompt)
-            self.rate_limiter.record_request(self.model_name, estimated_tokens)
             
             content = response.content if hasattr(response, 'content') else str(response)
             
@@ -145,11 +149,23 @@ class GeminiProvider(BaseLLMProvider):
             }
             
         except Exception as e:
-            self.rate_limiter.record_error(self.model_name, str(type(e).__name__))
+            self.rate_limiter.record_error(self.rate_limit_id, str(type(e).__name__))
             if "quota" in str(e).lower() or "rate" in str(e).lower():
-                raise RateLimitError(f"Gemini rate limit error: {e}")
+                raise RateLimitError("gemini", f"Gemini rate limit error: {e}")
             raise ProviderError("gemini", f"Gemini completion failed: {e}")
             
+    def _acquire_rate_limit(self, estimated_tokens: float) -> None:
+        """Block until the rate limiter admits a request of the given size."""
+        if not self.rate_limiter.acquire(self.rate_limit_id, estimated_tokens,
+                                         timeout=self.rate_limit_timeout):
+            retry_after = self.rate_limiter.time_until_available(self.rate_limit_id, estimated_tokens)
+            raise RateLimitError(
+                "gemini",
+                f"Rate limit exceeded for model {self.model_name}. "
+                f"Capacity frees up in {retry_after:.1f}s.",
+                retry_after=retry_after
+            )
+            
     def get_rate_limits(self) -> Dict[str, Any]:
         """Get current rate limit status."""
         return self.rate_limiter.get_status()
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""LLM router that load balances across several model/API key routes."""
+
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List
+
+from src.providers.llm.base import BaseLLMProvider
+from src.core.exceptions import ProviderError, RateLimitError
+from src.core.plugin_discovery import provider_plugin
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LLMRoute:
+    """A single model/API key combination the router can send requests to."""
+    name: str
+    provider: Any
+    latency: Optional[float] = None  # Smoothed seconds per request
+    in_flight: int = 0
+    requests: int = 0
+    failures: int = 0
+    cooldown_until: float = 0.0
+    last_error: Optional[str] = None
+
+    @property
+    def model_name(self) -> str:
+        return getattr(self.provider, 'model_name', 'unknown')
+
+    @property
+    def rate_limit_id(self) -> str:
+        """Identifier the route's provider records requests under."""
+        return getattr(self.provider, 'rate_limit_id', None) or self.model_name
+
+    def time_until_available(self, cost: float) -> float:
+        """Seconds until the route's own rate limiter would admit the request."""
+        limiter = getattr(self.provider, 'rate_limiter', None)
+        if limiter is None or not hasattr(limiter, 'time_until_available'):
+            return 0.0
+        return limiter.time_until_available(self.rate_limit_id, cost)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'model': self.model_name,
+            'latency': self.latency,
+            'in_flight': self.in_flight,
+            'requests': self.requests,
+            'failures': self.failures,
+            'cooldown_remaining': max(0.0, self.cooldown_until - time.time()),
+            'last_error': self.last_error
+        }
+
+
+@provider_plugin('llm', 'router', version='1.0.0', author='Podcast KG',
+                description='Routes LLM requests across several models and API keys')
+class LLMRouter(BaseLLMProvider):
+    """LLM provider that spreads requests over a pool of routes.
+
+    Each entry in ``config['llm_routes']`` is merged over the base config and
+    built into its own provider (``gemini`` unless the route names another),
+    so every model/key pair keeps its own rate limiter and pooled clients.
+    Each route's requests are recorded under its model name scoped by a hash
+    of the provider and API key, so routes for the same model on different
+    keys keep separate budgets even on a shared sqlite or redis ledger, while
+    routes reusing one key share that key's quota.
+    Requests go to the route with the lowest expected completion time, which
+    is the wait for rate limit capacity plus the observed latency scaled by
+    the requests already in flight. A route that raises a rate limit error,
+    such as running out of its daily quota, is cooled down and the request
+    fails over to the next best route.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize the router and build a provider for every route."""
+        super().__init__(config)
+        self.model_name = 'router'
+        route_configs = config.get('llm_routes') or []
+        if not route_configs:
+            # A single route from the base config behaves like the plain provider
+            route_configs = [{}]
+
+        # Weight of the newest sample in the latency moving average
+        self.latency_smoothing = config.get('route_latency_smoothing', 0.3)
+        # Cooldown for rate limit errors that carry no retry_after hint
+        self.route_cooldown = config.get('route_cooldown', 60.0)
+        # Routes whose wait exceeds this are skipped while any other route can serve
+        self.rate_limit_timeout = config.get('rate_limit_timeout', 120.0)
+
+        self._lock = threading.Lock()
+        self.routes: List[LLMRoute] = [
+            self._build_route(index, route_config)
+            for index, route_config in enumerate(route_configs)
+        ]
+        logger.info(f"LLM router configured with {len(self.routes)} routes: "
+                    f"{[route.name for route in self.routes]}")
+
+    def _build_route(self, index: int, route_config: Dict[str, Any]) -> LLMRoute:
+        """Create the provider for one route from the base config plus overrides."""
+        # Imported here because the factory imports provider modules
+        from src.factories.provider_factory import ProviderFactory
+
+        provider_name = route_config.get('provider', self.config.get('route_provider', 'gemini'))
+        if provider_name == 'router':
+            raise ProviderError("router", "A router route cannot itself be a router")
+
+        merged = {
+            key: value for key, value in self.config.items()
+            if key not in ('llm_routes', 'provider')
+        }
+        merged.update({key: value for key, value in route_config.items()
+                       if key not in ('name', 'provider')})
+        if not merged.get('rate_limit_scope'):
+            merged['rate_limit_scope'] = self._key_scope(provider_name, merged.get('api_key'))
+        provider = ProviderFactory.create_provider('llm', provider_name, merged)
+        name = route_config.get('name') or f"{provider_name}:{provider.model_name}#{index}"
+        return LLMRoute(name=name, provider=provider)
+
+    @staticmethod
+    def _key_scope(provider_name: str, api_key: Optional[str]) -> str:
+        """Rate limit scope for a provider/API key pair, without exposing the key."""
+        digest = hashlib.sha256(f"{provider_name}\0{api_key or ''}".encode('utf-8'))
+        return digest.hexdigest()[:12]
+
+    def _initialize_client(self) -> None:
+        """Routes initialize their own clients lazily on first use."""
+        pass
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        """Generate completion on the best available route."""
+        return self._dispatch(prompt, lambda provider: provider.complete(prompt, **kwargs))
+
+    def complete_with_options(self, prompt: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate completion with additional options on the best available route."""
+        route_holder = {}
+
+        def call(provider):
+            return provider.complete_with_options(prompt, options)
+
+        result = self._dispatch(prompt, call, route_holder)
+        if isinstance(result, dict):
+            result = dict(result)
+            result['route'] = route_holder.get('name')
+        return result
+
+    def _dispatch(self, prompt: str, call, route_holder: Optional[Dict[str, Any]] = None) -> Any:
+        """Run ``call`` on routes in order of preference until one succeeds."""
+        estimated_tokens = len(prompt.split()) * 1.3
+        tried = set()
+        last_error: Optional[Exception] = None
+
+        while True:
+            route = self._select_route(estimated_tokens, tried)
+            if route is None:
+                break
+            tried.add(route.name)
+
+            start = time.time()
+            # Whatever happens, the route's slot is released with the outcome
+            outcome: Dict[str, Any] = {}
+            try:
+                result = call(route.provider)
+                outcome['latency'] = time.time() - start
+            except RateLimitError as e:
+                retry_after = e.details.get('retry_after') or self.route_cooldown
+                outcome.update(error=e, cooldown=retry_after)
+                logger.warning(f"Route {route.name} rate limited for {retry_after:.1f}s, failing over")
+                last_error = e
+                continue
+            except ProviderError as e:
+                outcome['error'] = e
+                logger.warning(f"Route {route.name} failed, failing over: {e}")
+                last_error = e
+                continue
+            except Exception as e:
+                outcome['error'] = e
+                raise
+            finally:
+                self._finish(route, **outcome)
+
+            if route_holder is not None:
+                route_holder['name'] = route.name
+            return result
+
+        if isinstance(last_error, RateLimitError) or last_error is None:
+            retry_after = self._min_wait(estimated_tokens)
+            raise RateLimitError(
+                "router",
+                f"All {len(self.routes)} LLM routes are rate limited. "
+                f"Capacity frees up in {retry_after:.1f}s.",
+                retry_after=retry_after
+            )
+        raise ProviderError("router", f"All LLM routes failed; last error: {last_error}")
+
+    def _select_route(self, cost: float, exclude: set) -> Optional[LLMRoute]:
+        """Pick the route with the lowest expected completion time and claim a slot on it."""
+        now = time.time()
+        # Rate limiter lookups can block (SQLite, Redis), so they run outside the lock
+        waits = {
+            route.name: route.time_until_available(cost)
+            for route in self.routes
+            if route.name not in exclude and route.cooldown_until <= now
+        }
+        with self._lock:
+            candidates = []
+            for route in self.routes:
+                if route.name not in waits or route.cooldown_until > now:
+                    continue
+                wait = waits[route.name]
+                if wait > self.rate_limit_timeout:
+                    # Out of quota (typically the daily limit) for longer than we would wait
+                    route.cooldown_until = now + wait
+                    continue
+                # Unmeasured routes are tried first so every route gets a latency sample
+                latency = route.latency if route.latency is not None else 0.0
+                candidates.append((wait + latency * (route.in_flight + 1), route.in_flight,
+                                   route.requests, route))
+            if not candidates:
+                return None
+            best = min(candidates, key=lambda candidate: candidate[:3])[3]
+            best.in_flight += 1
+            return best
+
+    def _finish(self, route: LLMRoute, latency: Optional[float] = None,
+                error: Optional[Exception] = None, cooldown: Optional[float] = None) -> None:
+        """Release the route's slot and record the outcome."""
+        with self._lock:
+            route.in_flight -= 1
+            route.requests += 1
+            if latency is not None:
+                if route.latency is None:
+                    route.latency = latency
+                else:
+                    route.latency += self.latency_smoothing * (latency - route.latency)
+            if error is not None:
+                route.failures += 1
+                route.last_error = str(error)
+            if cooldown is not None:
+                route.cooldown_until = max(route.cooldown_until, time.time() + cooldown)
+
+    def _min_wait(self, cost: float) -> float:
+        """Shortest time until any route can take a request."""
+        now = time.time()
+        waits = [
+            max(route.cooldown_until - now, route.time_until_available(cost))
+            for route in self.routes
+        ]
+        return max(0.0, min(waits)) if waits else 0.0
+
+    def get_rate_limits(self) -> Dict[str, Any]:
+        """Get rate limit status for every route."""
+        status = {}
+        for route in self.routes:
+            try:
+                limits = route.provider.get_rate_limits()
+            except Exception as e:
+                limits = {'error': str(e)}
+            status[route.name] = {**route.to_dict(), 'limits': limits}
+        return status
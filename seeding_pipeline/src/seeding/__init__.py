@@ -1,5 +1,15 @@
 """Seeding module for podcast knowledge graph pipeline."""
 
-from .orchestrator import PodcastKnowledgePipeline
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .orchestrator import PodcastKnowledgePipeline
+
+# Loaded on first use so submodules such as checkpoint import quickly
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'PodcastKnowledgePipeline': '.orchestrator',
+})
 
 __all__ = ['PodcastKnowledgePipeline']
\ No newline at end of file
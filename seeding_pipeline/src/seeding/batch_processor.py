@@ -12,7 +12,8 @@ import time
 from datetime import datetime
 
 from src.core.exceptions import BatchProcessingError
-from src.utils.memory import monitor_memory, cleanup_memory
+from src.utils.memory import monitor_memory, MemoryBudget
+from src.utils.model_pool import get_model_pool
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,9 @@ class BatchProcessor:
         self.memory_limit_mb = memory_limit_mb
         self.progress_callback = progress_callback
         self.config = config or {}
+        self.memory_budget = MemoryBudget(
+            budget_mb=self.config.get('memory_budget_mb', memory_limit_mb)
+        )
         
         # Batch size optimization
         self._optimal_batch_size = batch_size
@@ -161,21 +165,42 @@ class BatchProcessor:
         except ImportError:
             return False
     
+    def _create_executor(self) -> Union[ThreadPoolExecutor, ProcessPoolExecutor]:
+        """Create the executor for individual items.
+        
+        Process workers are forked after preparing the model pool, so models
+        already loaded in the parent are shared copy-on-write instead of being
+        loaded again by every worker. When a loaded model is not fork-safe,
+        workers are spawned and load their own copies.
+        """
+        if not self.use_processes:
+            return ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        if 'fork' not in mp.get_all_start_methods():
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        start_method = 'fork' if get_model_pool().prepare_for_fork() else 'spawn'
+        return ProcessPoolExecutor(max_workers=self.max_workers,
+                                   mp_context=mp.get_context(start_method))
+    
     def _process_individual_items(self,
                                  items: List[BatchItem],
                                  process_func: Callable[[BatchItem], Any]) -> List[BatchResult]:
         """Process items individually with parallel execution."""
         results = []
         
-        # Choose executor based on configuration
-        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
-        
-        with executor_class(max_workers=self.max_workers) as executor:
-            # Submit all items
-            future_to_item = {
-                executor.submit(self._process_single_item, item, process_func): item
-                for item in items
-            }
+        with self._create_executor() as executor:
+            # Submit items, holding back while over the memory budget
+            future_to_item = {}
+            try:
+                for item in items:
+                    self.memory_budget.wait_for_headroom()
+                    future = executor.submit(self._process_single_item, item, process_func)
+                    self.memory_budget.track_future(future)
+                    future_to_item[future] = item
+            finally:
+                if self.use_processes:
+                    # Workers are started by now (or submission failed)
+                    get_model_pool().finish_fork()
             
             # Process completed items
             for future in as_completed(future_to_item):
@@ -281,8 +306,8 @@ class BatchProcessor:
                 self._items_processed += len(batch)
             self._update_progress()
             
-            # Clean up memory after each batch
-            cleanup_memory()
+            # Release memory after each batch if over budget
+            self.memory_budget.release()
         
         return results
     
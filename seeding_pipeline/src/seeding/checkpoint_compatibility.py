@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from ..core.embeddings import json_default
 from ..core.exceptions import CheckpointError
 
 
@@ -270,9 +271,9 @@ class CheckpointCompatibilityLayer:
             # Create directory if needed
             self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
             
-            # Save checkpoint
+            # Save checkpoint; embedding arrays are written as lists
             with open(checkpoint_file, 'w') as f:
-                json.dump(checkpoint_data, f, indent=2)
+                json.dump(checkpoint_data, f, indent=2, default=json_default)
                 
             return True
             
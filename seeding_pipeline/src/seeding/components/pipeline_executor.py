@@ -2,19 +2,32 @@
 
 import os
 import logging
+import contextvars
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from src.core.models import Podcast, Episode, Segment
+from src.core.segment_store import SegmentStore
 from src.core.exceptions import PipelineError
+from src.seeding.stage_graph import StageGraph
 from src.utils.feed_processing import download_episode_audio
-from src.utils.memory import cleanup_memory
+from src.utils.memory import MemoryBudget
+from src.utils.stage_profiling import get_stage_profiler, profile_stage
 from src.tracing import create_span, add_span_attributes
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _profiled(stage: str, func, *args, **kwargs):
+    """Call ``func`` inside a profiled stage."""
+    with profile_stage(stage):
+        return func(*args, **kwargs)
+
+
 class PipelineExecutor:
     """Executes the processing pipeline for podcast episodes."""
     
@@ -42,6 +55,18 @@ class PipelineExecutor:
         self.graph_provider = provider_coordinator.graph_provider
         self.llm_provider = provider_coordinator.llm_provider
         self.embedding_provider = provider_coordinator.embedding_provider
+        
+        # Collect garbage only when the RSS budget is crossed
+        self.memory_budget = MemoryBudget(
+            budget_mb=getattr(config, "memory_budget_mb", None),
+            backpressure_timeout=getattr(config, "memory_backpressure_timeout", 60.0)
+        )
+        
+        # Per-stage wall/CPU/allocation counters, with optional stack sampling
+        self.stage_profiler = get_stage_profiler()
+        
+        # Worker processes for the "process" analysis executor, shared by all episodes
+        self._analysis_pool: Optional[ProcessPoolExecutor] = None
     
     def process_episode(self, podcast_config: Dict[str, Any], 
                        episode: Dict[str, Any],
@@ -63,29 +88,63 @@ class PipelineExecutor:
         if self._is_episode_completed(episode_id):
             return {'segments': 0, 'insights': 0, 'entities': 0}
         
-        # Download and process audio
-        audio_path = self._download_episode_audio(episode, podcast_config['id'])
+        # Hold back this episode while over budget and others are still in flight
+        self.memory_budget.wait_for_headroom()
         
-        try:
-            # Add episode context
-            self._add_episode_context(episode, podcast_config)
+        with self.memory_budget.track(), self._profile_episode(episode):
+            # Download and process audio
+            with profile_stage("download"):
+                audio_path = self._download_episode_audio(episode, podcast_config['id'])
             
-            # Process audio segments
-            segments = self._process_audio_segments(audio_path, episode_id)
-            
-            # Extract knowledge based on mode
-            result = self._extract_knowledge(
-                podcast_config, episode, segments, episode_id, use_large_context
-            )
-            
-            # Finalize processing
-            self._finalize_episode_processing(episode_id, result)
-            
-            return result
+            try:
+                # Add episode context
+                self._add_episode_context(episode, podcast_config)
+                
+                # Process audio segments
+                segments = self._process_audio_segments(audio_path, episode_id)
+                
+                # Extract knowledge based on mode
+                result = self._extract_knowledge(
+                    podcast_config, episode, segments, episode_id, use_large_context
+                )
+                
+                # Finalize processing
+                self._finalize_episode_processing(episode_id, result)
+                
+                return result
+                
+            finally:
+                # Cleanup
+                self._cleanup_audio_file(audio_path)
+    
+    def _profile_episode(self, episode: Dict[str, Any]):
+        """Start the stage profile of an episode.
+        
+        Episodes listed in ``profile_episodes`` (or all, for ``"*"``), episodes
+        flagged with ``profile: True`` and episodes requested through the API
+        are also stack-sampled for a flamegraph.
+        
+        Args:
+            episode: Episode information
             
-        finally:
-            # Cleanup
-            self._cleanup_audio_file(audio_path)
+        Returns:
+            Context manager profiling the episode
+        """
+        if not getattr(self.config, "stage_profiling", True):
+            return nullcontext()
+        
+        profile_episodes = getattr(self.config, "profile_episodes", None) or []
+        sample = bool(
+            episode.get('profile')
+            or '*' in profile_episodes
+            or episode['id'] in profile_episodes
+        )
+        return self.stage_profiler.profile_episode(
+            episode['id'],
+            sample=sample,
+            sample_interval=getattr(self.config, "profile_sample_interval_ms", 5.0) / 1000,
+            output_dir=getattr(self.config, "profile_output_dir", None)
+        )
     
     def _prepare_segments(self, audio_path: str) -> List[Dict[str, Any]]:
         """Prepare and process audio segments.
@@ -96,7 +155,11 @@ class PipelineExecutor:
         Returns:
             List of processed segments
         """
-        return self.segmenter.process_audio(audio_path)
+        result = self.segmenter.process_audio(audio_path)
+        # The segmenter returns the transcript alongside diarization and metadata
+        if isinstance(result, dict):
+            return result.get('transcript', [])
+        return result
     
     def _extract_fixed_schema(self, podcast_config: Dict[str, Any],
                             episode: Dict[str, Any],
@@ -123,15 +186,16 @@ class PipelineExecutor:
         }):
             # Extract knowledge
             logger.info("Extracting knowledge...")
-            extraction_result = self.knowledge_extractor.extract_knowledge(
-                segments,
-                episode_metadata={
-                    'title': episode['title'],
-                    'description': episode.get('description', ''),
-                    'podcast_name': podcast_config.get('name', '')
-                },
-                use_large_context=use_large_context
-            )
+            with profile_stage("extraction"):
+                extraction_result = self.knowledge_extractor.extract_knowledge(
+                    segments,
+                    episode_metadata={
+                        'title': episode['title'],
+                        'description': episode.get('description', ''),
+                        'podcast_name': podcast_config.get('name', '')
+                    },
+                    use_large_context=use_large_context
+                )
             
             add_span_attributes({
                 "entities.extracted": len(extraction_result.get('entities', [])),
@@ -148,48 +212,33 @@ class PipelineExecutor:
                 episode_id
             )
             
-            # Analyze discourse flow
+            # Analyze discourse flow, emergent themes and episode flow
             segment_objects = self._create_segment_objects(segments, episode_id)
-            flow_results = self.discourse_flow_tracker.analyze_episode_flow(
-                segment_objects,
-                resolved_entities,
-                extraction_result.get('insights', [])
-            )
-            extraction_result['discourse_flow'] = flow_results
-            
-            # Detect emergent themes
-            theme_results = self._detect_themes(
+            extraction_result.update(self._run_episode_analyses(
                 resolved_entities,
                 extraction_result,
                 segment_objects
-            )
-            extraction_result['emergent_themes'] = theme_results
-            
-            # Analyze episode flow
-            episode_flow = self._analyze_episode_flow(
-                segment_objects,
-                resolved_entities
-            )
-            extraction_result['episode_flow'] = episode_flow
+            ))
             
             # Save to graph
-            if self.storage_coordinator:
-                self.storage_coordinator.store_all(
-                    podcast_config,
-                    episode,
-                    segments,
-                    extraction_result,
-                    resolved_entities
-                )
-            else:
-                # Fallback to direct method if storage coordinator not available
-                self._save_to_graph(
-                    podcast_config,
-                    episode,
-                    segments,
-                    extraction_result,
-                    resolved_entities
-                )
+            with profile_stage("storage"):
+                if self.storage_coordinator:
+                    self.storage_coordinator.store_all(
+                        podcast_config,
+                        episode,
+                        segments,
+                        extraction_result,
+                        resolved_entities
+                    )
+                else:
+                    # Fallback to direct method if storage coordinator not available
+                    self._save_to_graph(
+                        podcast_config,
+                        episode,
+                        segments,
+                        extraction_result,
+                        resolved_entities
+                    )
             
             return {
                 'segments': len(segments),
@@ -218,7 +267,7 @@ class PipelineExecutor:
         with create_span("schemaless_extraction", attributes={
             "segments.count": len(segments),
             "extraction.mode": "schemaless"
-        }):
+        }), profile_stage("schemaless_extraction"):
             # Check if graph provider supports schemaless
             if not hasattr(self.graph_provider, 'process_segment_schemaless'):
                 raise PipelineError("Graph provider does not support schemaless extraction")
@@ -241,15 +290,7 @@ class PipelineExecutor:
             extraction_results = []
             discovered_types = set()
             
-            for i, segment_data in enumerate(segments):
-                segment_obj = Segment(
-                    id=f"{episode_id}_segment_{i}",
-                    text=segment_data.get('text', ''),
-                    start_time=segment_data.get('start_time', 0),
-                    end_time=segment_data.get('end_time', 0),
-                    speaker=segment_data.get('speaker', 'Unknown')
-                )
-                
+            for i, segment_obj in enumerate(self._create_segment_objects(segments, episode_id)):
                 try:
                     result = self.graph_provider.process_segment_schemaless(
                         segment_obj, episode_obj, podcast_obj
@@ -302,15 +343,30 @@ class PipelineExecutor:
         """
         logger.info("Running in MIGRATION MODE - executing both extraction pipelines")
         
-        # Run fixed schema extraction
-        fixed_result = self._extract_fixed_schema(
-            podcast_config, episode, segments, episode_id, use_large_context
-        )
-        
-        # Run schemaless extraction
-        schemaless_result = self._extract_schemaless(
-            podcast_config, episode, segments, episode_id
-        )
+        if getattr(self.config, "parallel_migration_extraction", True):
+            # Both pipelines only read the shared segments, so run them side by side.
+            # Each task runs in a copy of the current context to keep trace parentage.
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="migration-extract") as executor:
+                fixed_future = executor.submit(
+                    contextvars.copy_context().run, self._extract_fixed_schema,
+                    podcast_config, episode, segments, episode_id, use_large_context
+                )
+                schemaless_future = executor.submit(
+                    contextvars.copy_context().run, self._extract_schemaless,
+                    podcast_config, episode, segments, episode_id
+                )
+                fixed_result = fixed_future.result()
+                schemaless_result = schemaless_future.result()
+        else:
+            # Run fixed schema extraction
+            fixed_result = self._extract_fixed_schema(
+                podcast_config, episode, segments, episode_id, use_large_context
+            )
+            
+            # Run schemaless extraction
+            schemaless_result = self._extract_schemaless(
+                podcast_config, episode, segments, episode_id
+            )
         
         # Compare results
         logger.info(f"Migration mode comparison:")
@@ -341,7 +397,8 @@ class PipelineExecutor:
         Returns:
             List of resolved entities
         """
-        with create_span("entity_resolution", attributes={"entities.count": len(entities)}):
+        with create_span("entity_resolution", attributes={"entities.count": len(entities)}), \
+                profile_stage("entity_resolution"):
             resolved_entities = self.entity_resolver.resolve_entities(entities)
             add_span_attributes({"entities.resolved": len(resolved_entities)})
             
@@ -353,28 +410,87 @@ class PipelineExecutor:
             return resolved_entities
     
     def _create_segment_objects(self, segments: List[Dict[str, Any]], 
-                               episode_id: str) -> List[Segment]:
-        """Create Segment model objects from segment data.
+                               episode_id: str) -> SegmentStore:
+        """Create segment objects from segment data.
+        
+        The analyzers share the returned store, so segments and their
+        lower-cased text exist once per episode.
         
         Args:
-            segments: Raw segment data
+            segments: Segment store or raw segment data
             episode_id: Episode ID
             
         Returns:
-            List of Segment objects
+            Segment store whose items behave like Segment objects
         """
-        segment_objects = []
-        for i, segment_data in enumerate(segments):
-            segment_obj = Segment(
-                id=f"{episode_id}_segment_{i}",
-                text=segment_data['text'],
-                start_time=segment_data['start'],
-                end_time=segment_data['end'],
-                speaker=segment_data.get('speaker', 'Unknown'),
-                segment_index=i
-            )
-            segment_objects.append(segment_obj)
-        return segment_objects
+        if isinstance(segments, SegmentStore):
+            return segments
+        return SegmentStore.from_dicts(segments, episode_id=episode_id)
+    
+    def _run_episode_analyses(self, resolved_entities: List[Any],
+                              extraction_result: Dict[str, Any],
+                              segment_objects: List[Segment]) -> Dict[str, Any]:
+        """Run the post-extraction analyses of an episode.
+        
+        The analyses only read the resolved entities and segments, so they run
+        side by side (``analysis_executor``), each limited to
+        ``analysis_timeout`` seconds. An analysis that times out contributes an
+        empty result. Flow data is added to the entities afterwards, in this
+        thread.
+        
+        Args:
+            resolved_entities: Resolved entities
+            extraction_result: Extraction results
+            segment_objects: Segment objects
+            
+        Returns:
+            Discourse flow, emergent themes and episode flow results, in that order
+        """
+        executor = getattr(self.config, "analysis_executor", "thread")
+        graph = StageGraph(
+            executor=executor,
+            timeout=getattr(self.config, "analysis_timeout", None),
+            process_pool=self._get_analysis_pool() if executor == "process" else None
+        )
+        graph.add(
+            "discourse_flow", _profiled, "discourse_flow",
+            self.discourse_flow_tracker.analyze_episode_flow,
+            segment_objects, resolved_entities, extraction_result.get('insights', []),
+            default={}
+        )
+        graph.add(
+            "emergent_themes", self._detect_themes,
+            resolved_entities, extraction_result, segment_objects,
+            default={}
+        )
+        graph.add(
+            "episode_flow", self._build_episode_flow,
+            segment_objects, resolved_entities,
+            default={}
+        )
+        results = {name: outcome.result for name, outcome in graph.run().items()}
+        
+        episode_flow = results["episode_flow"]
+        if episode_flow:
+            self._add_flow_data_to_entities(resolved_entities, episode_flow, segment_objects)
+            results["episode_flow"] = self._summarize_episode_flow(episode_flow)
+        return results
+    
+    def _get_analysis_pool(self) -> ProcessPoolExecutor:
+        """Process pool for episode analyses, started on first use.
+        
+        Workers are spawned rather than forked from this multi-threaded
+        process, and kept for later episodes until :meth:`close`.
+        """
+        if self._analysis_pool is None:
+            self._analysis_pool = ProcessPoolExecutor(max_workers=3, mp_context=mp.get_context("spawn"))
+        return self._analysis_pool
+    
+    def close(self) -> None:
+        """Shut down the analysis worker processes, if any were started."""
+        if self._analysis_pool is not None:
+            self._analysis_pool.shutdown(wait=False, cancel_futures=True)
+            self._analysis_pool = None
     
     def _detect_themes(self, resolved_entities: List[Any],
                       extraction_result: Dict[str, Any],
@@ -389,7 +505,8 @@ class PipelineExecutor:
         Returns:
             Theme detection results
         """
-        with create_span("emergent_theme_detection", attributes={"entities.count": len(resolved_entities)}):
+        with create_span("emergent_theme_detection", attributes={"entities.count": len(resolved_entities)}), \
+                profile_stage("emergent_themes"):
             logger.info("Detecting emergent themes...")
             
             # Build co-occurrence data
@@ -417,18 +534,19 @@ class PipelineExecutor:
             
             return theme_results
     
-    def _analyze_episode_flow(self, segment_objects: List[Segment],
+    def _build_episode_flow(self, segment_objects: List[Segment],
                             resolved_entities: List[Any]) -> Dict[str, Any]:
-        """Analyze the flow patterns of the episode.
+        """Run the flow analyses of the episode without touching the entities.
         
         Args:
             segment_objects: Segment objects
             resolved_entities: Resolved entities
             
         Returns:
-            Episode flow analysis results
+            Full episode flow analysis, including its summary
         """
-        with create_span("episode_flow_analysis", attributes={"segments.count": len(segment_objects)}):
+        with create_span("episode_flow_analysis", attributes={"segments.count": len(segment_objects)}), \
+                profile_stage("episode_flow"):
             logger.info("Analyzing episode flow...")
             
             # Build concept timeline
@@ -465,11 +583,6 @@ class PipelineExecutor:
             flow_summary = self.episode_flow_analyzer.generate_episode_flow_summary(episode_flow)
             episode_flow["summary"] = flow_summary
             
-            # Add flow data to entities
-            self._add_flow_data_to_entities(
-                resolved_entities, episode_flow, segment_objects
-            )
-            
             add_span_attributes({
                 "flow.pattern": flow_summary.get("flow_pattern"),
                 "flow.coherence": flow_summary.get("narrative_coherence"),
@@ -477,11 +590,23 @@ class PipelineExecutor:
                 "flow.circular_refs": len(episode_flow.get("circular_references", []))
             })
             
-            return {
-                "pattern": flow_summary.get("flow_pattern", "unknown"),
-                "key_transitions": flow_summary.get("key_transitions", []),
-                "flow_quality": flow_summary.get("narrative_coherence", 0.5)
-            }
+            return episode_flow
+    
+    def _summarize_episode_flow(self, episode_flow: Dict[str, Any]) -> Dict[str, Any]:
+        """Episode flow results stored with the episode.
+        
+        Args:
+            episode_flow: Full episode flow analysis
+            
+        Returns:
+            Flow pattern, key transitions and flow quality
+        """
+        flow_summary = episode_flow.get("summary", {})
+        return {
+            "pattern": flow_summary.get("flow_pattern", "unknown"),
+            "key_transitions": flow_summary.get("key_transitions", []),
+            "flow_quality": flow_summary.get("narrative_coherence", 0.5)
+        }
     
     def _add_flow_data_to_entities(self, entities: List[Any],
                                  episode_flow: Dict[str, Any],
@@ -542,12 +667,13 @@ class PipelineExecutor:
         # Map entities to segments they appear in
         entity_segments = defaultdict(set)
         
+        if not isinstance(segments, SegmentStore):
+            segments = SegmentStore.from_segments(segments)
+        
         for entity in entities:
-            entity_name_lower = entity.name.lower()
-            
-            for i, segment in enumerate(segments):
-                if entity_name_lower in segment.text.lower():
-                    entity_segments[entity.id].add(i)
+            entity_segments[entity.id].update(
+                segments.segments_containing(entity.name).tolist()
+            )
         
         # Build co-occurrence relationships
         co_occurrences = []
@@ -675,7 +801,7 @@ class PipelineExecutor:
             "podcast.name": podcast_config.get("name", ""),
         })
     
-    def _process_audio_segments(self, audio_path: str, episode_id: str) -> List[Dict[str, Any]]:
+    def _process_audio_segments(self, audio_path: str, episode_id: str) -> SegmentStore:
         """Process audio into segments.
         
         Args:
@@ -683,11 +809,12 @@ class PipelineExecutor:
             episode_id: Episode identifier
             
         Returns:
-            List of processed segments
+            Segment store holding the episode's segments
         """
-        with create_span("segmentation", attributes={"audio.path": audio_path}):
+        with create_span("segmentation", attributes={"audio.path": audio_path}), \
+                profile_stage("segmentation"):
             logger.info("Segmenting audio...")
-            segments = self._prepare_segments(audio_path)
+            segments = SegmentStore.from_dicts(self._prepare_segments(audio_path), episode_id=episode_id)
             add_span_attributes({"segments.count": len(segments)})
         
         # Save segments checkpoint
@@ -757,8 +884,8 @@ class PipelineExecutor:
         # Mark episode as complete
         self.checkpoint_manager.mark_completed(episode_id, result)
         
-        # Clean up memory
-        cleanup_memory()
+        # Release memory if over budget
+        self.memory_budget.release()
         
         # Add result metrics to span
         add_span_attributes({
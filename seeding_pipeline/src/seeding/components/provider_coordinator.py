@@ -9,6 +9,7 @@ from src.providers.audio.base import AudioProvider
 from src.providers.llm.base import LLMProvider
 from src.providers.graph.base import GraphProvider
 from src.providers.embeddings.base import EmbeddingProvider
+from src.providers.embeddings.cache import get_embedding_cache
 from src.processing.segmentation import EnhancedPodcastSegmenter
 from src.processing.extraction import KnowledgeExtractor
 from src.processing.entity_resolution import EntityResolver
@@ -93,9 +94,11 @@ class ProviderCoordinator:
             if 'google_api_key' in llm_config and 'api_key' not in llm_config:
                 llm_config['api_key'] = llm_config['google_api_key']
             
+            # Several configured routes are load balanced by the router provider
+            default_llm = 'router' if getattr(self.config, 'llm_routes', None) else 'gemini'
             self.llm_provider = self.factory.create_provider(
                 'llm',
-                getattr(self.config, 'llm_provider', 'gemini'),
+                getattr(self.config, 'llm_provider', default_llm),
                 llm_config
             )
             
@@ -106,9 +109,13 @@ class ProviderCoordinator:
                 config_dict
             )
             
-            self.embedding_provider = self.factory.create_provider(
-                'embedding',
-                getattr(self.config, 'embedding_provider', 'sentence_transformer'),
+            # Every embedding consumer shares one content-hash cache
+            self.embedding_provider = get_embedding_cache(
+                self.factory.create_provider(
+                    'embedding',
+                    getattr(self.config, 'embedding_provider', 'sentence_transformer'),
+                    config_dict
+                ),
                 config_dict
             )
             
@@ -5,6 +5,7 @@ from typing import Dict, Any, List, Optional
 
 from src.providers.graph.base import GraphProvider
 from src.providers.graph.enhancements import GraphEnhancements
+from src.core.embeddings import embedding_to_list, has_embedding
 from src.core.models import Entity
 from src.tracing import trace_method, create_span, add_span_attributes
 from src.utils.logging import get_logger
@@ -214,8 +215,8 @@ class StorageCoordinator:
                 })
             
             # Add embedding if present
-            if hasattr(entity, 'embedding') and entity.embedding:
-                entity_data['embedding'] = entity.embedding
+            if has_embedding(entity):
+                entity_data['embedding'] = embedding_to_list(entity.embedding)
             
             # Create or update entity
             self.graph_provider.create_node('Entity', entity_data)
@@ -30,7 +30,7 @@ from src.utils.logging import get_logger, log_execution_time, log_error_with_con
 from src.tracing import (
     init_tracing, trace_method, trace_async, add_span_attributes,
     record_exception, set_span_status, create_span, get_current_span,
-    trace_business_operation, instrument_all
+    trace_business_operation
 )
 from src.tracing.config import TracingConfig
 
@@ -226,6 +226,9 @@ class PodcastKnowledgePipeline:
         # Delegate to provider coordinator
         self.provider_coordinator.cleanup()
         
+        if self.pipeline_executor is not None:
+            self.pipeline_executor.close()
+        
         # Clean up memory
         cleanup_memory()
         logger.info("Pipeline cleanup completed")
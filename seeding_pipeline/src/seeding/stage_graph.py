@@ -0,0 +1,285 @@
+"""
+Concurrent execution of independent pipeline stages.
+
+A :class:`StageGraph` holds named stages and the stages each one depends on.
+Stages whose dependencies have finished run side by side on a thread or
+process pool; results come back keyed by stage name in the order the stages
+were added, whatever order they finished in. Every stage has a timeout: a
+stage that runs over it gets its default result and the graph moves on, so
+one pathological input cannot hold up the rest of the pipeline.
+
+Process pools need the stage function and its arguments to be picklable.
+Stages that are not (for example bound methods of objects holding provider
+clients) run on threads instead. Worker processes are spawned rather than
+forked, as forking a process that already runs threads can deadlock the
+children. Pass a ``process_pool`` to reuse one pool across graphs.
+"""
+
+import contextvars
+import logging
+import multiprocessing as mp
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("serial", "thread", "process")
+
+
+@dataclass
+class Stage:
+    """One stage of a stage graph."""
+    name: str
+    func: Callable[..., Any]
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    default: Any = None
+
+
+@dataclass
+class StageOutcome:
+    """Result of running one stage."""
+    name: str
+    status: str  # completed, failed, timed_out or skipped
+    result: Any = None
+    duration: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "completed"
+
+
+class StageGraph:
+    """
+    Runs stages in dependency order, independent ones concurrently.
+
+    Results of a stage's dependencies are passed to it as keyword arguments
+    named after them.
+
+    Example:
+        graph = StageGraph(executor="thread", timeout=600)
+        graph.add("themes", detect_themes, entities, segments)
+        graph.add("flow", analyze_flow, segments)
+        outcomes = graph.run()
+    """
+
+    def __init__(self, executor: str = "thread", max_workers: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 process_pool: Optional[ProcessPoolExecutor] = None):
+        """
+        Initialize the graph.
+
+        Args:
+            executor: "serial", "thread" or "process"
+            max_workers: Pool size; defaults to the number of stages
+            timeout: Default per-stage timeout in seconds, None for no limit;
+                not enforced by the serial executor
+            process_pool: Pool the "process" executor submits to instead of
+                starting its own; it is left running after :meth:`run`
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of: {', '.join(EXECUTORS)}")
+        self.executor = executor
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.process_pool = process_pool
+        self._stages: Dict[str, Stage] = {}
+
+    def add(self, name: str, func: Callable[..., Any], *args: Any,
+            depends_on: Tuple[str, ...] = (), timeout: Optional[float] = None,
+            default: Any = None, **kwargs: Any) -> "StageGraph":
+        """
+        Add a stage.
+
+        Args:
+            name: Unique stage name
+            func: Function to run
+            *args: Positional arguments for ``func``
+            depends_on: Names of stages that must complete first
+            timeout: Timeout in seconds, overriding the graph's default
+            default: Result used when the stage times out or is skipped
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The graph, for chaining
+        """
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        self._stages[name] = Stage(
+            name=name, func=func, args=args, kwargs=kwargs, depends_on=tuple(depends_on),
+            timeout=self.timeout if timeout is None else timeout, default=default
+        )
+        return self
+
+    def run(self, raise_on_error: bool = True) -> Dict[str, StageOutcome]:
+        """
+        Run all stages.
+
+        A failed or timed-out stage skips the stages depending on it. Timed-out
+        stages cannot be interrupted; their result is discarded when they
+        finish.
+
+        Args:
+            raise_on_error: Re-raise the error of the first failed stage, in
+                the order stages were added
+
+        Returns:
+            Outcome of every stage, in the order stages were added
+        """
+        self._check_dependencies()
+        if self.executor == "serial":
+            outcomes = self._run_serial()
+        else:
+            outcomes = self._run_concurrent()
+
+        ordered = {name: outcomes[name] for name in self._stages}
+        if raise_on_error:
+            for outcome in ordered.values():
+                if outcome.status == "failed":
+                    raise outcome.error
+        return ordered
+
+    def _check_dependencies(self) -> None:
+        """Reject unknown dependencies and cycles."""
+        for stage in self._stages.values():
+            unknown = [name for name in stage.depends_on if name not in self._stages]
+            if unknown:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages: {unknown}")
+
+        visited: Dict[str, bool] = {}
+
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if visited.get(name):
+                return
+            if name in path:
+                raise ValueError(f"Stage dependencies form a cycle: {' -> '.join(path + (name,))}")
+            for dependency in self._stages[name].depends_on:
+                visit(dependency, path + (name,))
+            visited[name] = True
+
+        for name in self._stages:
+            visit(name, ())
+
+    def _ready(self, outcomes: Dict[str, StageOutcome], started: set) -> List[Stage]:
+        """Stages not started yet whose dependencies have all finished."""
+        ready = []
+        for stage in self._stages.values():
+            if stage.name in started:
+                continue
+            if all(name in outcomes for name in stage.depends_on):
+                ready.append(stage)
+        return ready
+
+    def _skip_or_prepare(self, stage: Stage, outcomes: Dict[str, StageOutcome]) -> Optional[Dict[str, Any]]:
+        """Keyword arguments for a stage, or None after recording it as skipped."""
+        failed = [name for name in stage.depends_on if not outcomes[name].ok]
+        if failed:
+            logger.warning(f"Skipping stage {stage.name}: dependencies {failed} did not complete")
+            outcomes[stage.name] = StageOutcome(stage.name, "skipped", result=stage.default)
+            return None
+        kwargs = dict(stage.kwargs)
+        for name in stage.depends_on:
+            kwargs[name] = outcomes[name].result
+        return kwargs
+
+    def _run_serial(self) -> Dict[str, StageOutcome]:
+        outcomes: Dict[str, StageOutcome] = {}
+        started: set = set()
+        while len(started) < len(self._stages):
+            for stage in self._ready(outcomes, started):
+                started.add(stage.name)
+                kwargs = self._skip_or_prepare(stage, outcomes)
+                if kwargs is None:
+                    continue
+                start = time.perf_counter()
+                try:
+                    result = stage.func(*stage.args, **kwargs)
+                    outcomes[stage.name] = StageOutcome(
+                        stage.name, "completed", result=result, duration=time.perf_counter() - start
+                    )
+                except Exception as e:
+                    outcomes[stage.name] = StageOutcome(
+                        stage.name, "failed", result=stage.default,
+                        duration=time.perf_counter() - start, error=e
+                    )
+        return outcomes
+
+    def _run_concurrent(self) -> Dict[str, StageOutcome]:
+        outcomes: Dict[str, StageOutcome] = {}
+        started: set = set()
+        running: Dict[Future, Tuple[Stage, float]] = {}
+        max_workers = self.max_workers or len(self._stages)
+        threads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stage")
+        processes = None
+        owns_processes = False
+        if self.executor == "process":
+            processes = self.process_pool
+            if processes is None:
+                processes = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp.get_context("spawn"))
+                owns_processes = True
+        timed_out = False
+
+        try:
+            while len(outcomes) < len(self._stages):
+                for stage in self._ready(outcomes, started):
+                    started.add(stage.name)
+                    kwargs = self._skip_or_prepare(stage, outcomes)
+                    if kwargs is None:
+                        continue
+                    future = self._submit(stage, kwargs, threads, processes)
+                    running[future] = (stage, time.perf_counter())
+                if not running:
+                    continue
+
+                now = time.perf_counter()
+                deadlines = [start + stage.timeout for stage, start in running.values()
+                             if stage.timeout is not None]
+                wait_for = max(0.0, min(deadlines) - now) if deadlines else None
+                done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                now = time.perf_counter()
+                for future in done:
+                    stage, start = running.pop(future)
+                    try:
+                        outcomes[stage.name] = StageOutcome(
+                            stage.name, "completed", result=future.result(), duration=now - start
+                        )
+                    except Exception as e:
+                        outcomes[stage.name] = StageOutcome(
+                            stage.name, "failed", result=stage.default, duration=now - start, error=e
+                        )
+                for future, (stage, start) in list(running.items()):
+                    if stage.timeout is not None and now - start >= stage.timeout:
+                        logger.warning(f"Stage {stage.name} timed out after {stage.timeout}s")
+                        future.cancel()
+                        running.pop(future)
+                        timed_out = True
+                        outcomes[stage.name] = StageOutcome(
+                            stage.name, "timed_out", result=stage.default, duration=now - start
+                        )
+        finally:
+            # Do not wait for timed-out stages
+            threads.shutdown(wait=not timed_out, cancel_futures=True)
+            if owns_processes:
+                processes.shutdown(wait=not timed_out, cancel_futures=True)
+
+        return outcomes
+
+    def _submit(self, stage: Stage, kwargs: Dict[str, Any], threads: ThreadPoolExecutor,
+                processes: Optional[ProcessPoolExecutor]) -> Future:
+        """Submit a stage, to the process pool when it can be pickled."""
+        if processes is not None:
+            try:
+                pickle.dumps((stage.func, stage.args, kwargs))
+            except Exception as e:
+                logger.debug(f"Running stage {stage.name} on a thread, it cannot be pickled: {e}")
+            else:
+                return processes.submit(stage.func, *stage.args, **kwargs)
+        # Each task runs in a copy of the current context to keep trace parentage
+        return threads.submit(contextvars.copy_context().run, stage.func, *stage.args, **kwargs)
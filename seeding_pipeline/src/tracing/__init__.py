@@ -27,12 +27,26 @@ from .middleware import (
     trace_business_operation,
 )
 
-from .instrumentation import (
-    instrument_neo4j,
-    instrument_redis,
-    instrument_requests,
-    instrument_all,
-)
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .instrumentation import (
+        instrument_neo4j,
+        instrument_redis,
+        instrument_requests,
+        instrument_all,
+    )
+
+# Instrumentation imports the neo4j, redis and requests instrumentors, so it
+# is loaded only when called
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'instrument_neo4j': '.instrumentation',
+    'instrument_redis': '.instrumentation',
+    'instrument_requests': '.instrumentation',
+    'instrument_all': '.instrumentation',
+})
 
 __all__ = [
     # Core tracing
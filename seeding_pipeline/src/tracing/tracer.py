@@ -8,7 +8,6 @@ import os
 import logging
 
 from opentelemetry import trace, context, propagate
-from opentelemetry.exporter.jaeger.thrift import JaegerExporter
 from opentelemetry.sdk.resources import Resource, SERVICE_NAME, SERVICE_VERSION
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import (
@@ -18,10 +17,14 @@ from opentelemetry.sdk.trace.export import (
 )
 from opentelemetry.trace import Status, StatusCode, Span
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
 
 from ..core.config import PipelineConfig
 from ..__version__ import __version__
+from ..utils.lazy_imports import LazyImport
+
+# Only needed once tracing is initialized; the instrumentation package is slow to import
+JaegerExporter = LazyImport('opentelemetry.exporter.jaeger.thrift', 'JaegerExporter')
+LoggingInstrumentor = LazyImport('opentelemetry.instrumentation.logging', 'LoggingInstrumentor')
 
 logger = logging.getLogger(__name__)
 
@@ -6,15 +6,20 @@ components in the extraction pipeline, helping identify redundant or
 low-impact components that can be removed.
 """
 
+import os
 import time
+import atexit
 import json
+import queue
+import random
 import functools
+import threading
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Callable, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 import hashlib
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from ..utils.logging import get_logger
 from ..api.metrics import get_metrics_collector
@@ -44,6 +49,11 @@ class ComponentContribution:
     count: int = 0
     examples: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: str = ""
+    
+    def __post_init__(self):
+        if not self.timestamp:
+            self.timestamp = datetime.utcnow().isoformat()
     
     
 @dataclass  
@@ -53,10 +63,45 @@ class ComponentMetrics:
     total_executions: int = 0
     total_execution_time: float = 0.0
     avg_execution_time: float = 0.0
+    max_execution_time: float = 0.0
     total_items_added: int = 0
     total_items_modified: int = 0
     total_items_removed: int = 0
+    properties_added: Dict[str, int] = field(default_factory=dict)
+    relationships_added: Dict[str, int] = field(default_factory=dict)
     contributions: List[ComponentContribution] = field(default_factory=list)
+    
+    def add_impact(self, impact: ComponentImpact) -> None:
+        """Fold one execution into the running totals."""
+        self.total_executions += 1
+        self.total_execution_time += impact.execution_time
+        self.avg_execution_time = self.total_execution_time / self.total_executions
+        self.max_execution_time = max(self.max_execution_time, impact.execution_time)
+        self.total_items_added += impact.items_added
+        self.total_items_modified += impact.items_modified
+        self.total_items_removed += impact.items_removed
+        for prop, count in impact.properties_added.items():
+            self.properties_added[prop] = self.properties_added.get(prop, 0) + count
+        for rel, count in impact.relationships_added.items():
+            self.relationships_added[rel] = self.relationships_added.get(rel, 0) + count
+    
+    def add_contribution(self, contribution: ComponentContribution) -> None:
+        """Fold a contribution into the running total for its type."""
+        for existing in self.contributions:
+            if existing.contribution_type == contribution.contribution_type:
+                existing.count += contribution.count
+                existing.examples = (existing.examples + contribution.examples)[-10:]
+                existing.metadata = contribution.metadata
+                existing.timestamp = contribution.timestamp
+                return
+        self.contributions.append(ComponentContribution(
+            component_name=contribution.component_name,
+            contribution_type=contribution.contribution_type,
+            count=contribution.count,
+            examples=list(contribution.examples[-10:]),
+            metadata=contribution.metadata,
+            timestamp=contribution.timestamp
+        ))
 
 
 @dataclass
@@ -70,22 +115,54 @@ class ComponentDependency:
 
 
 class ComponentTracker:
-    """Tracks component execution and impact."""
+    """Tracks component execution and impact.
     
-    def __init__(self, output_dir: Optional[Path] = None):
+    Every execution is folded into in-memory aggregates per component. A
+    sampled subset is kept in a bounded list of recent impacts and written to
+    ``<component>_impacts.jsonl`` by a background thread, which drains a
+    bounded queue in batches so callers never touch the filesystem. Records
+    are dropped rather than blocking when the queue is full.
+    """
+    
+    def __init__(self, output_dir: Optional[Path] = None,
+                 sample_rate: Optional[float] = None,
+                 max_recent_impacts: int = 1000,
+                 queue_size: int = 10000,
+                 batch_size: int = 500,
+                 flush_interval: float = 1.0):
         """
         Initialize the component tracker.
         
         Args:
             output_dir: Directory to save tracking data
+            sample_rate: Fraction of executions kept and persisted, defaults to
+                the COMPONENT_TRACKING_SAMPLE_RATE environment variable or 1.0
+            max_recent_impacts: Sampled impacts kept in memory per component
+            queue_size: Maximum records waiting to be written
+            batch_size: Maximum records written per flush
+            flush_interval: Seconds the writer waits to fill a batch
         """
         self.output_dir = output_dir or Path("component_tracking")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        self.impacts: Dict[str, List[ComponentImpact]] = defaultdict(list)
+        if sample_rate is None:
+            sample_rate = float(os.environ.get("COMPONENT_TRACKING_SAMPLE_RATE", "1.0"))
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        
+        self.impacts: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_recent_impacts))
+        self.aggregates: Dict[str, ComponentMetrics] = {}
         self.baseline_results: Dict[str, Any] = {}
         self.metrics = get_metrics_collector()
         
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = queue.Queue(
+            maxsize=queue_size
+        )
+        self._writer: Optional[threading.Thread] = None
+        self._stats = {'recorded': 0, 'sampled': 0, 'written': 0, 'dropped': 0, 'write_errors': 0}
+        
     def track_impact(self, component_name: str) -> 'ImpactContext':
         """
         Create a context for tracking component impact.
@@ -100,7 +177,13 @@ class ComponentTracker:
     
     def record_impact(self, impact: ComponentImpact) -> None:
         """Record a component impact."""
-        self.impacts[impact.component_name].append(impact)
+        sampled = self._should_sample()
+        with self._lock:
+            self._aggregate(impact.component_name).add_impact(impact)
+            self._stats['recorded'] += 1
+            if sampled:
+                self.impacts[impact.component_name].append(impact)
+                self._stats['sampled'] += 1
         
         # Update metrics
         self.metrics.processing_duration.observe(
@@ -108,46 +191,159 @@ class ComponentTracker:
             labels={"stage": f"component_{impact.component_name}"}
         )
         
-        # Save to disk
-        self._save_impact(impact)
+        if sampled:
+            self._save_impact(impact)
+    
+    def track_contribution(self, contribution: ComponentContribution) -> None:
+        """Record what a component contributed to the extraction results."""
+        with self._lock:
+            self._aggregate(contribution.component_name).add_contribution(contribution)
+        if self._should_sample():
+            record = asdict(contribution)
+            record["sample_rate"] = self.sample_rate
+            self._enqueue(f"{contribution.component_name}_contributions.jsonl", record)
+    
+    def get_aggregates(self, component_name: str) -> Optional[ComponentMetrics]:
+        """Get the running totals for a component."""
+        return self.aggregates.get(component_name)
+    
+    def get_tracking_stats(self) -> Dict[str, Any]:
+        """Get counters for the tracker itself."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['pending'] = self._queue.qsize()
+        stats['sample_rate'] = self.sample_rate
+        return stats
+    
+    def _aggregate(self, component_name: str) -> ComponentMetrics:
+        """Get or create the aggregate for a component; caller holds the lock."""
+        aggregate = self.aggregates.get(component_name)
+        if aggregate is None:
+            aggregate = self.aggregates[component_name] = ComponentMetrics(component_name)
+        return aggregate
+    
+    def _should_sample(self) -> bool:
+        """Decide whether the current execution is kept and persisted."""
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
         
     def _save_impact(self, impact: ComponentImpact) -> None:
-        """Save impact data to disk."""
-        file_path = self.output_dir / f"{impact.component_name}_impacts.jsonl"
-        
-        with open(file_path, 'a') as f:
-            json.dump({
-                "component_name": impact.component_name,
-                "execution_time": impact.execution_time,
-                "items_added": impact.items_added,
-                "items_modified": impact.items_modified,
-                "items_removed": impact.items_removed,
-                "properties_added": impact.properties_added,
-                "relationships_added": impact.relationships_added,
-                "metadata": impact.metadata,
-                "timestamp": impact.timestamp
-            }, f)
-            f.write('\n')
+        """Queue impact data to be saved to disk."""
+        self._enqueue(f"{impact.component_name}_impacts.jsonl", {
+            "component_name": impact.component_name,
+            "execution_time": impact.execution_time,
+            "items_added": impact.items_added,
+            "items_modified": impact.items_modified,
+            "items_removed": impact.items_removed,
+            "properties_added": impact.properties_added,
+            "relationships_added": impact.relationships_added,
+            "metadata": impact.metadata,
+            "timestamp": impact.timestamp,
+            "sample_rate": self.sample_rate
+        })
+    
+    def _enqueue(self, file_name: str, record: Dict[str, Any]) -> None:
+        """Hand a record to the writer thread, dropping it if the queue is full."""
+        if self._writer is None:
+            self._start_writer()
+        try:
+            self._queue.put_nowait((file_name, record))
+        except queue.Full:
+            with self._lock:
+                self._stats['dropped'] += 1
+    
+    def _start_writer(self) -> None:
+        """Start the background writer thread."""
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._run_writer, name="component-tracker-writer", daemon=True
+            )
+            self._writer.start()
+    
+    def _run_writer(self) -> None:
+        """Writer loop: collect a batch of records, then append them file by file."""
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            deadline = time.time() + self.flush_interval
+            while item is not None and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.time()))
+                except queue.Empty:
+                    break
+                batch.append(item)
+            
+            try:
+                self._write_batch([entry for entry in batch if entry is not None])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is None:
+                return
+    
+    def _write_batch(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Append a batch of records, opening each output file once."""
+        by_file: Dict[str, List[str]] = defaultdict(list)
+        for file_name, record in batch:
+            by_file[file_name].append(json.dumps(record, default=str))
+        
+        for file_name, lines in by_file.items():
+            try:
+                with open(self.output_dir / file_name, 'a') as f:
+                    f.write('\n'.join(lines) + '\n')
+            except OSError as e:
+                logger.warning(f"Failed to write component tracking data to {file_name}: {e}")
+                with self._lock:
+                    self._stats['write_errors'] += len(lines)
+                continue
+            with self._lock:
+                self._stats['written'] += len(lines)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued records have been written.
+        
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+            
+        Returns:
+            True if the queue drained within the timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.time() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write pending records and stop the writer thread."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        self._queue.put(None)
+        writer.join(timeout)
     
     def generate_impact_report(self) -> Dict[str, Any]:
         """Generate a comprehensive impact report for all components."""
+        with self._lock:
+            aggregates = dict(self.aggregates)
         report = {
             "generated_at": datetime.utcnow().isoformat(),
             "components": {},
             "summary": {
-                "total_components": len(self.impacts),
-                "total_executions": sum(len(impacts) for impacts in self.impacts.values()),
-                "total_time": sum(
-                    impact.execution_time 
-                    for impacts in self.impacts.values() 
-                    for impact in impacts
-                )
+                "total_components": len(aggregates),
+                "total_executions": sum(a.total_executions for a in aggregates.values()),
+                "total_time": sum(a.total_execution_time for a in aggregates.values()),
+                "sample_rate": self.sample_rate
             }
         }
         
         # Analyze each component
-        for component_name, impacts in self.impacts.items():
-            component_stats = self._analyze_component(component_name, impacts)
+        for component_name, aggregate in aggregates.items():
+            component_stats = self._analyze_component(component_name, aggregate)
             report["components"][component_name] = component_stats
         
         # Add recommendations
@@ -156,36 +352,29 @@ class ComponentTracker:
         return report
     
     def _analyze_component(self, component_name: str, 
-                          impacts: List[ComponentImpact]) -> Dict[str, Any]:
-        """Analyze impacts for a single component."""
-        if not impacts:
+                          aggregate: ComponentMetrics) -> Dict[str, Any]:
+        """Analyze the running totals for a single component."""
+        executions = aggregate.total_executions
+        if not executions:
             return {}
         
-        total_time = sum(impact.execution_time for impact in impacts)
-        total_additions = sum(impact.items_added for impact in impacts)
-        total_modifications = sum(impact.items_modified for impact in impacts)
-        
-        # Aggregate property additions
-        all_properties = defaultdict(int)
-        for impact in impacts:
-            for prop, count in impact.properties_added.items():
-                all_properties[prop] += count
-        
-        # Aggregate relationship additions
-        all_relationships = defaultdict(int)
-        for impact in impacts:
-            for rel, count in impact.relationships_added.items():
-                all_relationships[rel] += count
+        total_time = aggregate.total_execution_time
+        total_additions = aggregate.total_items_added
+        total_modifications = aggregate.total_items_modified
         
         return {
-            "execution_count": len(impacts),
+            "execution_count": executions,
             "total_time": total_time,
-            "avg_time": total_time / len(impacts),
+            "avg_time": total_time / executions,
+            "max_time": aggregate.max_execution_time,
             "total_items_added": total_additions,
             "total_items_modified": total_modifications,
-            "avg_items_per_execution": (total_additions + total_modifications) / len(impacts),
-            "properties_added": dict(all_properties),
-            "relationships_added": dict(all_relationships),
+            "avg_items_per_execution": (total_additions + total_modifications) / executions,
+            "properties_added": dict(aggregate.properties_added),
+            "relationships_added": dict(aggregate.relationships_added),
+            "contributions": {
+                c.contribution_type: c.count for c in aggregate.contributions
+            },
             "impact_score": self._calculate_impact_score(
                 total_additions, total_modifications, total_time
             )
@@ -284,19 +473,21 @@ class ComponentTracker:
         """Identify potentially redundant components."""
         redundant = []
         
-        for component_name, impacts in self.impacts.items():
-            if not impacts:
+        with self._lock:
+            aggregates = list(self.aggregates.values())
+        
+        for aggregate in aggregates:
+            component_name = aggregate.component_name
+            executions = aggregate.total_executions
+            if not executions:
                 continue
             
             # Check if component has minimal impact
-            total_impact = sum(
-                impact.items_added + impact.items_modified 
-                for impact in impacts
-            )
+            total_impact = aggregate.total_items_added + aggregate.total_items_modified
             
             if total_impact == 0:
                 redundant.append(component_name)
-            elif len(impacts) > 10 and total_impact / len(impacts) < 0.1:
+            elif executions > 10 and total_impact / executions < 0.1:
                 redundant.append(component_name)
         
         return redundant
@@ -447,6 +638,8 @@ def get_component_tracker() -> ComponentTracker:
     global _global_tracker
     if _global_tracker is None:
         _global_tracker = ComponentTracker()
+        # Write out records still queued when the process exits
+        atexit.register(_global_tracker.close)
     return _global_tracker
 
 
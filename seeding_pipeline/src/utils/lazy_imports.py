@@ -0,0 +1,91 @@
+"""
+Deferred imports for heavy optional dependencies and package exports.
+
+Importing the pipeline used to pull in scipy, networkx, neo4j and the
+provider SDKs at module load, which made short-lived commands slow. Modules
+use :class:`LazyImport` for dependencies only needed by some code paths, and
+packages use :func:`lazy_exports` so their public names resolve on first use.
+"""
+
+import importlib
+import importlib.util
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class LazyImport:
+    """Stand-in for a module, or an attribute of one, imported on first use.
+
+    Example:
+        nx = LazyImport('networkx')
+        entropy = LazyImport('scipy.stats', 'entropy')
+    """
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None):
+        """
+        Initialize the placeholder.
+
+        Args:
+            module_name: Module to import
+            attribute: Name to take from the module instead of the module itself
+        """
+        self._module_name = module_name
+        self._attribute = attribute
+        self._target = None
+
+    def _load(self) -> Any:
+        """Import the target on first use."""
+        if self._target is None:
+            module = importlib.import_module(self._module_name)
+            self._target = getattr(module, self._attribute) if self._attribute else module
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        target = f"{self._module_name}.{self._attribute}" if self._attribute else self._module_name
+        state = 'loaded' if self._target is not None else 'not loaded'
+        return f"<LazyImport {target} ({state})>"
+
+
+def is_available(module_name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    if module_name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any],
+                                                                  Callable[[], List[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package with lazy exports.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Public name -> relative module it is defined in
+
+    Returns:
+        Functions to assign to the package's ``__getattr__`` and ``__dir__``
+
+    Example:
+        __getattr__, __dir__ = lazy_exports(__name__, {'Pipeline': '.orchestrator'})
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Later lookups find the name directly
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
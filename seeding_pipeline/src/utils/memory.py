@@ -2,6 +2,8 @@
 
 import gc
 import functools
+import threading
+import time
 import warnings
 from contextlib import contextmanager
 from typing import Optional, Callable, Any, Dict
@@ -340,6 +342,21 @@ def batch_processor(batch_size: int = 100,
         return wrapper
     return decorator
 
+def get_memory_usage() -> float:
+    """Get the resident set size of the current process.
+    
+    Returns:
+        RSS in MB, or 0.0 if psutil is unavailable
+    """
+    if not HAS_PSUTIL:
+        return 0.0
+    try:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception as e:
+        logger.debug(f"Could not read process memory: {e}")
+        return 0.0
+
+
 class MemoryMonitor:
     """Memory monitoring utility for tracking memory usage."""
     
@@ -373,4 +390,183 @@ class MemoryMonitor:
         
     def stop(self) -> Dict[str, float]:
         """Stop monitoring and return final stats."""
-        return self.check()
\ No newline at end of file
+        return self.check()
+
+class MemoryBudget:
+    """Episode-scoped memory budget.
+    
+    Tracks process RSS against a budget and only collects garbage once the
+    budget is crossed, instead of running full collections after every
+    episode. Work registered as in flight (``track``/``track_future``) can be
+    throttled: callers about to start new work wait for headroom while other
+    work is still running, and go ahead at once when nothing is in flight,
+    since then there is nothing to wait for.
+    """
+    
+    def __init__(self,
+                 budget_mb: Optional[float] = None,
+                 high_water_ratio: float = 0.9,
+                 backpressure_timeout: float = 60.0,
+                 poll_interval: float = 0.5):
+        """
+        Initialize memory budget.
+        
+        Args:
+            budget_mb: RSS budget in MB (None for 75% of system memory)
+            high_water_ratio: Fraction of the budget that counts as crossed
+            backpressure_timeout: Maximum seconds to hold back new work
+            poll_interval: Seconds between memory checks while waiting
+        """
+        if budget_mb is None and HAS_PSUTIL:
+            budget_mb = psutil.virtual_memory().total / (1024 * 1024) * 0.75
+        self.budget_mb = budget_mb
+        self.high_water_ratio = high_water_ratio
+        self.backpressure_timeout = backpressure_timeout
+        self.poll_interval = poll_interval
+        self.monitor = MemoryMonitor(threshold_mb=budget_mb)
+        self.monitor.start()
+        
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {
+            'collections': 0,
+            'gc_pause_seconds': 0.0,
+            'backpressure_waits': 0,
+            'backpressure_seconds': 0.0
+        }
+    
+    def is_over_budget(self) -> bool:
+        """Check whether current RSS has crossed the budget."""
+        if not self.budget_mb:
+            return False
+        usage = self.monitor.check()
+        return usage['current_mb'] >= self.budget_mb * self.high_water_ratio
+    
+    def collect(self, generation: int = 2) -> float:
+        """Run a garbage collection of the given generation.
+        
+        Args:
+            generation: Oldest generation to collect (0-2)
+            
+        Returns:
+            Pause time in seconds
+        """
+        start = time.perf_counter()
+        gc.collect(generation)
+        pause = time.perf_counter() - start
+        
+        with self._lock:
+            self._stats['collections'] += 1
+            self._stats['gc_pause_seconds'] += pause
+        _observe_metric('gc_pause_duration', pause, {'generation': str(generation)})
+        logger.debug(f"gc.collect({generation}) paused for {pause * 1000:.1f}ms")
+        return pause
+    
+    def release(self) -> bool:
+        """Lightweight cleanup to run after each episode or batch.
+        
+        Does nothing while under budget. Once crossed, collects the young
+        generations first and only escalates to a full collection (and GPU
+        and matplotlib cache clearing) if that was not enough.
+        
+        Returns:
+            True if any collection was performed
+        """
+        if not self.is_over_budget():
+            return False
+        
+        self.collect(1)
+        if self.is_over_budget():
+            self.collect(2)
+            if HAS_TORCH and torch.cuda.is_available():
+                torch.cuda.empty_cache()
+            if HAS_MATPLOTLIB:
+                plt.close('all')
+            
+            if self.is_over_budget():
+                usage = self.monitor.check()
+                logger.warning(f"Memory still over budget after full collection: "
+                               f"{usage['current_mb']:.0f}MB / {self.budget_mb:.0f}MB")
+        return True
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of work units currently registered as in flight."""
+        with self._lock:
+            return self._in_flight
+    
+    def begin(self) -> None:
+        """Register one unit of work (episode, batch item) as in flight."""
+        with self._lock:
+            self._in_flight += 1
+    
+    def end(self) -> None:
+        """Mark one unit of in-flight work as finished."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+    
+    @contextmanager
+    def track(self):
+        """Keep the enclosed work registered as in flight."""
+        self.begin()
+        try:
+            yield
+        finally:
+            self.end()
+    
+    def track_future(self, future) -> None:
+        """Keep work registered as in flight until ``future`` is done."""
+        self.begin()
+        future.add_done_callback(lambda _: self.end())
+    
+    def wait_for_headroom(self, timeout: Optional[float] = None) -> float:
+        """Hold back new work until RSS is under budget again.
+        
+        Only in-flight work can free memory while we wait, so this returns
+        right after a cleanup pass when nothing is in flight, and stops
+        waiting as soon as the last in-flight unit finishes.
+        
+        Args:
+            timeout: Maximum seconds to wait (defaults to backpressure_timeout)
+            
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.is_over_budget():
+            return 0.0
+        
+        self.release()
+        if not self.in_flight:
+            return 0.0
+        
+        timeout = self.backpressure_timeout if timeout is None else timeout
+        start = time.time()
+        while self.is_over_budget() and self.in_flight and time.time() - start < timeout:
+            time.sleep(self.poll_interval)
+        waited = time.time() - start
+        
+        if self.is_over_budget():
+            logger.warning(f"Memory over budget after waiting {waited:.1f}s, continuing anyway")
+        
+        with self._lock:
+            self._stats['backpressure_waits'] += 1
+            self._stats['backpressure_seconds'] += waited
+        _observe_metric('memory_backpressure_wait', waited)
+        return waited
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get budget usage and collection statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(self.monitor.check())
+        stats['budget_mb'] = self.budget_mb
+        return stats
+
+
+def _observe_metric(name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+    """Record an observation on a histogram from the metrics collector, if available."""
+    try:
+        from src.api.metrics import get_metrics_collector
+        getattr(get_metrics_collector(), name).observe(value, labels)
+    except Exception as e:
+        logger.debug(f"Could not record metric {name}: {e}")
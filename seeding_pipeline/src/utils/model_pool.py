@@ -0,0 +1,251 @@
+"""Process-wide pool of loaded models shared across providers and pipelines.
+
+Whisper, pyannote and sentence-transformer models take seconds to minutes to
+load. Providers acquire them from this pool by a key describing the model and
+device, so a new pipeline (for example one per API-triggered run) reuses the
+weights loaded by the previous one. Models stay warm while referenced and are
+evicted once idle for longer than the idle timeout.
+
+For process pools, CPU models already loaded in the parent when the workers
+are forked are shared copy-on-write: children use the parent's weight pages
+instead of each loading their own copy.
+"""
+
+import gc
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PooledModel:
+    """A loaded model and its usage bookkeeping."""
+    key: Hashable
+    model: Any
+    load_time: float
+    fork_safe: bool = True
+    ref_count: int = 0
+    hits: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'key': str(self.key),
+            'ref_count': self.ref_count,
+            'hits': self.hits,
+            'fork_safe': self.fork_safe,
+            'load_time': self.load_time,
+            'idle_seconds': time.monotonic() - self.last_used if self.ref_count == 0 else 0.0
+        }
+
+
+class ModelPool:
+    """Reference-counted registry of loaded models with idle eviction."""
+
+    def __init__(self, idle_timeout: Optional[float] = None, reap_interval: float = 60.0):
+        """
+        Initialize the model pool.
+
+        Args:
+            idle_timeout: Seconds an unreferenced model stays loaded, defaults
+                to the MODEL_POOL_IDLE_TIMEOUT environment variable or 600.
+                Zero evicts models as soon as their last user releases them.
+            reap_interval: Longest time between idle checks of the reaper thread
+        """
+        if idle_timeout is None:
+            idle_timeout = float(os.environ.get("MODEL_POOL_IDLE_TIMEOUT", "600"))
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+
+        self._models: Dict[Hashable, PooledModel] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._stats = {'loads': 0, 'hits': 0, 'evictions': 0}
+
+    def acquire(self, key: Hashable, loader: Callable[[], Any], fork_safe: bool = True) -> Any:
+        """
+        Get a model, loading it if it is not in the pool.
+
+        Every acquire must be matched by a :meth:`release` once the caller no
+        longer needs the model.
+
+        Args:
+            key: Identity of the model, e.g. (kind, name, device)
+            loader: Function loading the model on a miss
+            fork_safe: Whether forked children may share the loaded model
+                (False for models on a GPU)
+
+        Returns:
+            The loaded model
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Loads of different models run in parallel; concurrent loads of the
+        # same model wait for the first one
+        with key_lock:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    entry.ref_count += 1
+                    entry.hits += 1
+                    entry.last_used = time.monotonic()
+                    self._stats['hits'] += 1
+                    return entry.model
+
+            start = time.time()
+            model = loader()
+            load_time = time.time() - start
+            logger.info(f"Loaded model {key} into pool in {load_time:.1f}s")
+
+            with self._lock:
+                self._models[key] = PooledModel(key, model, load_time, fork_safe=fork_safe,
+                                                ref_count=1)
+                self._stats['loads'] += 1
+        self._ensure_reaper()
+        return model
+
+    def release(self, key: Hashable) -> None:
+        """Drop one reference to a model; it is evicted once idle for too long."""
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is None or entry.ref_count == 0:
+                return
+            entry.ref_count -= 1
+            entry.last_used = time.monotonic()
+        if self.idle_timeout <= 0:
+            self.evict_idle()
+
+    def prepare_for_fork(self) -> bool:
+        """
+        Make loaded models shareable copy-on-write with children forked next.
+
+        Moves every object allocated so far into the permanent GC generation
+        so collections in the children do not write to (and thereby copy) the
+        pages holding model objects. Call :meth:`finish_fork` once the
+        children have been started.
+
+        Returns:
+            True if all loaded models can safely be used from forked children
+        """
+        with self._lock:
+            unsafe = [str(entry.key) for entry in self._models.values() if not entry.fork_safe]
+        if unsafe:
+            logger.warning(f"Models {unsafe} cannot be shared with forked workers; "
+                           f"children will load their own copies")
+            return False
+        gc.collect()
+        gc.freeze()
+        return True
+
+    def finish_fork(self) -> None:
+        """Let the parent collect objects frozen by :meth:`prepare_for_fork` again."""
+        gc.unfreeze()
+
+    def evict_idle(self) -> int:
+        """
+        Unload models nobody has used for longer than the idle timeout.
+
+        Returns:
+            Number of models evicted
+        """
+        now = time.monotonic()
+        with self._lock:
+            idle = [
+                key for key, entry in self._models.items()
+                if entry.ref_count == 0 and now - entry.last_used >= self.idle_timeout
+            ]
+            for key in idle:
+                del self._models[key]
+                self._key_locks.pop(key, None)
+            self._stats['evictions'] += len(idle)
+        if idle:
+            logger.info(f"Evicted idle models from pool: {[str(key) for key in idle]}")
+            self._free_memory()
+        return len(idle)
+
+    def clear(self) -> None:
+        """Unload every model, including referenced ones."""
+        with self._lock:
+            self._models.clear()
+            self._key_locks.clear()
+        self._free_memory()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool counters and the state of every loaded model."""
+        with self._lock:
+            return {
+                **self._stats,
+                'idle_timeout': self.idle_timeout,
+                'models': [entry.to_dict() for entry in self._models.values()]
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def _ensure_reaper(self) -> None:
+        """Start the thread that evicts idle models."""
+        if self.idle_timeout <= 0:
+            return
+        with self._lock:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._stop.clear()
+            self._reaper = threading.Thread(target=self._reap, name="model-pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap(self) -> None:
+        """Reaper loop."""
+        while not self._stop.wait(min(self.reap_interval, self.idle_timeout)):
+            self.evict_idle()
+
+    def _reset_after_fork(self) -> None:
+        """Recreate locks and threads in a forked child."""
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._stop = threading.Event()
+        self._reaper = None
+
+    @staticmethod
+    def _free_memory() -> None:
+        """Return freed model memory, including cached GPU memory."""
+        gc.collect()
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+
+# Global model pool instance
+_global_pool: Optional[ModelPool] = None
+
+
+def get_model_pool() -> ModelPool:
+    """Get the global model pool instance."""
+    global _global_pool
+    if _global_pool is None:
+        _global_pool = ModelPool()
+    return _global_pool
+
+
+def _reset_pool_after_fork() -> None:
+    if _global_pool is not None:
+        _global_pool._reset_after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
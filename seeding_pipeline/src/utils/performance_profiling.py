@@ -9,7 +9,9 @@ import cProfile
 import pstats
 import io
 import functools
+import threading
 import tracemalloc
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Dict, Any, Optional, List, Callable, Tuple
@@ -385,60 +387,497 @@ def profile_function(name: Optional[str] = None, track_memory: bool = True):
 
 # Optimization implementations
 
+@dataclass
+class OptimizationChange:
+    """A single setting changed (or considered) by an optimizer."""
+    optimizer: str
+    target: str
+    setting: str
+    before: Any
+    after: Any
+    reason: str
+    applied: bool = True
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "optimizer": self.optimizer,
+            "target": self.target,
+            "setting": self.setting,
+            "before": self.before,
+            "after": self.after,
+            "reason": self.reason,
+            "applied": self.applied
+        }
+
+
+def _resolve_providers(pipeline: Any) -> Any:
+    """Find the object holding the providers (a coordinator or the pipeline itself)."""
+    return getattr(pipeline, "provider_coordinator", None) or pipeline
+
+
+def _section_stats(profiler: Optional[PerformanceProfiler]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Get per-section summary and bottlenecks from a profiler, if it has results."""
+    if profiler is None or not profiler.results:
+        return {}, {}
+    analysis = profiler.analyze_results()
+    return analysis.get("summary", {}), analysis.get("bottlenecks", {})
+
+
 class OptimizationManager:
     """Manages performance optimizations for the pipeline."""
     
-    def __init__(self):
-        self.batch_processor = BatchOptimizer()
-        self.cache_manager = CacheOptimizer()
-        self.async_manager = AsyncOptimizer()
-        self.pool_manager = ConnectionPoolOptimizer()
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 profiler: Optional[PerformanceProfiler] = None):
+        """
+        Initialize the optimization manager.
+        
+        Args:
+            config: Optimizer settings (see each optimizer for keys)
+            profiler: Profiler whose results drive batch size tuning
+        """
+        self.config = config or {}
+        self.profiler = profiler
+        self.batch_processor = BatchOptimizer(self.config, profiler)
+        self.cache_manager = CacheOptimizer(self.config)
+        self.async_manager = AsyncOptimizer(self.config)
+        self.pool_manager = ConnectionPoolOptimizer(self.config)
+        self.changes: List[OptimizationChange] = []
     
-    def apply_optimizations(self, pipeline: Any) -> None:
-        """Apply all optimizations to the pipeline."""
+    def apply_optimizations(self, pipeline: Any) -> List[OptimizationChange]:
+        """
+        Apply all optimizations to the pipeline.
+        
+        Args:
+            pipeline: Pipeline, orchestrator or provider coordinator
+            
+        Returns:
+            Changes made during this call
+        """
         logger.info("Applying performance optimizations...")
         
-        # Apply each optimization
-        self.batch_processor.optimize(pipeline)
-        self.cache_manager.optimize(pipeline)
-        self.async_manager.optimize(pipeline)
-        self.pool_manager.optimize(pipeline)
+        changes = []
+        for optimizer in (self.batch_processor, self.cache_manager,
+                          self.async_manager, self.pool_manager):
+            try:
+                changes.extend(optimizer.optimize(pipeline))
+            except Exception as e:
+                logger.error(f"{type(optimizer).__name__} failed: {e}")
+        
+        self.changes.extend(changes)
+        for change in changes:
+            logger.info(f"{change.optimizer}: {change.target}.{change.setting} "
+                        f"{change.before!r} -> {change.after!r} ({change.reason})")
+        logger.info(f"Optimizations applied: {sum(1 for c in changes if c.applied)} changes")
+        return changes
+    
+    def get_report(self) -> Dict[str, Any]:
+        """Get a before/after report of all changes made so far."""
+        return {
+            "applied": [c.to_dict() for c in self.changes if c.applied],
+            "pending": [c.to_dict() for c in self.changes if not c.applied],
+            "cache_stats": self.cache_manager.get_stats()
+        }
+    
+    def generate_report(self, output_file: Optional[Path] = None) -> str:
+        """Generate a markdown before/after report of applied optimizations."""
+        report_lines = [
+            "# Optimization Report",
+            f"Generated: {datetime.utcnow().isoformat()}",
+            "",
+            "| Optimizer | Setting | Before | After | Reason |",
+            "|---|---|---|---|---|"
+        ]
+        
+        for change in self.changes:
+            after = change.after if change.applied else f"{change.after} (pending)"
+            report_lines.append(
+                f"| {change.optimizer} | {change.target}.{change.setting} | "
+                f"{change.before} | {after} | {change.reason} |"
+            )
+        
+        report = "\n".join(report_lines)
         
-        logger.info("Optimizations applied")
+        if output_file:
+            output_file.write_text(report)
+            logger.info(f"Optimization report saved to {output_file}")
+        
+        return report
 
 
 class BatchOptimizer:
-    """Handles batch processing optimizations."""
+    """Tunes batch sizes from profiler bottleneck data.
+    
+    Config keys: min_batch_size, max_batch_size, slow_section_seconds,
+    high_memory_bytes.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 profiler: Optional[PerformanceProfiler] = None):
+        config = config or {}
+        self.profiler = profiler
+        self.min_batch_size = config.get("min_batch_size", 8)
+        self.max_batch_size = config.get("max_batch_size", 256)
+        self.slow_section_seconds = config.get("slow_section_seconds", 5.0)
+        self.high_memory_bytes = config.get("high_memory_bytes", 500 * 1024 * 1024)
     
-    def optimize(self, pipeline: Any) -> None:
+    def optimize(self, pipeline: Any) -> List[OptimizationChange]:
         """Apply batch processing optimizations."""
-        # This would be implemented based on SimpleKGPipeline's API
-        logger.info("Batch processing optimization applied")
+        summary, bottlenecks = _section_stats(self.profiler)
+        if not summary:
+            logger.debug("No profiling results, leaving batch sizes unchanged")
+            return []
+        
+        providers = _resolve_providers(pipeline)
+        embedding_provider = getattr(providers, "embedding_provider", None)
+        if embedding_provider is None or not hasattr(embedding_provider, "batch_size"):
+            return []
+        
+        embed_sections = {name: stats for name, stats in summary.items() if "embed" in name.lower()}
+        if not embed_sections:
+            return []
+        
+        before = embedding_provider.batch_size
+        high_memory = any(s["avg_memory"] > self.high_memory_bytes for s in embed_sections.values())
+        slow = (any(s["avg_time"] > self.slow_section_seconds for s in embed_sections.values())
+                or any("embed" in func.lower() for func in list(bottlenecks)[:3]))
+        
+        if high_memory:
+            after = max(self.min_batch_size, before // 2)
+            reason = "embedding sections exceed memory threshold"
+        elif slow:
+            after = min(self.max_batch_size, before * 2)
+            reason = "embedding is a top bottleneck"
+        else:
+            return []
+        
+        if after == before:
+            return []
+        embedding_provider.batch_size = after
+        return [OptimizationChange("batch", "embedding_provider", "batch_size", before, after, reason)]
+
+
+_MISSING = object()
+
+
+class ProviderCache:
+    """Thread-safe LRU cache used to memoize provider calls."""
+    
+    def __init__(self, name: str, max_size: int = 1024):
+        self.name = name
+        self.max_size = max_size
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Any) -> Any:
+        """Get a cached value, or _MISSING."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                hit = True
+                value = self._entries[key]
+            else:
+                self.misses += 1
+                hit = False
+                value = _MISSING
+        metrics = get_metrics_collector()
+        (metrics.cache_hits if hit else metrics.cache_misses).inc(labels={"cache": self.name})
+        return value
+    
+    def put(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0
+            }
 
 
 class CacheOptimizer:
-    """Handles caching optimizations."""
+    """Puts providers behind response and embedding caches.
+    
+    Embeddings go through the shared content-hash cache
+    (:func:`~src.providers.embeddings.cache.get_embedding_cache`), the same
+    one every embedding consumer uses, rather than a second cache layer.
+    
+    The LLM response cache is opt-in. It is installed by wrapping the provider
+    instance's ``complete`` so every component holding the provider shares it.
+    Keys include the model and sampling options, and calls sampling at a
+    temperature above zero bypass the cache, since repeating them is expected
+    to give different completions.
+    
+    Config keys: enable_llm_cache (default False), llm_cache_size,
+    enable_embedding_cache, embedding_cache_size, embedding_cache_dir.
+    """
+    
+    # Provider attributes that change what a prompt completes to
+    LLM_KEY_ATTRIBUTES = ("model_name", "temperature", "max_tokens")
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+        self.enable_llm_cache = config.get("enable_llm_cache", False)
+        self.llm_cache_size = config.get("llm_cache_size", 512)
+        self.enable_embedding_cache = config.get("enable_embedding_cache", True)
+        self.embedding_cache_config = {
+            key: config[key] for key in ("embedding_cache_size", "embedding_cache_dir") if key in config
+        }
+        self.caches: Dict[str, Any] = {}
     
-    def optimize(self, pipeline: Any) -> None:
+    def optimize(self, pipeline: Any) -> List[OptimizationChange]:
         """Apply caching optimizations."""
-        # Enable LLM response caching
-        # Enable embedding caching
-        logger.info("Caching optimization applied")
+        providers = _resolve_providers(pipeline)
+        changes = []
+        
+        llm_provider = getattr(providers, "llm_provider", None)
+        if self.enable_llm_cache and llm_provider is not None and hasattr(llm_provider, "complete"):
+            if self._install_llm_cache(llm_provider):
+                changes.append(OptimizationChange(
+                    "cache", "llm_provider", "response_cache", None, self.llm_cache_size,
+                    "memoize identical deterministic prompts"
+                ))
+        
+        embedding_provider = getattr(providers, "embedding_provider", None)
+        if self.enable_embedding_cache and embedding_provider is not None:
+            cached = self._install_embedding_cache(providers, embedding_provider)
+            if cached is not None:
+                changes.append(OptimizationChange(
+                    "cache", "embedding_provider", "embedding_cache", None, cached.max_size,
+                    "route embeddings through the shared content-hash cache"
+                ))
+        
+        return changes
+    
+    def _install_llm_cache(self, provider: Any) -> bool:
+        """Wrap provider.complete with a response cache for deterministic calls."""
+        if isinstance(getattr(provider, "_response_cache", None), ProviderCache):
+            return False
+        
+        cache = ProviderCache("llm_response", self.llm_cache_size)
+        complete = provider.complete
+        
+        @functools.wraps(complete)
+        def cached_complete(prompt: str, **kwargs) -> str:
+            options = {
+                name: getattr(provider, name, None) for name in self.LLM_KEY_ATTRIBUTES
+            }
+            options.update(kwargs)
+            temperature = options.get("temperature")
+            if not isinstance(temperature, (int, float)) or temperature > 0:
+                # Sampled (or unknown) temperature: every call should reach the model
+                return complete(prompt, **kwargs)
+            
+            key = (prompt, tuple(sorted(options.items())))
+            try:
+                value = cache.get(key)
+            except TypeError:  # Unhashable options
+                return complete(prompt, **kwargs)
+            if value is _MISSING:
+                value = complete(prompt, **kwargs)
+                cache.put(key, value)
+            return value
+        
+        provider.complete = cached_complete
+        provider._response_cache = cache
+        self.caches["llm_response"] = cache
+        return True
+    
+    def _install_embedding_cache(self, providers: Any, provider: Any) -> Optional[Any]:
+        """Swap the embedding provider for its shared cache wrapper.
+        
+        Returns:
+            The cache wrapper, or None if the provider was already cached or
+            cannot be wrapped
+        """
+        from ..providers.embeddings.cache import CachedEmbeddingProvider, get_embedding_cache
+        if isinstance(provider, CachedEmbeddingProvider):
+            self.caches["embedding"] = provider
+            return None
+        
+        cached = get_embedding_cache(provider, self.embedding_cache_config)
+        if not isinstance(cached, CachedEmbeddingProvider):
+            return None
+        providers.embedding_provider = cached
+        self.caches["embedding"] = cached
+        return cached
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics for installed caches."""
+        return {name: cache.get_stats() for name, cache in self.caches.items()}
 
 
 class AsyncOptimizer:
-    """Handles async operation optimizations."""
+    """Switches stages that support concurrent execution to their concurrent mode.
+    
+    Config keys: enable_async.
+    """
+    
+    # (stage, where the flag lives, flag name)
+    ASYNC_STAGES = [
+        ("migration_extraction", "config", "parallel_migration_extraction"),
+        ("shadow_writes", "graph_provider", "async_shadow_writes"),
+    ]
     
-    def optimize(self, pipeline: Any) -> None:
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+        self.enable_async = config.get("enable_async", True)
+    
+    def optimize(self, pipeline: Any) -> List[OptimizationChange]:
         """Apply async optimizations."""
-        # Convert blocking operations to async where possible
-        logger.info("Async optimization applied")
+        if not self.enable_async:
+            return []
+        
+        providers = _resolve_providers(pipeline)
+        changes = []
+        for stage, owner_name, flag in self.ASYNC_STAGES:
+            owner = getattr(providers, owner_name, None)
+            if owner is None:
+                owner = getattr(pipeline, owner_name, None)
+            if owner is None:
+                continue
+            
+            if isinstance(owner, dict):
+                before = owner.get(flag)
+                if before is True:
+                    continue
+                owner[flag] = True
+            elif hasattr(owner, flag) or owner_name == "config":
+                before = getattr(owner, flag, None)
+                if before is True:
+                    continue
+                setattr(owner, flag, True)
+            else:
+                continue
+            
+            changes.append(OptimizationChange(
+                "async", owner_name, flag, before, True, f"run {stage} concurrently"
+            ))
+        return changes
 
 
 class ConnectionPoolOptimizer:
-    """Handles connection pooling optimizations."""
+    """Sizes the Neo4j connection pool from observed session concurrency.
+    
+    The first call starts tracking concurrent sessions on the graph
+    provider(s); later calls size the pool to the observed peak times
+    pool_headroom. The driver pool size is fixed at creation, so a running
+    driver is only recreated when recreate_driver is set; otherwise the new
+    size takes effect on the next connect.
+    
+    Config keys: pool_headroom, min_pool_size, max_pool_size,
+    expected_concurrency, recreate_driver.
+    """
     
-    def optimize(self, pipeline: Any) -> None:
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+        self.pool_headroom = config.get("pool_headroom", 1.5)
+        self.min_pool_size = config.get("min_pool_size", 10)
+        self.max_pool_size = config.get("max_pool_size", 100)
+        self.expected_concurrency = config.get("expected_concurrency")
+        self.recreate_driver = config.get("recreate_driver", False)
+    
+    def optimize(self, pipeline: Any) -> List[OptimizationChange]:
         """Apply connection pooling optimizations."""
-        # Optimize Neo4j connection pooling
-        logger.info("Connection pooling optimization applied")
\ No newline at end of file
+        providers = _resolve_providers(pipeline)
+        graph_provider = getattr(providers, "graph_provider", None)
+        if graph_provider is None:
+            return []
+        
+        changes = []
+        for name, provider in self._session_providers(graph_provider):
+            tracker = self._track_sessions(provider)
+            concurrency = tracker.peak or self.expected_concurrency
+            if not concurrency:
+                continue
+            
+            target = int(min(self.max_pool_size,
+                             max(self.min_pool_size, round(concurrency * self.pool_headroom))))
+            before = self._get_pool_size(provider)
+            if target == before:
+                continue
+            
+            self._set_pool_size(provider, target)
+            applied = True
+            if getattr(provider, "_driver", None) is not None:
+                applied = self.recreate_driver
+                if applied:
+                    provider.disconnect()
+                    provider.connect()
+            
+            changes.append(OptimizationChange(
+                "connection_pool", name, "pool_size", before, target,
+                f"peak concurrency {concurrency}", applied=applied
+            ))
+        return changes
+    
+    @staticmethod
+    def _session_providers(graph_provider: Any) -> List[Tuple[str, Any]]:
+        """Providers that own a driver, including those behind a compatibility wrapper."""
+        candidates = [("graph_provider", graph_provider)]
+        for attr in ("fixed_provider", "schemaless_provider"):
+            inner = getattr(graph_provider, attr, None)
+            if inner is not None:
+                candidates.append((f"graph_provider.{attr}", inner))
+        return [(name, p) for name, p in candidates if callable(getattr(p, "session", None))]
+    
+    @staticmethod
+    def _track_sessions(provider: Any) -> "SessionConcurrencyTracker":
+        """Wrap provider.session to record concurrent session usage."""
+        tracker = getattr(provider, "_session_tracker", None)
+        if not isinstance(tracker, SessionConcurrencyTracker):
+            tracker = SessionConcurrencyTracker(provider.session)
+            provider.session = tracker.session
+            provider._session_tracker = tracker
+        return tracker
+    
+    @staticmethod
+    def _get_pool_size(provider: Any) -> Optional[int]:
+        if hasattr(provider, "_pool_size"):
+            return provider._pool_size
+        config = getattr(provider, "config", None)
+        return config.get("pool_size", 50) if isinstance(config, dict) else None
+    
+    @staticmethod
+    def _set_pool_size(provider: Any, size: int) -> None:
+        if hasattr(provider, "_pool_size"):
+            provider._pool_size = size
+        config = getattr(provider, "config", None)
+        if isinstance(config, dict):
+            config["pool_size"] = size
+
+
+class SessionConcurrencyTracker:
+    """Counts concurrently open sessions on a graph provider."""
+    
+    def __init__(self, session_factory: Callable):
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+    
+    @contextmanager
+    def session(self, *args, **kwargs):
+        """Open a session through the wrapped factory, tracking concurrency."""
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            with self._session_factory(*args, **kwargs) as session:
+                yield session
+        finally:
+            with self._lock:
+                self.active -= 1
@@ -1,10 +1,79 @@
 """Rate limiting utilities for API calls."""
 
+import itertools
+import os
+import sqlite3
+import tempfile
+import threading
 import time
-from typing import Dict, Any, Optional
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Sequence, Tuple
 from collections import deque
 from abc import ABC, abstractmethod
 
+# Optional imports
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+    redis = None
+
+
+def scoped_identifier(identifier: str, scope: Optional[str] = None) -> str:
+    """
+    Rate limit identifier for ``identifier`` within a separate budget.
+    
+    A scope (for example a hash of the API key) gives each account its own
+    ledger entries while still using the limits configured for the base
+    identifier.
+    """
+    return f"{identifier}@{scope}" if scope else identifier
+
+
+def _limits_for(limits: Dict[str, Dict[str, Any]], default_limits: Dict[str, Any],
+                identifier: str) -> Dict[str, Any]:
+    """Limits for an identifier, falling back to its unscoped base, then the default."""
+    if identifier in limits:
+        return limits[identifier]
+    return limits.get(identifier.split('@', 1)[0], default_limits)
+
+
+def _window_wait(limits: Dict[str, Any], cost: float, current_time: float,
+                 minute_times: Sequence[float], day_times: Sequence[float],
+                 token_entries: Sequence[Tuple[float, float]], tokens_used: float,
+                 minute: float = 60, day: float = 86400) -> float:
+    """
+    Seconds until a request fits within rpm/tpm/rpd limits (<= 0 if it fits now).
+    
+    Windows must be in ascending time order and already trimmed of expired
+    entries. The wait is until the oldest entry blocking the request expires.
+    """
+    wait = 0.0
+    
+    if 'rpm' in limits:
+        excess = len(minute_times) - limits['rpm']
+        if excess >= 0:
+            wait = max(wait, minute_times[excess] + minute - current_time)
+            
+    if 'rpd' in limits:
+        excess = len(day_times) - limits['rpd']
+        if excess >= 0:
+            wait = max(wait, day_times[excess] + day - current_time)
+            
+    if 'tpm' in limits and tokens_used + cost > limits['tpm'] and token_entries:
+        # Walk forward until enough tokens expire; a request larger
+        # than the whole budget is admitted once the window is empty.
+        freed = 0.0
+        for timestamp, tokens in token_entries:
+            freed += tokens
+            if tokens_used - freed + cost <= limits['tpm']:
+                break
+        wait = max(wait, timestamp + minute - current_time)
+        
+    return wait
+
 
 class RateLimiter(ABC):
     """Abstract base class for rate limiters."""
@@ -28,6 +97,31 @@ class RateLimiter(ABC):
     def get_status(self) -> Dict[str, Any]:
         """Get current rate limit status."""
         pass
+        
+    def acquire(self, identifier: str, cost: float = 1.0,
+                timeout: Optional[float] = None, poll_interval: float = 0.1) -> bool:
+        """
+        Block until a request can be made, then record it.
+        
+        Subclasses that know when capacity frees up should override this to
+        sleep exactly that long instead of polling.
+        
+        Args:
+            identifier: Rate limit identifier (e.g. model name)
+            cost: Cost of the request (e.g. estimated tokens)
+            timeout: Maximum seconds to wait, None to wait indefinitely
+            poll_interval: Seconds between checks
+            
+        Returns:
+            True if the request was admitted, False on timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while not self.can_make_request(identifier, cost):
+            if deadline is not None and time.time() + poll_interval > deadline:
+                return False
+            time.sleep(poll_interval)
+        self.record_request(identifier, cost)
+        return True
 
 
 class TokenBucketRateLimiter(RateLimiter):
@@ -89,7 +183,16 @@ class TokenBucketRateLimiter(RateLimiter):
 
 
 class WindowedRateLimiter(RateLimiter):
-    """Sliding window rate limiter implementation."""
+    """Sliding window rate limiter implementation.
+    
+    Token usage per minute is kept as a running total alongside the window,
+    so admission checks are O(1). acquire() waits exactly until the oldest
+    entry blocking the request leaves its window, and admits waiters for the
+    same identifier in FIFO order.
+    """
+    
+    MINUTE = 60
+    DAY = 86400
     
     def __init__(self, limits: Dict[str, Dict[str, Any]]):
         """
@@ -114,57 +217,75 @@ class WindowedRateLimiter(RateLimiter):
         
         # Track usage per identifier
         self.requests = {}
+        self.token_totals: Dict[str, float] = {}
         self.error_counts = {}
         
+        # FIFO admission for blocking acquire
+        self._condition = threading.Condition()
+        self._tickets = itertools.count()
+        self._waiters: Dict[str, deque] = {}
+        
     def can_make_request(self, identifier: str, cost: float = 1.0) -> bool:
         """Check if request can be made within rate limits."""
-        current_time = time.time()
-        
-        # Get limits for identifier
-        limits = self.limits.get(identifier, self.default_limits)
-        
-        # Get or create usage tracker
-        if identifier not in self.requests:
-            self.requests[identifier] = self._create_usage_tracker()
-            
-        usage = self.requests[identifier]
-        
-        # Clean old entries
-        self._clean_old_entries(usage, current_time)
-        
-        # Check all limits
-        if 'rpm' in limits:
-            rpm_count = len(usage.get('minute', []))
-            if rpm_count >= limits['rpm']:
-                return False
-                
-        if 'tpm' in limits:
-            tokens_used = sum(t[1] for t in usage.get('tokens_minute', []))
-            if tokens_used + cost > limits['tpm']:
-                return False
-                
-        if 'rpd' in limits:
-            rpd_count = len(usage.get('day', []))
-            if rpd_count >= limits['rpd']:
-                return False
-                
-        return True
+        with self._condition:
+            return self._time_until_available(identifier, cost, time.time()) <= 0
         
     def record_request(self, identifier: str, cost: float = 1.0) -> None:
         """Record a successful request."""
-        current_time = time.time()
+        with self._condition:
+            self._record(identifier, cost, time.time())
+            
+    def acquire(self, identifier: str, cost: float = 1.0,
+                timeout: Optional[float] = None, poll_interval: float = 0.1) -> bool:
+        """
+        Block until a request fits within all windows, then record it.
         
-        if identifier not in self.requests:
-            self.requests[identifier] = self._create_usage_tracker()
+        The slot is reserved at admission so concurrent callers cannot
+        overshoot the limits; callers should not call record_request() for
+        the same request.
+        
+        Args:
+            identifier: Rate limit identifier (e.g. model name)
+            cost: Cost of the request (e.g. estimated tokens)
+            timeout: Maximum seconds to wait, None to wait indefinitely
+            poll_interval: Unused; waits are computed from the windows
             
-        usage = self.requests[identifier]
+        Returns:
+            True if the request was admitted, False if it could not be
+            admitted within the timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
         
-        if 'minute' in usage:
-            usage['minute'].append(current_time)
-        if 'day' in usage:
-            usage['day'].append(current_time)
-        if 'tokens_minute' in usage:
-            usage['tokens_minute'].append((current_time, cost))
+        with self._condition:
+            ticket = next(self._tickets)
+            queue = self._waiters.setdefault(identifier, deque())
+            queue.append(ticket)
+            try:
+                while True:
+                    now = time.time()
+                    if queue[0] == ticket:
+                        wait = self._time_until_available(identifier, cost, now)
+                        if wait <= 0:
+                            self._record(identifier, cost, now)
+                            return True
+                    else:
+                        # Not our turn; woken when the head is admitted or leaves
+                        wait = None
+                        
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0 or (wait is not None and wait > remaining):
+                            return False
+                        wait = remaining if wait is None else wait
+                    self._condition.wait(wait)
+            finally:
+                queue.remove(ticket)
+                self._condition.notify_all()
+                
+    def time_until_available(self, identifier: str, cost: float = 1.0) -> float:
+        """Seconds until a request of the given cost would fit, ignoring queued waiters."""
+        with self._condition:
+            return max(0.0, self._time_until_available(identifier, cost, time.time()))
             
     def record_error(self, identifier: str, error_type: str) -> None:
         """Record an error for monitoring."""
@@ -176,57 +297,100 @@ class WindowedRateLimiter(RateLimiter):
         current_time = time.time()
         status = {}
         
-        for identifier, usage in self.requests.items():
-            self._clean_old_entries(usage, current_time)
-            
-            limits = self.limits.get(identifier, self.default_limits)
-            
-            identifier_status = {}
-            
-            if 'rpm' in limits:
-                rpm_count = len(usage.get('minute', []))
-                identifier_status['rpm'] = {
-                    'used': rpm_count,
-                    'limit': limits['rpm']
-                }
+        with self._condition:
+            for identifier, usage in self.requests.items():
+                self._clean_old_entries(usage, current_time, identifier)
                 
-            if 'tpm' in limits:
-                tokens_used = sum(t[1] for t in usage.get('tokens_minute', []))
-                identifier_status['tpm'] = {
-                    'used': int(tokens_used),
-                    'limit': limits['tpm']
-                }
+                limits = _limits_for(self.limits, self.default_limits, identifier)
                 
-            if 'rpd' in limits:
-                rpd_count = len(usage.get('day', []))
-                identifier_status['rpd'] = {
-                    'used': rpd_count,
-                    'limit': limits['rpd']
+                identifier_status = {}
+                
+                if 'rpm' in limits:
+                    rpm_count = len(usage.get('minute', []))
+                    identifier_status['rpm'] = {
+                        'used': rpm_count,
+                        'limit': limits['rpm']
+                    }
+                    
+                if 'tpm' in limits:
+                    tokens_used = self.token_totals.get(identifier, 0.0)
+                    identifier_status['tpm'] = {
+                        'used': int(tokens_used),
+                        'limit': limits['tpm']
+                    }
+                    
+                if 'rpd' in limits:
+                    rpd_count = len(usage.get('day', []))
+                    identifier_status['rpd'] = {
+                        'used': rpd_count,
+                        'limit': limits['rpd']
+                    }
+                    
+                identifier_status['waiting'] = len(self._waiters.get(identifier, ()))
+                identifier_status['errors'] = {
+                    k: v for k, v in self.error_counts.items()
+                    if k.startswith(identifier)
                 }
                 
-            identifier_status['errors'] = {
-                k: v for k, v in self.error_counts.items()
-                if k.startswith(identifier)
-            }
-            
-            status[identifier] = identifier_status
+                status[identifier] = identifier_status
             
         return status
         
-    def _clean_old_entries(self, usage: Dict[str, deque], current_time: float) -> None:
+    def _get_usage(self, identifier: str) -> Dict[str, deque]:
+        """Get or create the usage tracker for an identifier."""
+        if identifier not in self.requests:
+            self.requests[identifier] = self._create_usage_tracker()
+            self.token_totals[identifier] = 0.0
+        return self.requests[identifier]
+        
+    def _record(self, identifier: str, cost: float, current_time: float) -> None:
+        """Record a request. Caller holds the lock."""
+        usage = self._get_usage(identifier)
+        
+        if 'minute' in usage:
+            usage['minute'].append(current_time)
+        if 'day' in usage:
+            usage['day'].append(current_time)
+        if 'tokens_minute' in usage:
+            usage['tokens_minute'].append((current_time, cost))
+            self.token_totals[identifier] += cost
+            
+    def _time_until_available(self, identifier: str, cost: float, current_time: float) -> float:
+        """
+        Seconds until a request fits within all limits (<= 0 if it fits now).
+        
+        Caller holds the lock.
+        """
+        limits = _limits_for(self.limits, self.default_limits, identifier)
+        usage = self._get_usage(identifier)
+        self._clean_old_entries(usage, current_time, identifier)
+        
+        return _window_wait(
+            limits, cost, current_time,
+            usage['minute'], usage['day'], usage['tokens_minute'],
+            self.token_totals[identifier], self.MINUTE, self.DAY
+        )
+        
+    def _clean_old_entries(self, usage: Dict[str, deque], current_time: float,
+                           identifier: Optional[str] = None) -> None:
         """Remove entries older than rate limit windows."""
         # Clean minute window (60 seconds)
         if 'minute' in usage:
-            while usage['minute'] and usage['minute'][0] < current_time - 60:
+            while usage['minute'] and usage['minute'][0] <= current_time - self.MINUTE:
                 usage['minute'].popleft()
                 
         if 'tokens_minute' in usage:
-            while usage['tokens_minute'] and usage['tokens_minute'][0][0] < current_time - 60:
-                usage['tokens_minute'].popleft()
+            while usage['tokens_minute'] and usage['tokens_minute'][0][0] <= current_time - self.MINUTE:
+                _, tokens = usage['tokens_minute'].popleft()
+                if identifier is not None:
+                    self.token_totals[identifier] -= tokens
+            if identifier is not None and not usage['tokens_minute']:
+                # Reset to avoid float drift from repeated subtraction
+                self.token_totals[identifier] = 0.0
                 
         # Clean day window (24 hours)
         if 'day' in usage:
-            while usage['day'] and usage['day'][0] < current_time - 86400:
+            while usage['day'] and usage['day'][0] <= current_time - self.DAY:
                 usage['day'].popleft()
                 
     def _create_usage_tracker(self) -> Dict[str, deque]:
@@ -267,4 +431,425 @@ class CompositeRateLimiter(RateLimiter):
         return {
             name: limiter.get_status()
             for name, limiter in self.limiters.items()
-        }
\ No newline at end of file
+        }
+
+class SQLiteRateLimiter(RateLimiter):
+    """Sliding window rate limiter backed by a SQLite ledger file.
+    
+    Every process pointing at the same ledger path draws from one budget.
+    Admission checks and reservations run inside a BEGIN IMMEDIATE
+    transaction, so SQLite's file lock serializes them across processes.
+    Waiting processes sleep until the oldest blocking entry expires; unlike
+    the in-process limiter, ordering across processes is not strictly FIFO.
+    """
+    
+    MINUTE = 60
+    DAY = 86400
+    
+    def __init__(self, limits: Dict[str, Dict[str, Any]],
+                 path: Optional[str] = None,
+                 busy_timeout: float = 30.0):
+        """
+        Initialize SQLite rate limiter.
+        
+        Args:
+            limits: Rate limits per identifier (same format as WindowedRateLimiter)
+            path: Ledger file path (defaults to a shared file in the temp directory)
+            busy_timeout: Seconds to wait for the ledger lock
+        """
+        self.limits = limits
+        self.default_limits = limits.get('default', {
+            'rpm': 10,
+            'tpm': 100000,
+            'rpd': 500
+        })
+        self.path = str(path or os.path.join(tempfile.gettempdir(), 'podcast_kg_rate_limits.sqlite'))
+        self.busy_timeout = busy_timeout
+        self.error_counts = {}
+        self._local = threading.local()
+        
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_ledger ("
+                "identifier TEXT NOT NULL, ts REAL NOT NULL, cost REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_rate_limit_ledger "
+                "ON rate_limit_ledger (identifier, ts)"
+            )
+            
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection to the ledger."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            self._local.conn = conn
+        return conn
+        
+    @contextmanager
+    def _transaction(self):
+        """Hold the ledger write lock for the duration of the block."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        
+    def _wait_locked(self, conn: sqlite3.Connection, identifier: str,
+                     cost: float, current_time: float) -> float:
+        """Seconds until a request fits. Caller holds the ledger lock."""
+        limits = _limits_for(self.limits, self.default_limits, identifier)
+        conn.execute(
+            "DELETE FROM rate_limit_ledger WHERE identifier = ? AND ts <= ?",
+            (identifier, current_time - self.DAY)
+        )
+        minute_rows = conn.execute(
+            "SELECT ts, cost FROM rate_limit_ledger WHERE identifier = ? AND ts > ? ORDER BY ts",
+            (identifier, current_time - self.MINUTE)
+        ).fetchall()
+        
+        minute_limits = {k: v for k, v in limits.items() if k != 'rpd'}
+        wait = _window_wait(
+            minute_limits, cost, current_time,
+            [row[0] for row in minute_rows], [], minute_rows,
+            sum(row[1] for row in minute_rows), self.MINUTE, self.DAY
+        )
+        
+        if 'rpd' in limits:
+            day_count = conn.execute(
+                "SELECT COUNT(*) FROM rate_limit_ledger WHERE identifier = ?", (identifier,)
+            ).fetchone()[0]
+            excess = day_count - limits['rpd']
+            if excess >= 0:
+                oldest = conn.execute(
+                    "SELECT ts FROM rate_limit_ledger WHERE identifier = ? "
+                    "ORDER BY ts LIMIT 1 OFFSET ?",
+                    (identifier, excess)
+                ).fetchone()[0]
+                wait = max(wait, oldest + self.DAY - current_time)
+                
+        return wait
+        
+    def can_make_request(self, identifier: str, cost: float = 1.0) -> bool:
+        """Check if request can be made within rate limits."""
+        return self.time_until_available(identifier, cost) <= 0
+        
+    def time_until_available(self, identifier: str, cost: float = 1.0) -> float:
+        """Seconds until a request of the given cost would fit."""
+        with self._transaction() as conn:
+            return max(0.0, self._wait_locked(conn, identifier, cost, time.time()))
+            
+    def record_request(self, identifier: str, cost: float = 1.0) -> None:
+        """Record a successful request."""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO rate_limit_ledger (identifier, ts, cost) VALUES (?, ?, ?)",
+                (identifier, time.time(), cost)
+            )
+            
+    def acquire(self, identifier: str, cost: float = 1.0,
+                timeout: Optional[float] = None, poll_interval: float = 0.1) -> bool:
+        """
+        Block until a request fits within the shared budget, then record it.
+        
+        Args:
+            identifier: Rate limit identifier (e.g. model name)
+            cost: Cost of the request (e.g. estimated tokens)
+            timeout: Maximum seconds to wait, None to wait indefinitely
+            poll_interval: Unused; waits are computed from the ledger
+            
+        Returns:
+            True if the request was admitted, False on timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            with self._transaction() as conn:
+                now = time.time()
+                wait = self._wait_locked(conn, identifier, cost, now)
+                if wait <= 0:
+                    conn.execute(
+                        "INSERT INTO rate_limit_ledger (identifier, ts, cost) VALUES (?, ?, ?)",
+                        (identifier, now, cost)
+                    )
+                    return True
+                    
+            if deadline is not None:
+                remaining = deadline - now
+                if wait > remaining:
+                    return False
+            time.sleep(wait)
+            
+    def record_error(self, identifier: str, error_type: str) -> None:
+        """Record an error for monitoring (per process)."""
+        key = f"{identifier}:{error_type}"
+        self.error_counts[key] = self.error_counts.get(key, 0) + 1
+        
+    def get_status(self) -> Dict[str, Any]:
+        """Get current rate limit status across all processes."""
+        current_time = time.time()
+        status = {}
+        
+        with self._transaction() as conn:
+            identifiers = [row[0] for row in conn.execute(
+                "SELECT DISTINCT identifier FROM rate_limit_ledger"
+            )]
+            for identifier in identifiers:
+                limits = _limits_for(self.limits, self.default_limits, identifier)
+                minute_count, tokens_used = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(cost), 0) FROM rate_limit_ledger "
+                    "WHERE identifier = ? AND ts > ?",
+                    (identifier, current_time - self.MINUTE)
+                ).fetchone()
+                day_count = conn.execute(
+                    "SELECT COUNT(*) FROM rate_limit_ledger WHERE identifier = ? AND ts > ?",
+                    (identifier, current_time - self.DAY)
+                ).fetchone()[0]
+                
+                identifier_status = {}
+                if 'rpm' in limits:
+                    identifier_status['rpm'] = {'used': minute_count, 'limit': limits['rpm']}
+                if 'tpm' in limits:
+                    identifier_status['tpm'] = {'used': int(tokens_used), 'limit': limits['tpm']}
+                if 'rpd' in limits:
+                    identifier_status['rpd'] = {'used': day_count, 'limit': limits['rpd']}
+                identifier_status['errors'] = {
+                    k: v for k, v in self.error_counts.items()
+                    if k.startswith(identifier)
+                }
+                status[identifier] = identifier_status
+                
+        return status
+
+
+class RedisRateLimiter(RateLimiter):
+    """Sliding window rate limiter shared through Redis.
+    
+    Each identifier uses two sorted sets (requests and token costs) scored
+    by timestamp. A Lua script checks all windows and reserves the slot
+    atomically, so any number of processes or hosts share one budget.
+    Timestamps come from the callers' clocks, which should be in sync.
+    """
+    
+    MINUTE = 60
+    DAY = 86400
+    
+    # Returns the wait in seconds as a string (Redis truncates Lua numbers)
+    ADMIT_SCRIPT = """
+    local now = tonumber(ARGV[1])
+    local cost = tonumber(ARGV[2])
+    local rpm = tonumber(ARGV[3])
+    local tpm = tonumber(ARGV[4])
+    local rpd = tonumber(ARGV[5])
+    local minute = tonumber(ARGV[6])
+    local day = tonumber(ARGV[7])
+    local member = ARGV[8]
+    local record = ARGV[9] == '1'
+
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - day)
+    redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now - minute)
+
+    local wait = 0
+    if rpd >= 0 then
+        local n = redis.call('ZCARD', KEYS[1])
+        if n >= rpd then
+            local entry = redis.call('ZRANGE', KEYS[1], n - rpd, n - rpd, 'WITHSCORES')
+            wait = math.max(wait, tonumber(entry[2]) + day - now)
+        end
+    end
+    if rpm >= 0 then
+        local since = '(' .. tostring(now - minute)
+        local n = redis.call('ZCOUNT', KEYS[1], since, '+inf')
+        if n >= rpm then
+            local entry = redis.call('ZRANGEBYSCORE', KEYS[1], since, '+inf', 'WITHSCORES', 'LIMIT', n - rpm, 1)
+            wait = math.max(wait, tonumber(entry[2]) + minute - now)
+        end
+    end
+    if tpm >= 0 then
+        local entries = redis.call('ZRANGE', KEYS[2], 0, -1, 'WITHSCORES')
+        local used = 0
+        for i = 1, #entries, 2 do
+            used = used + tonumber(string.match(entries[i], ':([^:]+)$'))
+        end
+        if used + cost > tpm and #entries > 0 then
+            local freed = 0
+            local ts = 0
+            for i = 1, #entries, 2 do
+                freed = freed + tonumber(string.match(entries[i], ':([^:]+)$'))
+                ts = tonumber(entries[i + 1])
+                if used - freed + cost <= tpm then
+                    break
+                end
+            end
+            wait = math.max(wait, ts + minute - now)
+        end
+    end
+
+    if wait <= 0 and record then
+        redis.call('ZADD', KEYS[1], now, member)
+        redis.call('ZADD', KEYS[2], now, member .. ':' .. tostring(cost))
+        redis.call('EXPIRE', KEYS[1], math.ceil(day))
+        redis.call('EXPIRE', KEYS[2], math.ceil(minute) + 1)
+    end
+    return tostring(wait)
+    """
+    
+    def __init__(self, limits: Dict[str, Dict[str, Any]],
+                 url: str = "redis://localhost:6379/0",
+                 namespace: str = "podcast_kg:ratelimit",
+                 client: Optional[Any] = None):
+        """
+        Initialize Redis rate limiter.
+        
+        Args:
+            limits: Rate limits per identifier (same format as WindowedRateLimiter)
+            url: Redis connection URL
+            namespace: Key prefix for the ledger
+            client: Existing Redis client to use instead of connecting to url
+        """
+        if client is None:
+            if not HAS_REDIS:
+                raise ImportError("redis is not installed. Install with: pip install redis")
+            client = redis.from_url(url)
+            
+        self.limits = limits
+        self.default_limits = limits.get('default', {
+            'rpm': 10,
+            'tpm': 100000,
+            'rpd': 500
+        })
+        self.namespace = namespace
+        self.client = client
+        self.error_counts = {}
+        self._script = client.register_script(self.ADMIT_SCRIPT)
+        
+    def _run(self, identifier: str, cost: float, record: bool) -> float:
+        """Run the admission script and return the wait in seconds."""
+        limits = _limits_for(self.limits, self.default_limits, identifier)
+        keys = [f"{self.namespace}:{identifier}:requests", f"{self.namespace}:{identifier}:tokens"]
+        args = [
+            time.time(), cost,
+            limits.get('rpm', -1), limits.get('tpm', -1), limits.get('rpd', -1),
+            self.MINUTE, self.DAY, uuid.uuid4().hex, '1' if record else '0'
+        ]
+        return float(self._script(keys=keys, args=args))
+        
+    def can_make_request(self, identifier: str, cost: float = 1.0) -> bool:
+        """Check if request can be made within rate limits."""
+        return self._run(identifier, cost, record=False) <= 0
+        
+    def time_until_available(self, identifier: str, cost: float = 1.0) -> float:
+        """Seconds until a request of the given cost would fit."""
+        return max(0.0, self._run(identifier, cost, record=False))
+        
+    def record_request(self, identifier: str, cost: float = 1.0) -> None:
+        """Record a successful request regardless of limits."""
+        now = time.time()
+        member = uuid.uuid4().hex
+        pipe = self.client.pipeline()
+        pipe.zadd(f"{self.namespace}:{identifier}:requests", {member: now})
+        pipe.zadd(f"{self.namespace}:{identifier}:tokens", {f"{member}:{cost}": now})
+        pipe.execute()
+        
+    def acquire(self, identifier: str, cost: float = 1.0,
+                timeout: Optional[float] = None, poll_interval: float = 0.1) -> bool:
+        """
+        Block until a request fits within the shared budget, then record it.
+        
+        Args:
+            identifier: Rate limit identifier (e.g. model name)
+            cost: Cost of the request (e.g. estimated tokens)
+            timeout: Maximum seconds to wait, None to wait indefinitely
+            poll_interval: Unused; waits are computed by the script
+            
+        Returns:
+            True if the request was admitted, False on timeout
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            wait = self._run(identifier, cost, record=True)
+            if wait <= 0:
+                return True
+            if deadline is not None and wait > deadline - time.time():
+                return False
+            time.sleep(wait)
+            
+    def record_error(self, identifier: str, error_type: str) -> None:
+        """Record an error for monitoring (per process)."""
+        key = f"{identifier}:{error_type}"
+        self.error_counts[key] = self.error_counts.get(key, 0) + 1
+        
+    def get_status(self) -> Dict[str, Any]:
+        """Get current rate limit status for configured and scoped identifiers."""
+        current_time = time.time()
+        status = {}
+        
+        # Scoped identifiers (model@scope) are only known from their ledger keys
+        prefix, suffix = f"{self.namespace}:", ":requests"
+        identifiers = list(self.limits)
+        for key in self.client.scan_iter(match=f"{prefix}*{suffix}"):
+            key = key.decode() if isinstance(key, bytes) else key
+            identifier = key[len(prefix):-len(suffix)]
+            if identifier not in identifiers:
+                identifiers.append(identifier)
+        
+        for identifier in identifiers:
+            limits = _limits_for(self.limits, self.default_limits, identifier)
+            requests_key = f"{self.namespace}:{identifier}:requests"
+            tokens = self.client.zrangebyscore(
+                f"{self.namespace}:{identifier}:tokens", current_time - self.MINUTE, '+inf'
+            )
+            identifier_status = {}
+            if 'rpm' in limits:
+                identifier_status['rpm'] = {
+                    'used': self.client.zcount(requests_key, current_time - self.MINUTE, '+inf'),
+                    'limit': limits['rpm']
+                }
+            if 'tpm' in limits:
+                used = sum(
+                    float((t.decode() if isinstance(t, bytes) else t).rsplit(':', 1)[1])
+                    for t in tokens
+                )
+                identifier_status['tpm'] = {'used': int(used), 'limit': limits['tpm']}
+            if 'rpd' in limits:
+                identifier_status['rpd'] = {
+                    'used': self.client.zcount(requests_key, current_time - self.DAY, '+inf'),
+                    'limit': limits['rpd']
+                }
+            identifier_status['errors'] = {
+                k: v for k, v in self.error_counts.items()
+                if k.startswith(identifier)
+            }
+            status[identifier] = identifier_status
+            
+        return status
+
+
+def create_rate_limiter(limits: Dict[str, Dict[str, Any]],
+                        config: Optional[Dict[str, Any]] = None) -> RateLimiter:
+    """
+    Create a sliding window rate limiter for the configured backend.
+    
+    Args:
+        limits: Rate limits per identifier
+        config: Provider configuration. Keys:
+            rate_limit_backend: 'memory' (per process, default), 'sqlite' or 'redis'
+            rate_limit_ledger_path: SQLite ledger file shared by all workers
+            rate_limit_redis_url: Redis URL (falls back to redis_url)
+            
+    Returns:
+        Rate limiter instance
+    """
+    config = config or {}
+    backend = config.get('rate_limit_backend') or 'memory'
+    
+    if backend == 'memory':
+        return WindowedRateLimiter(limits)
+    if backend == 'sqlite':
+        return SQLiteRateLimiter(limits, path=config.get('rate_limit_ledger_path'))
+    if backend == 'redis':
+        url = config.get('rate_limit_redis_url') or config.get('redis_url') or "redis://localhost:6379/0"
+        return RedisRateLimiter(limits, url=url)
+    raise ValueError(f"Unknown rate limit backend: {backend}")
@@ -0,0 +1,397 @@
+"""
+Low-overhead per-stage profiling of the episode pipeline.
+
+``PerformanceProfiler.profile_section`` runs cProfile and tracemalloc, which
+slows the profiled code several times over and is only usable offline. This
+module keeps cheap counters instead: every pipeline stage records wall time,
+CPU time of its thread and the change in allocated memory blocks and RSS,
+costing tens of microseconds per stage. For a closer look, an episode can be
+sampled: a background thread snapshots the stacks of the threads working on
+it every few milliseconds and aggregates them into collapsed stacks that
+flamegraph.pl, speedscope or inferno render directly.
+
+Stages are recorded against the episode profile active in the current
+context, so ``profile_stage`` is a no-op outside ``profile_episode`` and work
+handed to other threads with ``contextvars.copy_context`` is attributed to
+the right episode.
+"""
+
+import contextvars
+import os
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+import psutil
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Stack depth kept per sample; deeper frames are cut at the root side
+MAX_STACK_DEPTH = 128
+
+_current_profile: contextvars.ContextVar[Optional["EpisodeProfile"]] = contextvars.ContextVar(
+    "stage_profile", default=None
+)
+
+
+@dataclass
+class StageStats:
+    """Accumulated cost of one pipeline stage within an episode."""
+    name: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    allocated_blocks: int = 0
+    rss_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'wall_seconds': self.wall_seconds,
+            'cpu_seconds': self.cpu_seconds,
+            'allocated_blocks': self.allocated_blocks,
+            'rss_bytes': self.rss_bytes
+        }
+
+
+@dataclass
+class EpisodeProfile:
+    """
+    Stage costs of one episode and, if sampled, its collapsed stacks.
+
+    Allocated blocks and RSS are process-wide, so with several episodes in
+    flight they include the other episodes' allocations.
+    """
+    episode_id: str
+    sampled: bool = False
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    wall_seconds: float = 0.0
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    stacks: Counter = field(default_factory=Counter)
+    sample_count: int = 0
+    flamegraph_path: Optional[str] = None
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+        # Open stages per thread, innermost last; read by the sampler
+        self._active: Dict[int, List[str]] = {}
+
+    def record(self, name: str, wall: float, cpu: float, blocks: int, rss: int) -> None:
+        """Add one run of a stage."""
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats(name)
+            stats.calls += 1
+            stats.wall_seconds += wall
+            stats.cpu_seconds += cpu
+            stats.allocated_blocks += blocks
+            stats.rss_bytes += rss
+
+    def enter(self, name: str) -> None:
+        """Mark a stage as running on the current thread."""
+        with self._lock:
+            self._active.setdefault(threading.get_ident(), []).append(name)
+
+    def exit(self) -> None:
+        """Mark the current thread's innermost stage as finished."""
+        thread_id = threading.get_ident()
+        with self._lock:
+            stages = self._active.get(thread_id)
+            if stages:
+                stages.pop()
+            if not stages:
+                self._active.pop(thread_id, None)
+
+    def active_stages(self) -> Dict[int, str]:
+        """Innermost running stage per thread."""
+        with self._lock:
+            return {thread_id: stages[-1] for thread_id, stages in self._active.items() if stages}
+
+    def add_sample(self, stack: str) -> None:
+        """Count one sampled stack."""
+        with self._lock:
+            self.stacks[stack] += 1
+            self.sample_count += 1
+
+    def collapsed_stacks(self) -> str:
+        """Samples in collapsed-stack format, one ``frame;frame;... count`` per line."""
+        with self._lock:
+            return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+    def write_flamegraph(self, path: Union[str, Path]) -> Path:
+        """
+        Write the collapsed stacks to a file.
+
+        Args:
+            path: Output file, conventionally ``*.folded``
+
+        Returns:
+            Path written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.collapsed_stacks())
+        self.flamegraph_path = str(path)
+        return path
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary, without the stacks."""
+        with self._lock:
+            stages = [stats.to_dict() for stats in self.stages.values()]
+        return {
+            'episode_id': self.episode_id,
+            'started_at': self.started_at,
+            'wall_seconds': self.wall_seconds,
+            'sampled': self.sampled,
+            'sample_count': self.sample_count,
+            'flamegraph_path': self.flamegraph_path,
+            'stages': stages
+        }
+
+
+_process: Optional[psutil.Process] = None
+
+
+def _current_process() -> psutil.Process:
+    """Handle of this process, recreated after a fork."""
+    global _process
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process()
+    return _process
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get('__name__', '?')
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class StackSampler:
+    """Periodically records the stacks of the threads working on an episode."""
+
+    def __init__(self, profile: EpisodeProfile, interval: float = 0.005):
+        """
+        Initialize sampler.
+
+        Args:
+            profile: Episode profile receiving the samples
+            interval: Seconds between samples
+        """
+        self.profile = profile
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"stack-sampler-{profile.episode_id}", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Record the current stack of every thread in a stage of the episode."""
+        active = self.profile.active_stages()
+        if not active:
+            return
+        frames = sys._current_frames()
+        for thread_id, stage in active.items():
+            frame = frames.get(thread_id)
+            labels = []
+            while frame is not None and len(labels) < MAX_STACK_DEPTH:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.reverse()
+            self.profile.add_sample(";".join([self.profile.episode_id, stage] + labels))
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """
+    Record the cost of a pipeline stage in the active episode profile.
+
+    Does nothing when no episode is being profiled.
+
+    Args:
+        name: Stage name, e.g. ``extraction``
+
+    Example:
+        with profile_stage("entity_resolution"):
+            resolved = resolver.resolve_entities(entities)
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+
+    profile.enter(name)
+    process = _current_process()
+    rss_start = process.memory_info().rss
+    blocks_start = sys.getallocatedblocks()
+    cpu_start = time.thread_time()
+    wall_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        blocks = sys.getallocatedblocks() - blocks_start
+        rss = process.memory_info().rss - rss_start
+        profile.exit()
+        profile.record(name, wall, cpu, blocks, rss)
+
+
+def current_episode_profile() -> Optional[EpisodeProfile]:
+    """Profile of the episode being processed in the current context."""
+    return _current_profile.get()
+
+
+class StageProfiler:
+    """Creates episode profiles and keeps the most recent ones for inspection."""
+
+    def __init__(self, max_profiles: int = 100, sample_interval: float = 0.005,
+                 output_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            max_profiles: Number of recent episode profiles to keep
+            sample_interval: Default seconds between stack samples
+            output_dir: Directory for flamegraph files of sampled episodes
+        """
+        self.max_profiles = max_profiles
+        self.sample_interval = sample_interval
+        self.output_dir = Path(output_dir) if output_dir else None
+        self._profiles: "OrderedDict[str, EpisodeProfile]" = OrderedDict()
+        self._requested: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def request_sampling(self, episode_id: str) -> None:
+        """Sample the stacks of an episode the next time it is processed."""
+        with self._lock:
+            self._requested.add(episode_id)
+
+    def pending_requests(self) -> List[str]:
+        """Episodes waiting to be sampled."""
+        with self._lock:
+            return sorted(self._requested)
+
+    @contextmanager
+    def profile_episode(self, episode_id: str, sample: bool = False,
+                        sample_interval: Optional[float] = None,
+                        output_dir: Optional[Union[str, Path]] = None) -> Iterator[EpisodeProfile]:
+        """
+        Profile the stages of one episode.
+
+        Args:
+            episode_id: Episode identifier
+            sample: Sample stacks for a flamegraph; also done if sampling was
+                requested for this episode
+            sample_interval: Seconds between stack samples
+            output_dir: Directory for the flamegraph file
+
+        Yields:
+            The episode profile, complete once the block exits
+        """
+        with self._lock:
+            if episode_id in self._requested:
+                self._requested.discard(episode_id)
+                sample = True
+
+        profile = EpisodeProfile(episode_id=episode_id, sampled=sample)
+        token = _current_profile.set(profile)
+        sampler = None
+        if sample:
+            sampler = StackSampler(profile, sample_interval or self.sample_interval)
+            sampler.start()
+
+        start = time.perf_counter()
+        profile.enter("episode")
+        try:
+            yield profile
+        finally:
+            profile.exit()
+            profile.wall_seconds = time.perf_counter() - start
+            if sampler is not None:
+                sampler.stop()
+            _current_profile.reset(token)
+            self._finish(profile, output_dir or self.output_dir)
+
+    def _finish(self, profile: EpisodeProfile, output_dir: Optional[Union[str, Path]]) -> None:
+        if profile.sampled and output_dir:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            safe_id = "".join(c if c.isalnum() or c in '-_' else '_' for c in profile.episode_id)
+            try:
+                path = profile.write_flamegraph(Path(output_dir) / f"{safe_id}_{timestamp}.folded")
+                logger.info(f"Wrote flamegraph stacks for episode {profile.episode_id} to {path}")
+            except OSError as e:
+                logger.warning(f"Failed to write flamegraph for episode {profile.episode_id}: {e}")
+
+        with self._lock:
+            self._profiles.pop(profile.episode_id, None)
+            self._profiles[profile.episode_id] = profile
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+        summary = ", ".join(
+            f"{stats.name} {stats.wall_seconds:.2f}s (cpu {stats.cpu_seconds:.2f}s)"
+            for stats in profile.stages.values()
+        )
+        logger.info(f"Episode {profile.episode_id} took {profile.wall_seconds:.2f}s: {summary}")
+
+        try:
+            from ..api.metrics import get_metrics_collector
+            histogram = get_metrics_collector().processing_duration
+            for stats in profile.stages.values():
+                histogram.observe(stats.wall_seconds, labels={"stage": stats.name})
+        except Exception as e:
+            logger.debug(f"Could not record stage metrics: {e}")
+
+    def get_profile(self, episode_id: str) -> Optional[EpisodeProfile]:
+        """Most recent profile of an episode, if still kept."""
+        with self._lock:
+            return self._profiles.get(episode_id)
+
+    def recent_profiles(self) -> List[EpisodeProfile]:
+        """Kept profiles, most recent first."""
+        with self._lock:
+            return list(reversed(self._profiles.values()))
+
+    def clear(self) -> None:
+        """Drop kept profiles and pending sampling requests."""
+        with self._lock:
+            self._profiles.clear()
+            self._requested.clear()
+
+
+# Global profiler instance
+_stage_profiler: Optional[StageProfiler] = None
+
+
+def get_stage_profiler() -> StageProfiler:
+    """Get the global stage profiler."""
+    global _stage_profiler
+    if _stage_profiler is None:
+        _stage_profiler = StageProfiler(
+            output_dir=os.environ.get("PROFILE_OUTPUT_DIR") or None
+        )
+    return _stage_profiler
@@ -0,0 +1,911 @@
+"""
+Offline end-to-end throughput benchmark.
+
+Runs episodes of a synthetic corpus through the pipeline executor and storage
+coordinator, with the mock providers in place of Whisper, Gemini, sentence
+transformers and Neo4j. Stage timings (transcription and segmentation,
+knowledge extraction, embedding, graph storage and episode analysis) come
+from the executor's stage profiles.
+Provider calls are delayed by seeded latency models with jitter and rate
+limits, which keeps results reproducible while still exposing contention,
+queueing and scaling effects.
+
+The report contains per-stage throughput and p50/p99 latencies, peak RSS and
+a scaling curve across worker counts, and is compared against the JSON
+baselines in this directory.
+
+Usage:
+    python -m tests.benchmarks.offline_benchmark
+    python -m tests.benchmarks.offline_benchmark --episodes 40 --segments 30 --workers 1 2 4 8
+    python -m tests.benchmarks.offline_benchmark --update-baseline
+"""
+
+import argparse
+import json
+import logging
+import math
+import random
+import re
+import sys
+import threading
+import time
+import warnings
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import psutil
+
+from src.core.interfaces import DiarizationSegment, TranscriptSegment
+from src.processing.discourse_flow import DiscourseFlowTracker
+from src.processing.emergent_themes import EmergentThemeDetector
+from src.processing.entity_resolution import EntityResolver
+from src.processing.episode_flow import EpisodeFlowAnalyzer
+from src.processing.extraction import KnowledgeExtractor
+from src.processing.segmentation import EnhancedPodcastSegmenter
+from src.providers.audio.mock import MockAudioProvider
+from src.providers.embeddings.cache import get_embedding_cache
+from src.providers.embeddings.mock import MockEmbeddingProvider
+from src.providers.graph.enhancements import GraphEnhancements
+from src.providers.graph.memory import InMemoryGraphProvider
+from src.providers.llm.mock import MockLLMProvider
+from src.seeding.components.pipeline_executor import PipelineExecutor
+from src.seeding.components.storage_coordinator import StorageCoordinator
+from src.utils.stage_profiling import StageProfiler, current_episode_profile, profile_stage
+
+
+BENCHMARK_DIR = Path(__file__).parent
+OFFLINE_BASELINE_FILE = BENCHMARK_DIR / "offline_baseline.json"
+BASELINE_METRICS_FILE = BENCHMARK_DIR / "baseline_metrics.json"
+
+STAGES = ("transcribe", "extract", "embed", "store", "analyze")
+
+# Executor profile stages making up each reported stage
+PROFILED_STAGES = {
+    "transcribe": ("segmentation",),
+    "extract": ("extraction",),
+    "embed": ("embedding",),
+    "store": ("storage",),
+    "analyze": ("entity_resolution", "discourse_flow", "emergent_themes", "episode_flow"),
+}
+
+PODCAST = {"id": "synthetic", "name": "Synthetic Podcast"}
+
+# Segment texts start with a marker the mock LLM uses to find its response
+MARKER_PATTERN = re.compile(r"\[(ep\d+-seg\d+)\]")
+
+
+@dataclass
+class LatencyModel:
+    """
+    Modeled latency of one provider call, in seconds of simulated time.
+
+    Latency is ``mean + per_item * items``, multiplied by log-normal jitter
+    with mean one. Calls are drawn from a generator seeded by the call's key,
+    so the same call sleeps the same time whatever the thread interleaving.
+    """
+    mean: float
+    jitter: float = 0.0
+    per_item: float = 0.0
+    rate_per_second: Optional[float] = None
+    burst: int = 1
+
+    def sample(self, key: str, items: int = 1, seed: int = 0) -> float:
+        """Latency of the call identified by ``key``."""
+        latency = self.mean + self.per_item * items
+        if self.jitter:
+            rng = random.Random(zlib.crc32(key.encode("utf-8")) ^ seed)
+            latency *= math.exp(self.jitter * rng.gauss(0.0, 1.0) - self.jitter ** 2 / 2)
+        return latency
+
+
+# Rough latencies of the real providers per call
+DEFAULT_LATENCY_MODELS = {
+    "transcribe": LatencyModel(mean=2.0, jitter=0.2),
+    "diarize": LatencyModel(mean=1.0, jitter=0.2),
+    "complete": LatencyModel(mean=1.2, jitter=0.3, rate_per_second=4.0, burst=4),
+    "generate_embeddings": LatencyModel(mean=0.02, jitter=0.1, per_item=0.002),
+    "create_node": LatencyModel(mean=0.005, jitter=0.2),
+    "create_relationship": LatencyModel(mean=0.005, jitter=0.2),
+}
+
+
+class RateLimiter:
+    """Thread-safe token bucket."""
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate_per_second: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, waiting for one if necessary. Returns seconds waited."""
+        with self._lock:
+            now = time.perf_counter()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class LatencyInjector:
+    """Delays provider methods according to latency models."""
+
+    def __init__(self, models: Dict[str, LatencyModel], time_scale: float = 1.0, seed: int = 0):
+        """
+        Initialize injector.
+
+        Args:
+            models: Latency model per method name
+            time_scale: Real seconds slept per simulated second; 0 disables
+                delays and rate limits
+            seed: Seed mixed into every latency draw
+        """
+        self.models = models
+        self.time_scale = time_scale
+        self.seed = seed
+        self.rate_wait = 0.0
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def wrap(self, provider: Any, method_name: str,
+             items: Optional[Callable[..., int]] = None) -> None:
+        """
+        Replace a provider method with one sleeping the modeled latency first.
+
+        The method is patched on the instance, so the provider keeps its type.
+
+        Args:
+            provider: Provider instance
+            method_name: Method to delay
+            items: Number of items in a call, from the call's arguments
+        """
+        model = self.models.get(method_name)
+        if model is None:
+            return
+
+        original = getattr(provider, method_name)
+        limiter = None
+        if model.rate_per_second and self.time_scale > 0:
+            limiter = RateLimiter(model.rate_per_second / self.time_scale, model.burst)
+            self._limiters[method_name] = limiter
+
+        def delayed(*args, **kwargs):
+            if limiter is not None:
+                waited = limiter.acquire()
+                if waited:
+                    with self._lock:
+                        self.rate_wait += waited
+            count = items(*args, **kwargs) if items else 1
+            key = f"{method_name}:{args[0] if args else ''}"
+            time.sleep(model.sample(key, count, self.seed) * self.time_scale)
+            return original(*args, **kwargs)
+
+        setattr(provider, method_name, delayed)
+
+
+@dataclass
+class BenchmarkConfig:
+    """Size of the synthetic corpus and how to run it."""
+    episodes: int = 12
+    segments: int = 20
+    entities: int = 6
+    vocabulary: int = 120
+    workers: Sequence[int] = (1, 2, 4)
+    time_scale: float = 0.01
+    seed: int = 42
+    latency: Dict[str, LatencyModel] = field(
+        default_factory=lambda: dict(DEFAULT_LATENCY_MODELS)
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for the report."""
+        data = asdict(self)
+        data["workers"] = list(self.workers)
+        return data
+
+
+@dataclass
+class SyntheticEpisode:
+    """Episode of the synthetic corpus with the extraction the LLM returns."""
+    id: str
+    title: str
+    audio_path: str
+    segments: List[TranscriptSegment]
+    responses: Dict[str, str]
+
+
+ENTITY_TYPES = ("TECHNOLOGY", "CONCEPT", "PERSON", "ORGANIZATION", "PRODUCT")
+NAME_PREFIXES = ("Quantum", "Neural", "Adaptive", "Open", "Deep", "Sparse",
+                 "Graph", "Solar", "Vector", "Civic", "Hidden", "Kinetic")
+NAME_SUFFIXES = ("Lattice", "Protocol", "Networks", "Foundation", "Engine",
+                 "Theory", "Markets", "Labs", "Memory", "Atlas")
+FILLER_WORDS = ("we", "talked", "about", "how", "the", "team", "thinks",
+                "that", "really", "changes", "what", "people", "expect",
+                "from", "research", "and", "practice", "today")
+SPEAKERS = ("Host", "Guest")
+
+
+def _entity_vocabulary(size: int) -> List[str]:
+    """Distinct entity names, most frequent first."""
+    names = [f"{prefix} {suffix}" for suffix in NAME_SUFFIXES for prefix in NAME_PREFIXES]
+    if size <= len(names):
+        return names[:size]
+    return names + [f"{names[i % len(names)]} {i // len(names) + 1}"
+                    for i in range(len(names), size)]
+
+
+def generate_corpus(config: BenchmarkConfig) -> List[SyntheticEpisode]:
+    """
+    Generate a deterministic corpus of episodes.
+
+    Every segment mentions ``config.entities`` entities drawn from a shared
+    Zipf-weighted vocabulary, so popular entities recur across episodes as
+    they do in a real podcast feed.
+
+    Args:
+        config: Benchmark configuration
+
+    Returns:
+        List of synthetic episodes
+    """
+    rng = random.Random(config.seed)
+    vocabulary = _entity_vocabulary(config.vocabulary)
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    entities_per_segment = min(config.entities, len(vocabulary))
+
+    corpus = []
+    for e in range(config.episodes):
+        episode_id = f"ep{e:03d}"
+        segments = []
+        responses = {}
+        start = 0.0
+        for s in range(config.segments):
+            marker = f"{episode_id}-seg{s:03d}"
+            mentioned: List[str] = []
+            while len(mentioned) < entities_per_segment:
+                name = rng.choices(vocabulary, weights)[0]
+                if name not in mentioned:
+                    mentioned.append(name)
+
+            sentences = []
+            for name in mentioned:
+                filler = " ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(6, 12)))
+                sentences.append(f"{filler.capitalize()} {name}.")
+            text = f"[{marker}] " + " ".join(sentences)
+            duration = len(text.split()) / 2.5
+
+            segments.append(TranscriptSegment(
+                id=marker,
+                text=text,
+                start_time=start,
+                end_time=start + duration,
+                confidence=0.9
+            ))
+            start += duration
+
+            # Insights are left out: the combined parser cannot read them yet
+            responses[marker] = json.dumps({
+                "entities": [
+                    {
+                        "name": name,
+                        "type": ENTITY_TYPES[vocabulary.index(name) % len(ENTITY_TYPES)],
+                        "description": f"{name} as discussed in {episode_id}",
+                        "importance": rng.randint(3, 9),
+                        "frequency": 1
+                    }
+                    for name in mentioned
+                ],
+                "insights": [],
+                "quotes": [{
+                    "text": sentences[0],
+                    "speaker": SPEAKERS[s % len(SPEAKERS)],
+                    "context": marker
+                }]
+            })
+
+        corpus.append(SyntheticEpisode(
+            id=episode_id,
+            title=f"Synthetic episode {e}",
+            audio_path=f"/synthetic/{episode_id}.mp3",
+            segments=segments,
+            responses=responses
+        ))
+
+    return corpus
+
+
+class CorpusAudioProvider(MockAudioProvider):
+    """Mock audio provider transcribing the synthetic corpus."""
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.corpus = {episode.audio_path: episode for episode in config.get("corpus", [])}
+
+    def transcribe(self, audio_path: str) -> List[TranscriptSegment]:
+        """Return the episode's segments."""
+        return list(self.corpus[audio_path].segments)
+
+    def diarize(self, audio_path: str) -> List[DiarizationSegment]:
+        """Alternate speakers segment by segment."""
+        return [
+            DiarizationSegment(
+                speaker=SPEAKERS[i % len(SPEAKERS)],
+                start_time=segment.start_time,
+                end_time=segment.end_time,
+                confidence=0.9
+            )
+            for i, segment in enumerate(self.corpus[audio_path].segments)
+        ]
+
+
+class CorpusLLMProvider(MockLLMProvider):
+    """Mock LLM provider answering extraction prompts of the synthetic corpus."""
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.corpus_responses = {}
+        for episode in config.get("corpus", []):
+            self.corpus_responses.update(episode.responses)
+        self._count_lock = threading.Lock()
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        """Return the extraction for the segment in the prompt."""
+        with self._count_lock:
+            self.call_count += 1
+        match = MARKER_PATTERN.search(prompt)
+        if match is None:
+            return self.default_response
+        return self.corpus_responses.get(match.group(1), self.default_response)
+
+
+class StageRecorder:
+    """Collects stage timings from the worker threads."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        self.items: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float, items: int) -> None:
+        """Record one run of a stage."""
+        with self._lock:
+            self.latencies[stage].append(seconds)
+            self.items[stage] += items
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage latency percentiles and single-stream throughput."""
+        stages = {}
+        for stage in STAGES:
+            latencies = sorted(self.latencies[stage])
+            total = sum(latencies)
+            stages[stage] = {
+                "runs": len(latencies),
+                "items": self.items[stage],
+                "total_seconds": total,
+                "mean": total / len(latencies) if latencies else 0.0,
+                "p50": percentile(latencies, 50),
+                "p99": percentile(latencies, 99),
+                "items_per_second": self.items[stage] / total if total else 0.0,
+            }
+        return stages
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Percentile of sorted values with linear interpolation."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class PeakRSSSampler:
+    """Samples the process RSS in a background thread."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self) -> None:
+        self.peak_mb = max(self.peak_mb, self._process.memory_info().rss / (1024 * 1024))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "PeakRSSSampler":
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+class CorpusGraphProvider(InMemoryGraphProvider):
+    """
+    In-memory graph shared by the worker threads.
+
+    Nodes are merged by id, like ``MERGE`` in Neo4j: the existence check and
+    the write happen under one lock, so episodes mentioning the same entity
+    at the same time create it once. Relationships are also accepted in the
+    ``(label, {"id": ...}), type, (label, {"id": ...})`` form the storage
+    coordinator writes.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.writes = 0
+        self._write_lock = threading.Lock()
+
+    def create_node(self, node_type: str, properties: Dict[str, Any]) -> str:
+        """Create a node, or update the node with the same id."""
+        with self._write_lock:
+            self.writes += 1
+            node_id = properties.get("id")
+            if node_id is None or node_id not in self.nodes:
+                return super().create_node(node_type, properties)
+            self.nodes[node_id].update(properties)
+            self.node_labels[node_id].add(node_type)
+            return node_id
+
+    def create_relationship(self, source: Any, target: Any, rel_type: Any,
+                            properties: Optional[Dict[str, Any]] = None) -> None:
+        """Create a relationship between node ids or node references."""
+        if isinstance(source, tuple):
+            # Called as (source_ref, rel_type, target_ref, properties)
+            source, target, rel_type = source[1]["id"], rel_type[1]["id"], target
+        with self._write_lock:
+            self.writes += 1
+            super().create_relationship(source, target, rel_type, properties)
+
+
+class SegmentKnowledgeExtractor:
+    """
+    Episode-level ``extract_knowledge`` running the combined extraction per segment.
+
+    Results are returned in the shape the executor's consumers read: entities
+    also carry their type and confidence as ``type`` and ``confidence`` for
+    the entity resolver and storage coordinator, and insights and quotes are
+    dictionaries.
+    """
+
+    def __init__(self, extractor: KnowledgeExtractor):
+        self.extractor = extractor
+
+    def extract_knowledge(self, segments, episode_metadata: Optional[Dict[str, Any]] = None,
+                          use_large_context: bool = False) -> Dict[str, Any]:
+        """Extract entities, insights and quotes from every segment."""
+        metadata = episode_metadata or {}
+        entities, insights, quotes = [], [], []
+        for segment in segments:
+            result = self.extractor.extract_combined(
+                segment["text"], metadata.get("podcast_name"), metadata.get("title")
+            )
+            for entity in result.entities:
+                entity.type = entity.entity_type
+                entity.confidence = entity.confidence_score
+                entities.append(entity)
+            insights.extend(insight.to_dict() for insight in result.insights)
+            quotes.extend(quote.to_dict() for quote in result.quotes)
+        return {"entities": entities, "insights": insights, "quotes": quotes}
+
+
+class MemoryCheckpoint:
+    """Checkpoint manager keeping completed episodes in memory."""
+
+    def __init__(self):
+        self.completed: Dict[str, Dict[str, Any]] = {}
+
+    def is_completed(self, episode_id: str) -> bool:
+        return episode_id in self.completed
+
+    def save_progress(self, episode_id: str, stage: str, data: Any) -> None:
+        pass
+
+    def save_schema_evolution(self, episode_id: str, types: List[str]) -> None:
+        pass
+
+    def mark_completed(self, episode_id: str, result: Dict[str, Any]) -> None:
+        self.completed[episode_id] = result
+
+
+class OfflineExecutor(PipelineExecutor):
+    """Pipeline executor reading the corpus audio in place of downloading it."""
+
+    def _download_episode_audio(self, episode: Dict[str, Any], podcast_id: str) -> str:
+        return episode["audio_url"]
+
+
+class OfflinePipeline:
+    """Runs the pipeline executor for one benchmark run against latency-modeled mocks."""
+
+    def __init__(self, corpus: List[SyntheticEpisode], config: BenchmarkConfig):
+        """
+        Initialize providers, processors and the executor for one run.
+
+        The components are wired like ``ProviderCoordinator`` wires them, with
+        the mock providers in place of Whisper, Gemini, sentence transformers
+        and Neo4j.
+
+        Args:
+            corpus: Synthetic episodes
+            config: Benchmark configuration
+        """
+        self.injector = LatencyInjector(config.latency, config.time_scale, config.seed)
+        self.recorder = StageRecorder()
+        self._embedded: Dict[str, int] = {}
+        self._embedded_lock = threading.Lock()
+
+        self.audio_provider = CorpusAudioProvider({"corpus": corpus})
+        self.llm_provider = CorpusLLMProvider({"corpus": corpus, "default_response": "{}"})
+        embedder = MockEmbeddingProvider({"dimension": 384})
+        self.graph_provider = CorpusGraphProvider({})
+        self.graph_provider.connect()
+
+        self.injector.wrap(self.audio_provider, "transcribe")
+        self.injector.wrap(self.audio_provider, "diarize")
+        self.injector.wrap(self.llm_provider, "complete")
+        self.injector.wrap(embedder, "generate_embeddings", items=lambda texts: len(texts))
+        self.injector.wrap(self.graph_provider, "create_node")
+        self.injector.wrap(self.graph_provider, "create_relationship")
+        self._profile_embeddings(embedder)
+        self.embedding_provider = get_embedding_cache(embedder)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            extractor = KnowledgeExtractor(self.llm_provider, self.embedding_provider, max_retries=1)
+        providers = SimpleNamespace(
+            segmenter=EnhancedPodcastSegmenter(self.audio_provider),
+            knowledge_extractor=SegmentKnowledgeExtractor(extractor),
+            entity_resolver=EntityResolver(),
+            discourse_flow_tracker=DiscourseFlowTracker(),
+            emergent_theme_detector=EmergentThemeDetector(self.embedding_provider, self.llm_provider),
+            episode_flow_analyzer=EpisodeFlowAnalyzer(self.embedding_provider),
+            graph_provider=self.graph_provider,
+            llm_provider=self.llm_provider,
+            embedding_provider=self.embedding_provider,
+        )
+        # Graph enhancement runs Cypher against Neo4j sessions
+        executor_config = SimpleNamespace(enhance_graph=False, delete_audio_after_processing=False)
+        self.executor = OfflineExecutor(
+            executor_config,
+            providers,
+            MemoryCheckpoint(),
+            StorageCoordinator(self.graph_provider, GraphEnhancements(), executor_config)
+        )
+        self.executor.stage_profiler = StageProfiler(max_profiles=len(corpus))
+
+    def _profile_embeddings(self, provider: Any) -> None:
+        """Record embedding calls as a stage of the calling episode."""
+        generate = provider.generate_embeddings
+
+        def profiled(texts):
+            profile = current_episode_profile()
+            if profile is not None:
+                with self._embedded_lock:
+                    self._embedded[profile.episode_id] = (
+                        self._embedded.get(profile.episode_id, 0) + len(texts)
+                    )
+            with profile_stage("embedding"):
+                return generate(texts)
+
+        provider.generate_embeddings = profiled
+
+    def process_episode(self, episode: SyntheticEpisode) -> None:
+        """Run one episode through the executor and record its stages."""
+        result = self.executor.process_episode(
+            PODCAST,
+            {"id": episode.id, "title": episode.title, "audio_url": episode.audio_path},
+            use_large_context=False
+        )
+        profile = self.executor.stage_profiler.get_profile(episode.id)
+        items = {
+            "transcribe": result["segments"],
+            "extract": result["segments"],
+            "embed": self._embedded.get(episode.id, 0),
+            "store": result["segments"],
+            "analyze": 1,
+        }
+        for stage, names in PROFILED_STAGES.items():
+            seconds = sum(profile.stages[name].wall_seconds
+                          for name in names if name in profile.stages)
+            self.recorder.record(stage, seconds, items[stage])
+
+
+def run_benchmark(config: BenchmarkConfig,
+                  corpus: Optional[List[SyntheticEpisode]] = None) -> Dict[str, Any]:
+    """
+    Run the corpus once per worker count.
+
+    Args:
+        config: Benchmark configuration
+        corpus: Corpus to process, generated from the config if not given
+
+    Returns:
+        Benchmark report
+    """
+    corpus = corpus if corpus is not None else generate_corpus(config)
+    total_segments = sum(len(episode.segments) for episode in corpus)
+
+    # Load the lazily imported processing dependencies outside the timed runs
+    if corpus:
+        OfflinePipeline(corpus[:1], replace(config, time_scale=0)).process_episode(corpus[0])
+
+    runs = []
+    for workers in config.workers:
+        pipeline = OfflinePipeline(corpus, config)
+        with PeakRSSSampler() as rss:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # list() re-raises the first failure
+                list(executor.map(pipeline.process_episode, corpus))
+            wall = time.perf_counter() - start
+
+        runs.append({
+            "workers": workers,
+            "wall_seconds": wall,
+            "episodes_per_minute": len(corpus) / wall * 60 if wall else 0.0,
+            "segments_per_second": total_segments / wall if wall else 0.0,
+            "peak_rss_mb": rss.peak_mb,
+            "rate_limit_wait_seconds": pipeline.injector.rate_wait,
+            "llm_calls": pipeline.llm_provider.call_count,
+            "graph_nodes": len(pipeline.graph_provider.nodes),
+            "graph_writes": pipeline.graph_provider.writes,
+            "stages": pipeline.recorder.summary(),
+        })
+
+    base = runs[0] if runs else None
+    scaling = []
+    for run in runs:
+        speedup = base["wall_seconds"] / run["wall_seconds"] if run["wall_seconds"] else 0.0
+        scaling.append({
+            "workers": run["workers"],
+            "speedup": speedup,
+            "efficiency": speedup * base["workers"] / run["workers"],
+        })
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "config": config.to_dict(),
+        "corpus": {"episodes": len(corpus), "segments": total_segments},
+        "runs": runs,
+        "scaling": scaling,
+    }
+
+
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """
+    Compare a report against an offline baseline.
+
+    Throughput may drop and stage p99 latency and peak RSS may grow by the
+    baseline's tolerances before counting as a regression. Latency growth
+    below ``latency_floor`` seconds is ignored, since millisecond stages are
+    dominated by thread scheduling noise. Runs with worker counts missing
+    from the baseline are skipped.
+
+    Args:
+        report: Benchmark report
+        baseline: Baseline with ``tolerances`` and ``runs``
+
+    Returns:
+        List of regression messages
+    """
+    tolerances = baseline.get("tolerances", {})
+    throughput_tolerance = tolerances.get("throughput", 0.2)
+    latency_tolerance = tolerances.get("latency", 0.5)
+    latency_floor = tolerances.get("latency_floor", 0.1)
+    memory_tolerance = tolerances.get("memory", 0.5)
+    baseline_runs = {run["workers"]: run for run in baseline.get("runs", [])}
+
+    regressions = []
+    for run in report["runs"]:
+        expected = baseline_runs.get(run["workers"])
+        if expected is None:
+            continue
+        label = f"{run['workers']} workers"
+
+        if run["episodes_per_minute"] < expected["episodes_per_minute"] * (1 - throughput_tolerance):
+            regressions.append(
+                f"{label}: throughput {run['episodes_per_minute']:.1f} episodes/min "
+                f"vs baseline {expected['episodes_per_minute']:.1f}"
+            )
+
+        for stage, stats in run["stages"].items():
+            expected_p99 = expected["stages"].get(stage, {}).get("p99")
+            if (expected_p99
+                    and stats["p99"] > expected_p99 * (1 + latency_tolerance)
+                    and stats["p99"] - expected_p99 > latency_floor):
+                regressions.append(
+                    f"{label}: {stage} p99 {stats['p99'] * 1000:.1f}ms "
+                    f"vs baseline {expected_p99 * 1000:.1f}ms"
+                )
+
+        if run["peak_rss_mb"] > expected["peak_rss_mb"] * (1 + memory_tolerance):
+            regressions.append(
+                f"{label}: peak RSS {run['peak_rss_mb']:.0f}MB "
+                f"vs baseline {expected['peak_rss_mb']:.0f}MB"
+            )
+
+    return regressions
+
+
+def check_thresholds(report: Dict[str, Any], metrics: Dict[str, Any]) -> List[str]:
+    """
+    Check a report against the absolute limits of ``baseline_metrics.json``.
+
+    Args:
+        report: Benchmark report
+        metrics: Baseline metrics with ``thresholds``
+
+    Returns:
+        List of violated thresholds
+    """
+    thresholds = metrics.get("thresholds", {})
+    violations = []
+
+    peak_limit = thresholds.get("memory_usage", {}).get("peak")
+    concurrent = thresholds.get("concurrent_processing", {})
+    for run in report["runs"]:
+        if peak_limit and run["peak_rss_mb"] > peak_limit:
+            violations.append(
+                f"{run['workers']} workers: peak RSS {run['peak_rss_mb']:.0f}MB "
+                f"exceeds {peak_limit}MB"
+            )
+        if (run["workers"] == concurrent.get("max_workers")
+                and run["episodes_per_minute"] < concurrent.get("episodes_per_minute", 0)):
+            violations.append(
+                f"{run['workers']} workers: {run['episodes_per_minute']:.1f} episodes/min "
+                f"below {concurrent['episodes_per_minute']}"
+            )
+
+    return violations
+
+
+def config_matches(report: Dict[str, Any], baseline: Dict[str, Any]) -> bool:
+    """Whether a baseline was recorded with the same corpus and latency setup."""
+    keys = ("episodes", "segments", "entities", "vocabulary", "time_scale", "seed", "latency")
+    current = report["config"]
+    recorded = baseline.get("config", {})
+    return all(current.get(key) == recorded.get(key) for key in keys)
+
+
+def make_baseline(report: Dict[str, Any], tolerances: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Turn a report into a baseline file."""
+    return {
+        "version": "1.0.0",
+        "timestamp": report["timestamp"],
+        "config": report["config"],
+        "tolerances": tolerances or {
+            "throughput": 0.2, "latency": 0.5, "latency_floor": 0.1, "memory": 0.5
+        },
+        "runs": [
+            {
+                "workers": run["workers"],
+                "episodes_per_minute": run["episodes_per_minute"],
+                "peak_rss_mb": run["peak_rss_mb"],
+                "stages": {stage: {"p50": stats["p50"], "p99": stats["p99"]}
+                           for stage, stats in run["stages"].items()},
+            }
+            for run in report["runs"]
+        ],
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable summary of a report."""
+    lines = [
+        f"Corpus: {report['corpus']['episodes']} episodes, "
+        f"{report['corpus']['segments']} segments "
+        f"(time scale {report['config']['time_scale']})",
+        "",
+        f"{'workers':>7} {'wall s':>8} {'ep/min':>9} {'seg/s':>8} {'RSS MB':>8} {'speedup':>8} {'eff':>6}",
+    ]
+    for run, scale in zip(report["runs"], report["scaling"]):
+        lines.append(
+            f"{run['workers']:>7} {run['wall_seconds']:>8.2f} {run['episodes_per_minute']:>9.1f} "
+            f"{run['segments_per_second']:>8.1f} {run['peak_rss_mb']:>8.0f} "
+            f"{scale['speedup']:>8.2f} {scale['efficiency']:>6.2f}"
+        )
+
+    for run in report["runs"]:
+        lines.extend(["", f"Stages with {run['workers']} workers:",
+                      f"  {'stage':<11} {'p50 ms':>9} {'p99 ms':>9} {'items/s':>10}"])
+        for stage, stats in run["stages"].items():
+            lines.append(
+                f"  {stage:<11} {stats['p50'] * 1000:>9.1f} {stats['p99'] * 1000:>9.1f} "
+                f"{stats['items_per_second']:>10.1f}"
+            )
+
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    defaults = BenchmarkConfig()
+    parser = argparse.ArgumentParser(description="Offline pipeline throughput benchmark")
+    parser.add_argument("--episodes", type=int, default=defaults.episodes)
+    parser.add_argument("--segments", type=int, default=defaults.segments,
+                        help="Segments per episode")
+    parser.add_argument("--entities", type=int, default=defaults.entities,
+                        help="Entities mentioned per segment")
+    parser.add_argument("--vocabulary", type=int, default=defaults.vocabulary,
+                        help="Distinct entities across the corpus")
+    parser.add_argument("--workers", type=int, nargs="+", default=list(defaults.workers))
+    parser.add_argument("--time-scale", type=float, default=defaults.time_scale,
+                        help="Real seconds slept per modeled second")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--baseline", type=Path, default=OFFLINE_BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the results as the new baseline")
+    parser.add_argument("--output", type=Path, help="Write the full report as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("src").setLevel(logging.ERROR)
+
+    config = BenchmarkConfig(
+        episodes=args.episodes,
+        segments=args.segments,
+        entities=args.entities,
+        vocabulary=args.vocabulary,
+        workers=args.workers,
+        time_scale=args.time_scale,
+        seed=args.seed,
+    )
+    report = run_benchmark(config)
+    print(format_report(report))
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(make_baseline(report), indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    problems = []
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        if config_matches(report, baseline):
+            problems.extend(compare_with_baseline(report, baseline))
+        else:
+            print(f"\nSkipping {args.baseline.name}: recorded with a different configuration")
+    if BASELINE_METRICS_FILE.exists():
+        problems.extend(check_thresholds(report, json.loads(BASELINE_METRICS_FILE.read_text())))
+
+    if problems:
+        print("\nRegressions:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,6 +35,15 @@ def test_env():
     os.environ.update(original_env)
 
 
+@pytest.fixture(autouse=True)
+def clear_model_pool():
+    """Keep models (often mocks) loaded by one test out of the next."""
+    yield
+    from src.utils import model_pool
+    if model_pool._global_pool is not None and len(model_pool._global_pool):
+        model_pool._global_pool.clear()
+
+
 @pytest.fixture
 def mock_neo4j_driver(mocker):
     """Mock Neo4j driver for unit tests."""
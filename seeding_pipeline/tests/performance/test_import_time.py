@@ -0,0 +1,82 @@
+"""Import-time regression tests.
+
+Runs ``python -X importtime`` in a fresh interpreter so short-lived commands
+(``cli.py --help``, checkpoint inspection, job pods) keep starting quickly.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Cumulative import budget in seconds; generous so slow CI machines pass
+IMPORT_BUDGETS = {
+    'cli': 1.0,
+    'src.seeding.checkpoint': 1.0,
+}
+
+# Heavy dependencies that must only load once a command actually needs them
+HEAVY_MODULES = [
+    'torch', 'whisper', 'sentence_transformers', 'langchain', 'langchain_google_genai',
+    'neo4j', 'scipy', 'networkx', 'opentelemetry.instrumentation', 'src.seeding.orchestrator',
+]
+
+
+def import_times(module: str) -> Dict[str, float]:
+    """Import a module in a fresh interpreter and return cumulative seconds per module."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize('module', sorted(IMPORT_BUDGETS))
+def test_import_stays_within_budget(module):
+    times = import_times(module)
+
+    assert times[module] < IMPORT_BUDGETS[module], (
+        f"import {module} took {times[module]:.2f}s; slowest imports: "
+        f"{sorted(times.items(), key=lambda item: -item[1])[:10]}"
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize('module', sorted(IMPORT_BUDGETS))
+def test_heavy_dependencies_not_imported(module):
+    loaded = import_times(module)
+
+    eager = [name for name in loaded
+             if any(name == heavy or name.startswith(heavy + '.') for heavy in HEAVY_MODULES)]
+    assert not eager, f"import {module} eagerly loads {sorted(eager)[:10]}"
+
+
+@pytest.mark.performance
+def test_lazy_package_exports_still_resolve():
+    code = (
+        "import src, src.seeding, src.processing, src.providers.audio, src.tracing\n"
+        "assert src.PodcastKnowledgePipeline is src.seeding.PodcastKnowledgePipeline\n"
+        "assert src.processing.ExtractionFactory.__name__ == 'ExtractionFactory'\n"
+        "assert src.providers.audio.MockAudioProvider.__name__ == 'MockAudioProvider'\n"
+        "assert callable(src.tracing.instrument_all)\n"
+        "assert 'PodcastKnowledgePipeline' in dir(src)\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, timeout=120)
+
+    assert result.returncode == 0, result.stderr[-2000:]
@@ -0,0 +1,175 @@
+"""
+Tests for the offline throughput benchmark
+"""
+import copy
+import json
+import subprocess
+import sys
+import threading
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.offline_benchmark import (
+    OFFLINE_BASELINE_FILE,
+    BenchmarkConfig,
+    CorpusGraphProvider,
+    LatencyModel,
+    OfflinePipeline,
+    RateLimiter,
+    check_thresholds,
+    compare_with_baseline,
+    config_matches,
+    generate_corpus,
+    make_baseline,
+    run_benchmark,
+)
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+pytestmark = [pytest.mark.performance, pytest.mark.benchmark]
+
+
+@pytest.fixture
+def tiny_config():
+    return BenchmarkConfig(episodes=4, segments=5, entities=3, vocabulary=20,
+                           workers=(1, 2), time_scale=0.001, seed=7)
+
+
+@pytest.fixture(scope="module")
+def report():
+    config = BenchmarkConfig(episodes=4, segments=5, entities=3, vocabulary=20,
+                             workers=(1, 2), time_scale=0.001, seed=7)
+    return run_benchmark(config)
+
+
+class TestSyntheticWorkload:
+    """Test corpus generation and latency models"""
+
+    def test_corpus_is_deterministic(self, tiny_config):
+        first = generate_corpus(tiny_config)
+        second = generate_corpus(tiny_config)
+
+        assert [e.responses for e in first] == [e.responses for e in second]
+        assert len(first) == 4
+        assert all(len(episode.segments) == 5 for episode in first)
+
+        response = json.loads(first[0].responses["ep000-seg000"])
+        assert len(response["entities"]) == 3
+        assert first[0].segments[0].text.startswith("[ep000-seg000]")
+        for entity in response["entities"]:
+            assert entity["name"] in first[0].segments[0].text
+
+    def test_latency_is_seeded_per_call(self):
+        model = LatencyModel(mean=1.0, jitter=0.3, per_item=0.5)
+
+        assert model.sample("complete:a", seed=1) == model.sample("complete:a", seed=1)
+        assert model.sample("complete:a", seed=1) != model.sample("complete:b", seed=1)
+        assert LatencyModel(mean=1.0, per_item=0.5).sample("x", items=4) == 3.0
+
+        samples = [model.sample(f"call-{i}", items=0) for i in range(4000)]
+        assert sum(samples) / len(samples) == pytest.approx(1.0, rel=0.05)
+
+    def test_rate_limiter_waits_after_burst(self):
+        limiter = RateLimiter(rate_per_second=1000, burst=2)
+
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() > 0.0
+
+    def test_graph_creates_shared_entity_once(self):
+        graph = CorpusGraphProvider({})
+        graph.connect()
+        barrier = threading.Barrier(8)
+
+        def write(episode):
+            barrier.wait()
+            graph.create_node("Entity", {"id": "graph_theory", "seen_in": episode})
+
+        threads = [threading.Thread(target=write, args=(f"ep{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert list(graph.nodes) == ["graph_theory"]
+        assert graph.writes == 8
+
+
+class TestOfflinePipeline:
+    """Test episodes go through the pipeline executor"""
+
+    def test_episode_is_stored_by_the_storage_coordinator(self, tiny_config):
+        corpus = generate_corpus(tiny_config)
+        pipeline = OfflinePipeline(corpus, replace(tiny_config, time_scale=0))
+
+        pipeline.process_episode(corpus[0])
+
+        graph = pipeline.graph_provider
+        labels = {label for node_labels in graph.node_labels.values() for label in node_labels}
+        assert {"Podcast", "Episode", "Segment", "Entity", "Quote"} <= labels
+        assert "discourse_flow_pattern" in graph.nodes["ep000"]
+        assert {"HAS_EPISODE", "HAS_SEGMENT", "MENTIONS"} <= {r["type"] for r in graph.relationships}
+        assert pipeline.executor.checkpoint_manager.is_completed("ep000")
+        assert all(pipeline.recorder.latencies[stage] for stage in pipeline.recorder.latencies)
+
+
+class TestBenchmarkRun:
+    """Test the report and baseline comparison"""
+
+    def test_report_covers_stages_and_workers(self, report):
+        assert [run["workers"] for run in report["runs"]] == [1, 2]
+        assert report["corpus"] == {"episodes": 4, "segments": 20}
+        assert report["scaling"][0]["speedup"] == 1.0
+
+        for run in report["runs"]:
+            assert run["llm_calls"] == 20
+            assert run["peak_rss_mb"] > 0
+            assert run["stages"]["extract"]["items"] == 20
+            for stats in run["stages"].values():
+                assert stats["runs"] == 4
+                assert 0 < stats["p50"] <= stats["p99"]
+
+    def test_baseline_comparison(self, report):
+        baseline = make_baseline(report)
+        assert config_matches(report, baseline)
+        assert compare_with_baseline(report, baseline) == []
+
+        faster = copy.deepcopy(baseline)
+        faster["runs"][1]["episodes_per_minute"] *= 2
+        faster["runs"][1]["stages"]["extract"]["p99"] = 0.001
+        faster["tolerances"]["latency_floor"] = 0.0
+
+        regressions = compare_with_baseline(report, faster)
+        assert len(regressions) == 2
+        assert all(message.startswith("2 workers") for message in regressions)
+
+    def test_thresholds(self, report):
+        metrics = {"thresholds": {
+            "memory_usage": {"peak": 1},
+            "concurrent_processing": {"max_workers": 2, "episodes_per_minute": 1e9},
+        }}
+
+        violations = check_thresholds(report, metrics)
+
+        assert len(violations) == 3
+
+    def test_committed_baseline_matches_default_config(self):
+        baseline = json.loads(OFFLINE_BASELINE_FILE.read_text())
+
+        assert baseline["config"] == json.loads(json.dumps(BenchmarkConfig().to_dict()))
+        assert {run["workers"] for run in baseline["runs"]} == set(BenchmarkConfig().workers)
+
+    @pytest.mark.slow
+    def test_default_run_has_no_regressions_against_committed_baseline(self):
+        # A fresh interpreter measures peak RSS the way the baseline was recorded
+        result = subprocess.run(
+            [sys.executable, "-m", "tests.benchmarks.offline_benchmark"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=600
+        )
+
+        regressions = [line for line in result.stdout.splitlines() if line.startswith("  - ")]
+        assert result.returncode == 0, regressions or result.stderr[-2000:]
+        assert "No regressions" in result.stdout
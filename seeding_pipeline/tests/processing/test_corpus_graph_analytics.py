@@ -0,0 +1,133 @@
+"""
+Tests for the corpus-wide graph analytics job
+"""
+import json
+
+import networkx as nx
+import pytest
+
+from src.core.exceptions import PodcastProcessingError
+from src.processing.corpus_graph_analytics import (
+    AnalyticsStage,
+    CorpusGraphAnalytics,
+)
+
+
+class FakeGraphProvider:
+    """Answers the job's read and write queries from in-memory lists"""
+
+    def __init__(self, graph, fail_on_write=None):
+        self.entities = sorted(graph.nodes)
+        self.edges = [(min(u, v), max(u, v), d.get('weight', 1.0)) for u, v, d in graph.edges(data=True)]
+        self.fail_on_write = fail_on_write
+        self.reads = 0
+        self.writes = []
+
+    def query(self, cypher, parameters=None):
+        if 'UNWIND' in cypher:
+            if self.fail_on_write is not None and len(self.writes) == self.fail_on_write:
+                self.fail_on_write = None
+                raise RuntimeError("connection lost")
+            self.writes.append(parameters['rows'])
+            return []
+
+        self.reads += 1
+        if 'RETURN e.id AS id' in cypher:
+            after = [e for e in self.entities if e > parameters['last_id']]
+            return [{'id': e, 'name': e.upper()} for e in after[:parameters['limit']]]
+
+        return [
+            {'source': source, 'target': target, 'weight': weight}
+            for source, target, weight in self.edges
+            if parameters['after_id'] < source <= parameters['until_id']
+        ]
+
+
+@pytest.fixture
+def corpus_graph():
+    graph = nx.barbell_graph(6, 2)
+    return nx.relabel_nodes(graph, {i: f"entity-{i:02d}" for i in graph.nodes})
+
+
+class TestCorpusGraphAnalytics:
+    """Test export, analysis, write-back and resuming"""
+
+    def test_run_writes_scores_for_every_entity(self, corpus_graph, tmp_path):
+        provider = FakeGraphProvider(corpus_graph)
+        job = CorpusGraphAnalytics(provider, work_dir=tmp_path, page_size=4,
+                                   write_batch_size=5, betweenness_pivots=0)
+
+        progress = job.run()
+
+        assert progress.stage == AnalyticsStage.COMPLETED
+        rows = {row['id']: row for batch in provider.writes for row in batch}
+        assert set(rows) == set(corpus_graph.nodes)
+        assert max(len(batch) for batch in provider.writes) == 5
+
+        expected_pagerank = nx.pagerank(corpus_graph)
+        expected_betweenness = nx.betweenness_centrality(corpus_graph)
+        for node_id, row in rows.items():
+            assert row['pagerank'] == pytest.approx(expected_pagerank[node_id], abs=1e-6)
+            assert row['betweenness'] == pytest.approx(expected_betweenness[node_id])
+
+        # The two bells are separate communities joined by the bar
+        assert progress.summary['communities'] >= 2
+        assert rows['entity-00']['community'] != rows['entity-13']['community']
+        assert progress.summary['bridge_concepts'][0]['id'] in {'entity-06', 'entity-07'}
+        assert progress.summary['bridge_concepts'][0]['name'] in {'ENTITY-06', 'ENTITY-07'}
+
+    def test_failed_write_resumes_without_exporting_again(self, corpus_graph, tmp_path):
+        provider = FakeGraphProvider(corpus_graph, fail_on_write=1)
+        job = CorpusGraphAnalytics(provider, work_dir=tmp_path, page_size=4,
+                                   write_batch_size=5, betweenness_pivots=0)
+
+        with pytest.raises(PodcastProcessingError):
+            job.run()
+        state = json.loads((tmp_path / "state.json").read_text())
+        assert state['stage'] == AnalyticsStage.WRITE_BACK.value
+        assert state['written_count'] == 5
+
+        reads = provider.reads
+        progress = CorpusGraphAnalytics(provider, work_dir=tmp_path, page_size=4,
+                                        write_batch_size=5, betweenness_pivots=0).run()
+
+        assert progress.stage == AnalyticsStage.COMPLETED
+        assert provider.reads == reads
+        written = [row['id'] for batch in provider.writes for row in batch]
+        assert sorted(written) == sorted(corpus_graph.nodes)
+
+    def test_edge_export_resumes_after_last_checkpoint(self, corpus_graph, tmp_path):
+        provider = FakeGraphProvider(corpus_graph)
+        job = CorpusGraphAnalytics(provider, work_dir=tmp_path, page_size=4, betweenness_pivots=0)
+        progress = job.load_progress()
+        job._export_nodes(progress)
+        job._export_edges(progress)
+        complete_edges = (tmp_path / "edges.bin").read_bytes()
+
+        # Rewind to the first page, leaving its bytes and a partial page behind
+        progress.edge_position = 4
+        progress.edge_count = sum(1 for source, _, _ in provider.edges if source <= 'entity-03')
+        job._export_edges(progress)
+
+        assert (tmp_path / "edges.bin").read_bytes() == complete_edges
+        assert progress.edge_count == corpus_graph.number_of_edges()
+
+    def test_completed_run_is_not_repeated(self, corpus_graph, tmp_path):
+        provider = FakeGraphProvider(corpus_graph)
+        CorpusGraphAnalytics(provider, work_dir=tmp_path).run()
+        reads, writes = provider.reads, len(provider.writes)
+
+        CorpusGraphAnalytics(provider, work_dir=tmp_path).run()
+        assert (provider.reads, len(provider.writes)) == (reads, writes)
+
+        CorpusGraphAnalytics(provider, work_dir=tmp_path).run(restart=True)
+        assert provider.reads > reads
+
+    def test_empty_graph(self, tmp_path):
+        provider = FakeGraphProvider(nx.Graph())
+
+        progress = CorpusGraphAnalytics(provider, work_dir=tmp_path).run()
+
+        assert progress.stage == AnalyticsStage.COMPLETED
+        assert progress.summary['entities'] == 0
+        assert provider.writes == []
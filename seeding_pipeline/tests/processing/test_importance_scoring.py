@@ -10,6 +10,23 @@ from src.processing.importance_scoring import ImportanceScorer
 from src.core.models import Entity, Insight, Segment, EntityType, InsightType
 
 
+def per_entity_factors(scorer, i, entities, entity_mentions, segments, insights, episode_duration):
+    """Factors of entity ``i`` from the per-entity methods, as score_entities computes them."""
+    entity = entities[i]
+    all_embeddings = [e.embedding for e in entities if e.embedding is not None]
+    return {
+        "frequency": scorer.calculate_frequency_factor(entity_mentions[i], episode_duration),
+        "semantic_centrality": (
+            scorer.calculate_semantic_centrality(entity.embedding, all_embeddings)
+            if entity.embedding is not None else 0.5
+        ),
+        **scorer.analyze_discourse_function(entity_mentions[i], segments),
+        **scorer.analyze_temporal_dynamics(entity_mentions[i], segments),
+        "cross_reference": scorer.calculate_cross_reference_score(entity.id, entities, insights),
+        "structural_centrality": 0.5
+    }
+
+
 class TestImportanceScorer:
     """Test suite for ImportanceScorer class."""
     
@@ -379,6 +396,72 @@ class TestImportanceScorer:
         result = scorer.calculate_composite_importance(factors, invalid_weights)
         assert 0.0 <= result <= 1.0  # Should normalize and return valid score
 
+    def test_score_entities_matches_per_entity_scoring(self, scorer, sample_entities,
+                                                       sample_segments, sample_insights):
+        """Test batch scoring gives the same values as the per-entity methods."""
+        sample_entities.append(Entity(
+            id="entity_4",
+            name="Statistics",
+            entity_type=EntityType.CONCEPT,
+            aliases=["stats"],
+            description="Mentioned alongside python and machine learning"
+        ))
+        entity_mentions = [
+            [{"segment_index": 0, "timestamp": 30}, {"segment_index": 0, "timestamp": 45},
+             {"segment_index": 4, "timestamp": 250}, {"segment_index": 9, "timestamp": 590}],
+            [{"segment_index": 2}, {"segment_index": 3}, {"segment_index": 3}],
+            [{"segment_index": 8, "timestamp": 500}],
+            []
+        ]
+        episode_duration = 600.0
+        
+        scores = scorer.score_entities(sample_entities, entity_mentions, sample_segments,
+                                       sample_insights, episode_duration)
+        
+        assert scores.entity_ids == [e.id for e in sample_entities]
+        for i, entity in enumerate(sample_entities):
+            expected = per_entity_factors(scorer, i, sample_entities, entity_mentions,
+                                          sample_segments, sample_insights, episode_duration)
+            assert scores.factors_for(i) == pytest.approx(expected, abs=1e-6)
+            assert scores.composite[i] == pytest.approx(
+                scorer.calculate_composite_importance(expected), abs=1e-6
+            )
+        
+        assert scores.discourse_roles_for(3) == {
+            "introduction_role": 0.0, "development_role": 0.0,
+            "conclusion_role": 0.0, "bridge_role": 0.0
+        }
+        assert set(scores.to_dict()) == {e.id for e in sample_entities}
+    
+    def test_score_entities_without_descriptions(self, scorer, sample_segments, sample_insights):
+        """Test batch scoring when no entity has a description to reference others."""
+        entities = [
+            Entity(id="entity_1", name="Machine Learning", entity_type=EntityType.CONCEPT),
+            Entity(id="entity_2", name="Python", entity_type=EntityType.TECHNOLOGY)
+        ]
+        entity_mentions = [[{"segment_index": 0, "timestamp": 30}], []]
+        
+        scores = scorer.score_entities(entities, entity_mentions, sample_segments,
+                                       sample_insights[:1], 600.0)
+        
+        for i in range(len(entities)):
+            expected = per_entity_factors(scorer, i, entities, entity_mentions,
+                                          sample_segments, sample_insights[:1], 600.0)
+            assert scores.factors_for(i) == pytest.approx(expected, abs=1e-6)
+            assert scores.composite[i] == pytest.approx(
+                scorer.calculate_composite_importance(expected), abs=1e-6
+            )
+    
+    def test_score_entities_empty_episode(self, scorer):
+        """Test batch scoring without entities or segments."""
+        scores = scorer.score_entities([], [], [], [], 0.0)
+        assert len(scores) == 0
+        assert scores.composite.shape == (0,)
+        
+        with pytest.raises(ValueError):
+            scorer.score_entities([Entity(id="e", name="E", entity_type=EntityType.CONCEPT)],
+                                  [], [], [], 60.0)
+
 
 class TestIntegrationWithExtraction:
     """Test integration of ImportanceScorer with extraction pipeline."""
@@ -0,0 +1,130 @@
+"""Tests for blocked and incremental schemaless entity resolution."""
+
+import random
+
+import pytest
+
+from src.processing.schemaless_entity_resolution import (
+    SchemalessEntityResolver,
+    EntityResolutionConfig,
+    EntityBlockIndex,
+    UnionFind
+)
+
+
+def cluster_ids(clusters):
+    return sorted(sorted(entity['id'] for entity in cluster) for cluster in clusters)
+
+
+@pytest.fixture
+def entities():
+    """A few hundred names with case, plural, typo, alias and acronym variants."""
+    rng = random.Random(7)
+    words = ["google", "neural", "network", "quantum", "climate", "podcast", "startup",
+             "history", "energy", "market", "science", "music", "capital", "venture"]
+    names = []
+    for _ in range(300):
+        name = ' '.join(rng.sample(words, rng.randint(1, 2))).title()
+        roll = rng.random()
+        if roll < 0.15:
+            name = name.lower()
+        elif roll < 0.3:
+            name += 's'
+        elif roll < 0.4:
+            pos = rng.randrange(len(name) - 1)
+            name = name[:pos] + name[pos + 1] + name[pos] + name[pos + 2:]
+        names.append(name)
+    names += ["AI", "Artificial Intelligence", "Dr.", "Doctor", "NASA",
+              "National Aeronautics And Space Administration", "people", "person"]
+    return [{'id': str(i), 'name': name} for i, name in enumerate(names)]
+
+
+class TestUnionFind:
+    """Tests for the disjoint-set forest."""
+
+    def test_union_and_groups(self):
+        sets = UnionFind(5)
+
+        assert sets.union(0, 3)
+        assert sets.union(3, 4)
+        assert not sets.union(0, 4)
+
+        assert sets.find(4) == sets.find(0)
+        assert sets.groups() == [[0, 3, 4], [1], [2]]
+
+    def test_add_extends_forest(self):
+        sets = UnionFind()
+        first, second = sets.add(), sets.add()
+        sets.union(first, second)
+
+        assert sets.groups() == [[0, 1]]
+
+
+class TestBlockedResolution:
+    """Blocking must find the same clusters as comparing every pair."""
+
+    def test_blocked_clusters_match_all_pairs(self, entities):
+        all_pairs = SchemalessEntityResolver(EntityResolutionConfig(blocking_min_entities=10 ** 9))
+        blocked = SchemalessEntityResolver(EntityResolutionConfig(blocking_min_entities=0))
+
+        expected = all_pairs._cluster_entities(entities, all_pairs._find_entity_matches(entities))
+        actual = blocked._cluster_entities(entities, blocked._find_entity_matches(entities))
+
+        assert cluster_ids(actual) == cluster_ids(expected)
+
+    def test_blocking_keys_group_variants(self):
+        index = EntityBlockIndex(SchemalessEntityResolver())
+
+        assert index.blocking_keys("AI") & index.blocking_keys("Artificial Intelligence")
+        assert index.blocking_keys("NASA") & index.blocking_keys("National Aeronautics And Space Administration")
+        assert index.blocking_keys("people") & index.blocking_keys("person")
+        assert index.blocking_keys("Podcasts") & index.blocking_keys("podcast")
+        assert not index.blocking_keys("Quantum") & index.blocking_keys("Climate")
+
+    def test_blocking_compares_fewer_pairs(self, entities, monkeypatch):
+        resolver = SchemalessEntityResolver(EntityResolutionConfig(blocking_min_entities=0))
+        calls = []
+        compare = resolver._compare_entities
+        monkeypatch.setattr(resolver, '_compare_entities',
+                            lambda e1, e2: calls.append(1) or compare(e1, e2))
+
+        resolver._find_entity_matches(entities)
+
+        all_pairs = len(entities) * (len(entities) - 1) // 2
+        assert len(calls) < all_pairs / 4
+
+
+class TestIncrementalResolution:
+    """Tests for resolving segments against the existing canonical set."""
+
+    def test_segments_resolve_against_earlier_entities(self):
+        resolver = SchemalessEntityResolver()
+        resolver.resolve_incremental([{'name': 'Google'}, {'name': 'Quantum Computing'}])
+
+        result = resolver.resolve_incremental([{'name': 'google'}, {'name': 'Climate'}])
+
+        names = sorted(entity['value' if 'value' in entity else 'name']
+                       for entity in result['resolved_entities'])
+        assert names == ['Climate', 'Google']
+        google = next(e for e in result['resolved_entities'] if e.get('value') == 'Google')
+        assert google['aliases'] == ['google']
+        assert result['canonical_count'] == 3
+
+    def test_incremental_matches_batch(self, entities):
+        resolver = SchemalessEntityResolver()
+        batch = resolver._cluster_entities(entities, resolver._find_entity_matches(entities))
+        incremental = SchemalessEntityResolver()
+        for start in range(0, len(entities), 25):
+            result = incremental.resolve_incremental(entities[start:start + 25])
+
+        assert result['canonical_count'] == len(batch)
+
+    def test_reset_forgets_seen_entities(self):
+        resolver = SchemalessEntityResolver()
+        resolver.resolve_incremental([{'name': 'Google'}])
+        resolver.reset_incremental()
+
+        result = resolver.resolve_incremental([{'name': 'google'}])
+
+        assert result['resolved_entities'] == [{'name': 'google'}]
+        assert result['canonical_count'] == 1
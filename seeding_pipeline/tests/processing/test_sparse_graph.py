@@ -0,0 +1,129 @@
+"""
+Tests for the CSR graph backend against NetworkX
+"""
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.processing.sparse_graph import SparseGraph
+
+
+def random_graph(num_nodes, num_edges, seed):
+    rng = random.Random(seed)
+    nodes = [{'id': f'n{i}', 'name': f'Node {i}'} for i in range(num_nodes)]
+    edges = [(f'n{rng.randrange(num_nodes)}', f'n{rng.randrange(num_nodes)}',
+              rng.choice([0.5, 1.0, 1.5, 2.0]))
+             for _ in range(num_edges)]
+    return nodes, edges
+
+
+def to_networkx(nodes, edges):
+    graph = nx.Graph()
+    graph.add_nodes_from(node['id'] for node in nodes)
+    graph.add_weighted_edges_from(edges)
+    return graph
+
+
+class TestSparseGraph:
+    """Test graph construction and algorithms"""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    @pytest.mark.parametrize("weighted", [True, False])
+    def test_betweenness_matches_networkx(self, seed, weighted):
+        nodes, edges = random_graph(40, 70, seed)
+        expected = nx.betweenness_centrality(to_networkx(nodes, edges),
+                                             weight='weight' if weighted else None)
+
+        actual = SparseGraph.from_edges(nodes, edges).betweenness_centrality(weighted=weighted)
+
+        assert actual == pytest.approx(expected, abs=1e-9)
+
+    def test_sampled_betweenness_scales_like_networkx(self):
+        nodes, edges = random_graph(60, 150, 3)
+        exact = SparseGraph.from_edges(nodes, edges).betweenness_centrality()
+
+        graph = SparseGraph.from_edges(nodes, edges)
+        sampled = graph.betweenness_centrality(pivots=30, seed=5)
+
+        assert sampled == graph.betweenness_centrality(pivots=30, seed=5)
+        assert sum(sampled.values()) == pytest.approx(sum(exact.values()), rel=0.5)
+        assert graph.betweenness_centrality(pivots=60) == pytest.approx(exact)
+
+    def test_structure_matches_networkx(self):
+        nodes, edges = random_graph(30, 25, 4)
+        expected = to_networkx(nodes, edges)
+
+        graph = SparseGraph.from_edges(nodes, edges)
+
+        assert graph.number_of_nodes == expected.number_of_nodes()
+        assert graph.number_of_edges == expected.number_of_edges()
+        assert dict(zip(graph.node_ids, graph.degrees().tolist())) == dict(expected.degree())
+        assert sorted(map(sorted, graph.connected_components())) == sorted(
+            map(sorted, nx.connected_components(expected))
+        )
+
+    def test_modularity_matches_networkx(self):
+        nodes, edges = random_graph(40, 90, 6)
+        expected_graph = to_networkx(nodes, edges)
+        communities = nx.community.louvain_communities(expected_graph, seed=1)
+
+        graph = SparseGraph.from_edges(nodes, edges)
+
+        assert graph.modularity(communities, resolution=0.7) == pytest.approx(
+            nx.community.modularity(expected_graph, communities, resolution=0.7)
+        )
+
+    def test_pagerank_matches_networkx(self):
+        nodes, edges = random_graph(50, 80, 7)
+        expected = nx.pagerank(to_networkx(nodes, edges))
+
+        actual = SparseGraph.from_edges(nodes, edges).pagerank()
+
+        assert actual == pytest.approx(expected, abs=1e-6)
+
+    def test_louvain_finds_planted_communities(self):
+        planted = nx.random_partition_graph([30, 30, 30, 30], 0.4, 0.01, seed=3)
+        nodes = [{'id': node} for node in planted.nodes]
+        edges = [(u, v, 1.0) for u, v in planted.edges]
+        graph = SparseGraph.from_edges(nodes, edges)
+
+        communities = graph.louvain_communities(seed=0)
+
+        assert sorted(map(sorted, communities)) == sorted(map(sorted, planted.graph['partition']))
+        assert graph.modularity(communities) >= nx.community.modularity(
+            planted, nx.community.louvain_communities(planted, seed=0)
+        ) - 1e-9
+        assert graph.louvain_communities(seed=0) == communities
+
+    def test_from_arrays_sums_parallel_edges(self):
+        graph = SparseGraph.from_arrays(
+            ['a', 'b', 'c'], np.array([0, 1, 2]), np.array([1, 0, 2]), np.array([1.0, 2.0, 4.0])
+        )
+
+        assert graph.to_networkx()['a']['b']['weight'] == 3.0
+        assert graph.to_networkx()['c']['c']['weight'] == 4.0
+        assert graph.number_of_edges == 2
+
+    def test_missing_nodes_and_repeated_edges(self):
+        nodes = [{'id': 'a'}, {'id': 'b'}]
+        edges = [('a', 'b', 1.0), ('b', 'a', 3.0), ('b', 'c', 1.0)]
+
+        dropped = SparseGraph.from_edges(nodes, edges)
+        added = SparseGraph.from_edges(nodes, edges, add_missing_nodes=True)
+
+        assert 'c' not in dropped
+        assert dropped.number_of_edges == 1
+        assert dropped.to_networkx()['a']['b']['weight'] == 3.0
+        assert 'c' in added
+        assert added.number_of_edges == 2
+
+    def test_empty_graph(self):
+        graph = SparseGraph.from_edges([], [])
+
+        assert graph.betweenness_centrality() == {}
+        assert graph.connected_components() == []
+        assert graph.modularity([]) == 0.0
+        assert graph.pagerank() == {}
+        assert graph.louvain_communities() == []
@@ -0,0 +1,121 @@
+"""Tests for the shared marker matcher."""
+
+import re
+
+import pytest
+
+from src.core import constants
+from src.core.models import Segment
+from src.core.segment_store import SegmentStore
+from src.processing.text_markers import (
+    ACKNOWLEDGMENT,
+    ADVERTISEMENT,
+    DISCOURSE_TRANSITION,
+    DISCOURSE_TRANSITION_MARKERS,
+    EPISODE_TRANSITION,
+    METAPHOR_FAMILIES,
+    NEGATIVE,
+    NEGATIVE_WORDS,
+    POSITIVE,
+    POSITIVE_WORDS,
+    MarkerMatcher,
+    markers_for,
+    metaphor_category,
+    store_markers,
+)
+
+
+class TestMarkerMatcher:
+    """Test single-pass phrase and word matching."""
+
+    @pytest.fixture
+    def matcher(self):
+        return MarkerMatcher(
+            {"short": ["on", "one", "bone"], "long": ["one more", "bon"]},
+            {"good": ["fine", "fined"], "bad": ["bone"]}
+        )
+
+    def test_overlapping_and_prefix_phrases(self, matcher):
+        hits = matcher.scan("just one more bone")
+
+        assert hits.found("short") == ["on", "one", "bone"]
+        assert hits.found("long") == ["one more", "bon"]
+        assert hits.positions["on"] == 5
+        assert hits.positions["bone"] == 14
+
+    def test_first_respects_category_order_and_limit(self, matcher):
+        hits = matcher.scan("bone then one")
+
+        assert hits.first("short") == "on"
+        assert hits.first("long") == "bon"
+        assert hits.first("short", within=3) == "on"
+        assert hits.first("short", within=2) is None
+        assert hits.first("long", within=2) is None
+
+    def test_words_are_counted_as_whole_words(self, matcher):
+        hits = matcher.scan("fine, fined and refine fine_tuned; bone bones")
+
+        assert hits.count("good") == 2
+        assert hits.count("bad") == 1
+        assert hits.count("missing") == 0
+
+    def test_scan_buffer_keeps_texts_apart(self, matcher):
+        texts = ["first one", "", "bo", "ne fine"]
+        buffer = "\x00".join(texts)
+        starts = [0, 10, 11, 14]
+
+        hits = matcher.scan_buffer(buffer, starts)
+
+        assert hits[0].found("short") == ["on", "one"] and hits[0].positions["one"] == 6
+        assert hits[1].positions == {} and hits[2].positions == {}
+        assert hits[3].count("good") == 1 and hits[3].found("short") == []
+
+
+class TestAnalyzerMarkers:
+    """Test the shared analyzer vocabulary against per-phrase scanning."""
+
+    TEXTS = [
+        "However, speaking of which, the journey is a battle. At its core this is about growth.",
+        "Brought to you by our sponsor; use promo code PODCAST for a great, amazing deal.",
+        "That was a terrible, awful problem. But we grow and build a better engine anyway.",
+        "Nothing to see here.",
+        "İstanbul: moving on, the ROAD ahead is difficult but good.",
+    ]
+
+    def test_matches_substring_semantics(self):
+        for text in self.TEXTS:
+            lowered = text.lower()
+            hits = markers_for(text)
+
+            assert hits.first(DISCOURSE_TRANSITION) == next(
+                (p for p in DISCOURSE_TRANSITION_MARKERS if p in lowered), None
+            )
+            assert hits.first(ADVERTISEMENT) == next(
+                (m for m in constants.AD_MARKERS if m in lowered), None
+            )
+            for family, keywords in METAPHOR_FAMILIES.items():
+                assert hits.found(metaphor_category(family)) == [k for k in keywords if k in lowered]
+
+            words = re.findall(r'\b\w+\b', lowered)
+            assert hits.count(POSITIVE) == sum(word in POSITIVE_WORDS for word in words)
+            assert hits.count(NEGATIVE) == sum(word in NEGATIVE_WORDS for word in words)
+
+    def test_store_is_scanned_once(self):
+        store = SegmentStore.from_dicts(
+            [{"text": text, "start_time": i, "end_time": i + 1} for i, text in enumerate(self.TEXTS)]
+        )
+
+        hits = store_markers(store)
+
+        assert store_markers(store) is hits
+        assert markers_for(store[0]) is hits[0]
+        for view, text in zip(store, self.TEXTS):
+            assert markers_for(view).positions == markers_for(text).positions
+        assert hits[0].first(ACKNOWLEDGMENT) == "at its core"
+        assert hits[4].first(DISCOURSE_TRANSITION) == "moving on"
+
+    def test_segments_and_texts(self):
+        segment = Segment(id="s1", text="Moving on to something else", start_time=0, end_time=1)
+
+        assert markers_for(segment).first(EPISODE_TRANSITION, within=100) == "moving on"
+        assert markers_for("x" * 95 + " moving on").first(EPISODE_TRANSITION, within=100) is None
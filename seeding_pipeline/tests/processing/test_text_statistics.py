@@ -0,0 +1,88 @@
+"""
+Tests for the shared text statistics engine
+"""
+import random
+import re
+
+import pytest
+
+from src.processing.complexity_analysis import ComplexityAnalyzer
+from src.processing.metrics import MetricsCalculator
+from src.processing.text_statistics import (
+    TextStatistics,
+    TextStatisticsEngine,
+    count_syllables,
+    estimate_token_syllables,
+    moving_average_ttr
+)
+
+
+def brute_force_mattr(words, window, step):
+    ratios = [len(set(words[i:i + window])) / window
+              for i in range(0, len(words) - window + 1, step)]
+    return sum(ratios) / len(ratios)
+
+
+class TestMovingAverageTTR:
+    """Test the sliding-window MATTR"""
+
+    @pytest.mark.parametrize("step", [1, 3, 10])
+    def test_matches_window_by_window_computation(self, step):
+        rng = random.Random(step)
+        words = [rng.choice("abcdefghijklmnopqrstuvwxyz"[:12]) for _ in range(317)]
+
+        assert moving_average_ttr(words, window=50, step=step) == pytest.approx(
+            brute_force_mattr(words, 50, step)
+        )
+
+    def test_short_text_has_no_mattr(self):
+        assert moving_average_ttr(["word"] * 50, window=50) is None
+
+
+class TestTextStatistics:
+    """Test tokenization and memoized lookups"""
+
+    def test_word_pattern_matches_equal_regex_scan(self):
+        patterns = MetricsCalculator().technical_patterns
+        text = ("The NASA neurology team found 42 enzymes; cardiovascular DNA, "
+                "Polyamide and a hyper_drive protocol. Algorithm? no-algorithms!")
+
+        expected = sum(len(re.findall(p, text, re.IGNORECASE)) for p in patterns)
+
+        assert TextStatistics(text).count_word_pattern_matches(tuple(patterns)) == expected
+
+    def test_sentences_and_counts(self):
+        stats = TextStatistics("Hello there. It's 2024! Ok")
+
+        assert stats.sentences == ["Hello there", "It's 2024", "Ok"]
+        assert stats.sentence_word_counts == [2, 3, 1]
+        assert stats.numeric_sentence_count == 1
+        assert stats.words == ["hello", "there", "it", "s", "ok"]
+
+    def test_syllable_lookups(self):
+        assert count_syllables("beautiful") == 3
+        assert count_syllables("cake") == 1
+        assert estimate_token_syllables("the.") == 1
+        assert estimate_token_syllables("Hello,") == 2
+
+
+class TestTextStatisticsEngine:
+    """Test caching across analyzers"""
+
+    def test_analyzers_share_tokenization(self):
+        engine = TextStatisticsEngine()
+        text = "Quantum algorithms reduce latency. The protocol is 10 percent faster."
+
+        ComplexityAnalyzer(text_statistics=engine).analyze_vocabulary_complexity(text)
+        MetricsCalculator(text_statistics=engine).calculate_accessibility(text, 2.0)
+
+        assert len(engine._cache) == 1
+        assert engine.analyze(text) is engine.analyze_many([text])[0]
+
+    def test_cache_is_bounded(self):
+        engine = TextStatisticsEngine(max_texts=2)
+        first = engine.analyze("one")
+        engine.analyze("two")
+        engine.analyze("three")
+
+        assert engine.analyze("one") is not first
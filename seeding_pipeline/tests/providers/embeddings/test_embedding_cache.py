@@ -0,0 +1,134 @@
+"""Tests for the shared content-hash embedding cache."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.providers.embeddings.cache import (
+    CachedEmbeddingProvider,
+    EmbeddingStore,
+    get_embedding_cache
+)
+from src.providers.embeddings.mock import MockEmbeddingProvider
+
+
+class CountingProvider(MockEmbeddingProvider):
+    """Mock provider recording every batch it computes."""
+
+    def __init__(self, config=None):
+        super().__init__(config or {'model_name': 'counting', 'dimension': 4})
+        self.batches = []
+
+    def generate_embeddings(self, texts):
+        self.batches.append(list(texts))
+        return super().generate_embeddings(texts)
+
+
+class TestCachedEmbeddingProvider:
+    """Tests for LRU caching, batch de-duplication and hit rates."""
+
+    def test_batch_deduplicated_and_cached(self):
+        provider = CountingProvider()
+        cache = CachedEmbeddingProvider(provider)
+
+        first = cache.generate_embeddings(["AI", "ML", "AI", "  ML "])
+        second = cache.generate_embedding("AI")
+
+        assert provider.batches == [["AI", "ML"]]
+        # Cached float32 vectors are shared rather than copied
+        assert first[0] is first[2] is second
+        assert first[1] is first[3]
+        assert first[0].dtype == np.float32 and not first[0].flags.writeable
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 2
+        assert stats['batch_duplicates'] == 2
+        assert stats['hit_rate'] == pytest.approx(1 / 3)
+
+    def test_lru_is_bounded(self):
+        provider = CountingProvider()
+        cache = CachedEmbeddingProvider(provider, {'embedding_cache_size': 2})
+
+        cache.generate_embeddings(["a", "b", "c"])
+        cache.generate_embedding("a")
+
+        assert cache.get_stats()['size'] == 2
+        assert provider.batches[-1] == ["a"]
+
+    def test_disk_store_survives_new_instance(self, tmp_path):
+        config = {'embedding_cache_dir': str(tmp_path), 'embedding_cache_size': 1}
+        first = CachedEmbeddingProvider(CountingProvider(), config)
+        vectors = first.generate_embeddings([f"text {i}" for i in range(5)])
+
+        provider = CountingProvider()
+        second = CachedEmbeddingProvider(provider, config)
+        again = second.generate_embeddings([f"text {i}" for i in range(5)])
+
+        assert provider.batches == []
+        np.testing.assert_array_equal(again, vectors)
+        assert second.get_stats()['disk_hits'] == 5
+
+    def test_namespace_resolved_after_backend_fallback(self, tmp_path):
+        class FallbackProvider(CountingProvider):
+            backend = 'onnx'
+
+            @property
+            def cache_namespace(self):
+                return 'counting@onnx' if self.backend == 'onnx' else 'counting'
+
+            def _initialize_model(self):
+                self.backend = 'torch'
+
+        provider = FallbackProvider()
+        cache = CachedEmbeddingProvider(provider, {'embedding_cache_dir': str(tmp_path)})
+
+        cache.generate_embedding("same text")
+        cache.generate_embedding("same text")
+
+        assert provider.batches == [["same text"]]
+        assert [path.name for path in tmp_path.iterdir()] == ['counting']
+
+    def test_key_includes_model_name(self):
+        cache_a = CachedEmbeddingProvider(CountingProvider({'model_name': 'a', 'dimension': 4}))
+        cache_b = CachedEmbeddingProvider(CountingProvider({'model_name': 'b', 'dimension': 4}))
+
+        cache_a.generate_embedding("same text")
+        cache_b.generate_embedding("same text")
+
+        assert cache_b.get_stats()['misses'] == 1
+
+    def test_legacy_aliases_and_delegation(self):
+        cache = CachedEmbeddingProvider(CountingProvider())
+
+        assert cache.embed("x") is cache.embed_text("x") is cache.embed_query("x")
+        assert cache.embedding_mode == 'hash'
+        assert cache.get_model_info()['cache']['hits'] == 2
+
+
+class TestEmbeddingStore:
+    """Tests for the memory-mapped float32 store."""
+
+    def test_grows_and_shares_rows_between_instances(self, tmp_path):
+        import numpy as np
+        writer = EmbeddingStore(str(tmp_path), initial_capacity=2)
+        reader = EmbeddingStore(str(tmp_path))
+
+        writer.put_many({f"k{i}": np.full(3, i, dtype=np.float32) for i in range(5)})
+        reader.refresh()
+
+        assert len(reader) == 5
+        assert reader.get("k4").tolist() == [4.0, 4.0, 4.0]
+        assert reader.get("missing") is None
+
+
+def test_get_embedding_cache_is_shared_and_idempotent():
+    provider = CountingProvider()
+
+    cache = get_embedding_cache(provider)
+
+    assert get_embedding_cache(provider) is cache
+    assert get_embedding_cache(cache) is cache
+    assert get_embedding_cache(None) is None
+    mock = Mock()
+    assert get_embedding_cache(mock) is mock
@@ -4,11 +4,14 @@ import pytest
 import math
 from unittest.mock import patch, MagicMock
 
+import numpy as np
+
 from src.providers.embeddings.mock import MockEmbeddingProvider
 from src.providers.embeddings.sentence_transformer import (
     SentenceTransformerProvider, 
     OpenAIEmbeddingProvider
 )
+from src.providers.embeddings.sentence_transformer_adapter import SentenceTransformerGraphRAGAdapter
 from src.core.exceptions import ProviderError
 
 
@@ -163,9 +166,7 @@ class TestSentenceTransformerProvider:
         
         # Mock the model directly
         mock_model = MagicMock()
-        mock_embedding = MagicMock()
-        mock_embedding.tolist.return_value = [0.1, 0.2, 0.3]
-        mock_model.encode.return_value = mock_embedding
+        mock_model.encode.return_value = np.array([0.1, 0.2, 0.3])
         mock_model.get_sentence_embedding_dimension.return_value = 3
         
         provider.model = mock_model
@@ -174,7 +175,8 @@ class TestSentenceTransformerProvider:
         
         embedding = provider.generate_embedding("Test text")
         
-        assert embedding == [0.1, 0.2, 0.3]
+        assert embedding.dtype == np.float32
+        assert embedding.tolist() == pytest.approx([0.1, 0.2, 0.3])
         mock_model.encode.assert_called_once_with(
             "Test text",
             normalize_embeddings=True,
@@ -190,9 +192,7 @@ class TestSentenceTransformerProvider:
         
         # Mock the model directly
         mock_model = MagicMock()
-        mock_embeddings = MagicMock()
-        mock_embeddings.tolist.return_value = [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
-        mock_model.encode.return_value = mock_embeddings
+        mock_model.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
         mock_model.get_sentence_embedding_dimension.return_value = 2
         
         provider.model = mock_model
@@ -203,9 +203,10 @@ class TestSentenceTransformerProvider:
         embeddings = provider.generate_embeddings(texts)
         
         assert len(embeddings) == 3
-        assert embeddings[0] == [0.1, 0.2]
-        assert embeddings[1] == [0.3, 0.4]
-        assert embeddings[2] == [0.5, 0.6]
+        assert all(embedding.dtype == np.float32 for embedding in embeddings)
+        assert embeddings[0].tolist() == pytest.approx([0.1, 0.2])
+        assert embeddings[1].tolist() == pytest.approx([0.3, 0.4])
+        assert embeddings[2].tolist() == pytest.approx([0.5, 0.6])
         
     def test_empty_text_handling(self):
         """Test handling of empty texts in batch."""
@@ -213,9 +214,7 @@ class TestSentenceTransformerProvider:
         
         # Mock the model
         mock_model = MagicMock()
-        mock_embeddings = MagicMock()
-        mock_embeddings.tolist.return_value = [[0.1, 0.2], [0.3, 0.4]]
-        mock_model.encode.return_value = mock_embeddings
+        mock_model.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4]])
         mock_model.get_sentence_embedding_dimension.return_value = 2
         
         provider._initialized = True
@@ -226,16 +225,60 @@ class TestSentenceTransformerProvider:
         embeddings = provider.generate_embeddings(texts)
         
         assert len(embeddings) == 4
-        assert embeddings[0] == [0.1, 0.2]  # Text 1
-        assert embeddings[1] == [0.0, 0.0]  # Empty
-        assert embeddings[2] == [0.3, 0.4]  # Text 2
-        assert embeddings[3] == [0.0, 0.0]  # Whitespace
+        assert embeddings[0].tolist() == pytest.approx([0.1, 0.2])  # Text 1
+        assert embeddings[1].tolist() == [0.0, 0.0]  # Empty
+        assert embeddings[2].tolist() == pytest.approx([0.3, 0.4])  # Text 2
+        assert embeddings[3].tolist() == [0.0, 0.0]  # Whitespace
         
         # Model should only be called with non-empty texts
         args = mock_model.encode.call_args[0][0]
         assert len(args) == 2  # Only "Text 1" and "Text 2"
 
 
+    def test_health_check_with_array_embeddings(self):
+        """Test health check when the provider returns numpy arrays."""
+        provider = SentenceTransformerProvider({'model_name': 'test-model'})
+        
+        mock_model = MagicMock()
+        mock_model.encode.return_value = np.array([0.1, 0.2, 0.3])
+        
+        provider.model = mock_model
+        provider.dimension = 3
+        provider._initialized = True
+        
+        health = provider.health_check()
+        
+        assert health['healthy'] is True
+        assert health['test_embedding_size'] == 3
+
+
+class TestSentenceTransformerGraphRAGAdapter:
+    """Test the neo4j-graphrag embedder adapter."""
+    
+    def test_embeddings_are_returned_as_lists(self):
+        """Test embed_query and embed_documents convert arrays to lists of floats."""
+        provider = SentenceTransformerProvider({'model_name': 'adapter-test-model'})
+        
+        mock_model = MagicMock()
+        mock_model.encode.side_effect = lambda texts, **kwargs: (
+            np.array([[0.5, 0.25]] * len(texts)) if isinstance(texts, list)
+            else np.array([0.5, 0.25])
+        )
+        
+        provider.model = mock_model
+        provider.dimension = 2
+        provider._initialized = True
+        adapter = SentenceTransformerGraphRAGAdapter(provider)
+        
+        query = adapter.embed_query("Query text")
+        documents = adapter.embed_documents(["First document", "Second document"])
+        
+        assert query == [0.5, 0.25]
+        assert documents == [[0.5, 0.25], [0.5, 0.25]]
+        assert all(type(value) is float for value in query)
+        assert all(isinstance(embedding, list) for embedding in documents)
+
+
 class TestOpenAIEmbeddingProvider:
     """Test OpenAI embedding provider functionality."""
     
@@ -285,7 +328,7 @@ class TestOpenAIEmbeddingProvider:
         
         embedding = provider.generate_embedding("Test text")
         
-        assert embedding == [0.1, 0.2, 0.3]
+        assert embedding.tolist() == pytest.approx([0.1, 0.2, 0.3])
         mock_client.embeddings.create.assert_called_once_with(
             model='text-embedding-3-small',
             input='Test text',
@@ -0,0 +1,132 @@
+"""Tests for the ONNX Runtime sentence-transformer backend."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.core.exceptions import ProviderError
+from src.providers.embeddings.onnx_backend import (
+    OnnxSentenceEncoder,
+    length_buckets,
+    pool_embeddings
+)
+from src.providers.embeddings.sentence_transformer import SentenceTransformerProvider
+
+
+class FakeTokenizer:
+    """Whitespace tokenizer; the id of a token is its length."""
+    pad_token_id = 0
+
+    def __call__(self, texts, truncation=True, max_length=None):
+        ids = [[len(word) for word in text.split()][:max_length] for text in texts]
+        return {'input_ids': ids}
+
+
+class FakeSession:
+    """Returns token embeddings [id, 1, 0] and records batch shapes."""
+
+    def __init__(self):
+        self.shapes = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name='input_ids'), SimpleNamespace(name='attention_mask')]
+
+    def run(self, output_names, feeds):
+        input_ids = feeds['input_ids']
+        self.shapes.append(input_ids.shape)
+        ones = np.ones_like(input_ids, dtype=np.float32)
+        return [np.stack([input_ids.astype(np.float32), ones, ones * 0], axis=-1)]
+
+
+@pytest.fixture
+def encoder():
+    return OnnxSentenceEncoder(FakeSession(), FakeTokenizer(), dimension=3, batch_size=2)
+
+
+class TestHelpers:
+    """Tests for bucketing and pooling."""
+
+    def test_length_buckets_group_similar_lengths(self):
+        buckets = length_buckets([5, 1, 4, 2, 3], batch_size=2)
+
+        assert [bucket.tolist() for bucket in buckets] == [[1, 3], [4, 2], [0]]
+
+    def test_mean_pooling_ignores_padding(self):
+        tokens = np.array([[[2.0], [4.0], [100.0]]])
+        mask = np.array([[1, 1, 0]])
+
+        assert pool_embeddings(tokens, mask, 'mean').tolist() == [[3.0]]
+        assert pool_embeddings(tokens, mask, 'max').tolist() == [[4.0]]
+        assert pool_embeddings(tokens, mask, 'cls').tolist() == [[2.0]]
+
+
+class TestOnnxSentenceEncoder:
+    """Tests for the encode contract."""
+
+    def test_batches_padded_to_their_own_length(self, encoder):
+        texts = ["a b c d e f", "x", "y z", "long words here too"]
+
+        encoder.encode(texts)
+
+        assert encoder.session.shapes == [(2, 2), (2, 6)]
+
+    def test_results_in_input_order(self, encoder):
+        embeddings = encoder.encode(["aaa bbb cccc", "x"])
+
+        # Mean of token ids: (3 + 3 + 4) / 3 and 1
+        assert embeddings[:, 0].tolist() == pytest.approx([10 / 3, 1.0])
+        assert embeddings.dtype == np.float32
+
+    def test_single_text_and_normalization(self, encoder):
+        embedding = encoder.encode("abc", normalize_embeddings=True)
+
+        assert embedding.shape == (3,)
+        assert np.linalg.norm(embedding) == pytest.approx(1.0)
+
+    def test_models_with_normalize_module_always_normalized(self):
+        encoder = OnnxSentenceEncoder(FakeSession(), FakeTokenizer(), dimension=3, normalize=True)
+
+        embedding = encoder.encode("abc", normalize_embeddings=False)
+
+        assert np.linalg.norm(embedding) == pytest.approx(1.0)
+
+    def test_rejects_unsupported_pooling(self):
+        with pytest.raises(ProviderError):
+            OnnxSentenceEncoder(FakeSession(), FakeTokenizer(), dimension=3, pooling='weighted')
+
+
+class TestProviderBackend:
+    """Tests for selecting the backend in SentenceTransformerProvider."""
+
+    def test_onnx_backend_used_for_embeddings(self, encoder):
+        provider = SentenceTransformerProvider({'model_name': 'mini', 'embedding_backend': 'onnx',
+                                                'embedding_onnx_threads': 2})
+
+        with patch.object(OnnxSentenceEncoder, 'from_pretrained', return_value=encoder) as load:
+            embeddings = provider.generate_embeddings(["ab cd", "", "x"])
+
+        assert load.call_args.kwargs['num_threads'] == 2
+        assert provider.dimension == 3
+        assert embeddings[1].tolist() == [0.0, 0.0, 0.0]
+        assert embeddings[0].tolist() == pytest.approx(list(encoder.encode("ab cd", normalize_embeddings=True)))
+        assert provider.get_model_info()['backend'] == 'onnx'
+
+    def test_cache_namespace_separates_backends(self):
+        torch_provider = SentenceTransformerProvider({'model_name': 'mini'})
+        onnx_provider = SentenceTransformerProvider({'model_name': 'mini', 'embedding_backend': 'onnx'})
+
+        assert torch_provider.cache_namespace == 'mini'
+        assert onnx_provider.cache_namespace == 'mini@onnx-int8'
+
+    def test_falls_back_to_torch_when_onnx_unavailable(self):
+        provider = SentenceTransformerProvider({'model_name': 'mini', 'embedding_backend': 'onnx'})
+        missing = ProviderError("sentence_transformer", "onnxruntime missing")
+
+        with patch.object(OnnxSentenceEncoder, 'from_pretrained', side_effect=missing), \
+                patch.object(provider, '_initialize_torch_model') as torch_init:
+            provider._initialize_model()
+
+        torch_init.assert_called_once()
+        assert provider.backend == 'torch'
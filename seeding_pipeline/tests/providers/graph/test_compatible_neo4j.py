@@ -0,0 +1,233 @@
+"""Unit tests for query caching and dual writes in CompatibleNeo4jProvider."""
+
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.migration.query_translator import QueryTranslator, TranslationCache, CompiledQuery
+from src.migration.result_standardizer import ResultStandardizer
+from src.migration.shadow_writer import ShadowWriteQueue
+from src.providers.graph.compatible_neo4j import CompatibleNeo4jProvider
+
+
+class TestTranslationCache:
+    """Test the bounded LRU of compiled translations."""
+
+    def test_hit_and_miss_counting(self):
+        cache = TranslationCache(max_size=4)
+        compiled = CompiledQuery("MATCH (n:Entity) RETURN n", "translated", True)
+
+        assert cache.get(compiled.original) is None
+        cache.put(compiled)
+        assert cache.get(compiled.original) is compiled
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        cache = TranslationCache(max_size=2)
+        for query in ("a", "b"):
+            cache.put(CompiledQuery(query, query, False))
+
+        cache.get("a")  # "b" is now least recently used
+        cache.put(CompiledQuery("c", "c", False))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get_stats()['evictions'] == 1
+        assert cache.get_stats()['size'] == 2
+
+    def test_compile_skips_translation_for_schemaless_queries(self):
+        translator = QueryTranslator()
+
+        compiled = translator.compile("MATCH (n:Node) RETURN n")
+
+        assert compiled.is_fixed_schema is False
+        assert compiled.translated == compiled.original
+
+
+class TestCompatibleProviderQueryCache:
+    """Test that repeated queries reuse cached translations."""
+
+    @pytest.fixture
+    def provider(self):
+        with patch.object(CompatibleNeo4jProvider, '_initialize_providers'):
+            provider = CompatibleNeo4jProvider({
+                'schema_mode': 'schemaless',
+                'use_schemaless_query': True,
+                'query_cache_size': 8
+            })
+        provider.schemaless_provider = Mock()
+        provider.schemaless_provider.query.return_value = []
+        return provider
+
+    def test_repeated_query_translated_once(self, provider):
+        query = "MATCH (n:Entity {name: $name}) RETURN n.importance"
+
+        with patch.object(provider.query_translator, 'translate_fixed_to_schemaless',
+                          wraps=provider.query_translator.translate_fixed_to_schemaless) as translate:
+            for _ in range(5):
+                provider.query(query, {'name': 'AI'})
+
+        assert translate.call_count == 1
+        executed = provider.schemaless_provider.query.call_args[0][0]
+        assert ':Node {_type: "Entity"' in executed
+        assert 'importance_score' in executed
+
+        stats = provider.get_query_cache_stats()
+        assert stats['hits'] == 4
+        assert stats['misses'] == 1
+        assert provider.get_migration_status()['query_cache']['size'] == 1
+
+
+class TestResultStandardizerPlans:
+    """Test the precomputed per-type property plans."""
+
+    def test_entity_plan_resolves_aliases_and_defaults(self):
+        standardizer = ResultStandardizer()
+
+        result = standardizer.standardize_results([{'n': {
+            'id': 'e1',
+            '_type': 'Entity',
+            'name': 'Neural Networks',
+            'importance_score': 0.9,
+            'total_mentions': 3
+        }}])[0]['n']
+
+        assert result['importance'] == 0.9
+        assert result['mention_count'] == 3
+        assert result['confidence'] == 1.0
+        assert result['is_peripheral'] is False
+        assert 'embedding' not in result
+
+    def test_segment_plan_adds_duration(self):
+        standardizer = ResultStandardizer()
+
+        result = standardizer.standardize_results([{'n': {
+            '_type': 'Segment',
+            'start_time': 10.0,
+            'end_time': 25.0,
+            'speaker_name': 'Host',
+            'segment_embedding': [0.1, 0.2]
+        }}])[0]['n']
+
+        assert result['duration'] == 15.0
+        assert result['speaker'] == 'Host'
+        assert result['embedding'] == [0.1, 0.2]
+
+    def test_new_properties_logged_once(self):
+        standardizer = ResultStandardizer()
+        node = {'id': 'q1', '_type': 'Quote', 'quote_text': 'hello'}
+
+        standardizer.standardize_results([{'n': node}, {'n': dict(node)}])
+
+        report = standardizer.get_evolution_report()
+        assert report['discovered_properties'] == {'Quote': ['quote_text']}
+        assert report['summary']['evolution_events'] == 2  # new type + new property
+
+
+class TestShadowWriteQueue:
+    """Test background secondary writes."""
+
+    def test_retries_then_applies(self):
+        writer = ShadowWriteQueue(max_retries=2, retry_base_delay=0.0)
+        func = Mock(side_effect=[Exception("transient"), "ok"])
+
+        writer.submit('update_node', func)
+        assert writer.flush(timeout=5)
+        writer.stop()
+
+        stats = writer.get_stats()
+        assert func.call_count == 2
+        assert stats['applied'] == 1
+        assert stats['retried'] == 1
+        assert writer.get_divergences() == []
+
+    def test_exhausted_retries_reported_as_divergence(self):
+        writer = ShadowWriteQueue(max_retries=1, retry_base_delay=0.0)
+
+        writer.submit('delete_node', Mock(side_effect=Exception("down")))
+        assert writer.flush(timeout=5)
+        writer.stop()
+
+        divergences = writer.get_divergences()
+        assert len(divergences) == 1
+        assert divergences[0]['operation'] == 'delete_node'
+        assert 'down' in divergences[0]['reason']
+        assert writer.get_stats()['failed'] == 1
+
+    def test_result_mismatch_reported(self):
+        writer = ShadowWriteQueue()
+
+        writer.submit('create_node', Mock(return_value='id-2'), primary_result='id-1', compare=True)
+        assert writer.flush(timeout=5)
+        writer.stop()
+
+        assert writer.get_stats()['mismatched'] == 1
+
+    def test_full_queue_drops_write(self):
+        writer = ShadowWriteQueue(max_size=1, enqueue_timeout=0.01)
+        release = threading.Event()
+        writer.submit('blocking', release.wait)
+
+        # Wait for the worker to pick up the first write, then fill the queue
+        while writer.get_stats()['pending']:
+            pass
+        assert writer.submit('queued', Mock()) is True
+        assert writer.submit('dropped', Mock()) is False
+
+        release.set()
+        writer.stop()
+        assert writer.get_stats()['dropped'] == 1
+
+
+class TestCompatibleProviderDualWrite:
+    """Test migration mode writes the primary synchronously and shadows the secondary."""
+
+    @pytest.fixture
+    def provider(self):
+        with patch.object(CompatibleNeo4jProvider, '_initialize_providers'):
+            provider = CompatibleNeo4jProvider({
+                'schema_mode': 'mixed',
+                'migration_mode': True,
+                'validate_dual_writes': True
+            })
+        provider.fixed_provider = Mock()
+        provider.schemaless_provider = Mock()
+        yield provider
+        provider.shadow_writer.stop()
+
+    def test_primary_written_before_return(self, provider):
+        release = threading.Event()
+        provider.schemaless_provider.update_node.side_effect = lambda *args: release.wait(5)
+
+        provider.update_node('n1', {'name': 'x'})
+
+        provider.fixed_provider.update_node.assert_called_once_with('n1', {'name': 'x'})
+        release.set()
+        assert provider.flush_shadow_writes(timeout=5)
+        provider.schemaless_provider.update_node.assert_called_once_with('n1', {'name': 'x'})
+
+    def test_create_node_divergence_reported(self, provider):
+        provider.fixed_provider.create_node.return_value = 'fixed-id'
+        provider.schemaless_provider.create_node.return_value = 'schemaless-id'
+
+        assert provider.create_node('Entity', {'name': 'AI'}) == 'fixed-id'
+        assert provider.flush_shadow_writes(timeout=5)
+
+        divergences = provider.get_dual_write_divergences()
+        assert len(divergences) == 1
+        assert 'fixed-id' in divergences[0]['reason']
+        assert provider.get_migration_status()['shadow_writes']['mismatched'] == 1
+
+    def test_prefer_schemaless_swaps_primary(self, provider):
+        provider.prefer_schemaless = True
+        provider.async_shadow_writes = False
+
+        provider.delete_node('n1')
+
+        provider.schemaless_provider.delete_node.assert_called_once_with('n1')
+        provider.fixed_provider.delete_node.assert_called_once_with('n1')
@@ -624,4 +624,77 @@ class TestMetadataEnricher:
                 enricher.add_extraction_metadata(node)
         
         # Node should still be valid
-        assert "id" in node
\ No newline at end of file
+        assert "id" in node
+
+class TestBatchedEmbeddings:
+    """Tests for batched, cached node embeddings in SchemalessMetadataEnricher."""
+
+    @pytest.fixture
+    def segment(self) -> Segment:
+        return Segment(id="seg1", start_time=0.0, end_time=5.0, text="AI and ML.", speaker="Host")
+
+    def test_segment_nodes_embedded_in_one_batch(self, segment):
+        from src.providers.graph.metadata_enricher import SchemalessMetadataEnricher
+
+        class Embedder:
+            model_name = 'mini'
+            batches = []
+
+            def generate_embedding(self, text):
+                raise AssertionError("single-text embedding should not be used")
+
+            def generate_embeddings(self, texts):
+                self.batches.append(texts)
+                return [[float(len(t))] for t in texts]
+
+        embedder = Embedder()
+        enricher = SchemalessMetadataEnricher()
+        nodes = [{"name": "AI"}, {"name": "Machine Learning"}, {"name": "AI"}]
+
+        enriched = enricher._enrich_nodes(nodes, segment, {}, {}, embedder.generate_embedding)
+
+        assert embedder.batches == [["AI", "Machine Learning"]]
+        assert [node['embedding'] for node in enriched] == [[2.0], [16.0], [2.0]]
+        assert enriched[0]['embedding_model'] == 'mini'
+
+    def test_shared_cache_skips_seen_texts(self):
+        from src.providers.graph.metadata_enricher import SchemalessMetadataEnricher
+        from src.providers.embeddings.cache import get_embedding_cache
+        from src.providers.embeddings.mock import MockEmbeddingProvider
+
+        provider = MockEmbeddingProvider({'model_name': 'mini', 'dimension': 4})
+        provider.generate_embeddings = Mock(wraps=provider.generate_embeddings)
+        enricher = SchemalessMetadataEnricher()
+
+        get_embedding_cache(provider).generate_embedding("AI")
+        nodes = [{"name": "AI"}, {"name": "  AI "}, {"name": "Podcasts"}]
+        enricher.add_embeddings_batch(nodes, embedder=provider.generate_embedding)
+
+        assert provider.generate_embeddings.call_args_list[-1].args == (["Podcasts"],)
+        assert get_embedding_cache(provider).get_stats()["hits"] == 1
+        assert nodes[0]['embedding'] == nodes[1]['embedding']
+        assert enricher.enrichment_stats["embedding_cache_hits"] == 1
+        assert enricher.enrichment_stats["embeddings_computed"] == 1
+
+    def test_single_text_embedder_fallback(self, segment):
+        from src.providers.graph.metadata_enricher import SchemalessMetadataEnricher
+        enricher = SchemalessMetadataEnricher()
+        embedder = Mock(side_effect=lambda text: [1.0, 2.0])
+
+        fields = enricher.add_embeddings({"name": "AI"}, embedder)
+
+        assert fields == ['embedding', 'embedding_model', 'embedding_dimension']
+        embedder.assert_called_once_with("AI")
+
+    def test_stats_are_aggregates(self, segment):
+        from src.providers.graph.metadata_enricher import SchemalessMetadataEnricher
+        enricher = SchemalessMetadataEnricher()
+
+        for _ in range(3):
+            enricher._enrich_nodes([{"name": "AI"}, {"name": "ML"}], segment, {}, {}, None)
+
+        stats = enricher.enrichment_stats
+        assert stats["nodes_enriched"] == 6
+        assert all(not isinstance(value, list) for value in stats.values())
+        details = enricher.get_enrichment_metrics()["details"]
+        assert details["avg_fields_per_node"] == stats["fields_total"] / 6
@@ -0,0 +1,168 @@
+"""Tests for the multi-route LLM router."""
+
+import sys
+import types
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.providers.llm.router import LLMRouter
+from src.providers.llm.gemini import GeminiProvider
+from src.core.exceptions import ProviderError, RateLimitError
+from src.utils.rate_limiting import WindowedRateLimiter
+
+
+def make_router(*names, **config):
+    """Create a router over mock routes, each with its own windowed rate limiter."""
+    routes = [
+        {'provider': 'mock', 'name': name, 'model_name': f'model-{name}',
+         'default_response': f'from {name}'}
+        for name in names
+    ]
+    router = LLMRouter({'llm_routes': routes, **config})
+    for route in router.routes:
+        route.provider.rate_limiter = WindowedRateLimiter({'default': {'rpm': 10, 'rpd': 100}})
+    return router
+
+
+def route(router, name):
+    return next(r for r in router.routes if r.name == name)
+
+
+class TestLLMRouter:
+    """Tests for route selection and failover."""
+
+    def test_routes_built_from_config(self):
+        router = make_router('a', 'b')
+
+        assert [r.name for r in router.routes] == ['a', 'b']
+        assert route(router, 'b').provider.model_name == 'model-b'
+
+    def test_prefers_lower_latency(self):
+        router = make_router('slow', 'fast')
+        route(router, 'slow').latency = 2.0
+        route(router, 'fast').latency = 0.1
+
+        assert router.complete("hello") == 'from fast'
+
+    def test_in_flight_requests_spread_load(self):
+        router = make_router('a', 'b')
+        route(router, 'a').latency = 0.1
+        route(router, 'b').latency = 0.15
+        # Two requests already running on 'a' make 'b' the faster choice
+        route(router, 'a').in_flight = 2
+
+        assert router.complete("hello") == 'from b'
+
+    def test_route_without_capacity_is_passed_over(self):
+        router = make_router('a', 'b')
+        route(router, 'a').provider.rate_limiter = WindowedRateLimiter({'default': {'rpm': 1}})
+        route(router, 'a').provider.rate_limiter.record_request('model-a')
+
+        assert router.complete("hello") == 'from b'
+
+    def test_daily_limit_cools_route_down(self):
+        router = make_router('a', 'b')
+        limiter = WindowedRateLimiter({'default': {'rpd': 1}})
+        limiter.record_request('model-a')
+        route(router, 'a').provider.rate_limiter = limiter
+
+        assert router.complete("hello") == 'from b'
+        status = router.get_rate_limits()
+        assert status['a']['cooldown_remaining'] > 80000
+        assert status['b']['requests'] == 1
+
+    def test_fails_over_on_rate_limit_error(self):
+        router = make_router('a', 'b')
+        failing = route(router, 'a').provider
+        failing.complete = Mock(side_effect=RateLimitError("gemini", "quota", retry_after=30))
+        route(router, 'b').latency = 5.0
+
+        assert router.complete("hello") == 'from b'
+        assert router.complete("again") == 'from b'
+        failing.complete.assert_called_once()
+        assert route(router, 'a').failures == 1
+        assert 25 < router.get_rate_limits()['a']['cooldown_remaining'] <= 30
+
+    def test_all_routes_limited_raises_with_retry_after(self):
+        router = make_router('a', 'b', route_cooldown=45)
+        for r in router.routes:
+            r.provider.complete = Mock(side_effect=RateLimitError("gemini", "quota"))
+
+        with pytest.raises(RateLimitError) as exc_info:
+            router.complete("hello")
+
+        assert 40 < exc_info.value.details['retry_after'] <= 45
+
+    def test_provider_errors_fail_over_then_raise(self):
+        router = make_router('a', 'b')
+        for r in router.routes:
+            r.provider.complete = Mock(side_effect=ProviderError("gemini", "boom"))
+
+        with pytest.raises(ProviderError, match="All LLM routes failed"):
+            router.complete("hello")
+        assert all(r.in_flight == 0 for r in router.routes)
+
+    def test_unexpected_error_releases_route(self):
+        router = make_router('a')
+        route(router, 'a').provider.complete = Mock(side_effect=ValueError("bad response"))
+
+        with pytest.raises(ValueError):
+            router.complete("hello")
+        assert route(router, 'a').in_flight == 0
+        assert route(router, 'a').failures == 1
+
+    def test_complete_with_options_reports_route(self):
+        router = make_router('a')
+
+        result = router.complete_with_options("hello", {'temperature': 0.1})
+
+        assert result['route'] == 'a'
+        assert result['temperature'] == 0.1
+        assert route(router, 'a').latency is not None
+
+
+    def test_same_model_routes_keep_separate_key_budgets(self, tmp_path):
+        ledger = str(tmp_path / 'ledger.sqlite')
+        router = LLMRouter({
+            'rate_limit_backend': 'sqlite',
+            'rate_limit_ledger_path': ledger,
+            'rate_limits': {'gemini-2.0-flash': {'rpm': 1}},
+            'llm_routes': [
+                {'name': 'key1', 'model_name': 'gemini-2.0-flash', 'api_key': 'k1'},
+                {'name': 'key2', 'model_name': 'gemini-2.0-flash', 'api_key': 'k2'},
+                {'name': 'key1-again', 'model_name': 'gemini-2.0-flash', 'api_key': 'k1'},
+            ]
+        })
+        key1, key2, key1_again = (route(router, name) for name in ('key1', 'key2', 'key1-again'))
+
+        assert key1.rate_limit_id != key2.rate_limit_id
+        assert key1.rate_limit_id == key1_again.rate_limit_id
+        assert 'k1' not in key1.rate_limit_id
+
+        # Spend key1's per-minute budget on the shared ledger
+        key1.provider.rate_limiter.record_request(key1.rate_limit_id)
+
+        assert key1.time_until_available(1) > 0
+        assert key1_again.time_until_available(1) > 0
+        assert key2.time_until_available(1) == 0
+
+
+class TestGeminiClientPool:
+    """Tests for reusing Gemini clients across per-call options."""
+
+    def test_clients_reused_per_options(self):
+        client_class = MagicMock()
+        client_class.return_value.invoke.return_value = MagicMock(content="ok")
+        fake_module = types.SimpleNamespace(ChatGoogleGenerativeAI=client_class)
+
+        with patch.dict(sys.modules, {'langchain_google_genai': fake_module}):
+            provider = GeminiProvider({'model_name': 'gemini-2.0-flash', 'api_key': 'key',
+                                       'temperature': 0.7})
+            provider.complete("one")
+            for _ in range(3):
+                provider.complete_with_options("two", {'temperature': 0.2})
+            provider.complete_with_options("three", {'temperature': 0.7})
+
+        # One client for the defaults and one for temperature 0.2
+        assert client_class.call_count == 2
@@ -230,6 +230,34 @@ class TestBatchProcessor:
         assert stats['optimal_batch_size'] > 0
         assert stats['worker_count'] == 2
 
+    
+    @patch('src.seeding.batch_processor.get_model_pool')
+    def test_failed_submit_still_finishes_fork(self, mock_get_pool):
+        """Test the model pool leaves its pre-fork state even if submission fails."""
+        processor = BatchProcessor(max_workers=2, use_processes=True)
+        executor = Mock()
+        executor.__enter__ = Mock(return_value=executor)
+        executor.__exit__ = Mock(return_value=False)
+        executor.submit.side_effect = RuntimeError("pool broken")
+        
+        with patch.object(processor, '_create_executor', return_value=executor):
+            with pytest.raises(RuntimeError):
+                processor.process_items([BatchItem(id='1', data=1)], lambda x: x.data)
+        
+        mock_get_pool.return_value.finish_fork.assert_called_once()
+    
+    @patch('src.seeding.batch_processor.get_model_pool')
+    def test_spawns_workers_when_models_not_fork_safe(self, mock_get_pool):
+        """Test workers are spawned instead of forked next to unsafe models."""
+        mock_get_pool.return_value.prepare_for_fork.return_value = False
+        processor = BatchProcessor(max_workers=2, use_processes=True)
+        
+        with patch('src.seeding.batch_processor.mp.get_all_start_methods',
+                   return_value=['fork', 'spawn']), \
+                patch('src.seeding.batch_processor.ProcessPoolExecutor') as pool_class:
+            processor._create_executor()
+        
+        assert pool_class.call_args.kwargs['mp_context'].get_start_method() == 'spawn'
 
 class TestPriorityBatchProcessor:
     """Tests for PriorityBatchProcessor."""
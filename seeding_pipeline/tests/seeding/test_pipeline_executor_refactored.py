@@ -8,9 +8,11 @@ to ensure they maintain the same behavior as the original code.
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 import os
+import threading
 
 from src.seeding.components.pipeline_executor import PipelineExecutor
 from src.core.exceptions import PipelineError
+from src.core.segment_store import SegmentStore
 
 
 class TestPipelineExecutorHelperMethods:
@@ -149,10 +151,13 @@ class TestPipelineExecutorHelperMethods:
             result = pipeline_executor._process_audio_segments(audio_path, episode_id)
         
         # Assert
-        assert result == mock_segments
+        assert isinstance(result, SegmentStore)
+        assert [segment['text'] for segment in result] == ['Segment 1', 'Segment 2']
+        assert result[1].id == 'ep123_segment_1'
+        assert result[1]['start'] == 30 and result[1].end_time == 60
         pipeline_executor._prepare_segments.assert_called_once_with(audio_path)
         pipeline_executor.checkpoint_manager.save_progress.assert_called_once_with(
-            episode_id, "segments", mock_segments
+            episode_id, "segments", result
         )
     
     def test_determine_extraction_mode_fixed(self, pipeline_executor):
@@ -191,12 +196,177 @@ class TestPipelineExecutorHelperMethods:
         # Assert
         assert result == 'migration'
     
-    @patch('src.seeding.components.pipeline_executor.cleanup_memory')
+    def test_migration_mode_runs_extractions_concurrently(self, pipeline_executor):
+        """Test both extraction pipelines run at the same time in migration mode."""
+        # Setup - each extraction waits until the other has started
+        pipeline_executor.config.parallel_migration_extraction = True
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def fixed(*args):
+            barrier.wait()
+            return {'entities': 3, 'insights': 2}
+        
+        def schemaless(*args):
+            barrier.wait()
+            return {'entities': 4, 'relationships': 5, 'discovered_types': ['Person']}
+        
+        with patch.object(pipeline_executor, '_extract_fixed_schema', side_effect=fixed), \
+             patch.object(pipeline_executor, '_extract_schemaless', side_effect=schemaless):
+            # Execute
+            result = pipeline_executor._handle_migration_mode(
+                {'id': 'p1'}, {'id': 'ep1', 'title': 'Ep'}, [{'text': 'a'}], 'ep1', False
+            )
+        
+        # Assert
+        assert result['mode'] == 'migration'
+        assert result['entities'] == 3
+        assert result['insights'] == 2
+        assert result['relationships'] == 5
+        assert result['discovered_types'] == ['Person']
+    
+    def test_migration_mode_propagates_extraction_errors(self, pipeline_executor):
+        """Test a failing extraction pipeline fails the episode in migration mode."""
+        pipeline_executor.config.parallel_migration_extraction = True
+        
+        with patch.object(pipeline_executor, '_extract_fixed_schema', return_value={'entities': 0, 'insights': 0}), \
+             patch.object(pipeline_executor, '_extract_schemaless', side_effect=PipelineError("boom")):
+            with pytest.raises(PipelineError):
+                pipeline_executor._handle_migration_mode(
+                    {'id': 'p1'}, {'id': 'ep1', 'title': 'Ep'}, [], 'ep1', False
+                )
+    
+    def test_episode_analyses_run_concurrently(self, pipeline_executor):
+        """Test post-extraction analyses run side by side and merge in a fixed order."""
+        # Setup - each analysis waits until the others have started
+        pipeline_executor.config.analysis_executor = 'thread'
+        pipeline_executor.config.analysis_timeout = 5
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def analysis(result):
+            def run(*args, **kwargs):
+                barrier.wait()
+                return result
+            return run
+        
+        pipeline_executor.discourse_flow_tracker.analyze_episode_flow = analysis({'flow': 1})
+        pipeline_executor._add_flow_data_to_entities = Mock()
+        segments = SegmentStore.from_dicts([{'text': 'a', 'start_time': 0, 'end_time': 1}])
+        entities = [Mock(id='e1')]
+        
+        episode_flow = {
+            'concept_introductions': {'e1': {'introduction_segment': 0}},
+            'summary': {'flow_pattern': 'linear', 'narrative_coherence': 0.8}
+        }
+        
+        with patch.object(pipeline_executor, '_detect_themes', side_effect=analysis({'themes': []})), \
+             patch.object(pipeline_executor, '_build_episode_flow', side_effect=analysis(episode_flow)):
+            # Execute
+            results = pipeline_executor._run_episode_analyses(entities, {'insights': []}, segments)
+        
+        # Assert - entities get the full flow analysis, the episode its summary
+        assert list(results) == ['discourse_flow', 'emergent_themes', 'episode_flow']
+        assert results['discourse_flow'] == {'flow': 1}
+        assert results['emergent_themes'] == {'themes': []}
+        assert results['episode_flow'] == {
+            'pattern': 'linear', 'key_transitions': [], 'flow_quality': 0.8
+        }
+        pipeline_executor._add_flow_data_to_entities.assert_called_once_with(
+            entities, episode_flow, segments
+        )
+    
+    def test_episode_analysis_timeout(self, pipeline_executor):
+        """Test an analysis that runs over its timeout does not hold up the episode."""
+        pipeline_executor.config.analysis_executor = 'thread'
+        pipeline_executor.config.analysis_timeout = 0.1
+        release = threading.Event()
+        pipeline_executor.discourse_flow_tracker.analyze_episode_flow = Mock(return_value={'flow': 1})
+        pipeline_executor._add_flow_data_to_entities = Mock()
+        
+        with patch.object(pipeline_executor, '_detect_themes', side_effect=lambda *a: release.wait(10)), \
+             patch.object(pipeline_executor, '_build_episode_flow', return_value={}):
+            results = pipeline_executor._run_episode_analyses([], {}, [])
+        release.set()
+        
+        assert results == {'discourse_flow': {'flow': 1}, 'emergent_themes': {}, 'episode_flow': {}}
+        pipeline_executor._add_flow_data_to_entities.assert_not_called()
+    
+    def test_process_analyses_share_one_pool(self, pipeline_executor):
+        """Test the process analysis executor reuses one spawned pool across episodes."""
+        pipeline_executor.config.analysis_executor = 'process'
+        pipeline_executor.config.analysis_timeout = 5
+        pipeline_executor.discourse_flow_tracker.analyze_episode_flow = Mock(return_value={'flow': 1})
+        
+        with patch('src.seeding.components.pipeline_executor.ProcessPoolExecutor') as pool_class, \
+             patch.object(pipeline_executor, '_detect_themes', return_value={}), \
+             patch.object(pipeline_executor, '_build_episode_flow', return_value={}):
+            for _ in range(2):
+                results = pipeline_executor._run_episode_analyses([], {}, [])
+            pipeline_executor.close()
+        
+        # Mocked stages cannot be pickled, so they ran on threads
+        assert results['discourse_flow'] == {'flow': 1}
+        pool_class.assert_called_once()
+        assert pool_class.call_args.kwargs['mp_context'].get_start_method() == 'spawn'
+        pool_class.return_value.shutdown.assert_called_once()
+    
+    def test_process_episode_records_stage_profile(self, pipeline_executor):
+        """Test episodes listed for profiling get stage counters and stack samples."""
+        from src.utils.stage_profiling import StageProfiler
+
+        # Setup
+        pipeline_executor.config.stage_profiling = True
+        pipeline_executor.config.profile_episodes = ['ep1']
+        pipeline_executor.config.profile_sample_interval_ms = 1.0
+        pipeline_executor.config.profile_output_dir = None
+        pipeline_executor.config.delete_audio_after_processing = False
+        pipeline_executor.stage_profiler = StageProfiler()
+        pipeline_executor.memory_budget = MagicMock()
+        pipeline_executor.checkpoint_manager.is_completed.return_value = False
+        pipeline_executor._prepare_segments = Mock(return_value=[{'text': 'a'}])
+        result = {'segments': 1, 'insights': 0, 'entities': 0, 'mode': 'fixed'}
+
+        with patch.object(pipeline_executor, '_download_episode_audio', return_value='/tmp/ep1.mp3'), \
+             patch.object(pipeline_executor, '_extract_knowledge', return_value=result):
+            # Execute
+            pipeline_executor.process_episode({'id': 'p1'}, {'id': 'ep1', 'title': 'Ep'}, False)
+
+        # Assert
+        profile = pipeline_executor.stage_profiler.get_profile('ep1')
+        assert list(profile.stages) == ['download', 'segmentation']
+        assert profile.sampled
+
+    @patch('src.utils.memory.get_memory_usage', return_value=950.0)
+    @patch('src.utils.memory.gc.collect')
+    def test_process_episode_over_budget_does_not_wait_when_alone(self, mock_gc, mock_usage,
+                                                                 pipeline_executor):
+        """Test an over-budget episode starts at once when no other episode is in flight."""
+        from src.utils.memory import MemoryBudget
+
+        # Setup
+        pipeline_executor.config.stage_profiling = False
+        pipeline_executor.config.delete_audio_after_processing = False
+        pipeline_executor.memory_budget = MemoryBudget(budget_mb=1000, backpressure_timeout=60)
+        pipeline_executor.checkpoint_manager.is_completed.return_value = False
+        pipeline_executor._prepare_segments = Mock(return_value=[{'text': 'a'}])
+        result = {'segments': 1, 'insights': 0, 'entities': 0, 'mode': 'fixed'}
+
+        with patch.object(pipeline_executor, '_download_episode_audio', return_value='/tmp/ep1.mp3'), \
+             patch.object(pipeline_executor, '_extract_knowledge', return_value=result), \
+             patch('src.utils.memory.time.sleep') as mock_sleep:
+            # Execute
+            pipeline_executor.process_episode({'id': 'p1'}, {'id': 'ep1', 'title': 'Ep'}, False)
+
+        # Assert
+        mock_sleep.assert_not_called()
+        assert pipeline_executor.memory_budget.get_stats()['backpressure_waits'] == 0
+        assert pipeline_executor.memory_budget.in_flight == 0
+
     @patch('src.seeding.components.pipeline_executor.add_span_attributes')
-    def test_finalize_episode_processing(self, mock_add_span, mock_cleanup, pipeline_executor):
+    def test_finalize_episode_processing(self, mock_add_span, pipeline_executor):
         """Test _finalize_episode_processing completes all steps."""
         # Setup
         episode_id = 'ep123'
+        pipeline_executor.memory_budget = Mock()
         result = {
             'segments': 5,
             'insights': 10,
@@ -211,7 +381,7 @@ class TestPipelineExecutorHelperMethods:
         pipeline_executor.checkpoint_manager.mark_completed.assert_called_once_with(
             episode_id, result
         )
-        mock_cleanup.assert_called_once()
+        pipeline_executor.memory_budget.release.assert_called_once()
         mock_add_span.assert_called_once_with({
             "result.segments": 5,
             "result.insights": 10,
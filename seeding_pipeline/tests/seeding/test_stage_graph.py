@@ -0,0 +1,126 @@
+"""Tests for the concurrent stage graph."""
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.seeding.stage_graph import StageGraph
+
+
+def _square(value):
+    return value * value
+
+
+def _process_id():
+    return os.getpid()
+
+
+class TestStageGraph:
+    """Test dependency-ordered concurrent stage execution."""
+
+    @pytest.mark.parametrize("executor", ["serial", "thread"])
+    def test_results_follow_declaration_order(self, executor):
+        graph = StageGraph(executor=executor)
+        graph.add("slow", lambda: time.sleep(0.05) or "slow")
+        graph.add("fast", lambda: "fast")
+        graph.add("combined", lambda slow, fast: f"{slow}+{fast}", depends_on=("slow", "fast"))
+
+        outcomes = graph.run()
+
+        assert list(outcomes) == ["slow", "fast", "combined"]
+        assert outcomes["combined"].result == "slow+fast"
+        assert all(outcome.ok for outcome in outcomes.values())
+
+    def test_independent_stages_run_concurrently(self):
+        # Each stage waits until all three have started
+        barrier = threading.Barrier(3, timeout=5)
+
+        def stage(name):
+            barrier.wait()
+            return name
+
+        graph = StageGraph(executor="thread")
+        for name in ("a", "b", "c"):
+            graph.add(name, stage, name)
+
+        outcomes = graph.run()
+
+        assert [outcome.result for outcome in outcomes.values()] == ["a", "b", "c"]
+
+    def test_timeout_uses_default_and_skips_dependents(self):
+        release = threading.Event()
+        graph = StageGraph(executor="thread", timeout=5)
+        graph.add("stuck", release.wait, 10, timeout=0.1, default={})
+        graph.add("after", lambda stuck: "never", depends_on=("stuck",), default="skipped")
+        graph.add("other", lambda: "done")
+
+        start = time.perf_counter()
+        outcomes = graph.run()
+        release.set()
+
+        assert time.perf_counter() - start < 5
+        assert outcomes["stuck"].status == "timed_out" and outcomes["stuck"].result == {}
+        assert outcomes["after"].status == "skipped" and outcomes["after"].result == "skipped"
+        assert outcomes["other"].result == "done"
+
+    def test_failures_are_raised_or_reported(self):
+        def fail():
+            raise KeyError("boom")
+
+        graph = StageGraph(executor="thread")
+        graph.add("ok", lambda: 1)
+        graph.add("failing", fail, default=0)
+
+        with pytest.raises(KeyError):
+            graph.run()
+
+        outcomes = graph.run(raise_on_error=False)
+        assert outcomes["failing"].status == "failed"
+        assert outcomes["failing"].result == 0
+        assert outcomes["ok"].result == 1
+
+    def test_process_executor_falls_back_to_threads(self):
+        graph = StageGraph(executor="process")
+        graph.add("square", _square, 7)
+        graph.add("pid", _process_id)
+        graph.add("unpicklable", lambda: os.getpid())
+
+        outcomes = graph.run()
+
+        assert outcomes["square"].result == 49
+        assert outcomes["pid"].result != os.getpid()
+        assert outcomes["unpicklable"].result == os.getpid()
+
+    def test_shared_process_pool_outlives_graphs(self):
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            pids = set()
+            for value in (2, 3):
+                graph = StageGraph(executor="process", process_pool=pool)
+                graph.add("square", _square, value)
+                graph.add("pid", _process_id)
+                outcomes = graph.run()
+                assert outcomes["square"].result == value * value
+                pids.add(outcomes["pid"].result)
+
+        # Both graphs ran on the single worker of the shared pool
+        assert len(pids) == 1 and os.getpid() not in pids
+
+    def test_invalid_graphs(self):
+        with pytest.raises(ValueError):
+            StageGraph(executor="gpu")
+
+        graph = StageGraph().add("a", _square, 1)
+        with pytest.raises(ValueError):
+            graph.add("a", _square, 2)
+
+        with pytest.raises(ValueError):
+            StageGraph().add("a", _square, 1, depends_on=("missing",)).run()
+
+        cyclic = StageGraph()
+        cyclic.add("a", lambda b: b, depends_on=("b",))
+        cyclic.add("b", lambda a: a, depends_on=("a",))
+        with pytest.raises(ValueError):
+            cyclic.run()
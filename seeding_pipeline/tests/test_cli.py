@@ -310,4 +310,18 @@ class TestCLI:
         
         exit_code = main()
         
-        assert exit_code == 1
\ No newline at end of file
+        assert exit_code == 1
+    
+    @patch('sys.argv', ['cli.py', 'analyze-graph', '--work-dir', 'out', '--pivots', '64'])
+    @patch('cli.analyze_graph')
+    def test_main_analyze_graph_command(self, mock_analyze_graph):
+        """Test main with analyze-graph command."""
+        mock_analyze_graph.return_value = 0
+        
+        exit_code = main()
+        
+        assert exit_code == 0
+        args = mock_analyze_graph.call_args[0][0]
+        assert args.work_dir == 'out'
+        assert args.pivots == 64
+        assert args.restart is False
@@ -351,4 +351,153 @@ class TestDataMigrator:
         
         # Verify counts were retrieved
         assert result['podcasts'].total_items == 25
-        assert migrator.batch_size == 10
\ No newline at end of file
+        assert migrator.batch_size == 10
+
+class FakeKeysetProvider:
+    """Graph provider double that serves keyset-paginated label reads."""
+    
+    def __init__(self, nodes_by_label):
+        self.nodes_by_label = {
+            label: sorted(nodes, key=lambda n: n['id'])
+            for label, nodes in nodes_by_label.items()
+        }
+        self.read_params = []
+        self.writes = []
+    
+    def _label(self, query):
+        # The first pattern names the label being paged or written
+        return query.split("MATCH (")[1].split(":")[1].split(")")[0].split(" ")[0]
+    
+    def execute_query(self, query, params=None):
+        label = self._label(query)
+        nodes = self.nodes_by_label.get(label, [])
+        if "count(" in query:
+            return [{'count': len(nodes)}]
+        
+        self.read_params.append((label, dict(params)))
+        var = query.split("MATCH (")[1].split(":")[0]
+        page = [n for n in nodes if n['id'] > params['last_id']][:params['limit']]
+        records = []
+        for node in page:
+            record = {var: node}
+            if "podcast_id" in query:
+                record['podcast_id'] = node.get('parent')
+            if "episode_id" in query:
+                record['episode_id'] = node.get('parent')
+            records.append(record)
+        return records
+    
+    def execute_write(self, query, params=None):
+        self.writes.append((self._label(query), params['rows']))
+        return {}
+
+
+class TestKeysetMigration:
+    """Test keyset pagination, batched writes and resumable checkpoints."""
+    
+    @pytest.fixture
+    def provider(self):
+        return FakeKeysetProvider({
+            'Podcast': [{'id': 'p1', 'title': 'Podcast'}],
+            'Episode': [{'id': f'e{i:02d}', 'parent': 'p1'} for i in range(5)]
+                       + [{'id': 'e99'}],  # orphan
+            'Segment': [{'id': f's{i:03d}', 'text': 't', 'parent': 'e00'} for i in range(23)],
+            'Entity': [{'id': f'n{i}'} for i in range(3)],
+        })
+    
+    def test_pages_by_last_id_with_one_write_per_page(self, provider, tmp_path):
+        migrator = DataMigrator(provider, checkpoint_dir=tmp_path, batch_size=10)
+        
+        result = migrator.migrate_all()
+        
+        segment_reads = [p for label, p in provider.read_params if label == 'Segment']
+        assert [p['last_id'] for p in segment_reads] == ['', 's009', 's019']
+        assert all(p['limit'] == 10 for p in segment_reads)
+        
+        segment_writes = [rows for label, rows in provider.writes if label == 'Segment']
+        assert [len(rows) for rows in segment_writes] == [10, 10, 3]
+        assert segment_writes[0][0] == {'id': 's000', 'episode_id': 'e00'}
+        
+        assert result['segments'].status == MigrationStatus.COMPLETED
+        assert result['segments'].processed_items == 23
+        assert result['segments'].last_id == 's022'
+        assert result['episodes'].processed_items == 5
+        assert result['episodes'].skipped_items == 1
+        assert result['entities'].processed_items == 3
+    
+    def test_dry_run_does_not_write(self, provider, tmp_path):
+        migrator = DataMigrator(provider, checkpoint_dir=tmp_path, batch_size=10)
+        
+        result = migrator.migrate_all(dry_run=True)
+        
+        assert provider.writes == []
+        assert result['segments'].processed_items == 23
+        assert not (tmp_path / "migration_progress.json").exists()
+    
+    def test_resumes_after_checkpointed_last_id(self, provider, tmp_path):
+        checkpoint = {
+            key: MigrationProgress(status=MigrationStatus.COMPLETED).to_dict()
+            for key in ['podcasts', 'episodes', 'entities', 'insights',
+                        'quotes', 'topics', 'speakers']
+        }
+        checkpoint['segments'] = MigrationProgress(
+            processed_items=10,
+            status=MigrationStatus.FAILED,
+            last_id='s009'
+        ).to_dict()
+        (tmp_path / "migration_progress.json").write_text(json.dumps(checkpoint))
+        
+        migrator = DataMigrator(provider, checkpoint_dir=tmp_path, batch_size=10)
+        result = migrator.migrate_all()
+        
+        assert {label for label, _ in provider.read_params} == {'Segment'}
+        assert provider.read_params[0][1]['last_id'] == 's009'
+        assert result['segments'].processed_items == 23
+        
+        saved = json.loads((tmp_path / "migration_progress.json").read_text())
+        assert saved['segments']['last_id'] == 's022'
+        assert saved['segments']['status'] == 'completed'
+    
+    def test_failed_write_stops_label_without_advancing(self, provider, tmp_path):
+        provider.execute_write = Mock(side_effect=Exception("write failed"))
+        migrator = DataMigrator(provider, checkpoint_dir=tmp_path, batch_size=10)
+        
+        result = migrator.migrate_all()
+        
+        assert result['podcasts'].status == MigrationStatus.FAILED
+        assert result['podcasts'].failed_items == 1
+        assert result['podcasts'].processed_items == 0
+        assert result['podcasts'].last_id is None
+        # Later stages never start once a page write fails
+        assert provider.execute_write.call_count == 1
+        assert result['segments'].status == MigrationStatus.PENDING
+    
+    def test_resume_retries_page_whose_write_failed(self, provider, tmp_path):
+        write = provider.execute_write
+        
+        def fail_second_segment_page(query, params=None):
+            if "Segment" in query and params['rows'][0]['id'] == 's010':
+                raise Exception("write failed")
+            return write(query, params)
+        
+        provider.execute_write = fail_second_segment_page
+        migrator = DataMigrator(provider, checkpoint_dir=tmp_path, batch_size=10)
+        
+        result = migrator.migrate_all()
+        
+        assert result['segments'].status == MigrationStatus.FAILED
+        assert result['segments'].last_id == 's009'
+        saved = json.loads((tmp_path / "migration_progress.json").read_text())
+        assert saved['segments']['last_id'] == 's009'
+        
+        provider.execute_write = write
+        provider.read_params = []
+        provider.writes = []
+        result = DataMigrator(provider, checkpoint_dir=tmp_path, batch_size=10).migrate_all()
+        
+        segment_reads = [p for label, p in provider.read_params if label == 'Segment']
+        assert segment_reads[0]['last_id'] == 's009'
+        segment_writes = [rows for label, rows in provider.writes if label == 'Segment']
+        assert segment_writes[0][0]['id'] == 's010'
+        assert result['segments'].status == MigrationStatus.COMPLETED
+        assert result['segments'].last_id == 's022'
@@ -0,0 +1,93 @@
+"""Unit tests for float32 embedding handling."""
+
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from src.core.embeddings import (
+    as_embedding,
+    decode_embedding,
+    embedding_matrix,
+    embedding_to_list,
+    encode_embedding,
+    has_embedding,
+    json_default,
+)
+from src.core.models import Entity, EntityType, Quote, Segment
+
+
+class TestEmbeddingCodec:
+    """Test conversion between lists, arrays and encoded embeddings"""
+
+    def test_as_embedding(self):
+        assert as_embedding(None) is None
+
+        embedding = as_embedding([0.5, 0.25, 1.0])
+        assert embedding.dtype == np.float32
+        assert embedding.tolist() == [0.5, 0.25, 1.0]
+        # Float32 arrays are not copied
+        assert as_embedding(embedding) is embedding
+        assert as_embedding(np.array([1.0, 2.0])).dtype == np.float32
+
+    def test_round_trip_through_base64(self):
+        embedding = np.linspace(-1, 1, 768, dtype=np.float32)
+
+        encoded = encode_embedding(embedding)
+
+        assert isinstance(encoded, str)
+        assert len(encoded) < len(json.dumps(embedding.tolist())) / 2
+        np.testing.assert_array_equal(decode_embedding(encoded), embedding)
+        np.testing.assert_array_equal(as_embedding(encoded), embedding)
+        # Lists written by older versions are still read
+        assert decode_embedding([0.5, 1.5]).tolist() == [0.5, 1.5]
+        assert encode_embedding(None) is None and decode_embedding(None) is None
+
+    def test_matrix_skips_missing(self):
+        matrix = embedding_matrix([[1, 0], None, [], np.array([0, 1], dtype=np.float32)])
+
+        assert matrix.shape == (2, 2) and matrix.dtype == np.float32
+        assert embedding_matrix([]).shape == (0, 0)
+
+    def test_json_and_graph_values(self):
+        data = {'embedding': np.array([0.5, 0.25], dtype=np.float32), 'score': np.float32(0.5)}
+
+        assert json.loads(json.dumps(data, default=json_default)) == {
+            'embedding': [0.5, 0.25], 'score': 0.5
+        }
+        assert embedding_to_list(np.array([0.5], dtype=np.float32)) == [0.5]
+        assert embedding_to_list(None) is None
+        with pytest.raises(TypeError):
+            json.dumps({'value': object()}, default=json_default)
+
+
+class TestModelEmbeddings:
+    """Test float32 embeddings on the data models"""
+
+    def test_models_store_float32(self):
+        entity = Entity(id='e1', name='AI', entity_type=EntityType.CONCEPT, embedding=[0.1] * 768)
+        segment = Segment(id='s1', text='text', start_time=0, end_time=1, embedding=[0.2] * 4)
+        quote = Quote(id='q1', text='quote', speaker='Host')
+
+        assert entity.embedding.dtype == np.float32
+        assert segment.embedding.dtype == np.float32
+        assert quote.embedding is None
+        assert has_embedding(entity) and not has_embedding(quote)
+        assert not has_embedding(Segment(id='s2', text='', start_time=0, end_time=1, embedding=[]))
+
+    def test_to_dict_writes_lists(self):
+        entity = Entity(id='e1', name='AI', entity_type=EntityType.CONCEPT, embedding=[0.5, 0.25])
+
+        properties = entity.to_dict()
+
+        assert properties['embedding'] == [0.5, 0.25]
+        assert all(type(value) is float for value in properties['embedding'])
+
+    def test_pickled_embedding_is_compact(self):
+        as_list = Entity(id='e1', name='AI', entity_type=EntityType.CONCEPT)
+        as_list.embedding = [float(i) / 768 for i in range(768)]
+        as_array = Entity(id='e1', name='AI', entity_type=EntityType.CONCEPT,
+                          embedding=as_list.embedding)
+
+        assert len(pickle.dumps(as_array)) < len(pickle.dumps(as_list)) / 2
@@ -300,7 +300,8 @@ class TestSegment:
         )
         
         assert segment.speaker == "Speaker One"
-        assert segment.embedding == embedding
+        # Embeddings are stored as float32 arrays
+        assert segment.embedding.tolist() == pytest.approx(embedding)
         assert segment.is_advertisement is False
         assert segment.word_count == 3
         assert segment.complexity_score == 0.7
@@ -347,7 +348,7 @@ class TestSegment:
         result = segment.to_dict()
         
         # Embedding is included in to_dict
-        assert result["embedding"] == [0.5, 0.6]
+        assert result["embedding"] == pytest.approx([0.5, 0.6])
 
 
 class TestSpeaker:
@@ -0,0 +1,127 @@
+"""Unit tests for the columnar segment store."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from src.core.models import Segment
+from src.core.segment_store import SegmentStore, SegmentView, lower_text
+
+
+@pytest.fixture
+def segment_dicts():
+    return [
+        {'text': 'Welcome to the Show', 'start_time': 0.0, 'end_time': 4.5, 'speaker': 'Host'},
+        {'text': 'Thanks, great to be here', 'start': 4.5, 'end': 7.0, 'speaker': 'Guest'},
+        {'text': '', 'start_time': 7.0, 'end_time': 7.5},
+        {'text': 'The show covers Python and PYTHON tooling', 'start_time': 7.5, 'end_time': 12.0,
+         'speaker': 'Host', 'is_advertisement': True},
+    ]
+
+
+class TestSegmentStore:
+    """Test columnar storage and segment views"""
+
+    def test_columns_from_dicts(self, segment_dicts):
+        store = SegmentStore.from_dicts(segment_dicts, episode_id='ep1')
+
+        assert len(store) == 4
+        assert [store.text(i) for i in range(4)] == [d['text'] for d in segment_dicts]
+        np.testing.assert_array_equal(store.start_times, [0.0, 4.5, 7.0, 7.5])
+        np.testing.assert_array_equal(store.end_times, [4.5, 7.0, 7.5, 12.0])
+        assert store.speakers == ['Host', 'Guest', 'Unknown']
+        np.testing.assert_array_equal(store.speaker_ids, [0, 1, 2, 0])
+        np.testing.assert_array_equal(store.word_counts, [4, 5, 0, 7])
+        assert store.is_advertisement.tolist() == [False, False, False, True]
+
+    def test_views_behave_like_segments(self, segment_dicts):
+        store = SegmentStore.from_dicts(segment_dicts, episode_id='ep1')
+        view = store[1]
+
+        assert isinstance(view, SegmentView)
+        assert store[1] is view and store[-3] is view
+        assert view.id == 'ep1_segment_1'
+        assert view.segment_index == 1
+        assert view.text == 'Thanks, great to be here'
+        assert view.speaker == 'Guest' and store[2].speaker == 'Unknown'
+        assert view.duration_seconds == pytest.approx(2.5)
+
+        view.complexity_score = 0.7
+        view.is_advertisement = True
+        assert store[1].complexity_score == 0.7
+        assert store.is_advertisement[1]
+
+        expected = Segment(id='ep1_segment_1', text=view.text, start_time=4.5, end_time=7.0,
+                           speaker='Guest', episode_id='ep1', segment_index=1,
+                           is_advertisement=True, word_count=5, duration_seconds=2.5).to_dict()
+        assert view.to_dict() == expected
+
+    def test_views_support_dict_access(self, segment_dicts):
+        store = SegmentStore.from_dicts(segment_dicts, episode_id='ep1')
+        view = store[0]
+
+        assert view['text'] == 'Welcome to the Show'
+        assert view['start'] == view['start_time'] == 0.0
+        assert view.get('end') == 4.5
+        assert store[2].get('speaker', 'Unknown') == 'Unknown'
+        assert view.get('missing', 'default') == 'default'
+        assert 'start' in view and 'missing' not in view
+        with pytest.raises(KeyError):
+            view['missing']
+
+    def test_lowercase_is_shared(self, segment_dicts):
+        store = SegmentStore.from_dicts(segment_dicts)
+
+        assert store[0].text_lower == 'welcome to the show'
+        assert lower_text(store[3]) == 'the show covers python and python tooling'
+        assert lower_text(Segment(id='s', text='MiXeD', start_time=0, end_time=1)) == 'mixed'
+        # The lower-cased buffer is computed once for all segments
+        assert store._lowered is store._lowered
+
+    def test_lowercase_with_length_changing_characters(self):
+        # 'İ' lowercases to two code points, shifting later offsets
+        store = SegmentStore.from_dicts([
+            {'text': 'İstanbul İzmir', 'start_time': 0, 'end_time': 1},
+            {'text': 'Ankara', 'start_time': 1, 'end_time': 2},
+        ])
+
+        assert store[0].text_lower == 'İstanbul İzmir'.lower()
+        assert store[1].text_lower == 'ankara'
+        assert store.segments_containing('ANKARA').tolist() == [1]
+
+    def test_segments_containing(self, segment_dicts):
+        store = SegmentStore.from_dicts(segment_dicts)
+
+        assert store.segments_containing('Show').tolist() == [0, 3]
+        assert store.segments_containing('python').tolist() == [3]
+        assert store.segments_containing('missing').tolist() == []
+        assert store.segments_containing('').tolist() == []
+        # Terms do not match across segment boundaries
+        assert store.segments_containing('show thanks').tolist() == []
+
+    def test_from_segments(self):
+        segments = [Segment(id=f's{i}', text=f'text {i}', start_time=i, end_time=i + 1,
+                            episode_id='ep2') for i in range(3)]
+
+        store = SegmentStore.from_segments(segments)
+
+        assert store.episode_id == 'ep2'
+        assert [view.text for view in store] == ['text 0', 'text 1', 'text 2']
+        assert [view.text for view in store[1:]] == ['text 1', 'text 2']
+
+    def test_pickle_is_compact(self):
+        dicts = [{'text': f'segment number {i} of a long conversation', 'start_time': i * 5.0,
+                  'end_time': i * 5.0 + 5.0, 'speaker': f'Speaker {i % 3}'} for i in range(2000)]
+        store = SegmentStore.from_dicts(dicts, episode_id='ep1')
+        store[0].text_lower
+
+        restored = pickle.loads(pickle.dumps(store))
+
+        assert restored.to_dicts() == store.to_dicts()
+        assert restored[5].text_lower == store[5].text_lower
+        assert len(pickle.dumps(store)) < len(pickle.dumps(dicts))
+
+    def test_mismatched_columns(self):
+        with pytest.raises(ValueError):
+            SegmentStore(['a', 'b'], [0.0], [1.0, 2.0])
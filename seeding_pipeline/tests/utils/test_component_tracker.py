@@ -2,6 +2,7 @@
 Unit tests for component tracking system.
 """
 
+import json
 import os
 import tempfile
 import pytest
@@ -62,7 +63,8 @@ class TestComponentTracker:
         assert len(tracker.impacts["test_component"]) == 1
         assert tracker.impacts["test_component"][0] == impact
         
-        # Verify file was created
+        # Verify file was created once the writer drained its queue
+        assert tracker.flush(timeout=5)
         impact_file = tracker.output_dir / "test_component_impacts.jsonl"
         assert impact_file.exists()
     
@@ -235,4 +237,77 @@ class TestComponentTracker:
         
         # Test get_tracker
         retrieved_tracker = get_tracker()
-        assert retrieved_tracker == tracker
\ No newline at end of file
+        assert retrieved_tracker == tracker
+
+class TestBufferedTracking:
+    """Test cases for sampled, buffered persistence and rolling aggregates."""
+    
+    def make_impact(self, name="component", items_added=1):
+        return ComponentImpact(component_name=name, execution_time=0.1, items_added=items_added)
+    
+    def test_writes_are_batched_and_flushed(self, tmp_path):
+        """Test that queued impacts all reach the JSONL file."""
+        tracker = ComponentTracker(output_dir=tmp_path)
+        
+        for _ in range(50):
+            tracker.record_impact(self.make_impact())
+        assert tracker.flush(timeout=5)
+        
+        lines = (tmp_path / "component_impacts.jsonl").read_text().splitlines()
+        assert len(lines) == 50
+        assert json.loads(lines[0])["sample_rate"] == 1.0
+        assert tracker.get_tracking_stats()["written"] == 50
+        tracker.close()
+    
+    def test_sampling_keeps_aggregates_exact(self, tmp_path):
+        """Test that unsampled executions still count in the report."""
+        tracker = ComponentTracker(output_dir=tmp_path, sample_rate=0.0)
+        
+        for _ in range(20):
+            tracker.record_impact(self.make_impact(items_added=2))
+        
+        assert len(tracker.impacts["component"]) == 0
+        report = tracker.generate_impact_report()
+        assert report["components"]["component"]["execution_count"] == 20
+        assert report["components"]["component"]["total_items_added"] == 40
+        assert not (tmp_path / "component_impacts.jsonl").exists()
+    
+    def test_recent_impacts_are_bounded(self, tmp_path):
+        """Test that memory use does not grow with the number of executions."""
+        tracker = ComponentTracker(output_dir=tmp_path, max_recent_impacts=5)
+        
+        for i in range(12):
+            tracker.record_impact(self.make_impact(items_added=i))
+        tracker.close()
+        
+        assert [impact.items_added for impact in tracker.impacts["component"]] == [7, 8, 9, 10, 11]
+        assert tracker.get_aggregates("component").total_items_added == sum(range(12))
+    
+    def test_full_queue_drops_records(self, tmp_path):
+        """Test that callers never block on a full queue."""
+        tracker = ComponentTracker(output_dir=tmp_path, queue_size=1)
+        
+        with patch.object(tracker, '_start_writer'):
+            for _ in range(3):
+                tracker.record_impact(self.make_impact())
+        
+        assert tracker.get_tracking_stats()["dropped"] == 2
+        assert tracker.get_aggregates("component").total_executions == 3
+    
+    def test_track_contribution(self, tmp_path):
+        """Test that contributions are aggregated by type and persisted."""
+        tracker = ComponentTracker(output_dir=tmp_path)
+        
+        for count in (2, 3):
+            tracker.track_contribution(ComponentContribution(
+                component_name="entity_resolution",
+                contribution_type="entities_merged",
+                count=count,
+                metadata={"reduction_ratio": 0.5}
+            ))
+        tracker.close()
+        
+        contributions = tracker.get_aggregates("entity_resolution").contributions
+        assert [(c.contribution_type, c.count) for c in contributions] == [("entities_merged", 5)]
+        lines = (tmp_path / "entity_resolution_contributions.jsonl").read_text().splitlines()
+        assert len(lines) == 2
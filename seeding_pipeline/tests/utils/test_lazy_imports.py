@@ -0,0 +1,22 @@
+"""Tests for deferred imports."""
+
+import sys
+
+from src.utils.lazy_imports import LazyImport, is_available
+
+
+def test_lazy_import_loads_on_first_use():
+    sys.modules.pop('colorsys', None)
+    colorsys = LazyImport('colorsys')
+    rgb_to_hsv = LazyImport('colorsys', 'rgb_to_hsv')
+
+    assert 'colorsys' not in sys.modules
+    assert rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert colorsys.hsv_to_rgb(0.0, 0.0, 1.0) == (1.0, 1.0, 1.0)
+    assert repr(colorsys) == '<LazyImport colorsys (loaded)>'
+
+
+def test_is_available():
+    assert is_available('json')
+    assert not is_available('no_such_module_here')
+    assert not is_available('no_such_package.submodule')
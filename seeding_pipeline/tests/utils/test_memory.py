@@ -2,6 +2,7 @@
 
 import gc
 import pytest
+from concurrent.futures import Future
 from unittest.mock import Mock, patch, MagicMock
 from src.utils.memory import (
     cleanup_memory,
@@ -10,7 +11,8 @@ from src.utils.memory import (
     ResourceManager,
     memory_limited,
     monitor_resources,
-    batch_processor
+    batch_processor,
+    MemoryBudget
 )
 
 
@@ -306,4 +308,101 @@ class TestBatchProcessor:
         
         list(process_items([1, 2, 3]))
         
-        mock_managed.assert_called_once_with(cleanup=False, monitor=True)
\ No newline at end of file
+        mock_managed.assert_called_once_with(cleanup=False, monitor=True)
+
+class TestMemoryBudget:
+    """Tests for the episode-scoped memory budget."""
+    
+    @staticmethod
+    def _usage_after_collections(mock_gc, before, after, collections=1):
+        """Report `before` MB until `collections` gc runs have happened, then `after`."""
+        return lambda: after if mock_gc.call_count >= collections else before
+    
+    @patch('src.utils.memory.get_memory_usage', return_value=500.0)
+    @patch('src.utils.memory.gc.collect')
+    def test_release_under_budget_skips_collection(self, mock_gc, mock_usage):
+        """Test no collection happens while under budget."""
+        budget = MemoryBudget(budget_mb=1000)
+        
+        assert budget.release() is False
+        mock_gc.assert_not_called()
+    
+    @patch('src.utils.memory.get_memory_usage')
+    @patch('src.utils.memory.gc.collect')
+    def test_release_collects_young_generations_first(self, mock_gc, mock_usage):
+        """Test a generation 1 collection is enough when it frees memory."""
+        mock_usage.side_effect = self._usage_after_collections(mock_gc, 950.0, 500.0)
+        budget = MemoryBudget(budget_mb=1000)
+        
+        assert budget.release() is True
+        mock_gc.assert_called_once_with(1)
+        assert budget.get_stats()['collections'] == 1
+    
+    @patch('src.utils.memory.get_memory_usage', return_value=950.0)
+    @patch('src.utils.memory.gc.collect')
+    def test_release_escalates_to_full_collection(self, mock_gc, mock_usage):
+        """Test a full collection runs when the young generations are not enough."""
+        budget = MemoryBudget(budget_mb=1000)
+        
+        budget.release()
+        
+        assert [c.args for c in mock_gc.call_args_list] == [(1,), (2,)]
+    
+    @patch('src.utils.memory.get_memory_usage')
+    @patch('src.utils.memory.gc.collect')
+    def test_wait_for_headroom_blocks_until_under_budget(self, mock_gc, mock_usage):
+        """Test backpressure waits while memory stays over budget."""
+        # Memory stays high through both collections and frees up while polling
+        polls = []
+        mock_usage.side_effect = lambda: 500.0 if len(polls) > 2 else 950.0
+        budget = MemoryBudget(budget_mb=1000, poll_interval=0.01)
+        budget.begin()
+        
+        with patch('src.utils.memory.time.sleep', side_effect=lambda _: polls.append(1)):
+            waited = budget.wait_for_headroom(timeout=5)
+        
+        assert waited < 5
+        assert len(polls) == 3
+        assert mock_gc.call_count == 2
+        assert budget.get_stats()['backpressure_waits'] == 1
+    
+    @patch('src.utils.memory.get_memory_usage', return_value=950.0)
+    @patch('src.utils.memory.gc.collect')
+    def test_wait_for_headroom_times_out(self, mock_gc, mock_usage):
+        """Test backpressure gives up after the timeout."""
+        budget = MemoryBudget(budget_mb=1000, poll_interval=0.01)
+        budget.begin()
+        
+        waited = budget.wait_for_headroom(timeout=0.05)
+        
+        assert 0.05 <= waited < 1
+    
+    @patch('src.utils.memory.get_memory_usage', return_value=950.0)
+    @patch('src.utils.memory.gc.collect')
+    def test_wait_for_headroom_returns_immediately_when_nothing_in_flight(self, mock_gc, mock_usage):
+        """Test no wait happens when no other work could free memory."""
+        budget = MemoryBudget(budget_mb=1000, poll_interval=0.01)
+        
+        with patch('src.utils.memory.time.sleep') as mock_sleep:
+            waited = budget.wait_for_headroom(timeout=60)
+        
+        assert waited == 0.0
+        mock_sleep.assert_not_called()
+        # Still does a cleanup pass before letting the work start
+        assert mock_gc.call_count == 2
+        assert budget.get_stats()['backpressure_waits'] == 0
+    
+    @patch('src.utils.memory.get_memory_usage', return_value=950.0)
+    @patch('src.utils.memory.gc.collect')
+    def test_wait_for_headroom_stops_when_in_flight_work_finishes(self, mock_gc, mock_usage):
+        """Test backpressure ends once the last in-flight unit is done."""
+        budget = MemoryBudget(budget_mb=1000, poll_interval=0.01)
+        future = Future()
+        budget.track_future(future)
+        assert budget.in_flight == 1
+        
+        with patch('src.utils.memory.time.sleep', side_effect=lambda _: future.set_result(None)):
+            waited = budget.wait_for_headroom(timeout=60)
+        
+        assert waited < 60
+        assert budget.in_flight == 0
@@ -0,0 +1,108 @@
+"""Tests for the shared model pool."""
+
+import gc
+import threading
+import time
+
+import pytest
+
+from src.utils.model_pool import ModelPool
+
+
+class Loader:
+    """Counts loads and returns a new object per load."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return object()
+
+
+@pytest.fixture
+def pool():
+    return ModelPool(idle_timeout=60)
+
+
+class TestModelPool:
+    """Tests for sharing, reference counting and eviction."""
+
+    def test_acquire_shares_loaded_model(self, pool):
+        loader = Loader()
+
+        first = pool.acquire(('whisper', 'large-v3', 'cpu'), loader)
+        second = pool.acquire(('whisper', 'large-v3', 'cpu'), loader)
+
+        assert first is second
+        assert loader.calls == 1
+        stats = pool.get_stats()
+        assert stats['loads'] == 1 and stats['hits'] == 1
+        assert stats['models'][0]['ref_count'] == 2
+
+    def test_different_keys_load_separately(self, pool):
+        loader = Loader()
+
+        pool.acquire(('whisper', 'large-v3', 'cpu'), loader)
+        pool.acquire(('whisper', 'large-v3', 'cuda'), loader)
+
+        assert loader.calls == 2
+        assert len(pool) == 2
+
+    def test_released_model_stays_warm_until_idle(self, pool):
+        key = ('sentence_transformer', 'mini', 'cpu')
+        model = pool.acquire(key, Loader())
+        pool.release(key)
+
+        assert pool.evict_idle() == 0
+        assert pool.acquire(key, Loader()) is model
+
+        pool.release(key)
+        pool.idle_timeout = 0.0
+        assert pool.evict_idle() == 1
+        assert key not in pool
+
+    def test_referenced_models_not_evicted(self):
+        pool = ModelPool(idle_timeout=0)
+        pool.acquire('in-use', Loader())
+
+        assert pool.evict_idle() == 0
+        assert 'in-use' in pool
+
+    def test_zero_timeout_evicts_on_last_release(self):
+        pool = ModelPool(idle_timeout=0)
+        pool.acquire('model', Loader())
+        pool.acquire('model', Loader())
+
+        pool.release('model')
+        assert 'model' in pool
+        pool.release('model')
+        assert 'model' not in pool
+
+    def test_concurrent_acquire_loads_once(self, pool):
+        loader = Loader(delay=0.05)
+        models = []
+
+        threads = [threading.Thread(target=lambda: models.append(pool.acquire('model', loader)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert loader.calls == 1
+        assert all(model is models[0] for model in models)
+
+    def test_prepare_for_fork(self, pool):
+        pool.acquire('cpu-model', Loader())
+        try:
+            assert pool.prepare_for_fork() is True
+            assert gc.get_freeze_count() > 0
+        finally:
+            pool.finish_fork()
+        assert gc.get_freeze_count() == 0
+
+        pool.acquire('gpu-model', Loader(), fork_safe=False)
+        assert pool.prepare_for_fork() is False
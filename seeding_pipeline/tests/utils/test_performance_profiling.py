@@ -0,0 +1,243 @@
+"""Tests for pipeline optimizers in performance profiling utilities."""
+
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.utils.performance_profiling import (
+    OptimizationManager,
+    BatchOptimizer,
+    CacheOptimizer,
+    AsyncOptimizer,
+    ConnectionPoolOptimizer,
+    ProfileResult
+)
+
+
+def make_profiler(sections):
+    """Create a profiler stub holding results for the given (name, seconds, memory) sections."""
+    from src.utils.performance_profiling import PerformanceProfiler
+    profiler = PerformanceProfiler.__new__(PerformanceProfiler)
+    profiler.results = [
+        ProfileResult(name, duration, duration, memory, memory, 1, [], "now")
+        for name, duration, memory in sections
+    ]
+    return profiler
+
+
+class FakeGraphProvider:
+    """Graph provider exposing a session factory and pool size."""
+
+    def __init__(self):
+        self._pool_size = 50
+        self._driver = None
+        self.config = {'pool_size': 50}
+
+    @contextmanager
+    def session(self):
+        yield Mock()
+
+
+class TestCacheOptimizer:
+    """Tests for LLM response caching and the shared embedding cache."""
+
+    @staticmethod
+    def make_llm(temperature=0.7):
+        llm = Mock()
+        llm.model_name = 'gemini-test'
+        llm.temperature = temperature
+        llm.max_tokens = 1024
+        llm.complete.side_effect = lambda prompt, **kwargs: f"answer:{prompt}"
+        return llm
+
+    def test_llm_cache_is_opt_in(self):
+        llm = self.make_llm(temperature=0)
+        complete = llm.complete
+        pipeline = SimpleNamespace(llm_provider=llm, embedding_provider=None)
+
+        assert CacheOptimizer().optimize(pipeline) == []
+        assert llm.complete is complete
+
+    def test_deterministic_llm_responses_cached(self):
+        llm = self.make_llm()
+        complete = llm.complete
+        pipeline = SimpleNamespace(llm_provider=llm, embedding_provider=None)
+
+        changes = CacheOptimizer({'enable_llm_cache': True}).optimize(pipeline)
+
+        assert [c.setting for c in changes] == ['response_cache']
+        assert llm.complete("q", temperature=0) == "answer:q"
+        assert llm.complete("q", temperature=0) == "answer:q"
+        assert complete.call_count == 1
+        assert llm._response_cache.get_stats()['hits'] == 1
+
+    def test_sampled_llm_calls_bypass_cache(self):
+        llm = self.make_llm(temperature=0.7)
+        complete = llm.complete
+        CacheOptimizer({'enable_llm_cache': True}).optimize(
+            SimpleNamespace(llm_provider=llm, embedding_provider=None)
+        )
+
+        llm.complete("q")
+        llm.complete("q")
+        llm.complete("q", temperature=0.2)
+
+        assert complete.call_count == 3
+        assert llm._response_cache.get_stats()['size'] == 0
+
+    def test_llm_cache_key_includes_model_and_options(self):
+        llm = self.make_llm(temperature=0)
+        complete = llm.complete
+        CacheOptimizer({'enable_llm_cache': True}).optimize(
+            SimpleNamespace(llm_provider=llm, embedding_provider=None)
+        )
+
+        llm.complete("q")
+        llm.complete("q", max_tokens=10)
+        llm.model_name = 'gemini-other'
+        llm.complete("q")
+        llm.complete("q")
+
+        assert complete.call_count == 3
+
+    def test_embedding_provider_routed_through_shared_cache(self):
+        from src.providers.embeddings.cache import CachedEmbeddingProvider, get_embedding_cache
+        from src.providers.embeddings.mock import MockEmbeddingProvider
+
+        provider = MockEmbeddingProvider({'model_name': 'mock', 'dimension': 4})
+        pipeline = SimpleNamespace(llm_provider=None, embedding_provider=provider)
+
+        changes = CacheOptimizer().optimize(pipeline)
+
+        assert [c.setting for c in changes] == ['embedding_cache']
+        assert isinstance(pipeline.embedding_provider, CachedEmbeddingProvider)
+        # The same cache every other embedding consumer gets
+        assert pipeline.embedding_provider is get_embedding_cache(provider)
+
+    def test_installing_twice_is_a_no_op(self):
+        from src.providers.embeddings.mock import MockEmbeddingProvider
+
+        pipeline = SimpleNamespace(
+            llm_provider=self.make_llm(),
+            embedding_provider=MockEmbeddingProvider({'model_name': 'mock', 'dimension': 4})
+        )
+        optimizer = CacheOptimizer({'enable_llm_cache': True})
+
+        assert len(optimizer.optimize(pipeline)) == 2
+        assert optimizer.optimize(pipeline) == []
+
+
+class TestBatchOptimizer:
+    """Tests for profiler-driven batch sizing."""
+
+    def test_slow_embedding_doubles_batch_size(self):
+        embedder = SimpleNamespace(batch_size=32)
+        profiler = make_profiler([("embedding_batch", 8.0, 0)])
+
+        changes = BatchOptimizer({'max_batch_size': 48}, profiler).optimize(
+            SimpleNamespace(embedding_provider=embedder)
+        )
+
+        assert embedder.batch_size == 48
+        assert (changes[0].before, changes[0].after) == (32, 48)
+
+    def test_high_memory_halves_batch_size(self):
+        embedder = SimpleNamespace(batch_size=32)
+        profiler = make_profiler([("embedding_batch", 8.0, 900 * 1024 * 1024)])
+
+        BatchOptimizer({}, profiler).optimize(SimpleNamespace(embedding_provider=embedder))
+
+        assert embedder.batch_size == 16
+
+    def test_no_profile_data_leaves_batch_size(self):
+        embedder = SimpleNamespace(batch_size=32)
+
+        assert BatchOptimizer().optimize(SimpleNamespace(embedding_provider=embedder)) == []
+        assert embedder.batch_size == 32
+
+
+class TestAsyncOptimizer:
+    """Tests for switching stages to concurrent execution."""
+
+    def test_enables_eligible_stages(self):
+        config = SimpleNamespace(parallel_migration_extraction=False)
+        graph = SimpleNamespace(async_shadow_writes=False)
+
+        changes = AsyncOptimizer().optimize(SimpleNamespace(config=config, graph_provider=graph))
+
+        assert config.parallel_migration_extraction is True
+        assert graph.async_shadow_writes is True
+        assert {c.setting for c in changes} == {'parallel_migration_extraction', 'async_shadow_writes'}
+
+    def test_disabled(self):
+        config = SimpleNamespace(parallel_migration_extraction=False)
+
+        assert AsyncOptimizer({'enable_async': False}).optimize(SimpleNamespace(config=config)) == []
+        assert config.parallel_migration_extraction is False
+
+
+class TestConnectionPoolOptimizer:
+    """Tests for sizing the pool from observed concurrency."""
+
+    def test_pool_sized_from_peak_sessions(self):
+        graph = FakeGraphProvider()
+        pipeline = SimpleNamespace(graph_provider=graph)
+        optimizer = ConnectionPoolOptimizer({'min_pool_size': 2, 'pool_headroom': 2.0})
+
+        # First call only starts tracking
+        assert optimizer.optimize(pipeline) == []
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def use_session():
+            with graph.session():
+                barrier.wait()
+
+        threads = [threading.Thread(target=use_session) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        changes = optimizer.optimize(pipeline)
+
+        assert graph._pool_size == 6
+        assert graph.config['pool_size'] == 6
+        assert changes[0].before == 50
+        assert changes[0].applied is True
+
+    def test_live_driver_change_is_pending(self):
+        graph = FakeGraphProvider()
+        graph._driver = Mock()
+
+        changes = ConnectionPoolOptimizer({'expected_concurrency': 4}).optimize(
+            SimpleNamespace(graph_provider=graph)
+        )
+
+        assert changes[0].after == 10
+        assert changes[0].applied is False
+
+
+class TestOptimizationManager:
+    """Tests for the optimization manager report."""
+
+    def test_report_lists_before_and_after(self):
+        llm = Mock()
+        coordinator = SimpleNamespace(
+            llm_provider=llm,
+            embedding_provider=None,
+            graph_provider=None,
+            config=SimpleNamespace(parallel_migration_extraction=False)
+        )
+        manager = OptimizationManager({'enable_llm_cache': True})
+
+        manager.apply_optimizations(SimpleNamespace(provider_coordinator=coordinator))
+
+        report = manager.get_report()
+        settings = {c['setting']: (c['before'], c['after']) for c in report['applied']}
+        assert settings['parallel_migration_extraction'] == (False, True)
+        assert 'response_cache' in settings
+        assert '| async | config.parallel_migration_extraction | False | True |' in manager.generate_report()
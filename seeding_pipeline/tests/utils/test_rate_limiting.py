@@ -0,0 +1,185 @@
+"""Tests for the sliding window rate limiters."""
+
+import multiprocessing
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.utils.rate_limiting import (
+    WindowedRateLimiter,
+    SQLiteRateLimiter,
+    RedisRateLimiter,
+    create_rate_limiter
+)
+
+
+class ShortWindowRateLimiter(WindowedRateLimiter):
+    """Windowed limiter with a 0.2s 'minute' so waits are observable in tests."""
+    MINUTE = 0.2
+
+
+class TestWindowedRateLimiter:
+    """Tests for WindowedRateLimiter admission and blocking acquire."""
+
+    def test_token_totals_are_running(self):
+        limiter = WindowedRateLimiter({'default': {'tpm': 100}})
+
+        limiter.record_request('m', 40)
+        limiter.record_request('m', 50)
+
+        assert limiter.token_totals['m'] == 90
+        assert limiter.can_make_request('m', 10)
+        assert not limiter.can_make_request('m', 11)
+        assert limiter.get_status()['m']['tpm']['used'] == 90
+
+    def test_time_until_available_uses_oldest_blocking_entry(self):
+        limiter = WindowedRateLimiter({'default': {'rpm': 2}})
+        limiter.record_request('m')
+        limiter.record_request('m')
+
+        wait = limiter.time_until_available('m')
+
+        assert 59 < wait <= 60
+
+    def test_acquire_waits_for_window(self):
+        limiter = ShortWindowRateLimiter({'default': {'rpm': 1}})
+        assert limiter.acquire('m')
+
+        start = time.time()
+        assert limiter.acquire('m', timeout=2)
+        elapsed = time.time() - start
+
+        assert 0.15 <= elapsed < 1.0
+
+    def test_acquire_gives_up_when_wait_exceeds_timeout(self):
+        limiter = WindowedRateLimiter({'default': {'rpm': 1}})
+        limiter.acquire('m')
+
+        start = time.time()
+        assert limiter.acquire('m', timeout=1) is False
+        # The wait (~60s) is known to exceed the timeout, so it fails immediately
+        assert time.time() - start < 0.5
+
+    def test_oversized_request_admitted_on_empty_window(self):
+        limiter = WindowedRateLimiter({'default': {'tpm': 100}})
+
+        assert limiter.acquire('m', cost=500, timeout=0)
+
+    def test_waiters_admitted_in_fifo_order(self):
+        limiter = ShortWindowRateLimiter({'default': {'rpm': 1}})
+        limiter.acquire('m')
+        order = []
+
+        def worker(index):
+            limiter.acquire('m', timeout=5)
+            order.append(index)
+
+        threads = []
+        for index in range(3):
+            thread = threading.Thread(target=worker, args=(index,))
+            thread.start()
+            threads.append(thread)
+            # Make sure each thread has queued before starting the next
+            while limiter.get_status()['m']['waiting'] < index + 1:
+                time.sleep(0.001)
+        for thread in threads:
+            thread.join()
+
+        assert order == [0, 1, 2]
+        assert limiter.get_status()['m']['waiting'] == 0
+
+
+def _hammer_ledger(path, count):
+    """Worker process: acquire `count` slots from the shared ledger."""
+    limiter = ShortWindowSQLiteRateLimiter({'default': {'rpm': 5}}, path=path)
+    for _ in range(count):
+        if not limiter.acquire('model', timeout=10):
+            raise SystemExit(1)
+
+
+class ShortWindowSQLiteRateLimiter(SQLiteRateLimiter):
+    """SQLite limiter with a 0.5s 'minute' so waits are observable in tests."""
+    MINUTE = 0.5
+
+
+class TestSQLiteRateLimiter:
+    """Tests for the cross-process SQLite ledger."""
+
+    def test_budget_shared_between_instances(self, tmp_path):
+        path = str(tmp_path / "ledger.sqlite")
+        first = SQLiteRateLimiter({'default': {'rpm': 2, 'tpm': 100}}, path=path)
+        second = SQLiteRateLimiter({'default': {'rpm': 2, 'tpm': 100}}, path=path)
+
+        assert first.acquire('m', cost=30, timeout=0)
+        assert second.acquire('m', cost=30, timeout=0)
+        assert not first.acquire('m', cost=30, timeout=0)
+
+        status = second.get_status()['m']
+        assert status['rpm']['used'] == 2
+        assert status['tpm']['used'] == 60
+
+    def test_aggregate_rate_held_across_processes(self, tmp_path):
+        path = str(tmp_path / "ledger.sqlite")
+        context = multiprocessing.get_context('fork')
+        workers = [
+            context.Process(target=_hammer_ledger, args=(path, 5))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+            assert worker.exitcode == 0
+
+        with sqlite3.connect(path) as conn:
+            admitted = [row[0] for row in conn.execute("SELECT ts FROM rate_limit_ledger ORDER BY ts")]
+        assert len(admitted) == 20
+        # No 0.5s window ever saw more than the 5 allowed requests
+        for i, start in enumerate(admitted):
+            in_window = [t for t in admitted[i:] if t < start + ShortWindowSQLiteRateLimiter.MINUTE]
+            assert len(in_window) <= 5
+        # 20 requests at 5 per window need at least three full windows
+        assert admitted[-1] - admitted[0] >= 3 * ShortWindowSQLiteRateLimiter.MINUTE * 0.95
+
+
+class TestRedisRateLimiter:
+    """Tests for the Redis-backed limiter (requires fakeredis with Lua support)."""
+
+    @pytest.fixture
+    def client(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        return fakeredis.FakeRedis()
+
+    def test_limits_enforced_atomically(self, client):
+        limiter = RedisRateLimiter({'m': {'rpm': 2, 'tpm': 25}}, client=client)
+
+        assert limiter.acquire('m', cost=10, timeout=0)
+        assert limiter.acquire('m', cost=10, timeout=0)
+        assert not limiter.acquire('m', cost=1, timeout=0)
+        assert 59 < limiter.time_until_available('m') <= 60
+        assert limiter.get_status()['m']['tpm']['used'] == 20
+
+    def test_status_includes_scoped_identifiers(self, client):
+        limiter = RedisRateLimiter({'m': {'rpm': 2}}, client=client)
+
+        limiter.record_request('m@key1')
+
+        status = limiter.get_status()
+        assert status['m@key1']['rpm'] == {'used': 1, 'limit': 2}
+        assert status['m']['rpm']['used'] == 0
+
+
+def test_create_rate_limiter_selects_backend(tmp_path):
+    limits = {'default': {'rpm': 1}}
+
+    assert isinstance(create_rate_limiter(limits), WindowedRateLimiter)
+    sqlite_limiter = create_rate_limiter(limits, {
+        'rate_limit_backend': 'sqlite',
+        'rate_limit_ledger_path': str(tmp_path / "ledger.sqlite")
+    })
+    assert isinstance(sqlite_limiter, SQLiteRateLimiter)
+    with pytest.raises(ValueError):
+        create_rate_limiter(limits, {'rate_limit_backend': 'carrier-pigeon'})
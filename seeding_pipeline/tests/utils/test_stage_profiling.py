@@ -0,0 +1,174 @@
+"""Tests for per-stage profiling and stack sampling."""
+
+import contextvars
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.v1 import profiling as profiling_api
+from src.utils.stage_profiling import (
+    EpisodeProfile,
+    StackSampler,
+    StageProfiler,
+    current_episode_profile,
+    profile_stage,
+)
+
+
+def busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestStageCounters:
+    """Test stage counters recorded inside an episode profile"""
+
+    def test_stage_outside_episode_is_noop(self):
+        with profile_stage("extraction"):
+            pass
+
+        assert current_episode_profile() is None
+
+    def test_stages_accumulate(self):
+        profiler = StageProfiler()
+
+        with profiler.profile_episode("ep1") as profile:
+            for _ in range(2):
+                with profile_stage("extraction"):
+                    busy_wait(0.01)
+            with profile_stage("storage"):
+                time.sleep(0.02)
+
+        assert list(profile.stages) == ["extraction", "storage"]
+        extraction = profile.stages["extraction"]
+        assert extraction.calls == 2
+        assert extraction.wall_seconds >= 0.02
+        assert extraction.cpu_seconds > 0.01
+        # Sleeping costs wall time but hardly any CPU
+        assert profile.stages["storage"].cpu_seconds < profile.stages["storage"].wall_seconds
+        assert profile.wall_seconds >= extraction.wall_seconds + profile.stages["storage"].wall_seconds
+        assert not profile.sampled
+        assert profiler.get_profile("ep1") is profile
+        assert current_episode_profile() is None
+
+    def test_stages_in_copied_context_belong_to_episode(self):
+        profiler = StageProfiler()
+
+        def resolve():
+            with profile_stage("entity_resolution"):
+                pass
+
+        with profiler.profile_episode("ep1") as profile:
+            worker = threading.Thread(target=contextvars.copy_context().run, args=(resolve,))
+            worker.start()
+            worker.join()
+
+        assert profile.stages["entity_resolution"].calls == 1
+
+    def test_recent_profiles_are_bounded(self):
+        profiler = StageProfiler(max_profiles=2)
+        for episode_id in ("ep1", "ep2", "ep3"):
+            with profiler.profile_episode(episode_id):
+                pass
+
+        assert [p.episode_id for p in profiler.recent_profiles()] == ["ep3", "ep2"]
+        assert profiler.get_profile("ep1") is None
+
+
+def extraction_hot_loop():
+    busy_wait(0.1)
+
+
+class TestStackSampling:
+    """Test sampled stacks and flamegraph output"""
+
+    def test_sampled_stacks_name_stage_and_function(self, tmp_path):
+        profiler = StageProfiler(sample_interval=0.002)
+
+        with profiler.profile_episode("ep/1", sample=True, output_dir=tmp_path) as profile:
+            with profile_stage("extraction"):
+                extraction_hot_loop()
+
+        assert profile.sample_count > 0
+        hot = [stack for stack in profile.stacks if "extraction_hot_loop" in stack]
+        assert hot
+        assert all(stack.startswith("ep/1;extraction;") for stack in hot)
+
+        folded = list(tmp_path.glob("ep_1_*.folded"))
+        assert len(folded) == 1
+        assert profile.flamegraph_path == str(folded[0])
+        line = folded[0].read_text().splitlines()[0]
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0 and ";" in stack
+
+    def test_sampler_only_records_threads_in_stages(self):
+        profile = EpisodeProfile(episode_id="ep1")
+        sampler = StackSampler(profile)
+
+        sampler.sample()
+        assert profile.sample_count == 0
+
+        profile.enter("segmentation")
+        sampler.sample()
+        profile.exit()
+
+        assert profile.sample_count == 1
+        (stack,) = profile.stacks
+        assert stack.startswith("ep1;segmentation;")
+        assert "test_sampler_only_records_threads_in_stages" in stack
+
+    def test_requested_sampling_applies_once(self):
+        profiler = StageProfiler(sample_interval=0.002)
+        profiler.request_sampling("ep1")
+        assert profiler.pending_requests() == ["ep1"]
+
+        with profiler.profile_episode("ep1") as first:
+            pass
+        with profiler.profile_episode("ep1") as second:
+            pass
+
+        assert first.sampled and not second.sampled
+        assert profiler.pending_requests() == []
+
+
+class TestProfilingAPI:
+    """Test the profiling endpoints"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        profiler = StageProfiler(sample_interval=0.002)
+        monkeypatch.setattr(profiling_api, "get_stage_profiler", lambda: profiler)
+        app = FastAPI()
+        app.include_router(profiling_api.router, prefix="/api/v1")
+        return TestClient(app), profiler
+
+    def test_request_sampling_and_fetch_flamegraph(self, client):
+        client, profiler = client
+
+        response = client.post("/api/v1/profiling/episodes/ep1/sample")
+        assert response.status_code == 200
+        assert client.get("/api/v1/profiling/episodes").json()["pending_sampling"] == ["ep1"]
+        assert client.get("/api/v1/profiling/episodes/ep1").status_code == 404
+
+        with profiler.profile_episode("ep1"):
+            with profile_stage("extraction"):
+                extraction_hot_loop()
+
+        profile = client.get("/api/v1/profiling/episodes/ep1").json()
+        assert profile["sampled"] is True
+        assert [stage["name"] for stage in profile["stages"]] == ["extraction"]
+
+        flamegraph = client.get("/api/v1/profiling/episodes/ep1/flamegraph")
+        assert flamegraph.status_code == 200
+        assert "extraction_hot_loop" in flamegraph.text
+
+    def test_flamegraph_of_unsampled_episode(self, client):
+        client, profiler = client
+        with profiler.profile_episode("ep1"):
+            pass
+
+        assert client.get("/api/v1/profiling/episodes/ep1/flamegraph").status_code == 404